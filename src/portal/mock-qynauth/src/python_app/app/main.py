@@ -1,3 +1,4 @@
+import asyncio
 import hashlib
 import logging
 import secrets
@@ -14,6 +15,10 @@ from starlette.responses import RedirectResponse
 sys.path.append(str(Path(__file__).parent.parent))
 from pqc_ffi import PQCLibrary, PQCLibraryError
 
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from python_app.optimization.concurrency_limiter import AdaptiveConcurrencyLimiter, ConcurrencyLimitExceeded
+from python_app.optimization.key_store import PQCKeyStore
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -25,12 +30,16 @@ app = FastAPI(
 )
 
 # In-memory user store for MVP simplicity (replace with DB later)
-# Store hashed passwords, JWT tokens, and PQC keys
+# Store hashed passwords, JWT tokens, and PQC keys (as bytes, see PQCKeyStore)
 users_db = (
     {}
 )  # { "username": {"hashed_password": "...", "salt": "...", "token": "...", "pqc_keys": {...}} }
 
 pqc_lib = None
+pqc_key_store = None
+
+# Registrations generating PQC keys at once; adjusted from observed latency
+pqc_limiter = AdaptiveConcurrencyLimiter("qynauth_register", max_wait=0.05)
 
 def get_pqc_library():
     """Get or initialize the PQC library instance."""
@@ -45,6 +54,55 @@ def get_pqc_library():
     return pqc_lib
 
 
+def get_pqc_key_store():
+    """Get or initialize the key store generating users' PQC keys."""
+    global pqc_key_store
+    if pqc_key_store is None:
+        pqc_library = get_pqc_library()
+        if pqc_library is not None:
+            pqc_key_store = PQCKeyStore(pqc_library)
+    return pqc_key_store
+
+
+def generate_pqc_keys(username: str) -> dict:
+    """
+    Generate a user's ML-KEM and ML-DSA keypairs.
+    Keys are returned as StoredKey values holding the keys as bytes.
+    Returns an empty dict if the PQC library is unavailable or fails.
+    """
+    pqc_keys = {}
+    try:
+        key_store = get_pqc_key_store()
+        if key_store is None:
+            logger.warning(f"PQC library not available, skipping key generation for user {username}")
+        else:
+            logger.info(f"Generating quantum-safe keys for user {username}")
+            
+            # Generate ML-KEM keypair for key encapsulation
+            kem_key = key_store.generate("ML-KEM-768")
+            logger.info(f"Generated ML-KEM-768 keypair for user {username}: "
+                        f"pub_key={len(key_store.public_key(kem_key))} bytes")
+            
+            # Generate ML-DSA keypair for digital signatures
+            dsa_key = key_store.generate("ML-DSA-65")
+            logger.info(f"Generated ML-DSA-65 keypair for user {username}: "
+                        f"pub_key={len(key_store.public_key(dsa_key))} bytes")
+            
+            pqc_keys = {
+                "ml_kem": kem_key,
+                "ml_dsa": dsa_key
+            }
+            
+            logger.info(f"Successfully generated and stored PQC keys for user {username}")
+            
+    except PQCLibraryError as e:
+        logger.error(f"PQC library error during key generation for user {username}: {e}")
+    except Exception as e:
+        logger.error(f"Unexpected error during PQC key generation for user {username}: {e}")
+
+    return pqc_keys
+
+
 # Pydantic models for request/response bodies
 class RegisterPayload(BaseModel):
     username: str
@@ -115,46 +173,18 @@ async def register(payload: RegisterPayload):
         "token": jwt_token,
     }
 
-    # Generate quantum-safe keys using FFI interface
-    pqc_keys = {}
+    # Generate quantum-safe keys off the event loop, under the adaptive limit
     try:
-        pqc_library = get_pqc_library()
-        if pqc_library is None:
-            logger.warning(f"PQC library not available, skipping key generation for user {username}")
-        else:
-            logger.info(f"Generating quantum-safe keys for user {username}")
-            
-            # Generate ML-KEM keypair for key encapsulation
-            kem_keypair = pqc_library.generate_ml_kem_keypair()
-            kem_public = kem_keypair['public_key']
-            kem_private = kem_keypair['private_key']
-            logger.info(f"Generated ML-KEM-768 keypair for user {username}: pub_key={len(kem_public)} bytes")
-            
-            # Generate ML-DSA keypair for digital signatures
-            dsa_keypair = pqc_library.generate_ml_dsa_keypair()
-            dsa_public = dsa_keypair['public_key']
-            dsa_private = dsa_keypair['private_key']
-            logger.info(f"Generated ML-DSA-65 keypair for user {username}: pub_key={len(dsa_public)} bytes")
-            
-            pqc_keys = {
-                "ml_kem": {
-                    "public_key": kem_public,
-                    "private_key": kem_private,
-                    "algorithm": "ML-KEM-768"
-                },
-                "ml_dsa": {
-                    "public_key": dsa_public,
-                    "private_key": dsa_private,
-                    "algorithm": "ML-DSA-65"
-                }
-            }
-            
-            logger.info(f"Successfully generated and stored PQC keys for user {username}")
-            
-    except PQCLibraryError as e:
-        logger.error(f"PQC library error during key generation for user {username}: {e}")
-    except Exception as e:
-        logger.error(f"Unexpected error during PQC key generation for user {username}: {e}")
+        async with pqc_limiter.limit_context():
+            pqc_keys = await asyncio.to_thread(generate_pqc_keys, username)
+    except ConcurrencyLimitExceeded:
+        users_db.pop(username, None)
+        logger.warning(f"PQC key generation saturated, rejecting registration for user {username}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Key generation is at capacity, retry shortly",
+            headers={"Retry-After": "1"},
+        )
 
     users_db[username] = {
         "hashed_password": hashed_password,
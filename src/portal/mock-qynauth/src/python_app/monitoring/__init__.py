@@ -7,6 +7,9 @@ for Post-Quantum Cryptography operations in the enhanced Python bindings.
 Modules:
 - pqc_logger: Structured JSON logging for PQC operations
 - performance_monitor: Performance monitoring with context managers
+- log_rotation: Background-compressed, size-budgeted log rotation
+- log_sampling: Head sampling and per-operation rate caps for log chatter
+- redaction: Single-pass redaction of sensitive material in log records
 - integration: Integration with existing Portal Backend monitoring
 
 Compliance:
@@ -17,12 +20,21 @@ Compliance:
 
 from .pqc_logger import PQCLogger, pqc_logger
 from .performance_monitor import PQCPerformanceMonitor, performance_monitor
+from .log_rotation import CompressingRotatingFileHandler
+from .log_sampling import PQCLogSampler, LogSamplingConfig, SamplingRule
+from .redaction import PQCRedactionEngine, get_redaction_engine
 
 __all__ = [
     'PQCLogger',
     'pqc_logger',
     'PQCPerformanceMonitor', 
-    'performance_monitor'
+    'performance_monitor',
+    'CompressingRotatingFileHandler',
+    'PQCLogSampler',
+    'LogSamplingConfig',
+    'SamplingRule',
+    'PQCRedactionEngine',
+    'get_redaction_engine'
 ]
 
 __version__ = "3.1.0"
@@ -0,0 +1,254 @@
+"""
+PQC Log Rotation
+
+This module provides size-triggered log rotation that never blocks the
+logging thread on compression or retention work. Sealed segments are named
+by time and handed to a background compressor (zstd when the ``zstandard``
+package is available, gzip otherwise), which also enforces retention by
+total bytes and optional age.
+
+Compliance:
+- NIST SP 800-53 (AU-4): Audit Log Storage Capacity
+- NIST SP 800-53 (AU-11): Audit Record Retention
+"""
+
+import gzip
+import logging
+import os
+import queue
+import shutil
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional, List, Union
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+_SEGMENT_TIME_FORMAT = "%Y%m%dT%H%M%S_%f"
+
+# Not the PQC logger: its handlers may be the ones whose segments failed
+logger = logging.getLogger(__name__)
+
+def _resolve_compression(compression: Optional[str]) -> Optional[str]:
+    """Resolve the requested compression to an available codec."""
+    if compression == "auto":
+        return "zstd" if zstandard is not None else "gzip"
+    if compression == "zstd" and zstandard is None:
+        return "gzip"
+    return compression
+
+class SegmentCompressor:
+    """
+    Background worker that compresses sealed log segments.
+
+    A single daemon thread serves every rotating handler in the process.
+    """
+
+    def __init__(self):
+        self._queue: "queue.Queue[tuple[CompressingRotatingFileHandler, Path]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self.segments_compressed = 0
+        self.segments_deleted = 0
+        self.errors = 0
+
+    def submit(self, handler: "CompressingRotatingFileHandler", segment: Path):
+        """
+        Queue a sealed segment for compression and retention.
+
+        Args:
+            handler: Handler that sealed the segment
+            segment: Path of the sealed, uncompressed segment
+        """
+        if self._thread is None or not self._thread.is_alive():
+            with self._start_lock:
+                if self._thread is None or not self._thread.is_alive():
+                    self._thread = threading.Thread(
+                        target=self._run, name="pqc-log-compressor", daemon=True
+                    )
+                    self._thread.start()
+        self._queue.put((handler, segment))
+
+    def wait_idle(self):
+        """Block until all queued segments have been processed."""
+        self._queue.join()
+
+    def _run(self):
+        """Worker loop."""
+        while True:
+            handler, segment = self._queue.get()
+            try:
+                if segment.exists():
+                    self._compress(segment, handler.compression)
+                self.segments_deleted += handler.enforce_retention()
+            except Exception:
+                self.errors += 1
+                logger.exception("Log segment compression or retention failed for %s", segment)
+            finally:
+                self._queue.task_done()
+
+    def _compress(self, segment: Path, compression: Optional[str]):
+        """Compress a segment next to itself and remove the original."""
+        if compression is None:
+            return
+
+        suffix = ".zst" if compression == "zstd" else ".gz"
+        target = segment.with_name(segment.name + suffix)
+        partial = segment.with_name(segment.name + suffix + ".partial")
+
+        with open(segment, "rb") as source:
+            if compression == "zstd":
+                with open(partial, "wb") as raw:
+                    zstandard.ZstdCompressor(level=3).copy_stream(source, raw)
+            else:
+                with gzip.open(partial, "wb", compresslevel=6) as destination:
+                    shutil.copyfileobj(source, destination, 1024 * 1024)
+
+        os.replace(partial, target)
+        os.unlink(segment)
+        self.segments_compressed += 1
+
+segment_compressor = SegmentCompressor()
+
+class CompressingRotatingFileHandler(logging.FileHandler):
+    """
+    Size-triggered rotating file handler with background compression.
+
+    Rotation on the logging thread is a single rename of the active file to
+    a time-stamped segment name; compression and retention happen on the
+    shared compressor thread.
+    """
+
+    def __init__(self, filename: Union[str, Path], max_bytes: int,
+                 max_total_bytes: Optional[int], compression: Optional[str] = "auto",
+                 retention_days: Optional[float] = None, encoding: str = "utf-8"):
+        """
+        Initialize rotating handler.
+
+        Args:
+            filename: Active log file path
+            max_bytes: Approximate size at which the active file is sealed
+            max_total_bytes: Byte budget for all sealed segments of this log
+                (None to keep segments until retention_days, whatever their size)
+            compression: "auto", "zstd", "gzip" or None
+            retention_days: Maximum segment age in days (None for no limit)
+            encoding: File encoding
+        """
+        super().__init__(filename, mode="a", encoding=encoding, delay=False)
+        self.max_bytes = max_bytes
+        self.max_total_bytes = max_total_bytes
+        self.compression = _resolve_compression(compression)
+        self.retention_seconds = retention_days * 86400 if retention_days else None
+        self.rollovers = 0
+
+        path = Path(self.baseFilename)
+        self._directory = path.parent
+        self._stem = path.stem
+        self._suffix = path.suffix
+        self._bytes_written = path.stat().st_size if path.exists() else 0
+
+        # A compressor that did not finish leaves a partial file next to the
+        # segment it was compressing; the segment itself is compressed again.
+        for partial in self._directory.glob(f"{self._stem}.*{self._suffix}*.partial"):
+            if partial.name.startswith(self._stem + "."):
+                try:
+                    partial.unlink()
+                except FileNotFoundError:
+                    continue
+
+        for segment in self._sealed_segments():
+            if not segment.name.endswith((".gz", ".zst")):
+                segment_compressor.submit(self, segment)
+
+    def _sealed_segments(self) -> List[Path]:
+        """List sealed segments of this log, oldest first."""
+        prefix = self._stem + "."
+        segments = [
+            entry for entry in self._directory.glob(f"{self._stem}.*{self._suffix}*")
+            if entry.name.startswith(prefix) and not entry.name.endswith(".partial")
+        ]
+        return sorted(segments, key=lambda entry: entry.name)
+
+    def _segment_path(self) -> Path:
+        """Build a unique time-stamped path for a sealed segment."""
+        stamp = datetime.now(timezone.utc).strftime(_SEGMENT_TIME_FORMAT)
+        candidate = self._directory / f"{self._stem}.{stamp}{self._suffix}"
+        counter = 1
+        while candidate.exists():
+            candidate = self._directory / f"{self._stem}.{stamp}-{counter}{self._suffix}"
+            counter += 1
+        return candidate
+
+    def do_rollover(self):
+        """Seal the active file and hand it to the background compressor."""
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+
+        segment = self._segment_path()
+        if os.path.exists(self.baseFilename):
+            os.rename(self.baseFilename, segment)
+            segment_compressor.submit(self, segment)
+
+        self.stream = self._open()
+        self._bytes_written = 0
+        self.rollovers += 1
+
+    def emit(self, record):
+        """
+        Emit a record, sealing the active file first if it is full.
+
+        Args:
+            record: LogRecord instance
+        """
+        try:
+            data = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            if self._bytes_written and self._bytes_written + len(data) > self.max_bytes:
+                self.do_rollover()
+            self.stream.write(data)
+            self.stream.flush()
+            self._bytes_written += len(data)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def enforce_retention(self) -> int:
+        """
+        Delete the oldest sealed segments beyond the byte budget or age.
+
+        Without a byte budget, only age is enforced. Runs on the compressor thread.
+
+        Returns:
+            Number of segments deleted
+        """
+        segments = []
+        for segment in self._sealed_segments():
+            try:
+                segments.append((segment, segment.stat()))
+            except FileNotFoundError:
+                continue
+
+        total_bytes = sum(stat.st_size for _, stat in segments)
+        cutoff = time.time() - self.retention_seconds if self.retention_seconds else None
+        deleted = 0
+
+        for segment, stat in segments:
+            expired = cutoff is not None and stat.st_mtime < cutoff
+            over_budget = self.max_total_bytes is not None and total_bytes > self.max_total_bytes
+            if not over_budget and not expired:
+                continue
+            try:
+                segment.unlink()
+                total_bytes -= stat.st_size
+                deleted += 1
+            except FileNotFoundError:
+                continue
+
+        return deleted
@@ -0,0 +1,200 @@
+"""
+PQC Log Sampling
+
+This module provides head sampling and per-operation rate caps for
+high-volume debug/info PQC log chatter (pool acquire/return, cache hits,
+rate-limit allows, batch submits). Suppressed events are accounted for in
+periodic summary records so audit trails stay complete.
+
+Compliance:
+- NIST SP 800-53 (AU-4): Audit Log Storage Capacity
+- NIST SP 800-53 (AU-12): Audit Generation
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, Any, Optional, List
+from dataclasses import dataclass, field
+
+@dataclass
+class SamplingRule:
+    """Sampling rule for a single ``pqc_operation`` key."""
+    sample_rate: float = 1.0  # Fraction of events kept by head sampling
+    max_per_second: Optional[float] = None  # Token bucket refill rate
+    burst: int = 10  # Token bucket capacity
+
+@dataclass
+class LogSamplingConfig:
+    """Central log sampling configuration."""
+    enabled: bool = True
+    default_rule: SamplingRule = field(default_factory=SamplingRule)
+    rules: Dict[str, SamplingRule] = field(default_factory=dict)
+    summary_interval: float = 10.0  # seconds
+    max_level: int = logging.INFO  # Records above this level are never sampled
+
+    def rule_for(self, operation: Optional[str]) -> SamplingRule:
+        """Get the sampling rule for an operation."""
+        if operation is None:
+            return self.default_rule
+        return self.rules.get(operation, self.default_rule)
+
+DEFAULT_SAMPLING_RULES: Dict[str, SamplingRule] = {
+    "connection_acquire": SamplingRule(sample_rate=0.01, max_per_second=5.0),
+    "connection_return": SamplingRule(sample_rate=0.01, max_per_second=5.0),
+    "cache_hit": SamplingRule(sample_rate=0.01, max_per_second=5.0),
+    "cache_set": SamplingRule(sample_rate=0.05, max_per_second=5.0),
+    "cache_evict": SamplingRule(sample_rate=0.05, max_per_second=5.0),
+    "rate_limit_allow": SamplingRule(sample_rate=0.01, max_per_second=5.0),
+    "batch_submit": SamplingRule(sample_rate=0.01, max_per_second=5.0),
+}
+
+def default_sampling_config() -> LogSamplingConfig:
+    """Build the default sampling configuration for PQC chatter."""
+    return LogSamplingConfig(rules=dict(DEFAULT_SAMPLING_RULES))
+
+@dataclass
+class _SamplingState:
+    """Per-key sampling state."""
+    credit: float = 0.0
+    tokens: float = 0.0
+    last_refill: float = 0.0
+    suppressed: int = 0
+    window_start: float = 0.0
+
+@dataclass
+class SamplingDecision:
+    """Outcome of a sampling check."""
+    emit: bool
+    summary: Optional[Dict[str, Any]] = None
+
+_EMIT = SamplingDecision(True)
+_DROP = SamplingDecision(False)
+
+class PQCLogSampler:
+    """
+    Head sampler with per-operation token-bucket caps.
+
+    Head sampling is deterministic: each key accumulates ``sample_rate``
+    credit per event and emits whenever a full credit is available, so a
+    rate of 0.01 keeps exactly one event in a hundred, starting with the
+    first. Events passing head sampling must then take a token from the
+    key's bucket.
+    """
+
+    def __init__(self, config: Optional[LogSamplingConfig] = None):
+        """
+        Initialize log sampler.
+
+        Args:
+            config: Sampling configuration (defaults if None)
+        """
+        self.config = config or default_sampling_config()
+        self._states: Dict[str, _SamplingState] = {}
+        self._lock = threading.Lock()
+        self._stats = {"events_emitted": 0, "events_suppressed": 0, "summaries_emitted": 0}
+
+    def _summary(self, operation: str, state: _SamplingState, now: float) -> Optional[Dict[str, Any]]:
+        """Produce and reset a pending suppression summary for a key."""
+        if state.suppressed == 0:
+            state.window_start = now
+            return None
+
+        summary = {
+            "sampled_operation": operation,
+            "suppressed_count": state.suppressed,
+            "window_seconds": now - state.window_start,
+        }
+        state.suppressed = 0
+        state.window_start = now
+        self._stats["summaries_emitted"] += 1
+        return summary
+
+    def check(self, levelno: int, operation: Optional[str]) -> SamplingDecision:
+        """
+        Decide whether a record should be emitted.
+
+        Args:
+            levelno: Numeric log level of the record
+            operation: ``pqc_operation`` key of the record
+
+        Returns:
+            SamplingDecision with an optional summary to emit first
+        """
+        if not self.config.enabled or levelno > self.config.max_level or operation is None:
+            return _EMIT
+
+        rule = self.config.rule_for(operation)
+        if rule.sample_rate >= 1.0 and rule.max_per_second is None:
+            return _EMIT
+
+        now = time.monotonic()
+
+        with self._lock:
+            state = self._states.get(operation)
+            if state is None:
+                state = _SamplingState(
+                    credit=1.0, tokens=float(rule.burst),
+                    last_refill=now, window_start=now
+                )
+                self._states[operation] = state
+
+            emit = True
+            if rule.sample_rate < 1.0:
+                if state.credit >= 1.0:
+                    state.credit -= 1.0
+                else:
+                    emit = False
+                state.credit += rule.sample_rate
+
+            if emit and rule.max_per_second is not None:
+                state.tokens = min(
+                    float(rule.burst),
+                    state.tokens + (now - state.last_refill) * rule.max_per_second
+                )
+                state.last_refill = now
+                if state.tokens >= 1.0:
+                    state.tokens -= 1.0
+                else:
+                    emit = False
+
+            if not emit:
+                state.suppressed += 1
+                self._stats["events_suppressed"] += 1
+                if now - state.window_start < self.config.summary_interval:
+                    return _DROP
+                return SamplingDecision(False, self._summary(operation, state, now))
+
+            self._stats["events_emitted"] += 1
+            if now - state.window_start < self.config.summary_interval:
+                return _EMIT
+            return SamplingDecision(True, self._summary(operation, state, now))
+
+    def drain_summaries(self, due_only: bool = False) -> List[Dict[str, Any]]:
+        """
+        Collect pending suppression summaries for all keys.
+
+        Args:
+            due_only: Only collect summaries whose interval has elapsed
+
+        Returns:
+            List of summary dictionaries
+        """
+        now = time.monotonic()
+        due_before = now - self.config.summary_interval if due_only else now
+        with self._lock:
+            summaries = [
+                self._summary(operation, state, now)
+                for operation, state in self._states.items()
+                if state.suppressed and state.window_start <= due_before
+            ]
+        return summaries
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get sampling statistics."""
+        with self._lock:
+            return {
+                "enabled": self.config.enabled,
+                "tracked_operations": len(self._states),
+                "stats": dict(self._stats)
+            }
@@ -10,15 +10,21 @@ Compliance:
 - ISO/IEC 27701 (7.5.2): Privacy Controls
 """
 
+import bisect
 import time
 import threading
 import statistics
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, Iterable, List, Optional, Sequence, Tuple, Union
 from contextlib import contextmanager
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from datetime import datetime, timedelta
 from .pqc_logger import pqc_logger
 
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
 @dataclass
 class OperationMetric:
     """Individual operation metric data."""
@@ -50,21 +56,66 @@ class AggregatedMetrics:
     operations_per_second: float
     last_updated: datetime
 
+DEFAULT_LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+@dataclass
+class HistogramSeries:
+    """Bucketed observations for one histogram series."""
+    buckets: Tuple[float, ...]
+    counts: List[int] = field(default_factory=list)  # per bucket, last one unbounded
+    total: float = 0.0
+    count: int = 0
+    
+    def __post_init__(self):
+        if not self.counts:
+            self.counts = [0] * (len(self.buckets) + 1)
+    
+    def observe(self, value: float):
+        """Add one observation."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+    
+    def cumulative_counts(self) -> List[int]:
+        """Observations at or below each bucket bound, ending with the total."""
+        cumulative, running = [], 0
+        for bucket_count in self.counts:
+            running += bucket_count
+            cumulative.append(running)
+        return cumulative
+    
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-quantile, or None if empty."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        for bound, cumulative in zip(self.buckets + (float("inf"),), self.cumulative_counts()):
+            if cumulative >= rank:
+                return bound
+        return float("inf")
+
 class PQCPerformanceMonitor:
     """Performance monitoring for PQC operations with comprehensive metrics collection."""
     
-    def __init__(self, max_metrics: int = 10000):
+    def __init__(self, max_metrics: int = 10000, introspection_interval: int = 100):
         """
         Initialize performance monitor.
         
         Args:
             max_metrics: Maximum number of metrics to store in memory
+            introspection_interval: Monitored operations per sample of
+                process memory and CPU usage and of success rate thresholds
         """
         self.metrics: Dict[str, List[OperationMetric]] = {}
         self.aggregated_metrics: Dict[str, AggregatedMetrics] = {}
+        self.gauges: Dict[str, Dict[Tuple[Tuple[str, str], ...], float]] = {}
+        self.histograms: Dict[str, Dict[Tuple[Tuple[str, str], ...], HistogramSeries]] = {}
         self.max_metrics = max_metrics
+        self.introspection_interval = max(1, introspection_interval)
         self.lock = threading.RLock()
         self.start_time = time.time()
+        self._operation_count = 0
+        self._stale_operations = set()
         
         self.thresholds = {
             'key_generation': {'max_duration_ms': 1000, 'min_success_rate': 0.95},
@@ -90,8 +141,9 @@ class PQCPerformanceMonitor:
             OperationContext with timing and resource tracking
         """
         start_time = time.time()
-        start_memory = self._get_memory_usage()
-        start_cpu = self._get_cpu_usage()
+        self._operation_count += 1
+        introspect = self._operation_count % self.introspection_interval == 0
+        start_memory = self._get_memory_usage() if introspect else None
         
         success = False
         error_message = None
@@ -127,8 +179,8 @@ class PQCPerformanceMonitor:
             end_time = time.time()
             duration_ms = (end_time - start_time) * 1000
             
-            end_memory = self._get_memory_usage()
-            end_cpu = self._get_cpu_usage()
+            end_memory = self._get_memory_usage() if introspect else None
+            end_cpu = self._get_cpu_usage(interval=None) if introspect else None
             
             memory_usage_mb = end_memory - start_memory if start_memory and end_memory else None
             cpu_usage_percent = end_cpu if end_cpu else None
@@ -167,10 +219,10 @@ class PQCPerformanceMonitor:
                 }
             )
             
-            self._check_thresholds(operation, duration_ms, success)
+            self._check_thresholds(operation, duration_ms, success, introspect)
     
     def _store_metric(self, metric: OperationMetric):
-        """Store metric and update aggregated statistics."""
+        """Store metric; aggregated statistics are recomputed when next read."""
         with self.lock:
             if metric.operation not in self.metrics:
                 self.metrics[metric.operation] = []
@@ -180,7 +232,14 @@ class PQCPerformanceMonitor:
             if len(self.metrics[metric.operation]) > self.max_metrics:
                 self.metrics[metric.operation] = self.metrics[metric.operation][-self.max_metrics:]
             
-            self._update_aggregated_metrics(metric.operation)
+            self._stale_operations.add(metric.operation)
+    
+    def _refresh_aggregated_metrics(self):
+        """Recompute aggregated statistics for operations recorded since the last read."""
+        with self.lock:
+            for operation in self._stale_operations:
+                self._update_aggregated_metrics(operation)
+            self._stale_operations.clear()
     
     def _update_aggregated_metrics(self, operation: str):
         """Update aggregated metrics for an operation."""
@@ -240,7 +299,8 @@ class PQCPerformanceMonitor:
         
         return data[f] * (1 - c) + data[f + 1] * c
     
-    def _check_thresholds(self, operation: str, duration_ms: float, success: bool):
+    def _check_thresholds(self, operation: str, duration_ms: float, success: bool,
+                          check_success_rate: bool = True):
         """Check if operation meets performance thresholds."""
         thresholds = self.thresholds.get(operation, {})
         
@@ -256,7 +316,8 @@ class PQCPerformanceMonitor:
             )
         
         min_success_rate = thresholds.get('min_success_rate')
-        if min_success_rate:
+        if min_success_rate and check_success_rate:
+            self._refresh_aggregated_metrics()
             aggregated = self.aggregated_metrics.get(operation)
             if aggregated and aggregated.success_rate < min_success_rate:
                 pqc_logger.log_security_event(
@@ -270,20 +331,15 @@ class PQCPerformanceMonitor:
     
     def _get_memory_usage(self) -> Optional[float]:
         """Get current memory usage in MB."""
-        try:
-            import psutil
-            process = psutil.Process()
-            return process.memory_info().rss / 1024 / 1024  # Convert to MB
-        except ImportError:
+        if psutil is None:
             return None
+        return psutil.Process().memory_info().rss / 1024 / 1024  # Convert to MB
     
-    def _get_cpu_usage(self) -> Optional[float]:
-        """Get current CPU usage percentage."""
-        try:
-            import psutil
-            return psutil.cpu_percent(interval=0.1)
-        except ImportError:
+    def _get_cpu_usage(self, interval: Optional[float] = 0.1) -> Optional[float]:
+        """Get current CPU usage percentage (since the previous call if interval is None)."""
+        if psutil is None:
             return None
+        return psutil.cpu_percent(interval=interval)
     
     def get_metrics(self, operation: Optional[str] = None, 
                    since: Optional[datetime] = None) -> Dict[str, List[Dict[str, Any]]]:
@@ -324,11 +380,104 @@ class PQCPerformanceMonitor:
             Dictionary of aggregated metrics
         """
         with self.lock:
+            self._refresh_aggregated_metrics()
             if operation:
                 return {operation: asdict(self.aggregated_metrics[operation])} if operation in self.aggregated_metrics else {}
             
             return {op: asdict(metrics) for op, metrics in self.aggregated_metrics.items()}
     
+    def record_gauge(self, name: str, value: float, **labels: str):
+        """
+        Set the current value of a gauge metric.
+        
+        Args:
+            name: Gauge name
+            value: Current value
+            **labels: Labels identifying the series
+        """
+        series = tuple(sorted((key, str(label)) for key, label in labels.items()))
+        with self.lock:
+            self.gauges.setdefault(name, {})[series] = value
+    
+    def get_gauges(self, name: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get current gauge values.
+        
+        Args:
+            name: Filter by gauge name
+            
+        Returns:
+            Dictionary of gauge series by name
+        """
+        with self.lock:
+            names = [name] if name else list(self.gauges)
+            return {
+                gauge: [
+                    {"labels": dict(series), "value": value}
+                    for series, value in self.gauges[gauge].items()
+                ]
+                for gauge in names if gauge in self.gauges
+            }
+    
+    def observe_histogram(self, name: str, value: float,
+                          buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS, **labels: str):
+        """
+        Record an observation in a histogram metric.
+        
+        Args:
+            name: Histogram name
+            value: Observed value
+            buckets: Upper bucket bounds, used when the series is first seen
+            **labels: Labels identifying the series
+        """
+        self.observe_histogram_values(name, (value,), buckets, **labels)
+    
+    def observe_histogram_values(self, name: str, values: Iterable[float],
+                                 buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS, **labels: str):
+        """
+        Record several observations in one histogram series.
+        
+        Args:
+            name: Histogram name
+            values: Observed values
+            buckets: Upper bucket bounds, used when the series is first seen
+            **labels: Labels identifying the series
+        """
+        series = tuple(sorted((key, str(label)) for key, label in labels.items()))
+        with self.lock:
+            histogram = self.histograms.setdefault(name, {}).get(series)
+            if histogram is None:
+                histogram = self.histograms[name][series] = HistogramSeries(tuple(sorted(buckets)))
+            for value in values:
+                histogram.observe(value)
+    
+    def get_histograms(self, name: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get histogram snapshots.
+        
+        Args:
+            name: Filter by histogram name
+            
+        Returns:
+            Dictionary of histogram series by name, with cumulative bucket counts
+        """
+        with self.lock:
+            names = [name] if name else list(self.histograms)
+            return {
+                histogram: [
+                    {
+                        "labels": dict(series),
+                        "buckets": dict(zip(values.buckets + (float("inf"),), values.cumulative_counts())),
+                        "sum": values.total,
+                        "count": values.count,
+                        "p50": values.quantile(0.5),
+                        "p99": values.quantile(0.99)
+                    }
+                    for series, values in self.histograms[histogram].items()
+                ]
+                for histogram in names if histogram in self.histograms
+            }
+    
     def get_performance_report(self) -> Dict[str, Any]:
         """
         Generate comprehensive performance report.
@@ -345,6 +494,8 @@ class PQCPerformanceMonitor:
                 'total_operations': sum(len(metrics) for metrics in self.metrics.values()),
                 'operations_summary': {},
                 'aggregated_metrics': self.get_aggregated_metrics(),
+                'gauges': self.get_gauges(),
+                'histograms': self.get_histograms(),
                 'system_info': {
                     'memory_usage_mb': self._get_memory_usage(),
                     'cpu_usage_percent': self._get_cpu_usage()
@@ -374,9 +525,13 @@ class PQCPerformanceMonitor:
             if operation:
                 self.metrics.pop(operation, None)
                 self.aggregated_metrics.pop(operation, None)
+                self._stale_operations.discard(operation)
             else:
                 self.metrics.clear()
                 self.aggregated_metrics.clear()
+                self._stale_operations.clear()
+                self.gauges.clear()
+                self.histograms.clear()
                 self.start_time = time.time()
             
             pqc_logger.log_pqc_operation(
@@ -409,6 +564,7 @@ class PQCPerformanceMonitor:
         """Export metrics in Prometheus format."""
         lines = []
         
+        self._refresh_aggregated_metrics()
         for operation, aggregated in self.aggregated_metrics.items():
             lines.append(f'pqc_operation_duration_ms{{operation="{operation}"}} {aggregated.avg_duration_ms}')
             lines.append(f'pqc_operation_duration_p95_ms{{operation="{operation}"}} {aggregated.p95_duration_ms}')
@@ -421,6 +577,21 @@ class PQCPerformanceMonitor:
             lines.append(f'pqc_operation_success_rate{{operation="{operation}"}} {aggregated.success_rate}')
             lines.append(f'pqc_operation_rate_per_second{{operation="{operation}"}} {aggregated.operations_per_second}')
         
+        with self.lock:
+            for name, series_values in self.gauges.items():
+                for series, value in series_values.items():
+                    labels = ",".join(f'{key}="{label}"' for key, label in series)
+                    lines.append(f'pqc_{name}{{{labels}}} {value}')
+            
+            for name, series_values in self.histograms.items():
+                for series, histogram in series_values.items():
+                    labels = "".join(f'{key}="{label}",' for key, label in series)
+                    bounds = [str(bound) for bound in histogram.buckets] + ["+Inf"]
+                    for bound, cumulative in zip(bounds, histogram.cumulative_counts()):
+                        lines.append(f'pqc_{name}_bucket{{{labels}le="{bound}"}} {cumulative}')
+                    lines.append(f'pqc_{name}_sum{{{labels.rstrip(",")}}} {histogram.total}')
+                    lines.append(f'pqc_{name}_count{{{labels.rstrip(",")}}} {histogram.count}')
+        
         return '\n'.join(lines)
     
     def _export_csv_format(self) -> str:
@@ -11,14 +11,23 @@ Compliance:
 """
 
 import logging
-import logging.handlers
 import json
 import sys
 import os
+import threading
+import time
 from datetime import datetime
 from typing import Dict, Any, Optional
 from pathlib import Path
 
+from .redaction import (
+    PQCRedactionEngine,
+    DEFAULT_SENSITIVE_PATTERNS,
+    get_redaction_engine
+)
+from .log_sampling import PQCLogSampler, LogSamplingConfig
+from .log_rotation import CompressingRotatingFileHandler, segment_compressor
+
 class PQCLogFormatter(logging.Formatter):
     """Custom formatter for PQC operations with structured JSON output."""
     
@@ -79,14 +88,21 @@ class PQCLogFormatter(logging.Formatter):
 class PQCSecurityFilter(logging.Filter):
     """Filter to prevent logging of sensitive cryptographic material."""
     
-    SENSITIVE_PATTERNS = [
-        'private_key', 'secret_key', 'shared_secret',
-        'password', 'token', 'signature', 'ciphertext'
-    ]
+    SENSITIVE_PATTERNS = list(DEFAULT_SENSITIVE_PATTERNS)
+    
+    def __init__(self, engine: Optional[PQCRedactionEngine] = None):
+        """
+        Initialize security filter.
+        
+        Args:
+            engine: Redaction engine to use (shared default if None)
+        """
+        super().__init__()
+        self.engine = engine or get_redaction_engine()
     
     def filter(self, record):
         """
-        Filter out sensitive information from log records.
+        Redact sensitive information from log records.
         
         Args:
             record: LogRecord instance
@@ -94,33 +110,27 @@ class PQCSecurityFilter(logging.Filter):
         Returns:
             True if record should be logged, False otherwise
         """
-        message = record.getMessage().lower()
-        
-        for pattern in self.SENSITIVE_PATTERNS:
-            if pattern in message:
-                if record.args and len(record.args) > 0:
-                    try:
-                        first_arg = str(record.args[0]) if record.args[0] is not None else ''
-                        record.msg = str(record.msg).replace(first_arg, '[REDACTED]')
-                    except (IndexError, TypeError):
-                        pass
-                break
-        
+        self.engine.redact_record(record)
         return True
 
 class PQCLogger:
     """Centralized logging for PQC operations with security and compliance features."""
     
-    def __init__(self, name: str = "pqc", log_level: str = "INFO"):
+    def __init__(self, name: str = "pqc", log_level: str = "INFO",
+                 sampling_config: Optional[LogSamplingConfig] = None):
         """
         Initialize PQC logger.
         
         Args:
             name: Logger name
             log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+            sampling_config: Log sampling configuration (defaults if None)
         """
         self.logger = logging.getLogger(name)
         self.logger.setLevel(getattr(logging, log_level.upper()))
+        self.sampler = PQCLogSampler(sampling_config)
+        self._summary_timer: Optional[threading.Thread] = None
+        self._summary_timer_lock = threading.Lock()
         
         if not self.logger.handlers:
             self._setup_handlers()
@@ -142,19 +152,22 @@ class PQCLogger:
         log_dir = Path("/tmp/pqc_logs")
         log_dir.mkdir(exist_ok=True)
         
-        operations_handler = logging.handlers.RotatingFileHandler(
+        operations_handler = CompressingRotatingFileHandler(
             log_dir / "pqc_operations.log",
-            maxBytes=10*1024*1024,  # 10MB
-            backupCount=5
+            max_bytes=10*1024*1024,  # 10MB
+            max_total_bytes=60*1024*1024  # 60MB of compressed segments
         )
         operations_handler.setLevel(logging.DEBUG)
         operations_handler.setFormatter(PQCLogFormatter())
         self.logger.addHandler(operations_handler)
         
-        security_handler = logging.handlers.RotatingFileHandler(
+        # Security events are audit records (AU-11): they are kept for the full
+        # retention period rather than dropped to fit a byte budget.
+        security_handler = CompressingRotatingFileHandler(
             log_dir / "pqc_security.log",
-            maxBytes=5*1024*1024,  # 5MB
-            backupCount=10
+            max_bytes=5*1024*1024,  # 5MB
+            max_total_bytes=None,  # No byte budget: retention_days governs
+            retention_days=7*365
         )
         security_handler.setLevel(logging.WARNING)
         security_handler.setFormatter(PQCLogFormatter())
@@ -166,10 +179,10 @@ class PQCLogger:
         security_handler.addFilter(SecurityEventFilter())
         self.logger.addHandler(security_handler)
         
-        performance_handler = logging.handlers.RotatingFileHandler(
+        performance_handler = CompressingRotatingFileHandler(
             log_dir / "pqc_performance.log",
-            maxBytes=20*1024*1024,  # 20MB
-            backupCount=3
+            max_bytes=20*1024*1024,  # 20MB
+            max_total_bytes=80*1024*1024  # 80MB of compressed segments
         )
         performance_handler.setLevel(logging.DEBUG)
         performance_handler.setFormatter(PQCLogFormatter())
@@ -181,15 +194,74 @@ class PQCLogger:
         performance_handler.addFilter(PerformanceEventFilter())
         self.logger.addHandler(performance_handler)
     
+    def configure_sampling(self, config: LogSamplingConfig):
+        """
+        Replace the log sampling configuration.
+        
+        Args:
+            config: New sampling configuration
+        """
+        self.flush_sampling_summaries()
+        self.sampler = PQCLogSampler(config)
+    
+    def _log_sampling_summary(self, summary: Dict[str, Any]):
+        """Emit a summary record for suppressed events."""
+        self.logger.info(
+            f"{summary['suppressed_count']} similar {summary['sampled_operation']} events "
+            f"suppressed in the last {summary['window_seconds']:.1f}s",
+            extra={"pqc_operation": "log_sampling_summary", **summary}
+        )
+    
+    def flush_sampling_summaries(self):
+        """Emit summaries for all events suppressed so far."""
+        for summary in self.sampler.drain_summaries():
+            self._log_sampling_summary(summary)
+    
+    def _start_summary_timer(self):
+        """Start the summary timer thread, once events are first suppressed."""
+        with self._summary_timer_lock:
+            if self._summary_timer is None:
+                self._summary_timer = threading.Thread(
+                    target=self._run_summary_timer, name="pqc-log-sampling-summaries", daemon=True
+                )
+                self._summary_timer.start()
+    
+    def _run_summary_timer(self):
+        """
+        Emit summaries as they fall due.
+        
+        Otherwise a summary waits for the next event of its operation, which
+        may never come once a burst has ended.
+        """
+        while True:
+            time.sleep(self.sampler.config.summary_interval / 2)
+            for summary in self.sampler.drain_summaries(due_only=True):
+                self._log_sampling_summary(summary)
+    
     def log_pqc_operation(self, level: str, message: str, **kwargs):
         """
         Log PQC operation with structured context.
         
+        Debug/info records are passed through the log sampler keyed by
+        ``pqc_operation`` before any record is created or formatted.
+        
         Args:
             level: Log level (debug, info, warning, error, critical)
             message: Log message
             **kwargs: Additional context (pqc_operation, user_id, algorithm, etc.)
         """
+        levelno = logging.getLevelName(level.upper())
+        if not self.logger.isEnabledFor(levelno):
+            return
+        
+        decision = self.sampler.check(levelno, kwargs.get('pqc_operation'))
+        if decision.summary is not None:
+            self._log_sampling_summary(decision.summary)
+        if not decision.emit:
+            if self._summary_timer is None:
+                self._start_summary_timer()
+            return
+        
         log_method = getattr(self.logger, level.lower())
         log_method(message, extra=kwargs)
     
@@ -330,6 +402,13 @@ class PQCLogger:
                 })
                 stats["total_size_bytes"] += file_stats.st_size
         
+        stats["sampling"] = self.sampler.get_stats()
+        stats["compression"] = {
+            "segments_compressed": segment_compressor.segments_compressed,
+            "segments_deleted": segment_compressor.segments_deleted,
+            "errors": segment_compressor.errors
+        }
+        
         return stats
 
 pqc_logger = PQCLogger()
@@ -0,0 +1,242 @@
+"""
+PQC Log Redaction Engine
+
+This module provides a precompiled, single-pass redaction engine that strips
+sensitive cryptographic material from log records before they are formatted.
+It covers the rendered message (including values embedded via f-strings),
+structured ``extra`` fields, and long byte / integer-list blobs.
+
+Compliance:
+- NIST SP 800-53 (AU-9): Protection of Audit Information
+- NIST SP 800-53 (SC-12): Cryptographic Key Establishment and Management
+- ISO/IEC 27701 (7.5.2): Privacy Controls
+"""
+
+import logging
+import re
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+REDACTED = '[REDACTED]'
+
+DEFAULT_SENSITIVE_PATTERNS: Tuple[str, ...] = (
+    'private_key', 'secret_key', 'shared_secret',
+    'password', 'token', 'signature', 'ciphertext'
+)
+
+_STANDARD_RECORD_ATTRS = frozenset(
+    logging.LogRecord('', logging.INFO, '', 0, '', None, None).__dict__
+) | {'message', 'asctime'}
+
+_SCALAR_TYPES = frozenset((bool, int, float))
+
+_SAFE_KEY_SUFFIXES = ('_hash', '_size', '_len', '_length', '_count', '_bytes', '_remaining')
+
+# Labels under which a hex run is a digest rather than key material
+_DIGEST_MARKERS = r'sha[-_]?\d+|sha3[-_]\d+|blake2[bs]?|hash|digest|fingerprint|checksum'
+
+# A whole str or bytes repr, with backslash escapes, in either quote style
+_QUOTED = r'b?"(?:[^"\\]|\\.)*"|b?\'(?:[^\'\\]|\\.)*\''
+
+# HTTP auth schemes that precede a credential in header-style values
+_AUTH_SCHEMES = r'bearer|basic|digest|negotiate|token|dpop'
+
+class PQCRedactionEngine:
+    """
+    Single-pass redaction of secrets in log records.
+
+    All sensitive markers and blob shapes are folded into one compiled
+    alternation, so a flagged record is rewritten in a single pass. Text
+    that fails the cheap marker pre-screen skips that scan entirely and is
+    never copied.
+    """
+
+    def __init__(self, patterns: Iterable[str] = DEFAULT_SENSITIVE_PATTERNS,
+                 min_blob_items: int = 16, max_depth: int = 3):
+        """
+        Initialize the redaction engine.
+
+        Args:
+            patterns: Sensitive field names (matched case-insensitively)
+            min_blob_items: Minimum length of a byte/int-list blob to redact
+            max_depth: Maximum nesting depth scanned in structured extras
+        """
+        self.patterns = tuple(patterns)
+        self.min_blob_items = min_blob_items
+        self.max_depth = max_depth
+        self._sensitive_keys: Dict[str, bool] = {}
+
+        keywords = '|'.join(
+            re.escape(p.lower()) for p in sorted(self.patterns, key=len, reverse=True)
+        )
+        hex_len = min_blob_items * 2
+        self._key_regex = re.compile(keywords)
+        self._marker_regex = re.compile(keywords + r'|\[\s*\d|b[\'"]')
+        self._hex_regex = re.compile(r'[0-9a-fA-F]{%d}' % hex_len)
+        self._regex = re.compile(
+            r'(?P<assign>(?P<key>(?:' + keywords + r')\w*)[\'"]?\s*[:=]\s*)'
+            r'(?P<value>' + _QUOTED + r'|\[[^\[\]]*\]|\([^()]*\)'
+            r'|(?:(?:' + _AUTH_SCHEMES + r')\s+)?[^\s,;)\]}]+)'
+            r'|(?P<digest>(?:' + _DIGEST_MARKERS + r')\w*[\'"]?\s*[:=]\s*[\'"]?[0-9a-fA-F]{%d,}\b)'
+            r'|(?P<intlist>\[(?:\s*\d{1,3}\s*,){%d,}\s*\d{1,3}\s*,?\s*\])'
+            r'|(?P<bytes>b"(?:[^"\\]|\\.){%d,}"|b\'(?:[^\'\\]|\\.){%d,}\')'
+            r'|(?P<hex>\b[0-9a-fA-F]{%d,}\b)'
+            % (hex_len, min_blob_items - 1, min_blob_items, min_blob_items, hex_len),
+            re.IGNORECASE
+        )
+
+    def has_marker(self, text: str) -> bool:
+        """
+        Cheap pre-screen for text that may need redaction.
+
+        Args:
+            text: Text to check
+
+        Returns:
+            True if the text contains a sensitive keyword or blob marker
+        """
+        return (self._marker_regex.search(text.lower()) is not None
+                or self._hex_regex.search(text) is not None)
+
+    def _replace(self, match: 're.Match') -> Optional[str]:
+        """Build the replacement text for a single match, or None to keep it."""
+        if match.group('assign') is not None:
+            if match.group('key').lower().endswith(_SAFE_KEY_SUFFIXES):
+                return None
+            return match.group('assign') + REDACTED
+        if match.group('digest') is not None:
+            return None
+        if match.group('intlist') is not None:
+            return f"[REDACTED {match.group('intlist').count(',') + 1} items]"
+        return REDACTED
+
+    def redact_text(self, text: str) -> Tuple[str, int]:
+        """
+        Redact sensitive assignments and blobs from text.
+
+        Assignments to sizes, counts and hashes (``signature_size=3309``) and
+        hex runs labelled as digests (``sha256=...``) are left as they are.
+
+        Args:
+            text: Text to redact
+
+        Returns:
+            Tuple of (redacted text, number of redactions)
+        """
+        if not self.has_marker(text):
+            return text, 0
+
+        redactions = 0
+
+        def replace(match: 're.Match') -> str:
+            nonlocal redactions
+            replacement = self._replace(match)
+            if replacement is None:
+                return match.group(0)
+            redactions += 1
+            return replacement
+
+        redacted = self._regex.sub(replace, text)
+        return (redacted, redactions) if redactions else (text, 0)
+
+    def _is_sensitive_key(self, key: str) -> bool:
+        """Check whether a structured field name denotes secret material."""
+        sensitive = self._sensitive_keys.get(key)
+        if sensitive is None:
+            sensitive = (self._key_regex.search(key.lower()) is not None
+                         and not key.endswith(_SAFE_KEY_SUFFIXES))
+            if len(self._sensitive_keys) < 4096:
+                self._sensitive_keys[key] = sensitive
+        return sensitive
+
+    def _is_blob(self, value: Any) -> bool:
+        """Check whether a value is a long byte buffer or int list."""
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return len(value) >= self.min_blob_items
+        if isinstance(value, (list, tuple)) and len(value) >= self.min_blob_items:
+            return isinstance(value[0], int) and isinstance(value[-1], int)
+        return False
+
+    def redact_value(self, key: str, value: Any, depth: int = 0) -> Any:
+        """
+        Redact a structured value, returning the original object if clean.
+
+        Args:
+            key: Field name the value is stored under
+            value: Field value
+            depth: Current nesting depth
+
+        Returns:
+            The value, or a redacted copy
+        """
+        if value is None or isinstance(value, (bool, int, float)):
+            return value
+        if self._is_sensitive_key(key):
+            return REDACTED
+        if self._is_blob(value):
+            return f"[REDACTED {len(value)} items]"
+        if isinstance(value, str):
+            if len(value) < self.min_blob_items:
+                return value
+            redacted, count = self.redact_text(value)
+            return redacted if count else value
+        if depth < self.max_depth and isinstance(value, dict):
+            redacted_dict = None
+            for item_key, item_value in value.items():
+                new_value = self.redact_value(str(item_key), item_value, depth + 1)
+                if new_value is not item_value:
+                    if redacted_dict is None:
+                        redacted_dict = dict(value)
+                    redacted_dict[item_key] = new_value
+            return value if redacted_dict is None else redacted_dict
+        return value
+
+    def redact_record(self, record: logging.LogRecord) -> int:
+        """
+        Redact a log record in place.
+
+        The message is rendered once and, if it changed, stored back into
+        ``record.msg`` with ``record.args`` cleared so handlers format the
+        redacted text. Non-standard attributes (``extra`` fields) are
+        redacted individually.
+
+        Args:
+            record: LogRecord instance
+
+        Returns:
+            Number of redactions applied
+        """
+        redactions = 0
+
+        message = record.getMessage()
+        if len(message) >= self.min_blob_items:
+            redacted, count = self.redact_text(message)
+            if count:
+                record.msg = redacted
+                record.args = None
+                redactions += count
+
+        record_dict = record.__dict__
+        for key in record_dict.keys() - _STANDARD_RECORD_ATTRS:
+            value = record_dict[key]
+            if value is None or type(value) in _SCALAR_TYPES:
+                continue
+            if type(value) is str and len(value) < self.min_blob_items:
+                if not self._is_sensitive_key(key):
+                    continue
+            new_value = self.redact_value(key, value)
+            if new_value is not value:
+                record_dict[key] = new_value
+                redactions += 1
+
+        return redactions
+
+_default_engine: Optional[PQCRedactionEngine] = None
+
+def get_redaction_engine() -> PQCRedactionEngine:
+    """Get or create the shared redaction engine."""
+    global _default_engine
+
+    if _default_engine is None:
+        _default_engine = PQCRedactionEngine()
+
+    return _default_engine
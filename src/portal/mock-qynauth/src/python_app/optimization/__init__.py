@@ -8,28 +8,60 @@ and batch processing.
 Modules:
 - connection_pool: Connection pooling and resource management
 - cache_manager: Intelligent caching for PQC operations
+- cache_store: Memory-mapped L2 store for the PQC cache
 - rate_limiter: Rate limiting and throttling utilities
+- rate_limit_store: Shared memory rate limit state for multi-worker hosts
+- shared_segments: Shared memory segments that outlive the creating worker
 - batch_processor: Batch processing for bulk operations
+- executor_backend: Thread and process pool executors for PQC work
+- deadline: Request deadlines propagated through the async PQC stack
+- concurrency_limiter: Adaptive limit on PQC operations in flight
+- native_async: Native completion queue awaited from the event loop
+- key_store: PQC keys stored compactly as bytes
 
 Compliance:
 - NIST SP 800-53 (SC-13): Cryptographic Protection
 - NIST SP 800-53 (AU-3): Audit and Accountability
 """
 
-from .connection_pool import PQCConnectionPool, pqc_pool
-from .cache_manager import PQCCacheManager, pqc_cache
-from .rate_limiter import rate_limit, PQCRateLimiter
+from .connection_pool import ConnectionResources, PQCConnectionPool, pqc_pool
+from .cache_manager import PQCCacheManager, pqc_cache, pqc_cached
+from .cache_store import L2CacheStore
+from .rate_limiter import rate_limit, PQCRateLimiter, RateLimitBackend, QuotaLevel
+from .rate_limit_store import SharedRateLimitTable
 from .batch_processor import batch_process, PQCBatchProcessor
+from .executor_backend import ExecutorBackend, PQCExecutor
+from .deadline import Deadline, DeadlineExceeded
+from .concurrency_limiter import AdaptiveConcurrencyLimiter, ConcurrencyLimitExceeded, LimitAlgorithm
+from .native_async import NativeAsyncQueue, open_native_queue
+from .key_store import PQCKeyStore, StoredKey
 
 __all__ = [
+    'ConnectionResources',
     'PQCConnectionPool',
     'pqc_pool',
     'PQCCacheManager', 
     'pqc_cache',
+    'pqc_cached',
+    'L2CacheStore',
     'rate_limit',
     'PQCRateLimiter',
+    'RateLimitBackend',
+    'QuotaLevel',
+    'SharedRateLimitTable',
     'batch_process',
-    'PQCBatchProcessor'
+    'PQCBatchProcessor',
+    'ExecutorBackend',
+    'PQCExecutor',
+    'Deadline',
+    'DeadlineExceeded',
+    'AdaptiveConcurrencyLimiter',
+    'ConcurrencyLimitExceeded',
+    'LimitAlgorithm',
+    'NativeAsyncQueue',
+    'open_native_queue',
+    'PQCKeyStore',
+    'StoredKey'
 ]
 
 __version__ = "3.1.0"
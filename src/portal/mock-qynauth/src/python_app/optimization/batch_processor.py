@@ -11,13 +11,15 @@ Compliance:
 
 import asyncio
 import time
-from typing import List, Dict, Any, Optional, Callable, TypeVar, Generic, Union
+from typing import Deque, List, Dict, Any, Optional, Callable, Iterable, TypeVar, Generic, Union
 from dataclasses import dataclass, field
-from collections import defaultdict
+from collections import defaultdict, deque
 from enum import Enum
 
 from ..monitoring.pqc_logger import pqc_logger
 from ..monitoring.performance_monitor import performance_monitor
+from .deadline import Deadline, DeadlineExceeded
+from .executor_backend import PQCExecutor
 
 T = TypeVar('T')
 R = TypeVar('R')
@@ -28,6 +30,31 @@ class BatchStrategy(Enum):
     TIME_BASED = "time_based"  # Process after time interval
     HYBRID = "hybrid"  # Combination of size and time based
 
+class BatchPriority(Enum):
+    """Priority lanes for batch items."""
+    INTERACTIVE = "interactive"  # Latency-sensitive requests such as logins
+    STANDARD = "standard"  # Default lane
+    BULK = "bulk"  # Background jobs such as key migration or mass re-signing
+
+class OverloadPolicy(Enum):
+    """Behaviour of submit when an item's lane is full."""
+    REJECT = "reject"  # Raise BatchOverloadError immediately
+    BLOCK = "block"  # Wait for space, up to max_block_time
+
+_DEFAULT_LANE_WEIGHTS = {
+    BatchPriority.INTERACTIVE: 8,
+    BatchPriority.STANDARD: 4,
+    BatchPriority.BULK: 1
+}
+
+class BatchOverloadError(Exception):
+    """Raised when an item cannot be queued because its lane is full."""
+    
+    def __init__(self, priority: BatchPriority, queue_size: int):
+        super().__init__(f"Batch queue for the {priority.value} lane is full ({queue_size} items)")
+        self.priority = priority
+        self.queue_size = queue_size
+
 @dataclass
 class BatchConfig:
     """Batch processing configuration."""
@@ -37,6 +64,32 @@ class BatchConfig:
     max_concurrent_batches: int = 3
     retry_attempts: int = 2
     retry_delay: float = 0.1
+    adaptive: bool = False  # Tune batch size and wait time from observed latency
+    target_p99_latency: float = 0.1  # seconds, submit to result, for adaptive sizing
+    min_batch_size: int = 1  # Lower bound for adaptive sizing
+    min_wait_time: float = 0.001  # seconds, lower bound for adaptive sizing
+    lane_weights: Dict[BatchPriority, int] = field(default_factory=lambda: dict(_DEFAULT_LANE_WEIGHTS))
+    max_queue_size: int = 10000  # Pending items per lane, 0 for unbounded
+    overload_policy: OverloadPolicy = OverloadPolicy.REJECT
+    max_block_time: float = 1.0  # seconds a blocked submit waits for space
+    
+    @classmethod
+    def for_executor(cls, executor: PQCExecutor, **overrides: Any) -> "BatchConfig":
+        """
+        Configuration with batches sized to an executor's pool.
+        
+        Batches hold the host's optimal batch size and one batch runs per worker.
+        
+        Args:
+            executor: Executor the batches will run on
+            **overrides: Other configuration fields
+            
+        Returns:
+            BatchConfig instance
+        """
+        overrides.setdefault("max_batch_size", executor.batch_size())
+        overrides.setdefault("max_concurrent_batches", executor.max_workers)
+        return cls(**overrides)
 
 @dataclass
 class BatchItem(Generic[T]):
@@ -47,6 +100,15 @@ class BatchItem(Generic[T]):
     created_at: float = field(default_factory=time.time)
     attempts: int = 0
     metadata: Dict[str, Any] = field(default_factory=dict)
+    priority: BatchPriority = BatchPriority.STANDARD
+    deadline: Optional[Deadline] = None
+    future: Optional[asyncio.Future] = field(default=None, repr=False, compare=False)
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle without the future, which stays with the submitter."""
+        state = self.__dict__.copy()
+        state['future'] = None
+        return state
 
 @dataclass
 class BatchResult(Generic[R]):
@@ -57,30 +119,152 @@ class BatchResult(Generic[R]):
     processing_time: float = 0.0
     batch_size: int = 0
 
+class AdaptiveBatchController:
+    """
+    AIMD controller for batch size and wait time.
+    
+    Tracks per-item latency from submit to result over a sliding window.
+    While the window's p99 is within target, every completed batch grows
+    the batch size by one item and the wait time by one step; when the p99
+    exceeds the target both are halved and the window restarts, so one slow
+    period triggers a single decrease.
+    """
+    
+    def __init__(self, target_p99: float, min_batch_size: int, max_batch_size: int,
+                 min_wait_time: float, max_wait_time: float, window: int = 200,
+                 min_samples: int = 20, decrease_factor: float = 0.5):
+        """
+        Initialize controller.
+        
+        Args:
+            target_p99: Target p99 item latency in seconds
+            min_batch_size: Smallest batch size
+            max_batch_size: Largest batch size
+            min_wait_time: Shortest wait time in seconds
+            max_wait_time: Longest wait time in seconds
+            window: Number of recent item latencies considered
+            min_samples: Latencies needed before the p99 is acted on
+            decrease_factor: Multiplier applied when over target
+        """
+        self.target_p99 = target_p99
+        self.min_batch_size = max(1, min_batch_size)
+        self.max_batch_size = max(self.min_batch_size, max_batch_size)
+        self.min_wait_time = min(min_wait_time, max_wait_time)
+        self.max_wait_time = max_wait_time
+        self.min_samples = min(min_samples, window)
+        self.decrease_factor = decrease_factor
+        self._wait_step = (self.max_wait_time - self.min_wait_time) / self.max_batch_size
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._batch_size = float(self.min_batch_size)
+        self.wait_time = self.min_wait_time
+        self.increases = 0
+        self.decreases = 0
+    
+    @property
+    def batch_size(self) -> int:
+        """Current target batch size."""
+        return int(self._batch_size)
+    
+    def latency_p99(self) -> Optional[float]:
+        """p99 of the latencies in the window, or None if there are none."""
+        if not self._latencies:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    
+    def observe(self, latencies: Iterable[float]):
+        """
+        Record the item latencies of a completed batch and adjust.
+        
+        Args:
+            latencies: Seconds from submit to result for each item
+        """
+        self._latencies.extend(latencies)
+        if len(self._latencies) < self.min_samples:
+            return
+        
+        if self.latency_p99() > self.target_p99:
+            self._batch_size = max(self.min_batch_size, self._batch_size * self.decrease_factor)
+            self.wait_time = max(self.min_wait_time, self.wait_time * self.decrease_factor)
+            self._latencies.clear()
+            self.decreases += 1
+        else:
+            self._batch_size = min(self.max_batch_size, self._batch_size + 1)
+            self.wait_time = min(self.max_wait_time, self.wait_time + self._wait_step)
+            self.increases += 1
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Current targets and adjustment counters."""
+        return {
+            "batch_size": self.batch_size,
+            "wait_time": self.wait_time,
+            "latency_p99": self.latency_p99(),
+            "target_p99_latency": self.target_p99,
+            "increases": self.increases,
+            "decreases": self.decreases
+        }
+
 class PQCBatchProcessor(Generic[T, R]):
     """
     Batch processor for PQC operations.
     
     This class provides batch processing capabilities to optimize
     performance when handling multiple PQC operations.
+    
+    Time-based flushing is anchored to the oldest pending item, so a steady
+    trickle of submissions cannot postpone a batch past its wait time. With
+    ``adaptive`` enabled, batch size and wait time are tuned online toward
+    the configured p99 latency, within the configured bounds.
+    
+    Each item carries the future its submitter awaits, so completing a batch
+    resolves its items directly. A batch whose function raises is bisected
+    until the failing items are isolated; the rest still get their results.
+    
+    Batches run on the default thread pool unless a ``PQCExecutor`` is given;
+    with a process backend the batch function must be picklable.
+    
+    Items wait in one bounded queue per priority lane. Batches are filled
+    from the lanes by smooth weighted round robin, so interactive items are
+    not stuck behind a bulk job and bulk work still progresses. A full lane
+    rejects new items with ``BatchOverloadError``, or blocks the submitter
+    for a while first, per ``overload_policy``.
     """
     
     def __init__(self, processor_func: Callable[[List[BatchItem[T]]], List[R]],
-                 config: Optional[BatchConfig] = None):
+                 config: Optional[BatchConfig] = None, name: str = "default",
+                 executor: Optional[PQCExecutor] = None):
         """
         Initialize PQC batch processor.
         
         Args:
             processor_func: Function to process batches
             config: Batch processing configuration
+            name: Processor name used to label metrics
+            executor: Executor to run batches on (default thread pool if None)
         """
         self.processor_func = processor_func
         self.config = config or BatchConfig()
+        self.name = name
+        self.executor = executor
+        self.controller: Optional[AdaptiveBatchController] = None
+        if self.config.adaptive:
+            self.controller = AdaptiveBatchController(
+                self.config.target_p99_latency,
+                self.config.min_batch_size, self.config.max_batch_size,
+                self.config.min_wait_time, self.config.max_wait_time
+            )
         
-        self._pending_items: List[BatchItem[T]] = []
+        self._lanes: Dict[BatchPriority, Deque[BatchItem[T]]] = {
+            priority: deque() for priority in BatchPriority
+        }
+        self._lane_weights = {
+            priority: max(1, self.config.lane_weights.get(priority, 1)) for priority in BatchPriority
+        }
+        self._lane_credit = {priority: 0 for priority in BatchPriority}
+        self._pending_count = 0
         self._processing_batches: Dict[str, asyncio.Task] = {}
-        self._results: Dict[str, asyncio.Future] = {}
         self._lock = asyncio.Lock()
+        self._space_available = asyncio.Condition(self._lock)
         self._stats = defaultdict(int)
         self._batch_timer: Optional[asyncio.Task] = None
         
@@ -90,11 +274,14 @@ class PQCBatchProcessor(Generic[T, R]):
             pqc_operation="batch_processor_init",
             max_batch_size=self.config.max_batch_size,
             max_wait_time=self.config.max_wait_time,
-            strategy=self.config.strategy.value
+            strategy=self.config.strategy.value,
+            backend=executor.backend.value if executor else "default"
         )
     
     async def submit(self, data: T, user_id: str, operation: str,
-                    metadata: Optional[Dict[str, Any]] = None) -> R:
+                    metadata: Optional[Dict[str, Any]] = None,
+                    priority: BatchPriority = BatchPriority.STANDARD,
+                    deadline: Optional[Deadline] = None) -> R:
         """
         Submit an item for batch processing.
         
@@ -103,36 +290,40 @@ class PQCBatchProcessor(Generic[T, R]):
             user_id: User identifier
             operation: PQC operation name
             metadata: Optional metadata
+            priority: Priority lane for the item
+            deadline: Optional deadline; the item is dropped if it passes
+                before the item's batch is formed
             
         Returns:
             Processing result
+            
+        Raises:
+            BatchOverloadError: If the item's lane is full
+            DeadlineExceeded: If the deadline passes before the item is processed
         """
+        if deadline is not None and deadline.expired:
+            self._stats['items_expired'] += 1
+            deadline.check("batch submit")
+        
         item = BatchItem(
             data=data,
             user_id=user_id,
             operation=operation,
-            metadata=metadata or {}
+            metadata=metadata or {},
+            priority=priority,
+            deadline=deadline,
+            future=asyncio.get_running_loop().create_future()
         )
         
-        result_future = asyncio.Future()
-        item_id = f"{user_id}_{operation}_{time.time()}_{id(item)}"
-        
         async with self._lock:
-            self._pending_items.append(item)
-            self._results[item_id] = result_future
+            lane = self._lanes[priority]
+            if self._lane_full(lane):
+                await self._wait_for_space(priority)
+            lane.append(item)
+            self._pending_count += 1
             self._stats['items_submitted'] += 1
             
-            should_process = False
-            
-            if self.config.strategy == BatchStrategy.SIZE_BASED:
-                should_process = len(self._pending_items) >= self.config.max_batch_size
-            elif self.config.strategy == BatchStrategy.HYBRID:
-                should_process = len(self._pending_items) >= self.config.max_batch_size
-            
-            if should_process:
-                await self._process_batch()
-            elif self.config.strategy in [BatchStrategy.TIME_BASED, BatchStrategy.HYBRID]:
-                await self._start_timer()
+            await self._schedule()
         
         pqc_logger.log_pqc_operation(
             "debug",
@@ -140,52 +331,165 @@ class PQCBatchProcessor(Generic[T, R]):
             pqc_operation="batch_submit",
             user_id=user_id,
             operation=operation,
-            pending_items=len(self._pending_items)
+            priority=priority.value,
+            pending_items=self._pending_count
         )
         
         try:
-            return await result_future
+            return await item.future
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             self._stats['items_failed'] += 1
             raise
     
+    def _lane_full(self, lane: Deque[BatchItem[T]]) -> bool:
+        """Whether a lane is at its size bound."""
+        return 0 < self.config.max_queue_size <= len(lane)
+    
+    async def _wait_for_space(self, priority: BatchPriority):
+        """
+        Apply the overload policy to a full lane. Must hold the lock.
+        
+        Raises:
+            BatchOverloadError: If the lane stays full
+        """
+        lane = self._lanes[priority]
+        if self.config.overload_policy == OverloadPolicy.BLOCK:
+            self._stats['items_blocked'] += 1
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + self.config.max_block_time
+            while self._lane_full(lane):
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    await asyncio.wait_for(self._space_available.wait(), remaining)
+                except asyncio.TimeoutError:
+                    pass
+            if not self._lane_full(lane):
+                return
+        
+        self._stats['items_rejected'] += 1
+        self._stats[f'items_rejected_{priority.value}'] += 1
+        pqc_logger.log_pqc_operation(
+            "warning",
+            f"Batch queue full for {priority.value} lane",
+            pqc_operation="batch_overload",
+            priority=priority.value,
+            queue_size=len(lane),
+            policy=self.config.overload_policy.value
+        )
+        raise BatchOverloadError(priority, len(lane))
+    
+    def _oldest_created_at(self) -> float:
+        """Submit time of the oldest pending item. Requires pending items."""
+        return min(lane[0].created_at for lane in self._lanes.values() if lane)
+    
+    def _take_batch(self, size: int) -> List[BatchItem[T]]:
+        """
+        Dequeue up to size items across lanes by smooth weighted round robin.
+        Must hold the lock.
+        """
+        lanes, credit, weights = self._lanes, self._lane_credit, self._lane_weights
+        batch: List[BatchItem[T]] = []
+        while len(batch) < size:
+            active = [priority for priority, lane in lanes.items() if lane]
+            if not active:
+                break
+            if len(active) == 1:
+                lane = lanes[active[0]]
+                batch.extend(lane.popleft() for _ in range(min(size - len(batch), len(lane))))
+                break
+            
+            total = 0
+            chosen = active[0]
+            for priority in active:
+                credit[priority] += weights[priority]
+                total += weights[priority]
+                if credit[priority] > credit[chosen]:
+                    chosen = priority
+            credit[chosen] -= total
+            batch.append(lanes[chosen].popleft())
+        
+        self._pending_count -= len(batch)
+        if self.config.max_queue_size > 0:
+            self._space_available.notify_all()
+        return batch
+    
+    def _batch_size(self) -> int:
+        """Current target batch size."""
+        return self.controller.batch_size if self.controller else self.config.max_batch_size
+    
+    def _wait_time(self) -> float:
+        """Current wait time for the oldest pending item."""
+        return self.controller.wait_time if self.controller else self.config.max_wait_time
+    
+    async def _schedule(self):
+        """Dispatch a full batch, or make sure the flush timer is running. Must hold the lock."""
+        if (self.config.strategy != BatchStrategy.TIME_BASED and
+                self._pending_count >= self._batch_size()):
+            await self._process_batch()
+        
+        if (self._pending_count and
+                self.config.strategy in [BatchStrategy.TIME_BASED, BatchStrategy.HYBRID]):
+            await self._start_timer()
+    
     async def _start_timer(self):
-        """Start or restart the batch timer."""
+        """Start the batch timer unless it is already running."""
         if self._batch_timer and not self._batch_timer.done():
-            self._batch_timer.cancel()
+            return
         
         self._batch_timer = asyncio.create_task(self._timer_callback())
     
     async def _timer_callback(self):
-        """Timer callback to process batch after timeout."""
+        """Process batches once the oldest pending item has waited long enough."""
         try:
-            await asyncio.sleep(self.config.max_wait_time)
-            
-            async with self._lock:
-                if self._pending_items:
-                    await self._process_batch()
+            while True:
+                async with self._lock:
+                    if not self._pending_count:
+                        return
+                    delay = self._oldest_created_at() + self._wait_time() - time.time()
+                    if delay <= 0:
+                        await self._process_batch()
+                        if len(self._processing_batches) >= self.config.max_concurrent_batches:
+                            # Completion of a running batch dispatches the rest.
+                            return
+                        continue
+                
+                await asyncio.sleep(delay)
         except asyncio.CancelledError:
             pass
     
     async def _process_batch(self):
         """Process the current batch of items."""
-        if not self._pending_items:
+        if not self._pending_count:
             return
         
         if len(self._processing_batches) >= self.config.max_concurrent_batches:
             return
         
-        batch_items = self._pending_items[:self.config.max_batch_size]
-        self._pending_items = self._pending_items[self.config.max_batch_size:]
-        
-        if not batch_items:
-            return
+        batch_size = self._batch_size()
+        batch_items = self._take_batch(batch_size)
         
-        batch_id = f"batch_{time.time()}_{len(batch_items)}"
+        self._stats['batches_started'] += 1
+        batch_id = f"batch_{self._stats['batches_started']}_{len(batch_items)}"
         task = asyncio.create_task(self._execute_batch(batch_id, batch_items))
         self._processing_batches[batch_id] = task
         
-        self._stats['batches_started'] += 1
+        now = time.time()
+        queue_times: Dict[BatchPriority, List[float]] = defaultdict(list)
+        for item in batch_items:
+            queue_times[item.priority].append(now - item.created_at)
+        for priority, times in queue_times.items():
+            performance_monitor.observe_histogram_values(
+                "batch_queue_time_seconds", times, processor=self.name, lane=priority.value)
+        for priority, lane in self._lanes.items():
+            performance_monitor.record_gauge("batch_queue_depth", len(lane),
+                                             processor=self.name, lane=priority.value)
+        performance_monitor.record_gauge("batch_size", batch_size, processor=self.name)
+        performance_monitor.record_gauge("batch_wait_time_seconds", self._wait_time(),
+                                         processor=self.name)
         
         pqc_logger.log_pqc_operation(
             "info",
@@ -193,7 +497,7 @@ class PQCBatchProcessor(Generic[T, R]):
             pqc_operation="batch_start",
             batch_id=batch_id,
             batch_size=len(batch_items),
-            pending_items=len(self._pending_items)
+            pending_items=self._pending_count
         )
     
     async def _execute_batch(self, batch_id: str, batch_items: List[BatchItem[T]]):
@@ -205,24 +509,16 @@ class PQCBatchProcessor(Generic[T, R]):
                 "batch_processing", "system", "batch", 
                 {"batch_size": len(batch_items), "batch_id": batch_id}
             ):
-                results = await asyncio.get_event_loop().run_in_executor(
-                    None, self.processor_func, batch_items
-                )
+                failed = await self._run_items(batch_items)
                 
                 processing_time = time.time() - start_time
                 
-                for i, (item, result) in enumerate(zip(batch_items, results)):
-                    item_id = f"{item.user_id}_{item.operation}_{item.created_at}_{id(item)}"
-                    future = self._results.get(item_id)
-                    
-                    if future and not future.done():
-                        if isinstance(result, Exception):
-                            future.set_exception(result)
-                        else:
-                            future.set_result(result)
+                if self.controller:
+                    completed_at = time.time()
+                    self.controller.observe(completed_at - item.created_at for item in batch_items)
                 
                 self._stats['batches_completed'] += 1
-                self._stats['items_processed'] += len(batch_items)
+                self._stats['items_processed'] += len(batch_items) - failed
                 
                 pqc_logger.log_pqc_operation(
                     "info",
@@ -231,58 +527,123 @@ class PQCBatchProcessor(Generic[T, R]):
                     batch_id=batch_id,
                     batch_size=len(batch_items),
                     processing_time=processing_time,
-                    success=True
+                    failed_items=failed,
+                    success=failed == 0
                 )
                 
-        except Exception as e:
-            processing_time = time.time() - start_time
-            
-            for item in batch_items:
-                item_id = f"{item.user_id}_{item.operation}_{item.created_at}_{id(item)}"
-                future = self._results.get(item_id)
+        finally:
+            async with self._lock:
+                self._processing_batches.pop(batch_id, None)
                 
-                if future and not future.done():
-                    item.attempts += 1
-                    if item.attempts < self.config.retry_attempts:
-                        async with self._lock:
-                            self._pending_items.append(item)
-                        
-                        await asyncio.sleep(self.config.retry_delay)
+                if self._pending_count:
+                    if (self._oldest_created_at() + self._wait_time() <= time.time() and
+                            self.config.strategy != BatchStrategy.SIZE_BASED):
                         await self._process_batch()
-                    else:
-                        future.set_exception(Exception(f"Batch processing failed after {item.attempts} attempts: {str(e)}"))
+                    await self._schedule()
+    
+    async def _run_items(self, items: List[BatchItem[T]]) -> int:
+        """
+        Process items and resolve their futures, bisecting on failure.
+        
+        If the batch function raises, the items are split in half and each
+        half is processed on its own, so one bad item costs about log2(n)
+        extra calls instead of failing the whole batch. A single item that
+        keeps failing is retried up to ``retry_attempts`` times. Items whose
+        deadline has passed are resolved with ``DeadlineExceeded`` and left
+        out of the call.
+        
+        Args:
+            items: Items to process
             
+        Returns:
+            Number of items resolved with an error
+        """
+        expired = self._drop_expired(items)
+        items = [item for item in items if not (item.future and item.future.done())]
+        if not items:
+            return expired
+        
+        try:
+            if self.executor:
+                results = await self.executor.run_batch(self.processor_func, items)
+            else:
+                results = await asyncio.get_running_loop().run_in_executor(
+                    None, self.processor_func, items
+                )
+            if len(results) != len(items):
+                raise ValueError(f"Batch function returned {len(results)} results for {len(items)} items")
+        except Exception as e:
             self._stats['batches_failed'] += 1
+            if len(items) > 1:
+                self._stats['batch_splits'] += 1
+                middle = len(items) // 2
+                return await self._run_items(items[:middle]) + await self._run_items(items[middle:])
+            
+            item = items[0]
+            item.attempts += 1
+            if item.attempts < self.config.retry_attempts:
+                self._stats['items_retried'] += 1
+                await asyncio.sleep(self.config.retry_delay)
+                return await self._run_items(items)
             
             pqc_logger.log_pqc_operation(
                 "error",
-                f"Batch processing failed: {batch_id}",
+                f"Batch item failed: {item.user_id}",
                 pqc_operation="batch_error",
-                batch_id=batch_id,
-                batch_size=len(batch_items),
-                processing_time=processing_time,
+                user_id=item.user_id,
+                operation=item.operation,
+                attempts=item.attempts,
                 error=str(e)
             )
-            
-        finally:
-            async with self._lock:
-                self._processing_batches.pop(batch_id, None)
-                
-                completed_futures = [
-                    item_id for item_id, future in self._results.items()
-                    if future.done()
-                ]
-                for item_id in completed_futures:
-                    self._results.pop(item_id, None)
+            self._resolve(item, Exception(f"Batch processing failed after {item.attempts} attempts: {str(e)}"))
+            return 1
+        
+        failed = expired
+        for item, result in zip(items, results):
+            failed += isinstance(result, Exception)
+            self._resolve(item, result)
+        return failed
+    
+    def _drop_expired(self, items: List[BatchItem[T]]) -> int:
+        """Resolve items whose deadline has passed with DeadlineExceeded; return how many."""
+        expired = 0
+        for item in items:
+            if (item.deadline is not None and item.future is not None and
+                    not item.future.done() and item.deadline.expired):
+                self._resolve(item, DeadlineExceeded("batch formation", -item.deadline.remaining()))
+                expired += 1
+        if expired:
+            self._stats['items_expired'] += expired
+            pqc_logger.log_pqc_operation(
+                "debug",
+                f"Dropped {expired} expired batch items",
+                pqc_operation="batch_expired",
+                expired_items=expired
+            )
+        return expired
+    
+    @staticmethod
+    def _resolve(item: BatchItem[T], result: Union[R, Exception]):
+        """Complete an item's future with its result or error."""
+        if item.future is None or item.future.done():
+            return
+        if isinstance(result, Exception):
+            item.future.set_exception(result)
+        else:
+            item.future.set_result(result)
     
     async def flush(self):
-        """Process all pending items immediately."""
-        async with self._lock:
-            while self._pending_items:
-                await self._process_batch()
-        
-        if self._processing_batches:
-            await asyncio.gather(*self._processing_batches.values(), return_exceptions=True)
+        """Process all pending items and wait for running batches to finish."""
+        while True:
+            async with self._lock:
+                while (self._pending_count and
+                       len(self._processing_batches) < self.config.max_concurrent_batches):
+                    await self._process_batch()
+                running = list(self._processing_batches.values())
+            
+            if not running:
+                return
+            await asyncio.wait(running)
     
     async def get_stats(self) -> Dict[str, Any]:
         """
@@ -297,13 +658,22 @@ class PQCBatchProcessor(Generic[T, R]):
                     "max_batch_size": self.config.max_batch_size,
                     "max_wait_time": self.config.max_wait_time,
                     "strategy": self.config.strategy.value,
-                    "max_concurrent_batches": self.config.max_concurrent_batches
+                    "max_concurrent_batches": self.config.max_concurrent_batches,
+                    "adaptive": self.config.adaptive,
+                    "target_p99_latency": self.config.target_p99_latency,
+                    "backend": self.executor.backend.value if self.executor else "default",
+                    "lane_weights": {priority.value: weight for priority, weight in self._lane_weights.items()},
+                    "max_queue_size": self.config.max_queue_size,
+                    "overload_policy": self.config.overload_policy.value
                 },
                 "current_state": {
-                    "pending_items": len(self._pending_items),
+                    "pending_items": self._pending_count,
+                    "lane_depths": {priority.value: len(lane) for priority, lane in self._lanes.items()},
                     "processing_batches": len(self._processing_batches),
-                    "pending_results": len(self._results)
+                    "batch_size": self._batch_size(),
+                    "wait_time": self._wait_time()
                 },
+                "adaptive": self.controller.get_stats() if self.controller else None,
                 "stats": dict(self._stats)
             }
 
@@ -338,18 +708,23 @@ async def batch_process(items: List[T], processor: Callable[[T], R],
     config = BatchConfig(
         max_batch_size=batch_size,
         max_wait_time=max_wait_time,
-        strategy=BatchStrategy.SIZE_BASED
+        strategy=BatchStrategy.HYBRID,
+        max_queue_size=len(items)
     )
     
     batch_processor_instance = PQCBatchProcessor(batch_processor, config)
     
     tasks = []
     for i, item in enumerate(items):
-        task = batch_processor_instance.submit(
+        task = asyncio.ensure_future(batch_processor_instance.submit(
             item, f"user_{i}", "batch_operation"
-        )
+        ))
         tasks.append(task)
     
+    # Process the last partial batch now; items not yet queued by then are
+    # picked up by the max_wait_time timer
+    await asyncio.sleep(0)
+    await batch_processor_instance.flush()
     results = await asyncio.gather(*tasks, return_exceptions=True)
     
     final_results = []
@@ -372,7 +747,7 @@ def get_kyber_batch_processor() -> PQCBatchProcessor:
         def kyber_processor(batch_items):
             return [f"kyber_result_{item.user_id}" for item in batch_items]
         
-        _kyber_batch_processor = PQCBatchProcessor(kyber_processor)
+        _kyber_batch_processor = PQCBatchProcessor(kyber_processor, name="kyber")
     
     return _kyber_batch_processor
 
@@ -384,6 +759,6 @@ def get_dilithium_batch_processor() -> PQCBatchProcessor:
         def dilithium_processor(batch_items):
             return [f"dilithium_result_{item.user_id}" for item in batch_items]
         
-        _dilithium_batch_processor = PQCBatchProcessor(dilithium_processor)
+        _dilithium_batch_processor = PQCBatchProcessor(dilithium_processor, name="dilithium")
     
     return _dilithium_batch_processor
@@ -10,26 +10,132 @@ Compliance:
 """
 
 import asyncio
+import functools
+import inspect
+import threading
 import time
 import hashlib
 import pickle
-from typing import Dict, Optional, Any, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Dict, Optional, Any, Tuple, Union, Hashable, Deque, Callable, Sequence, Set, Type,
+    TYPE_CHECKING
+)
 from dataclasses import dataclass, field
-from collections import defaultdict
+from collections import defaultdict, deque
 from enum import Enum
 
 from ..monitoring.pqc_logger import pqc_logger
+from .cache_policies import (
+    EvictionPolicy, LRUPolicy, LFUPolicy, TTLPolicy, WindowTinyLFUPolicy, ExpiryHeap
+)
+
+if TYPE_CHECKING:
+    from .cache_store import L2CacheStore
+
+CacheKey = Tuple[Hashable, ...]
+
+_BUFFER_TYPES = (bytes, bytearray, str)
+_FIXED_SIZE_TYPES = (bool, int, float, type(None))
+_FIXED_SIZE_BYTES = 8
+_MAX_SIZE_DEPTH = 4
+_READ_BUFFER_SIZE = 256
+_ENTRIES_PER_STRIPE = 64
+_MAX_AUTO_STRIPES = 16
+_UNKEYED_ARGS = frozenset({"self", "cls", "user_id", "algorithm"})
+_SIZE_SAMPLE_ITEMS = 16
+
+def _freeze(value: Any) -> Hashable:
+    """Convert an unhashable key parameter into an equivalent hashable value."""
+    if isinstance(value, dict):
+        return tuple(sorted(((name, _freeze(item)) for name, item in value.items()), key=repr))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted((_freeze(item) for item in value), key=repr))
+    if isinstance(value, (bytearray, memoryview)):
+        return bytes(value)
+    return value
+
+def stable_key_hash(key: Any) -> str:
+    """
+    Hash a cache key (or key parameters) to a short digest.
+    
+    Unlike the built-in ``hash``, the digest is identical across processes,
+    so it can name entries outside the current interpreter.
+    
+    Args:
+        key: Structural cache key or key parameters
+        
+    Returns:
+        16-character hexadecimal digest
+    """
+    return hashlib.blake2b(repr(key).encode(), digest_size=8).hexdigest()
+
+def estimate_size(value: Any, _depth: int = 0) -> int:
+    """
+    Estimate the payload size of a cached value in bytes.
+    
+    Binary buffers and strings are measured by length, and dicts,
+    sequences and plain objects by their contents; large sequences are
+    extrapolated from a sample. Other values fall back to pickling.
+    
+    Args:
+        value: Value to measure
+        
+    Returns:
+        Estimated size in bytes
+    """
+    kind = type(value)
+    if kind in _BUFFER_TYPES:
+        return len(value)
+    if kind in _FIXED_SIZE_TYPES:
+        return _FIXED_SIZE_BYTES
+    if kind is memoryview:
+        return value.nbytes
+    
+    if _depth < _MAX_SIZE_DEPTH:
+        if isinstance(value, dict):
+            total = 0
+            for name, item in value.items():
+                total += len(name) if type(name) in _BUFFER_TYPES else estimate_size(name, _depth + 1)
+                total += len(item) if type(item) in _BUFFER_TYPES else estimate_size(item, _depth + 1)
+            return total
+        if isinstance(value, (list, tuple, set, frozenset)):
+            items = value if isinstance(value, (list, tuple)) else list(value)
+            sample = items[:_SIZE_SAMPLE_ITEMS]
+            if not sample:
+                return 0
+            sampled = 0
+            for item in sample:
+                kind = type(item)
+                if kind in _BUFFER_TYPES:
+                    sampled += len(item)
+                elif kind in _FIXED_SIZE_TYPES:
+                    sampled += _FIXED_SIZE_BYTES
+                else:
+                    sampled += estimate_size(item, _depth + 1)
+            return sampled * len(items) // len(sample)
+        attributes = getattr(value, "__dict__", None)
+        if isinstance(attributes, dict):
+            return estimate_size(attributes, _depth + 1)
+    
+    try:
+        return len(pickle.dumps(value))
+    except Exception:
+        return len(str(value).encode('utf-8'))
 
 class CachePolicy(Enum):
     """Cache eviction policies."""
     LRU = "lru"  # Least Recently Used
     LFU = "lfu"  # Least Frequently Used
     TTL = "ttl"  # Time To Live
+    TINYLFU = "tinylfu"  # Window TinyLFU admission with segmented LRU
 
 @dataclass
 class CacheEntry:
     """Cache entry with metadata."""
-    key: str
+    key: CacheKey
     value: Any
     created_at: float
     last_accessed: float
@@ -38,6 +144,13 @@ class CacheEntry:
     size_bytes: int = 0
     metadata: Dict[str, Any] = field(default_factory=dict)
     
+    @property
+    def expires_at(self) -> Optional[float]:
+        """Absolute expiry time, or None if the entry never expires."""
+        if self.ttl is None:
+            return None
+        return self.created_at + self.ttl
+    
     def is_expired(self) -> bool:
         """Check if the cache entry has expired."""
         if self.ttl is None:
@@ -49,16 +162,46 @@ class CacheEntry:
         self.last_accessed = time.time()
         self.access_count += 1
 
+class _CacheStripe:
+    """
+    One lock-protected partition of the cache.
+    
+    Writers hold the lock; readers look entries up without it and record
+    hits in a bounded read buffer that writers replay into the eviction
+    policy. When the buffer is full the oldest reads are dropped, so
+    recency and frequency tracking are approximate under heavy reads.
+    """
+    
+    def __init__(self, policy: EvictionPolicy, expiry: ExpiryHeap,
+                 max_size: int, max_memory_bytes: int):
+        self.lock = threading.Lock()
+        self.entries: Dict[CacheKey, CacheEntry] = {}
+        self.expiry = expiry
+        self.policy = policy
+        self.reads: Deque[CacheKey] = deque(maxlen=_READ_BUFFER_SIZE)
+        self.max_size = max_size
+        self.max_memory_bytes = max_memory_bytes
+        self.memory = 0
+        self.stats = defaultdict(int)
+
 class PQCCacheManager:
     """
     Intelligent cache manager for PQC operations.
     
     This class provides caching capabilities with multiple eviction policies,
     TTL support, and performance monitoring for PQC operations.
+    
+    Entries are partitioned into lock stripes by key hash, each with its own
+    size and memory share and eviction bookkeeping. Reads take no lock, and
+    the synchronous ``get_sync``/``set_sync`` entry points can be called from
+    thread-pool workers as well as coroutines.
     """
     
     def __init__(self, max_size: int = 1000, max_memory_mb: int = 100,
-                 default_ttl: float = 3600.0, policy: CachePolicy = CachePolicy.LRU):
+                 default_ttl: float = 3600.0, policy: CachePolicy = CachePolicy.LRU,
+                 expiry_batch_size: int = 16, hash_key_params: bool = False,
+                 l2_store: Optional["L2CacheStore"] = None, l2_write_through: bool = True,
+                 lock_stripes: Optional[int] = None):
         """
         Initialize PQC cache manager.
         
@@ -67,16 +210,39 @@ class PQCCacheManager:
             max_memory_mb: Maximum memory usage in MB
             default_ttl: Default TTL for cache entries (seconds)
             policy: Cache eviction policy
+            expiry_batch_size: Maximum expired entries purged per set call
+            hash_key_params: Store a stable digest of the additional key
+                parameters instead of the parameters themselves
+            l2_store: Optional memory-mapped second tier
+            l2_write_through: Write every set to L2; if False, L2 is only
+                written by snapshot_to_l2
+            lock_stripes: Number of lock stripes, rounded down to a power of
+                two; by default one stripe per 64 entries, up to 16
         """
         self.max_size = max_size
         self.max_memory_bytes = max_memory_mb * 1024 * 1024
         self.default_ttl = default_ttl
         self.policy = policy
+        self.expiry_batch_size = expiry_batch_size
+        self.hash_key_params = hash_key_params
+        self.l2_store = l2_store
+        self.l2_write_through = l2_write_through
         
-        self._cache: Dict[str, CacheEntry] = {}
-        self._stats = defaultdict(int)
-        self._lock = asyncio.Lock()
-        self._current_memory = 0
+        if lock_stripes is None:
+            lock_stripes = min(_MAX_AUTO_STRIPES, max_size // _ENTRIES_PER_STRIPE)
+        stripe_count = 1
+        while stripe_count * 2 <= lock_stripes:
+            stripe_count *= 2
+        self._stripe_mask = stripe_count - 1
+        self._stripes = []
+        for index in range(stripe_count):
+            expiry = ExpiryHeap()
+            stripe_size = max(1, (max_size + index) // stripe_count)
+            self._stripes.append(_CacheStripe(
+                self._create_policy(policy, expiry, stripe_size), expiry,
+                stripe_size, self.max_memory_bytes // stripe_count
+            ))
+        self._expiry_task: Optional[asyncio.Task] = None
         
         pqc_logger.log_pqc_operation(
             "info",
@@ -85,14 +251,20 @@ class PQCCacheManager:
             max_size=max_size,
             max_memory_mb=max_memory_mb,
             default_ttl=default_ttl,
-            policy=policy.value
+            policy=policy.value,
+            lock_stripes=stripe_count,
+            l2_enabled=l2_store is not None
         )
     
     def _generate_cache_key(self, operation: str, user_id: str, 
-                          algorithm: str, **kwargs) -> str:
+                          algorithm: str, **kwargs) -> CacheKey:
         """
         Generate a cache key for PQC operations.
         
+        Keys are tuples of ``(operation, user_id, algorithm)`` followed by
+        the sorted additional parameters, or by their stable digest when
+        ``hash_key_params`` is set.
+        
         Args:
             operation: PQC operation type
             user_id: User identifier
@@ -100,84 +272,364 @@ class PQCCacheManager:
             **kwargs: Additional parameters
             
         Returns:
-            Cache key string
+            Structural cache key
         """
-        key_data = {
-            "operation": operation,
-            "user_id": user_id,
-            "algorithm": algorithm,
-            **kwargs
-        }
+        return self._key_from_params(operation, user_id, algorithm, kwargs)
+    
+    def _key_from_params(self, operation: str, user_id: str, algorithm: str,
+                         params: Dict[str, Any]) -> CacheKey:
+        """Build a structural cache key from a dict of additional parameters."""
+        if not params:
+            return (operation, user_id, algorithm)
+        
+        items = []
+        for name in sorted(params):
+            value = params[name]
+            try:
+                hash(value)
+            except TypeError:
+                value = _freeze(value)
+            items.append((name, value))
         
-        key_str = str(sorted(key_data.items()))
-        return hashlib.sha256(key_str.encode()).hexdigest()[:16]
+        if self.hash_key_params:
+            return (operation, user_id, algorithm, stable_key_hash(items))
+        return (operation, user_id, algorithm, *items)
     
     def _calculate_size(self, value: Any) -> int:
         """Calculate the size of a value in bytes."""
-        try:
-            return len(pickle.dumps(value))
-        except Exception:
-            return len(str(value).encode('utf-8'))
+        return estimate_size(value)
+    
+    def _create_policy(self, policy: CachePolicy, expiry: ExpiryHeap,
+                       capacity: int) -> EvictionPolicy:
+        """Create the eviction bookkeeping structure for a policy."""
+        if policy == CachePolicy.LRU:
+            return LRUPolicy()
+        elif policy == CachePolicy.LFU:
+            return LFUPolicy()
+        elif policy == CachePolicy.TINYLFU:
+            return WindowTinyLFUPolicy(capacity)
+        else:  # TTL policy
+            return TTLPolicy(expiry)
+    
+    def _stripe_for(self, key: CacheKey) -> _CacheStripe:
+        """Return the stripe that owns a key."""
+        return self._stripes[hash(key) & self._stripe_mask]
+    
+    def _drain_reads(self, stripe: _CacheStripe):
+        """Replay buffered reads into the eviction policy. Caller must hold the stripe lock."""
+        reads = stripe.reads
+        entries = stripe.entries
+        policy = stripe.policy
+        while reads:
+            key = reads.popleft()
+            if key in entries:
+                policy.on_access(key)
+    
+    def _remove_entry(self, stripe: _CacheStripe, key: CacheKey,
+                      evicted: bool = False) -> Optional[CacheEntry]:
+        """Remove an entry and its bookkeeping. Caller must hold the stripe lock."""
+        entry = stripe.entries.pop(key, None)
+        if entry is not None:
+            stripe.memory -= entry.size_bytes
+            if evicted:
+                stripe.policy.on_evict(key)
+            else:
+                stripe.policy.on_remove(key)
+            stripe.expiry.discard(key)
+        return entry
+    
+    def _expire_entries(self, stripe: _CacheStripe, limit: Optional[int] = None) -> int:
+        """
+        Remove expired entries, soonest-expiring first. Caller must hold the stripe lock.
+        
+        Args:
+            stripe: Stripe to purge
+            limit: Maximum number of entries to remove (None for all)
+            
+        Returns:
+            Number of entries removed
+        """
+        expired_keys = stripe.expiry.pop_expired(time.time(), limit)
+        for key in expired_keys:
+            if self._remove_entry(stripe, key) is not None:
+                stripe.stats['cache_expired'] += 1
+        return len(expired_keys)
     
-    async def _evict_entries(self, required_space: int = 0):
+    def _evict_entries(self, stripe: _CacheStripe, required_space: int = 0):
         """
-        Evict cache entries based on the configured policy.
+        Evict cache entries based on the configured policy. Caller must hold the stripe lock.
+        
+        Expired entries are purged first; further victims come from the
+        policy structure in O(1) each.
         
         Args:
+            stripe: Stripe to evict from
             required_space: Additional space required in bytes
         """
-        if not self._cache:
+        if not stripe.entries:
             return
         
-        entries_to_remove = []
+        self._expire_entries(stripe)
+        self._drain_reads(stripe)
         
         current_time = time.time()
-        for key, entry in self._cache.items():
-            if entry.is_expired():
-                entries_to_remove.append(key)
-        
-        if self.policy == CachePolicy.LRU:
-            sorted_entries = sorted(
-                self._cache.items(),
-                key=lambda x: x[1].last_accessed
-            )
-        elif self.policy == CachePolicy.LFU:
-            sorted_entries = sorted(
-                self._cache.items(),
-                key=lambda x: x[1].access_count
-            )
-        else:  # TTL policy
-            sorted_entries = sorted(
-                self._cache.items(),
-                key=lambda x: x[1].created_at
-            )
+        target_size = max(0, stripe.max_size - 1)  # Leave room for new entry
+        target_memory = max(0, stripe.max_memory_bytes - required_space)
         
-        target_size = max(0, self.max_size - 1)  # Leave room for new entry
-        target_memory = max(0, self.max_memory_bytes - required_space)
-        
-        for key, entry in sorted_entries:
-            if (len(self._cache) <= target_size and 
-                self._current_memory <= target_memory):
+        while stripe.entries and (len(stripe.entries) > target_size or
+                                  stripe.memory > target_memory):
+            key = stripe.policy.victim()
+            if key is None:
                 break
             
-            if key not in entries_to_remove:
-                entries_to_remove.append(key)
-        
-        for key in entries_to_remove:
-            entry = self._cache.pop(key, None)
+            entry = self._remove_entry(stripe, key, evicted=True)
             if entry:
-                self._current_memory -= entry.size_bytes
-                self._stats['entries_evicted'] += 1
+                stripe.stats['entries_evicted'] += 1
                 
                 pqc_logger.log_pqc_operation(
                     "debug",
-                    f"Cache entry evicted: {key}",
+                    f"Cache entry evicted: {key[0]}",
                     pqc_operation="cache_evict",
-                    cache_key=key,
+                    operation=key[0],
+                    user_id=key[1],
+                    algorithm=key[2],
                     reason=self.policy.value,
                     age_seconds=current_time - entry.created_at
                 )
     
+    def _insert_entry(self, stripe: _CacheStripe, cache_key: CacheKey, value: Any,
+                      ttl: Optional[float], value_size: int) -> CacheEntry:
+        """
+        Insert or replace an L1 entry, evicting as needed. Caller must hold the stripe lock.
+        
+        Args:
+            stripe: Stripe that owns the key
+            cache_key: Structural cache key
+            value: Value to cache
+            ttl: Time to live (seconds), None for no expiry
+            value_size: Size of the value in bytes
+            
+        Returns:
+            The inserted entry
+        """
+        self._remove_entry(stripe, cache_key)
+        
+        if (len(stripe.entries) >= stripe.max_size or 
+            stripe.memory + value_size > stripe.max_memory_bytes):
+            self._evict_entries(stripe, value_size)
+        
+        now = time.time()
+        entry = CacheEntry(
+            key=cache_key,
+            value=value,
+            created_at=now,
+            last_accessed=now,
+            ttl=ttl,
+            size_bytes=value_size
+        )
+        
+        stripe.entries[cache_key] = entry
+        stripe.memory += value_size
+        stripe.expiry.push(cache_key, entry.expires_at)
+        stripe.policy.on_insert(cache_key, entry.expires_at)
+        return entry
+    
+    def _promote_from_l2(self, stripe: _CacheStripe, cache_key: CacheKey) -> Optional[CacheEntry]:
+        """
+        Copy an entry from L2 into L1. Caller must hold the stripe lock.
+        
+        Args:
+            stripe: Stripe that owns the key
+            cache_key: Structural cache key
+            
+        Returns:
+            The promoted entry, or None if L2 has no live entry
+        """
+        found = self.l2_store.get(cache_key)
+        if found is None:
+            return None
+        
+        value, expires_at, value_size = found
+        ttl = None if expires_at is None else expires_at - time.time()
+        if ttl is not None and ttl <= 0:
+            return None
+        
+        stripe.stats['l2_promotions'] += 1
+        return self._insert_entry(stripe, cache_key, value, ttl, value_size)
+    
+    async def snapshot_to_l2(self) -> int:
+        """
+        Write all live L1 entries to L2 and flush it to disk.
+        
+        The mmap writes and flush run in a worker thread, off the event loop.
+        
+        Returns:
+            Number of entries written
+        """
+        if self.l2_store is None:
+            return 0
+        return await asyncio.to_thread(self._snapshot_to_l2)
+    
+    def _snapshot_to_l2(self) -> int:
+        """Write live L1 entries to L2 and flush it (blocking)."""
+        written = 0
+        for stripe in self._stripes:
+            with stripe.lock:
+                entries = list(stripe.entries.items())
+            for key, entry in entries:
+                if not entry.is_expired() and self.l2_store.put(key, entry.value, entry.expires_at):
+                    written += 1
+        self.l2_store.flush()
+        
+        pqc_logger.log_pqc_operation(
+            "info",
+            f"Cache snapshot written to L2: {written} entries",
+            pqc_operation="cache_l2_snapshot",
+            entries_written=written
+        )
+        return written
+    
+    async def warm_from_l2(self, limit: Optional[int] = None) -> int:
+        """
+        Load live L2 entries into L1, e.g. when a worker starts.
+        
+        The mmap reads run in a worker thread, off the event loop. Entries
+        that expire while loading are skipped.
+        
+        Args:
+            limit: Maximum number of entries to load (None for up to max_size)
+            
+        Returns:
+            Number of entries loaded
+        """
+        if self.l2_store is None:
+            return 0
+        return await asyncio.to_thread(self._warm_from_l2, limit)
+    
+    def _warm_from_l2(self, limit: Optional[int]) -> int:
+        """Load live L2 entries into L1 (blocking)."""
+        limit = self.max_size if limit is None else min(limit, self.max_size)
+        loaded = 0
+        for key, value, expires_at, value_size in self.l2_store.items():
+            if loaded >= limit:
+                break
+            stripe = self._stripe_for(key)
+            with stripe.lock:
+                if key in stripe.entries:
+                    continue
+                ttl = None if expires_at is None else expires_at - time.time()
+                if ttl is not None and ttl <= 0:
+                    continue
+                self._insert_entry(stripe, key, value, ttl, value_size)
+            loaded += 1
+        
+        pqc_logger.log_pqc_operation(
+            "info",
+            f"Cache warmed from L2: {loaded} entries",
+            pqc_operation="cache_l2_warm",
+            entries_loaded=loaded
+        )
+        return loaded
+    
+    async def purge_expired(self, limit: Optional[int] = None) -> int:
+        """
+        Purge expired entries.
+        
+        Args:
+            limit: Maximum number of entries to purge (None for all)
+            
+        Returns:
+            Number of entries purged
+        """
+        purged = 0
+        for stripe in self._stripes:
+            if limit is not None and purged >= limit:
+                break
+            with stripe.lock:
+                purged += self._expire_entries(stripe, None if limit is None else limit - purged)
+        return purged
+    
+    async def start_expiry_task(self, interval: float = 1.0):
+        """
+        Start a background task that purges expired entries in small batches.
+        
+        Args:
+            interval: Seconds between purge batches
+        """
+        if self._expiry_task is None or self._expiry_task.done():
+            self._expiry_task = asyncio.create_task(self._expiry_loop(interval))
+    
+    async def stop_expiry_task(self):
+        """Stop the background expiry task."""
+        if self._expiry_task and not self._expiry_task.done():
+            self._expiry_task.cancel()
+            try:
+                await self._expiry_task
+            except asyncio.CancelledError:
+                pass
+    
+    async def _expiry_loop(self, interval: float):
+        """Background loop purging at most expiry_batch_size entries per tick."""
+        while True:
+            await asyncio.sleep(interval)
+            await self.purge_expired(self.expiry_batch_size)
+    
+    def get_sync(self, operation: str, user_id: str, algorithm: str,
+                 **kwargs) -> Optional[Any]:
+        """
+        Get value from cache without awaiting; safe to call from worker threads.
+        
+        Hits take no lock: access metadata is updated in place and the hit is
+        queued for the eviction policy.
+        
+        Args:
+            operation: PQC operation type
+            user_id: User identifier
+            algorithm: Cryptographic algorithm
+            **kwargs: Additional parameters
+            
+        Returns:
+            Cached value or None if not found
+        """
+        return self._get_by_key(self._generate_cache_key(operation, user_id, algorithm, **kwargs))
+    
+    def _get_by_key(self, cache_key: CacheKey) -> Optional[Any]:
+        """Look up a value by structural key; see get_sync."""
+        stripe = self._stripe_for(cache_key)
+        entry = stripe.entries.get(cache_key)
+        
+        if entry is not None and entry.is_expired():
+            with stripe.lock:
+                if stripe.entries.get(cache_key) is entry:
+                    self._remove_entry(stripe, cache_key)
+                    stripe.stats['cache_expired'] += 1
+            entry = None
+        
+        if entry is None:
+            if self.l2_store is not None:
+                with stripe.lock:
+                    entry = stripe.entries.get(cache_key)
+                    if entry is None:
+                        entry = self._promote_from_l2(stripe, cache_key)
+            if entry is None:
+                stripe.stats['cache_misses'] += 1
+                return None
+        
+        entry.touch()
+        stripe.reads.append(cache_key)
+        stripe.stats['cache_hits'] += 1
+        
+        pqc_logger.log_pqc_operation(
+            "debug",
+            f"Cache hit: {cache_key[0]}",
+            pqc_operation="cache_hit",
+            operation=cache_key[0],
+            user_id=cache_key[1],
+            algorithm=cache_key[2]
+        )
+        
+        return entry.value
+    
     async def get(self, operation: str, user_id: str, algorithm: str,
                   **kwargs) -> Optional[Any]:
         """
@@ -192,38 +644,55 @@ class PQCCacheManager:
         Returns:
             Cached value or None if not found
         """
+        return self.get_sync(operation, user_id, algorithm, **kwargs)
+    
+    def set_sync(self, operation: str, user_id: str, algorithm: str,
+                 value: Any, ttl: Optional[float] = None,
+                 size_bytes: Optional[int] = None, **kwargs):
+        """
+        Set value in cache without awaiting; safe to call from worker threads.
+        
+        Args:
+            operation: PQC operation type
+            user_id: User identifier
+            algorithm: Cryptographic algorithm
+            value: Value to cache
+            ttl: Time to live (seconds), uses default if None
+            size_bytes: Known size of the value, estimated if None
+            **kwargs: Additional parameters
+        """
         cache_key = self._generate_cache_key(operation, user_id, algorithm, **kwargs)
+        value_size = size_bytes if size_bytes is not None else self._calculate_size(value)
+        self._set_by_key(cache_key, value, ttl, value_size)
+    
+    def _set_by_key(self, cache_key: CacheKey, value: Any, ttl: Optional[float],
+                    value_size: int):
+        """Store a value by structural key; see set_sync."""
+        stripe = self._stripe_for(cache_key)
         
-        async with self._lock:
-            entry = self._cache.get(cache_key)
-            
-            if entry is None:
-                self._stats['cache_misses'] += 1
-                return None
+        with stripe.lock:
+            if self.expiry_batch_size:
+                self._expire_entries(stripe, self.expiry_batch_size)
             
-            if entry.is_expired():
-                self._cache.pop(cache_key)
-                self._current_memory -= entry.size_bytes
-                self._stats['cache_expired'] += 1
-                return None
-            
-            entry.touch()
-            self._stats['cache_hits'] += 1
-            
-            pqc_logger.log_pqc_operation(
-                "debug",
-                f"Cache hit: {cache_key}",
-                pqc_operation="cache_hit",
-                cache_key=cache_key,
-                operation=operation,
-                user_id=user_id,
-                algorithm=algorithm
-            )
-            
-            return entry.value
+            entry = self._insert_entry(stripe, cache_key, value, ttl or self.default_ttl, value_size)
+            stripe.stats['cache_sets'] += 1
+        
+        if self.l2_store is not None and self.l2_write_through:
+            self.l2_store.put(cache_key, value, entry.expires_at)
+        
+        pqc_logger.log_pqc_operation(
+            "debug",
+            f"Cache set: {cache_key[0]}",
+            pqc_operation="cache_set",
+            operation=cache_key[0],
+            user_id=cache_key[1],
+            algorithm=cache_key[2],
+            size_bytes=value_size
+        )
     
     async def set(self, operation: str, user_id: str, algorithm: str,
-                  value: Any, ttl: Optional[float] = None, **kwargs):
+                  value: Any, ttl: Optional[float] = None,
+                  size_bytes: Optional[int] = None, **kwargs):
         """
         Set value in cache.
         
@@ -233,48 +702,10 @@ class PQCCacheManager:
             algorithm: Cryptographic algorithm
             value: Value to cache
             ttl: Time to live (seconds), uses default if None
+            size_bytes: Known size of the value, estimated if None
             **kwargs: Additional parameters
         """
-        cache_key = self._generate_cache_key(operation, user_id, algorithm, **kwargs)
-        value_size = self._calculate_size(value)
-        
-        async with self._lock:
-            if (len(self._cache) >= self.max_size or 
-                self._current_memory + value_size > self.max_memory_bytes):
-                await self._evict_entries(value_size)
-            
-            entry = CacheEntry(
-                key=cache_key,
-                value=value,
-                created_at=time.time(),
-                last_accessed=time.time(),
-                ttl=ttl or self.default_ttl,
-                size_bytes=value_size,
-                metadata={
-                    "operation": operation,
-                    "user_id": user_id,
-                    "algorithm": algorithm
-                }
-            )
-            
-            existing_entry = self._cache.get(cache_key)
-            if existing_entry:
-                self._current_memory -= existing_entry.size_bytes
-            
-            self._cache[cache_key] = entry
-            self._current_memory += value_size
-            self._stats['cache_sets'] += 1
-            
-            pqc_logger.log_pqc_operation(
-                "debug",
-                f"Cache set: {cache_key}",
-                pqc_operation="cache_set",
-                cache_key=cache_key,
-                operation=operation,
-                user_id=user_id,
-                algorithm=algorithm,
-                size_bytes=value_size
-            )
+        self.set_sync(operation, user_id, algorithm, value, ttl, size_bytes, **kwargs)
     
     async def invalidate(self, operation: Optional[str] = None, user_id: Optional[str] = None,
                         algorithm: Optional[str] = None, **kwargs):
@@ -287,78 +718,107 @@ class PQCCacheManager:
             algorithm: Cryptographic algorithm (None for all)
             **kwargs: Additional parameters
         """
-        async with self._lock:
-            keys_to_remove = []
-            
-            for key, entry in self._cache.items():
-                should_remove = True
-                
-                if operation and entry.metadata.get("operation") != operation:
-                    should_remove = False
-                if user_id and entry.metadata.get("user_id") != user_id:
-                    should_remove = False
-                if algorithm and entry.metadata.get("algorithm") != algorithm:
-                    should_remove = False
-                
-                if should_remove:
-                    keys_to_remove.append(key)
+        def matches(key: CacheKey) -> bool:
+            if operation and key[0] != operation:
+                return False
+            if user_id and key[1] != user_id:
+                return False
+            if algorithm and key[2] != algorithm:
+                return False
+            return True
+        
+        for stripe in self._stripes:
+            with stripe.lock:
+                keys_to_remove = [key for key in stripe.entries if matches(key)]
+                for key in keys_to_remove:
+                    self._remove_entry(stripe, key)
+                    stripe.stats['cache_invalidations'] += 1
             
             for key in keys_to_remove:
-                entry = self._cache.pop(key)
-                self._current_memory -= entry.size_bytes
-                self._stats['cache_invalidations'] += 1
-                
                 pqc_logger.log_pqc_operation(
                     "debug",
-                    f"Cache invalidated: {key}",
+                    f"Cache invalidated: {key[0]}",
                     pqc_operation="cache_invalidate",
-                    cache_key=key
+                    operation=key[0],
+                    user_id=key[1],
+                    algorithm=key[2]
                 )
+        
+        if self.l2_store is not None:
+            removed = self.l2_store.remove_matching(matches)
+            self._stripes[0].stats['l2_invalidations'] += removed
     
     async def clear(self):
         """Clear all cache entries."""
-        async with self._lock:
-            entry_count = len(self._cache)
-            self._cache.clear()
-            self._current_memory = 0
-            self._stats['cache_clears'] += 1
-            
-            pqc_logger.log_pqc_operation(
-                "info",
-                f"Cache cleared: {entry_count} entries removed",
-                pqc_operation="cache_clear",
-                entries_removed=entry_count
-            )
+        entry_count = 0
+        for stripe in self._stripes:
+            with stripe.lock:
+                entry_count += len(stripe.entries)
+                stripe.entries.clear()
+                stripe.expiry.clear()
+                stripe.policy.clear()
+                stripe.reads.clear()
+                stripe.memory = 0
+        self._stripes[0].stats['cache_clears'] += 1
+        if self.l2_store is not None:
+            self.l2_store.clear()
+        
+        pqc_logger.log_pqc_operation(
+            "info",
+            f"Cache cleared: {entry_count} entries removed",
+            pqc_operation="cache_clear",
+            entries_removed=entry_count
+        )
     
     async def get_stats(self) -> Dict[str, Any]:
         """
         Get cache statistics.
         
+        Hit and miss counters are updated without locks and may undercount
+        slightly when many threads share a stripe.
+        
         Returns:
             Dictionary with cache statistics
         """
-        async with self._lock:
-            hit_rate = 0.0
-            total_requests = self._stats['cache_hits'] + self._stats['cache_misses']
-            if total_requests > 0:
-                hit_rate = self._stats['cache_hits'] / total_requests
-            
-            return {
-                "max_size": self.max_size,
-                "current_size": len(self._cache),
-                "max_memory_bytes": self.max_memory_bytes,
-                "current_memory_bytes": self._current_memory,
-                "memory_usage_percent": (self._current_memory / self.max_memory_bytes) * 100,
-                "hit_rate": hit_rate,
-                "policy": self.policy.value,
-                "default_ttl": self.default_ttl,
-                "stats": dict(self._stats)
-            }
+        stats = defaultdict(int)
+        admission = defaultdict(int)
+        current_size = 0
+        current_memory = 0
+        for stripe in self._stripes:
+            with stripe.lock:
+                current_size += len(stripe.entries)
+                current_memory += stripe.memory
+                for name, count in stripe.stats.items():
+                    stats[name] += count
+                if isinstance(stripe.policy, WindowTinyLFUPolicy):
+                    for name, count in stripe.policy.get_stats().items():
+                        admission[name] += count
+        
+        hit_rate = 0.0
+        total_requests = stats['cache_hits'] + stats['cache_misses']
+        if total_requests > 0:
+            hit_rate = stats['cache_hits'] / total_requests
+        
+        return {
+            "max_size": self.max_size,
+            "current_size": current_size,
+            "max_memory_bytes": self.max_memory_bytes,
+            "current_memory_bytes": current_memory,
+            "memory_usage_percent": (current_memory / self.max_memory_bytes) * 100,
+            "hit_rate": hit_rate,
+            "policy": self.policy.value,
+            "default_ttl": self.default_ttl,
+            "lock_stripes": len(self._stripes),
+            "stats": dict(stats),
+            "admission": dict(admission) if admission else None,
+            "l2": self.l2_store.get_stats() if self.l2_store is not None else None
+        }
 
 pqc_cache = PQCCacheManager()
 
 async def cache_pqc_operation(operation: str, user_id: str, algorithm: str,
-                             value: Any, ttl: Optional[float] = None, **kwargs):
+                             value: Any, ttl: Optional[float] = None,
+                             size_bytes: Optional[int] = None, **kwargs):
     """
     Cache a PQC operation result.
     
@@ -368,9 +828,10 @@ async def cache_pqc_operation(operation: str, user_id: str, algorithm: str,
         algorithm: Cryptographic algorithm
         value: Value to cache
         ttl: Time to live (seconds)
+        size_bytes: Known size of the value, estimated if None
         **kwargs: Additional parameters
     """
-    await pqc_cache.set(operation, user_id, algorithm, value, ttl, **kwargs)
+    await pqc_cache.set(operation, user_id, algorithm, value, ttl, size_bytes, **kwargs)
 
 async def get_cached_pqc_operation(operation: str, user_id: str, algorithm: str,
                                   **kwargs) -> Optional[Any]:
@@ -387,3 +848,260 @@ async def get_cached_pqc_operation(operation: str, user_id: str, algorithm: str,
         Cached value or None if not found
     """
     return await pqc_cache.get(operation, user_id, algorithm, **kwargs)
+
+def _copy_error(error: BaseException) -> BaseException:
+    """
+    Copy of a shared exception, for one raise.
+    
+    Raising the same exception object from several callers overwrites its
+    ``__traceback__`` and ``__context__`` under each of them, so a cached or
+    shared failure is raised as a copy. The copy is built without calling
+    ``__init__``, so exceptions with custom constructors are copied too.
+    """
+    error_type = type(error)
+    copied = error_type.__new__(error_type, *error.args)
+    copied.__dict__.update(error.__dict__)
+    return copied
+
+@dataclass
+class _CachedResult:
+    """Value or failure stored by pqc_cached, with its freshness deadline."""
+    value: Any = None
+    error: Optional[BaseException] = None
+    fresh_until: float = 0.0
+
+class _SyncFlight:
+    """In-flight computation shared by threads calling a sync function."""
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+_refresh_executor: Optional[ThreadPoolExecutor] = None
+_refresh_executor_lock = threading.Lock()
+
+def _get_refresh_executor() -> ThreadPoolExecutor:
+    """Shared executor for background revalidation of sync functions."""
+    global _refresh_executor
+    if _refresh_executor is None:
+        with _refresh_executor_lock:
+            if _refresh_executor is None:
+                _refresh_executor = ThreadPoolExecutor(
+                    max_workers=2, thread_name_prefix="pqc-cache-refresh"
+                )
+    return _refresh_executor
+
+def pqc_cached(operation: str, ttl: Optional[float] = None, algorithm: str = "",
+               negative_ttl: Optional[float] = None,
+               negative_exceptions: Tuple[Type[BaseException], ...] = (Exception,),
+               stale_ttl: float = 0.0, key_args: Optional[Sequence[str]] = None,
+               cache: Optional[PQCCacheManager] = None):
+    """
+    Decorator caching the results of a sync or async PQC function.
+    
+    The cache key is built from the call arguments: ``user_id`` and
+    ``algorithm`` arguments (if present) fill the key fields, and the
+    remaining arguments become key parameters. A classmethod is keyed on its
+    class. A method must name its key arguments in ``key_args``, which
+    declares that its result does not depend on the instance. Concurrent
+    misses on the same key run the function once and share its result
+    (single-flight). Cached and shared failures are raised as copies.
+    
+    Args:
+        operation: Operation name used in cache keys
+        ttl: Time results stay fresh (seconds), cache default if None
+        algorithm: Algorithm used when the function has no ``algorithm`` argument
+        negative_ttl: Cache failures for this long (None disables negative caching)
+        negative_exceptions: Exception types eligible for negative caching
+        stale_ttl: After going stale, keep serving a result for this long
+            while one background call refreshes it
+        key_args: Argument names that form the key (None for all)
+        cache: Cache manager, the global cache if None
+        
+    Returns:
+        Decorator; the wrapped function exposes ``cache_stats``
+        
+    Raises:
+        TypeError: If a method is decorated without ``key_args``
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        if "self" in signature.parameters and key_args is None:
+            raise TypeError(f"pqc_cached method {func.__qualname__} needs key_args; "
+                            "results would otherwise be shared across instances")
+        is_async = asyncio.iscoroutinefunction(func)
+        stats = defaultdict(int)
+        async_flights: Dict[CacheKey, asyncio.Task] = {}
+        sync_flights: Dict[CacheKey, _SyncFlight] = {}
+        flights_lock = threading.Lock()
+        refreshing: Set[CacheKey] = set()
+        refresh_tasks: Set[asyncio.Task] = set()
+        
+        def target_cache() -> PQCCacheManager:
+            return cache if cache is not None else pqc_cache
+        
+        def derive_key(args, kwargs) -> CacheKey:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = bound.arguments
+            params = {
+                name: value for name, value in arguments.items()
+                if name not in _UNKEYED_ARGS and (key_args is None or name in key_args)
+            }
+            if "cls" in arguments:
+                params["cls"] = f"{arguments['cls'].__module__}.{arguments['cls'].__qualname__}"
+            return target_cache()._key_from_params(
+                operation, arguments.get("user_id", ""),
+                arguments.get("algorithm", algorithm), params
+            )
+        
+        def store(cache_key, value):
+            fresh_ttl = ttl or target_cache().default_ttl
+            target_cache()._set_by_key(
+                cache_key, _CachedResult(value=value, fresh_until=time.time() + fresh_ttl),
+                fresh_ttl + stale_ttl, estimate_size(value)
+            )
+        
+        def store_error(cache_key, error):
+            if negative_ttl and isinstance(error, negative_exceptions):
+                target_cache()._set_by_key(
+                    cache_key, _CachedResult(error=_copy_error(error), fresh_until=time.time() + negative_ttl),
+                    negative_ttl, 0
+                )
+        
+        def lookup(cache_key) -> Tuple[Optional[_CachedResult], bool]:
+            """Return the cached result and whether it needs revalidation."""
+            cached = target_cache()._get_by_key(cache_key)
+            if cached is None:
+                stats['misses'] += 1
+                return None, False
+            if cached.error is not None:
+                stats['negative_hits'] += 1
+                raise _copy_error(cached.error)
+            if time.time() < cached.fresh_until:
+                stats['hits'] += 1
+                return cached, False
+            stats['stale_hits'] += 1
+            return cached, True
+        
+        def refresh_failed(error):
+            stats['refresh_errors'] += 1
+            pqc_logger.log_pqc_operation(
+                "warning",
+                f"Cache revalidation failed: {operation}",
+                pqc_operation="cache_refresh_error",
+                operation=operation,
+                error_type=type(error).__name__
+            )
+        
+        if is_async:
+            async def refresh(cache_key, args, kwargs):
+                try:
+                    store(cache_key, await func(*args, **kwargs))
+                    stats['refreshes'] += 1
+                except Exception as e:
+                    refresh_failed(e)
+                finally:
+                    refreshing.discard(cache_key)
+            
+            async def compute(cache_key, args, kwargs):
+                try:
+                    value = await func(*args, **kwargs)
+                except Exception as e:
+                    store_error(cache_key, e)
+                    raise
+                else:
+                    store(cache_key, value)
+                    return value
+                finally:
+                    async_flights.pop(cache_key, None)
+            
+            def flight_done(flight):
+                if not flight.cancelled():
+                    flight.exception()
+            
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                cache_key = derive_key(args, kwargs)
+                cached, revalidate = lookup(cache_key)
+                
+                if cached is not None:
+                    if revalidate and cache_key not in refreshing:
+                        refreshing.add(cache_key)
+                        task = asyncio.ensure_future(refresh(cache_key, args, kwargs))
+                        refresh_tasks.add(task)
+                        task.add_done_callback(refresh_tasks.discard)
+                    return cached.value
+                
+                flight = async_flights.get(cache_key)
+                leader = flight is None or flight.get_loop() is not asyncio.get_running_loop()
+                if leader:
+                    flight = asyncio.ensure_future(compute(cache_key, args, kwargs))
+                    flight.add_done_callback(flight_done)
+                    async_flights[cache_key] = flight
+                else:
+                    stats['coalesced'] += 1
+                
+                # Shielded so a cancelled caller does not cancel the shared call
+                try:
+                    return await asyncio.shield(flight)
+                except Exception as e:
+                    if leader:
+                        raise
+                    raise _copy_error(e) from e
+        else:
+            def refresh(cache_key, args, kwargs):
+                try:
+                    store(cache_key, func(*args, **kwargs))
+                    stats['refreshes'] += 1
+                except Exception as e:
+                    refresh_failed(e)
+                finally:
+                    with flights_lock:
+                        refreshing.discard(cache_key)
+            
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                cache_key = derive_key(args, kwargs)
+                cached, revalidate = lookup(cache_key)
+                
+                if cached is not None:
+                    if revalidate:
+                        with flights_lock:
+                            start_refresh = cache_key not in refreshing
+                            refreshing.add(cache_key)
+                        if start_refresh:
+                            _get_refresh_executor().submit(refresh, cache_key, args, kwargs)
+                    return cached.value
+                
+                with flights_lock:
+                    flight = sync_flights.get(cache_key)
+                    leader = flight is None
+                    if leader:
+                        flight = sync_flights[cache_key] = _SyncFlight()
+                
+                if not leader:
+                    stats['coalesced'] += 1
+                    flight.done.wait()
+                    if flight.error is not None:
+                        raise _copy_error(flight.error) from flight.error
+                    return flight.value
+                
+                try:
+                    flight.value = func(*args, **kwargs)
+                except BaseException as e:
+                    flight.error = e
+                    store_error(cache_key, e)
+                    raise
+                else:
+                    store(cache_key, flight.value)
+                    return flight.value
+                finally:
+                    with flights_lock:
+                        del sync_flights[cache_key]
+                    flight.done.set()
+        
+        wrapper.cache_stats = stats
+        return wrapper
+    return decorator
@@ -0,0 +1,433 @@
+"""
+PQC Cache Eviction Policies
+
+This module provides constant-time bookkeeping structures for the PQC cache
+eviction policies, a TinyLFU admission filter, and an expiry heap for
+amortized TTL expiration.
+
+Compliance:
+- NIST SP 800-53 (SC-13): Cryptographic Protection
+"""
+
+import heapq
+import itertools
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+class EvictionPolicy(ABC):
+    """Base class for cache eviction bookkeeping."""
+
+    @abstractmethod
+    def on_insert(self, key: Hashable, expires_at: Optional[float]):
+        """Record a new or replaced entry."""
+
+    @abstractmethod
+    def on_access(self, key: Hashable):
+        """Record a cache hit."""
+
+    @abstractmethod
+    def on_remove(self, key: Hashable):
+        """Forget an entry."""
+
+    def on_evict(self, key: Hashable):
+        """Forget an entry evicted after victim() chose it."""
+        self.on_remove(key)
+
+    @abstractmethod
+    def victim(self) -> Optional[Hashable]:
+        """Return the next key to evict, without changing any state."""
+
+    @abstractmethod
+    def clear(self):
+        """Forget all entries."""
+
+class LRUPolicy(EvictionPolicy):
+    """Least recently used ordering backed by an ordered map."""
+
+    def __init__(self):
+        self._order: "OrderedDict[Hashable, None]" = OrderedDict()
+
+    def on_insert(self, key, expires_at):
+        self._order[key] = None
+        self._order.move_to_end(key)
+
+    def on_access(self, key):
+        self._order.move_to_end(key)
+
+    def on_remove(self, key):
+        self._order.pop(key, None)
+
+    def victim(self):
+        return next(iter(self._order), None)
+
+    def clear(self):
+        self._order.clear()
+
+class LFUPolicy(EvictionPolicy):
+    """
+    Least frequently used ordering with O(1) frequency buckets.
+
+    Keys within a bucket are kept in recency order, so ties are broken by
+    least recent use.
+    """
+
+    def __init__(self):
+        self._frequency: Dict[Hashable, int] = {}
+        self._buckets: Dict[int, "OrderedDict[Hashable, None]"] = {}
+        self._min_frequency = 0
+
+    def _bucket_add(self, key, frequency):
+        bucket = self._buckets.get(frequency)
+        if bucket is None:
+            bucket = self._buckets[frequency] = OrderedDict()
+        bucket[key] = None
+
+    def _bucket_remove(self, key, frequency):
+        bucket = self._buckets[frequency]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[frequency]
+            if self._min_frequency == frequency:
+                self._min_frequency = frequency + 1
+
+    def on_insert(self, key, expires_at):
+        frequency = self._frequency.get(key)
+        if frequency is not None:
+            self._bucket_remove(key, frequency)
+        self._frequency[key] = 1
+        self._bucket_add(key, 1)
+        self._min_frequency = 1
+
+    def on_access(self, key):
+        frequency = self._frequency.get(key)
+        if frequency is None:
+            return
+        self._bucket_remove(key, frequency)
+        self._frequency[key] = frequency + 1
+        self._bucket_add(key, frequency + 1)
+
+    def on_remove(self, key):
+        frequency = self._frequency.pop(key, None)
+        if frequency is None:
+            return
+        self._bucket_remove(key, frequency)
+
+    def victim(self):
+        if not self._frequency:
+            return None
+        bucket = self._buckets.get(self._min_frequency)
+        if bucket is None:
+            self._min_frequency = min(self._buckets)
+            bucket = self._buckets[self._min_frequency]
+        return next(iter(bucket))
+
+    def clear(self):
+        self._frequency.clear()
+        self._buckets.clear()
+        self._min_frequency = 0
+
+class ExpiryHeap:
+    """
+    Min-heap of expiry times with lazy invalidation.
+
+    Replaced or removed entries leave stale heap items behind; they are
+    discarded when popped and the heap is compacted once stale items
+    outnumber live ones.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int, Hashable]] = []
+        self._deadlines: Dict[Hashable, float] = {}
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def push(self, key: Hashable, expires_at: Optional[float]):
+        """Track (or re-track) a key's expiry time."""
+        if expires_at is None:
+            self._deadlines.pop(key, None)
+            return
+        self._deadlines[key] = expires_at
+        heapq.heappush(self._heap, (expires_at, next(self._counter), key))
+        if len(self._heap) > 2 * len(self._deadlines) + 64:
+            self._compact()
+
+    def discard(self, key: Hashable):
+        """Stop tracking a key."""
+        self._deadlines.pop(key, None)
+
+    def _prune(self):
+        """Drop stale items from the top of the heap."""
+        heap = self._heap
+        while heap:
+            expires_at, _, key = heap[0]
+            if self._deadlines.get(key) == expires_at:
+                return
+            heapq.heappop(heap)
+
+    def peek(self) -> Optional[Hashable]:
+        """Return the key that expires first."""
+        self._prune()
+        return self._heap[0][2] if self._heap else None
+
+    def pop_expired(self, now: float, limit: Optional[int] = None) -> List[Hashable]:
+        """
+        Remove and return keys whose expiry time has passed.
+
+        Args:
+            now: Current time
+            limit: Maximum number of keys to return (None for all)
+
+        Returns:
+            Expired keys, soonest first
+        """
+        expired = []
+        while limit is None or len(expired) < limit:
+            self._prune()
+            if not self._heap or self._heap[0][0] > now:
+                break
+            _, _, key = heapq.heappop(self._heap)
+            del self._deadlines[key]
+            expired.append(key)
+        return expired
+
+    def _compact(self):
+        """Rebuild the heap from live deadlines only."""
+        self._heap = [
+            (expires_at, next(self._counter), key)
+            for key, expires_at in self._deadlines.items()
+        ]
+        heapq.heapify(self._heap)
+
+    def clear(self):
+        self._heap.clear()
+        self._deadlines.clear()
+
+class TTLPolicy(EvictionPolicy):
+    """
+    Evicts the entry closest to expiry first.
+
+    Reads the cache's shared expiry heap; entries without a TTL are
+    evicted in insertion order once no expiring entries remain.
+    """
+
+    def __init__(self, expiry: ExpiryHeap):
+        self._expiry = expiry
+        self._fifo: "OrderedDict[Hashable, None]" = OrderedDict()
+
+    def on_insert(self, key, expires_at):
+        self._fifo.pop(key, None)
+        if expires_at is None:
+            self._fifo[key] = None
+
+    def on_access(self, key):
+        pass
+
+    def on_remove(self, key):
+        self._fifo.pop(key, None)
+
+    def victim(self):
+        key = self._expiry.peek()
+        if key is None:
+            key = next(iter(self._fifo), None)
+        return key
+
+    def clear(self):
+        self._fifo.clear()
+
+_SKETCH_DEPTH = 4
+_SKETCH_MAX_COUNT = 15
+_SKETCH_SEEDS = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0xD6E8FEB86659FD93)
+_HASH_MASK = (1 << 64) - 1
+_HALVE_TABLE = bytes(count >> 1 for count in range(256))
+
+class FrequencySketch:
+    """
+    Count-min sketch of access frequencies with periodic aging.
+
+    Counters saturate at 15 and are all halved once the number of recorded
+    accesses reaches ``sample_size``, so old popularity fades.
+    """
+
+    def __init__(self, capacity: int, sample_factor: int = 10):
+        """
+        Initialize sketch.
+
+        Args:
+            capacity: Number of cache entries the sketch serves
+            sample_factor: Accesses per entry between agings
+        """
+        width = 16
+        while width < capacity * 2:
+            width *= 2
+        self._shift = 64 - width.bit_length() + 1
+        self._width = width
+        self._table = bytearray(width * _SKETCH_DEPTH)
+        self.sample_size = max(1, capacity) * sample_factor
+        self._additions = 0
+        self.resets = 0
+
+    def _indexes(self, key: Hashable) -> List[int]:
+        """Counter positions of a key, one per row."""
+        item = hash(key) & _HASH_MASK
+        return [
+            row * self._width + (((item * seed) & _HASH_MASK) >> self._shift)
+            for row, seed in enumerate(_SKETCH_SEEDS)
+        ]
+
+    def increment(self, key: Hashable):
+        """Record one access."""
+        table = self._table
+        for index in self._indexes(key):
+            if table[index] < _SKETCH_MAX_COUNT:
+                table[index] += 1
+        self._additions += 1
+        if self._additions >= self.sample_size:
+            self._age()
+
+    def frequency(self, key: Hashable) -> int:
+        """Estimated access count of a key."""
+        table = self._table
+        return min(table[index] for index in self._indexes(key))
+
+    def _age(self):
+        """Halve every counter."""
+        self._table = bytearray(self._table.translate(_HALVE_TABLE))
+        self._additions //= 2
+        self.resets += 1
+
+    def clear(self):
+        self._table = bytearray(len(self._table))
+        self._additions = 0
+
+class WindowTinyLFUPolicy(EvictionPolicy):
+    """
+    Window TinyLFU: a small admission window LRU in front of a segmented
+    main LRU, guarded by a frequency sketch.
+
+    New entries land in the window. Entries leaving the window move into
+    the main area's probation segment while it has room; once the cache
+    is full, a window candidate only displaces the probation victim if the
+    sketch says it is used more often, so one-off scans do not flush the
+    hot set. Hits in probation promote entries to the protected segment.
+    The admission decision is applied in on_evict(), so victim() can be
+    called without side effects.
+    """
+
+    def __init__(self, capacity: int, window_ratio: float = 0.01,
+                 protected_ratio: float = 0.8):
+        """
+        Initialize policy.
+
+        Args:
+            capacity: Maximum number of entries
+            window_ratio: Share of capacity used by the admission window
+            protected_ratio: Share of the main area used by the protected segment
+        """
+        self.capacity = max(1, capacity)
+        self._window_capacity = max(1, int(self.capacity * window_ratio))
+        self._main_capacity = max(1, self.capacity - self._window_capacity)
+        self._protected_capacity = max(1, int(self._main_capacity * protected_ratio))
+        self._window: "OrderedDict[Hashable, None]" = OrderedDict()
+        self._probation: "OrderedDict[Hashable, None]" = OrderedDict()
+        self._protected: "OrderedDict[Hashable, None]" = OrderedDict()
+        self.sketch = FrequencySketch(self.capacity)
+        self.admitted = 0
+        self.rejected = 0
+
+    def _main_size(self) -> int:
+        return len(self._probation) + len(self._protected)
+
+    def _drain_window(self):
+        """Move window overflow into probation while the main area has room."""
+        while (len(self._window) > self._window_capacity and
+               self._main_size() < self._main_capacity):
+            key, _ = self._window.popitem(last=False)
+            self._probation[key] = None
+
+    def on_insert(self, key, expires_at):
+        self.on_remove(key)
+        self.sketch.increment(key)
+        self._window[key] = None
+        self._drain_window()
+
+    def on_access(self, key):
+        self.sketch.increment(key)
+        if key in self._window:
+            self._window.move_to_end(key)
+        elif key in self._protected:
+            self._protected.move_to_end(key)
+        elif key in self._probation:
+            del self._probation[key]
+            self._protected[key] = None
+            if len(self._protected) > self._protected_capacity:
+                demoted, _ = self._protected.popitem(last=False)
+                self._probation[demoted] = None
+
+    def on_remove(self, key):
+        for segment in (self._window, self._probation, self._protected):
+            if key in segment:
+                del segment[key]
+                return
+
+    def _main_victim(self) -> Optional[Hashable]:
+        victim = next(iter(self._probation), None)
+        if victim is None:
+            victim = next(iter(self._protected), None)
+        return victim
+
+    def _admission(self) -> Tuple[Optional[Hashable], Optional[Hashable], bool]:
+        """
+        Decide the next victim.
+
+        Returns:
+            (victim, window candidate that competed for the main area or
+            None, whether the candidate was admitted)
+        """
+        # Eviction runs before the incoming entry is inserted, so a full
+        # window means its LRU entry is about to be pushed out and must
+        # compete for a place in the main area.
+        main_victim = self._main_victim()
+        if len(self._window) < self._window_capacity and main_victim is not None:
+            return main_victim, None, False
+
+        candidate = next(iter(self._window), None)
+        if candidate is None or main_victim is None:
+            return (candidate if candidate is not None else main_victim), None, False
+
+        if self.sketch.frequency(candidate) > self.sketch.frequency(main_victim):
+            return main_victim, candidate, True
+        return candidate, candidate, False
+
+    def victim(self):
+        return self._admission()[0]
+
+    def on_evict(self, key):
+        victim, candidate, admitted = self._admission()
+        if key == victim and candidate is not None:
+            if admitted:
+                del self._window[candidate]
+                self._probation[candidate] = None
+                self.admitted += 1
+            else:
+                self.rejected += 1
+        self.on_remove(key)
+
+    def clear(self):
+        self._window.clear()
+        self._probation.clear()
+        self._protected.clear()
+        self.sketch.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Admission counters and segment sizes."""
+        return {
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "window": len(self._window),
+            "probation": len(self._probation),
+            "protected": len(self._protected),
+            "sketch_resets": self.sketch.resets
+        }
@@ -0,0 +1,565 @@
+"""
+PQC Cache L2 Store
+
+This module provides a memory-mapped, fixed-slot file store used as the
+second cache tier under the in-process PQC cache. Each size class is a
+single file holding a compact open-addressing hash index followed by
+fixed-size data slots, so gigabytes of cached key material cost no Python
+objects and survive process restarts.
+
+Values are stored without pickling: ``bytes``-like values, strings and
+dicts of them are encoded directly; other values are not stored in L2.
+Store files hold cached values in plaintext and are created owner-only;
+the data slot of a removed, expired, replaced or cleared entry is zeroed
+so its value does not linger on disk.
+
+Compliance:
+- NIST SP 800-53 (SC-13): Cryptographic Protection
+- NIST SP 800-53 (SC-28): Protection of Information at Rest
+"""
+
+import ast
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional, Sequence, Tuple, Union
+
+from ..monitoring.pqc_logger import pqc_logger
+
+_FILE_MAGIC = b"PQCL2v02"
+_FILE_HEADER = struct.Struct("<8sII")  # magic, slot_size, slot_count
+_FILE_HEADER_SIZE = 64
+_SLOT_HEADER = struct.Struct("<16sBBxxdHxxII")  # digest, state, codec, expires_at, key_len, value_len, crc
+
+_SLOT_EMPTY = 0
+_SLOT_LIVE = 1
+_SLOT_DELETED = 2
+
+_CODEC_BYTES = 0
+_CODEC_STR = 1
+_CODEC_DICT = 2
+
+_DICT_COUNT = struct.Struct("<H")
+_DICT_NAME = struct.Struct("<H")
+_DICT_ITEM = struct.Struct("<I")
+
+_MAX_PROBE = 8
+
+# Slot sizes cover a key allowance of ~256 bytes plus the FIPS 203/204
+# object sizes: ML-KEM-768 ciphertext (1088) and public key (1184),
+# ML-KEM-768 secret key (2400), ML-DSA-65 signature (3309), secret key
+# (4032) or a full ML-KEM-768 key pair, and a full ML-DSA-65 key pair.
+DEFAULT_L2_SLOT_SIZES = (1536, 2688, 4352, 6656)
+
+def _encode_key(key: Hashable) -> bytes:
+    """Encode a structural cache key."""
+    return repr(key).encode()
+
+def _decode_key(key_blob: bytes) -> Optional[Hashable]:
+    """Decode a structural cache key, or None if it is not a literal."""
+    try:
+        return ast.literal_eval(key_blob.decode())
+    except (ValueError, SyntaxError, UnicodeDecodeError):
+        return None
+
+def _encode_value(value: Any) -> Optional[Tuple[int, bytes]]:
+    """
+    Encode a cache value without pickling.
+
+    Args:
+        value: Value to encode
+
+    Returns:
+        (codec, payload) or None if the value type is not supported
+    """
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return _CODEC_BYTES, bytes(value)
+    if isinstance(value, str):
+        return _CODEC_STR, value.encode()
+    if isinstance(value, dict) and len(value) < 0x10000:
+        parts = [_DICT_COUNT.pack(len(value))]
+        for name, item in value.items():
+            if not isinstance(name, str) or not isinstance(item, (bytes, bytearray, memoryview)):
+                return None
+            encoded_name = name.encode()
+            parts += [_DICT_NAME.pack(len(encoded_name)), encoded_name,
+                      _DICT_ITEM.pack(len(item)), bytes(item)]
+        return _CODEC_DICT, b"".join(parts)
+    return None
+
+def _decode_value(codec: int, payload: bytes) -> Any:
+    """Decode a value written by _encode_value."""
+    if codec == _CODEC_BYTES:
+        return payload
+    if codec == _CODEC_STR:
+        return payload.decode()
+
+    value = {}
+    (count,) = _DICT_COUNT.unpack_from(payload, 0)
+    offset = _DICT_COUNT.size
+    for _ in range(count):
+        (name_len,) = _DICT_NAME.unpack_from(payload, offset)
+        offset += _DICT_NAME.size
+        name = payload[offset:offset + name_len].decode()
+        offset += name_len
+        (item_len,) = _DICT_ITEM.unpack_from(payload, offset)
+        offset += _DICT_ITEM.size
+        value[name] = payload[offset:offset + item_len]
+        offset += item_len
+    return value
+
+class MmapSlotStore:
+    """
+    Single size-class store: a memory-mapped open-addressing hash table.
+
+    The file holds an index of fixed-size slot headers (key digest, state,
+    expiry, lengths, checksum) followed by one data slot per header with
+    the key and value bytes. Probing only touches the dense index, so
+    misses stay within a few hot pages. Keys probe at most
+    ``_MAX_PROBE`` slots from their home slot; a full probe window evicts
+    its soonest-expiring entry. Entries are checksummed, so a torn write
+    from another process reads as a miss.
+    """
+
+    def __init__(self, path: Union[str, Path], slot_size: int, slot_count: int):
+        """
+        Open or create a slot store.
+
+        A file whose header does not match the requested geometry is
+        discarded and recreated empty.
+
+        Args:
+            path: Store file path
+            slot_size: Bytes available per slot for key and value
+            slot_count: Number of slots
+        """
+        self.path = Path(path)
+        self.slot_size = slot_size
+        self.slot_count = slot_count
+        self._data_offset = _FILE_HEADER_SIZE + _SLOT_HEADER.size * slot_count
+        self._file_size = self._data_offset + slot_size * slot_count
+
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        self._file = os.fdopen(fd, "r+b")
+        header = self._file.read(_FILE_HEADER.size)
+        expected = _FILE_HEADER.pack(_FILE_MAGIC, slot_size, slot_count)
+        if header != expected or os.fstat(fd).st_size != self._file_size:
+            self._reset_file(expected)
+        self._mmap = mmap.mmap(self._file.fileno(), self._file_size)
+
+    def _reset_file(self, header: bytes):
+        """Truncate the file to an empty, sparse store."""
+        self._file.truncate(0)
+        self._file.truncate(self._file_size)
+        self._file.seek(0)
+        self._file.write(header)
+        self._file.flush()
+
+    def _slot_offset(self, index: int) -> int:
+        """Byte offset of a slot header."""
+        return _FILE_HEADER_SIZE + index * _SLOT_HEADER.size
+
+    def _data_start(self, index: int) -> int:
+        """Byte offset of a data slot."""
+        return self._data_offset + index * self.slot_size
+
+    def _probe(self, digest: bytes) -> Iterator[int]:
+        """Slot indexes in the probe window of a key digest."""
+        home = int.from_bytes(digest[:8], "little") % self.slot_count
+        for step in range(min(_MAX_PROBE, self.slot_count)):
+            yield (home + step) % self.slot_count
+
+    def _set_state(self, index: int, state: int):
+        """Overwrite the state byte of a slot."""
+        self._mmap[self._slot_offset(index) + 16] = state
+
+    def _wipe(self, index: int, keep: int = 0):
+        """Zero the bytes a slot's header says are in use, past the first ``keep``."""
+        _, _, _, _, key_len, value_len, _ = \
+            _SLOT_HEADER.unpack_from(self._mmap, self._slot_offset(index))
+        used = min(key_len + value_len, self.slot_size)
+        if used > keep:
+            start = self._data_start(index)
+            self._mmap[start + keep:start + used] = bytes(used - keep)
+
+    def _delete(self, index: int):
+        """Mark a slot deleted and zero its data."""
+        self._set_state(index, _SLOT_DELETED)
+        self._wipe(index)
+
+    def _read_payload(self, index: int, key_len: int, value_len: int,
+                      crc: int) -> Optional[Tuple[bytes, bytes]]:
+        """Read and verify the key and value bytes of a slot."""
+        start = self._data_start(index)
+        key_blob = self._mmap[start:start + key_len]
+        payload = self._mmap[start + key_len:start + key_len + value_len]
+        if zlib.crc32(payload, zlib.crc32(key_blob)) != crc:
+            return None
+        return key_blob, payload
+
+    def fits(self, key_len: int, value_len: int) -> bool:
+        """Check whether an entry fits in one slot."""
+        return key_len + value_len <= self.slot_size
+
+    def get(self, digest: bytes, key_blob: bytes,
+            now: float) -> Optional[Tuple[int, bytes, float]]:
+        """
+        Look up an entry.
+
+        Args:
+            digest: Key digest
+            key_blob: Encoded key
+            now: Current time, for expiry
+
+        Returns:
+            (codec, payload, expires_at) or None; expires_at is 0.0 for
+            entries that never expire
+        """
+        for index in self._probe(digest):
+            offset = self._slot_offset(index)
+            slot_digest, state, codec, expires_at, key_len, value_len, crc = \
+                _SLOT_HEADER.unpack_from(self._mmap, offset)
+            if state == _SLOT_EMPTY:
+                return None
+            if state != _SLOT_LIVE or slot_digest != digest:
+                continue
+
+            if expires_at and expires_at <= now:
+                self._delete(index)
+                return None
+            data = self._read_payload(index, key_len, value_len, crc)
+            if data is None or data[0] != key_blob:
+                return None
+            return codec, data[1], expires_at
+        return None
+
+    def put(self, digest: bytes, key_blob: bytes, codec: int, payload: bytes,
+            expires_at: float, now: float) -> bool:
+        """
+        Insert or replace an entry.
+
+        Args:
+            digest: Key digest
+            key_blob: Encoded key
+            codec: Value codec
+            payload: Encoded value
+            expires_at: Absolute expiry time (0.0 for none)
+            now: Current time, for expiry
+
+        Returns:
+            True if a live entry was displaced to make room
+        """
+        target = None
+        victim = None
+        victim_expiry = float("inf")
+
+        for index in self._probe(digest):
+            slot_digest, state, _, slot_expiry, _, _, _ = \
+                _SLOT_HEADER.unpack_from(self._mmap, self._slot_offset(index))
+            if state == _SLOT_LIVE and slot_digest == digest:
+                target = index
+                break
+            reusable = state != _SLOT_LIVE or (slot_expiry and slot_expiry <= now)
+            if reusable:
+                if target is None:
+                    target = index
+                if state == _SLOT_EMPTY:
+                    break
+            else:
+                slot_expiry = slot_expiry or float("inf")
+                if victim is None or slot_expiry < victim_expiry:
+                    victim, victim_expiry = index, slot_expiry
+
+        displaced = target is None
+        if displaced:
+            target = victim
+
+        offset = self._slot_offset(target)
+        crc = zlib.crc32(payload, zlib.crc32(key_blob))
+        self._set_state(target, _SLOT_DELETED)
+        used = len(key_blob) + len(payload)
+        self._wipe(target, keep=used)  # Tail of a longer value previously in the slot
+        start = self._data_start(target)
+        self._mmap[start:start + len(key_blob)] = key_blob
+        self._mmap[start + len(key_blob):start + used] = payload
+        _SLOT_HEADER.pack_into(self._mmap, offset, digest, _SLOT_LIVE, codec, expires_at,
+                               len(key_blob), len(payload), crc)
+        return displaced
+
+    def remove(self, digest: bytes, key_blob: bytes) -> bool:
+        """
+        Remove an entry.
+
+        Args:
+            digest: Key digest
+            key_blob: Encoded key
+
+        Returns:
+            True if an entry was removed
+        """
+        for index in self._probe(digest):
+            offset = self._slot_offset(index)
+            slot_digest, state, _, _, key_len, _, _ = _SLOT_HEADER.unpack_from(self._mmap, offset)
+            if state == _SLOT_EMPTY:
+                return False
+            start = self._data_start(index)
+            if (state == _SLOT_LIVE and slot_digest == digest and
+                    self._mmap[start:start + key_len] == key_blob):
+                self._delete(index)
+                return True
+        return False
+
+    def entries(self, now: float) -> Iterator[Tuple[int, bytes, int, bytes, float]]:
+        """
+        Iterate live, unexpired entries.
+
+        Args:
+            now: Current time, for expiry
+
+        Yields:
+            (slot index, key blob, codec, payload, expires_at)
+        """
+        for index in range(self.slot_count):
+            offset = self._slot_offset(index)
+            _, state, codec, expires_at, key_len, value_len, crc = \
+                _SLOT_HEADER.unpack_from(self._mmap, offset)
+            if state != _SLOT_LIVE or (expires_at and expires_at <= now):
+                continue
+            data = self._read_payload(index, key_len, value_len, crc)
+            if data is not None:
+                yield index, data[0], codec, data[1], expires_at
+
+    def discard_slot(self, index: int):
+        """Mark a slot deleted and zero its data."""
+        self._delete(index)
+
+    def clear(self):
+        """
+        Remove all entries by zeroing the data of used slots, then the index.
+
+        Never-used slots are skipped so the sparse file stays sparse; the
+        mapping stays valid for readers.
+        """
+        for index in range(self.slot_count):
+            if self._mmap[self._slot_offset(index) + 16] != _SLOT_EMPTY:
+                self._wipe(index)
+
+        chunk = bytes(_SLOT_HEADER.size * 4096)
+        offset = _FILE_HEADER_SIZE
+        while offset < self._data_offset:
+            end = min(offset + len(chunk), self._data_offset)
+            self._mmap[offset:end] = chunk[:end - offset]
+            offset = end
+
+    def flush(self):
+        """Write dirty pages back to the file."""
+        self._mmap.flush()
+
+    def close(self):
+        """Flush and unmap the store."""
+        if not self._mmap.closed:
+            self._mmap.flush()
+            self._mmap.close()
+        self._file.close()
+
+class L2CacheStore:
+    """
+    Second-tier PQC cache store made of memory-mapped size classes.
+
+    Entries go to the smallest slot size that fits the encoded key and
+    value; lookups probe each size class in turn. Methods are thread-safe;
+    ``items`` reads without the lock and skips entries torn by concurrent
+    writers.
+    """
+
+    def __init__(self, directory: Union[str, Path], capacity_bytes: int = 1024 * 1024 * 1024,
+                 slot_sizes: Sequence[int] = DEFAULT_L2_SLOT_SIZES):
+        """
+        Open or create an L2 store.
+
+        Args:
+            directory: Directory holding one file per size class
+            capacity_bytes: Total file size budget, split evenly across classes
+            slot_sizes: Slot sizes in bytes
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.capacity_bytes = capacity_bytes
+
+        per_class = capacity_bytes // len(slot_sizes)
+        self._stores = [
+            MmapSlotStore(
+                self.directory / f"pqc_cache_l2_{slot_size}.bin", slot_size,
+                max(1, per_class // (_SLOT_HEADER.size + slot_size))
+            )
+            for slot_size in sorted(slot_sizes)
+        ]
+        self._stats = defaultdict(int)
+        self._lock = threading.Lock()
+
+        pqc_logger.log_pqc_operation(
+            "info",
+            f"PQC L2 cache store opened",
+            pqc_operation="cache_l2_init",
+            directory=str(self.directory),
+            capacity_bytes=capacity_bytes,
+            slot_sizes=list(sorted(slot_sizes))
+        )
+
+    @staticmethod
+    def _digest(key_blob: bytes) -> bytes:
+        """Digest an encoded key."""
+        return hashlib.blake2b(key_blob, digest_size=16).digest()
+
+    def get(self, key: Hashable) -> Optional[Tuple[Any, Optional[float], int]]:
+        """
+        Look up a cached value.
+
+        Args:
+            key: Structural cache key
+
+        Returns:
+            (value, expires_at, size_bytes) or None if not found;
+            expires_at is None for entries that never expire
+        """
+        key_blob = _encode_key(key)
+        digest = self._digest(key_blob)
+        now = time.time()
+        with self._lock:
+            for store in self._stores:
+                found = store.get(digest, key_blob, now)
+                if found is not None:
+                    codec, payload, expires_at = found
+                    self._stats['l2_hits'] += 1
+                    break
+            else:
+                self._stats['l2_misses'] += 1
+                return None
+        return _decode_value(codec, payload), expires_at or None, len(payload)
+
+    def put(self, key: Hashable, value: Any, expires_at: Optional[float]) -> bool:
+        """
+        Store a value.
+
+        Args:
+            key: Structural cache key
+            value: Value to store
+            expires_at: Absolute expiry time (None for no expiry)
+
+        Returns:
+            True if stored, False if the value type or size is unsupported
+        """
+        encoded = _encode_value(value)
+        key_blob = _encode_key(key)
+        if encoded is None:
+            with self._lock:
+                self._stats['l2_skipped'] += 1
+            return False
+
+        codec, payload = encoded
+        digest = self._digest(key_blob)
+        now = time.time()
+        stored = False
+        with self._lock:
+            for store in self._stores:
+                if not stored and store.fits(len(key_blob), len(payload)):
+                    if store.put(digest, key_blob, codec, payload, expires_at or 0.0, now):
+                        self._stats['l2_displaced'] += 1
+                    stored = True
+                else:
+                    store.remove(digest, key_blob)
+
+            self._stats['l2_puts' if stored else 'l2_skipped'] += 1
+        return stored
+
+    def remove(self, key: Hashable) -> bool:
+        """
+        Remove a value.
+
+        Args:
+            key: Structural cache key
+
+        Returns:
+            True if a value was removed
+        """
+        key_blob = _encode_key(key)
+        digest = self._digest(key_blob)
+        with self._lock:
+            return any([store.remove(digest, key_blob) for store in self._stores])
+
+    def remove_matching(self, predicate: Callable[[Hashable], bool]) -> int:
+        """
+        Remove every entry whose key matches a predicate.
+
+        Scans all slots.
+
+        Args:
+            predicate: Called with each decoded key
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        now = time.time()
+        with self._lock:
+            for store in self._stores:
+                for index, key_blob, _, _, _ in list(store.entries(now)):
+                    key = _decode_key(key_blob)
+                    if key is not None and predicate(key):
+                        store.discard_slot(index)
+                        removed += 1
+        return removed
+
+    def items(self) -> Iterator[Tuple[Hashable, Any, Optional[float], int]]:
+        """
+        Iterate live, unexpired entries.
+
+        Yields:
+            (key, value, expires_at, size_bytes)
+        """
+        now = time.time()
+        for store in self._stores:
+            for _, key_blob, codec, payload, expires_at in store.entries(now):
+                key = _decode_key(key_blob)
+                if key is not None:
+                    yield key, _decode_value(codec, payload), expires_at or None, len(payload)
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            for store in self._stores:
+                store.clear()
+
+    def flush(self):
+        """Write dirty pages back to disk."""
+        with self._lock:
+            for store in self._stores:
+                store.flush()
+
+    def close(self):
+        """Flush and close all size classes."""
+        with self._lock:
+            for store in self._stores:
+                store.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get L2 store statistics.
+
+        Returns:
+            Dictionary with L2 store statistics
+        """
+        return {
+            "directory": str(self.directory),
+            "capacity_bytes": self.capacity_bytes,
+            "size_classes": {
+                store.slot_size: store.slot_count for store in self._stores
+            },
+            "stats": dict(self._stats)
+        }
@@ -0,0 +1,327 @@
+"""
+Adaptive Concurrency Limiting for PQC Operations
+
+This module provides a concurrency limiter that sets the number of PQC
+operations in flight from measured latency, instead of a fixed worker
+count. When latency rises above its long-run level, requests are queueing
+rather than running, and the limit is lowered; when latency stays flat
+while requests are being turned away, the limit is raised. Requests over the limit are rejected at
+once (or after a short bounded wait) rather than queued behind work that
+will miss its deadline.
+
+Two limit algorithms are available: a gradient in the style of Netflix's
+gradient2, comparing short-term to long-term latency, and one in the style
+of TCP Vegas, estimating the queue from the latency over the best seen.
+
+Compliance:
+- NIST SP 800-53 (SC-5): Denial of Service Protection
+- NIST SP 800-53 (AU-3): Audit and Accountability
+"""
+
+import asyncio
+import math
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from ..monitoring.pqc_logger import pqc_logger
+from ..monitoring.performance_monitor import performance_monitor
+from .deadline import Deadline, DeadlineExceeded
+from .executor_backend import _cpu_count
+
+_WARMUP_SAMPLES = 10
+
+class LimitAlgorithm(Enum):
+    """Algorithms for adjusting the concurrency limit."""
+    GRADIENT2 = "gradient2"  # Short-term against long-term latency
+    VEGAS = "vegas"  # Estimated queue from latency over the no-load latency
+
+class ConcurrencyLimitExceeded(Exception):
+    """Raised when a request is rejected because the limiter is saturated."""
+
+    def __init__(self, name: str, limit: int, in_flight: int):
+        super().__init__(f"Concurrency limit {limit} reached for {name} ({in_flight} in flight)")
+        self.name = name
+        self.limit = limit
+        self.in_flight = in_flight
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Latency-driven limit on PQC operations in flight.
+
+    Not thread-safe: use one limiter per event loop.
+    """
+
+    def __init__(self, name: str = "pqc", algorithm: LimitAlgorithm = LimitAlgorithm.GRADIENT2,
+                 initial_limit: Optional[int] = None, min_limit: int = 1, max_limit: int = 200,
+                 max_wait: float = 0.0, smoothing: float = 0.2, tolerance: float = 1.5,
+                 long_window: int = 600, backoff_ratio: float = 0.9):
+        """
+        Initialize limiter.
+
+        Args:
+            name: Limiter name used in errors and as a metric label
+            algorithm: How the limit follows latency
+            initial_limit: Starting limit (defaults to twice the available CPUs)
+            min_limit: Lowest limit
+            max_limit: Highest limit
+            max_wait: Seconds a request over the limit may wait for a slot
+                before it is rejected (0 rejects at once)
+            smoothing: Weight of each new gradient2 estimate in the limit
+            tolerance: Latency growth over the long-run level that gradient2
+                accepts before lowering the limit
+            long_window: Samples averaged into the long-run latency
+            backoff_ratio: Factor applied to the limit when a request is
+                dropped at its deadline
+        """
+        initial_limit = initial_limit or _cpu_count() * 2
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError(
+                f"Invalid limits: min {min_limit}, initial {initial_limit}, max {max_limit}"
+            )
+
+        self.name = name
+        self.algorithm = algorithm
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.max_wait = max_wait
+        self.smoothing = smoothing
+        self.tolerance = tolerance
+        self.long_window = long_window
+        self.backoff_ratio = backoff_ratio
+
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._waiting = 0
+        self._long_rtt = 0.0
+        self._noload_rtt = 0.0
+        self._samples = 0
+        self._last_probe = 0
+        self._turned_away = False
+        self._slot_available = asyncio.Condition()
+        self._stats = defaultdict(int)
+
+        self._record_limit()
+        pqc_logger.log_pqc_operation(
+            "info",
+            f"Adaptive concurrency limiter initialized: {name} ({algorithm.value}, limit {initial_limit})",
+            pqc_operation="limiter_init",
+            limiter=name,
+            algorithm=algorithm.value,
+            initial_limit=initial_limit,
+            min_limit=min_limit,
+            max_limit=max_limit
+        )
+
+    @property
+    def limit(self) -> int:
+        """Current limit on requests in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Requests currently admitted."""
+        return self._in_flight
+
+    def _has_slot(self) -> bool:
+        """Whether another request can be admitted."""
+        return self._in_flight < int(self._limit)
+
+    async def acquire(self, deadline: Optional[Deadline] = None) -> Tuple[float, int]:
+        """
+        Admit a request, waiting up to max_wait for a slot.
+
+        Args:
+            deadline: Request deadline, which also bounds the wait
+
+        Returns:
+            Admission time and requests in flight on admission, to pass to release()
+
+        Raises:
+            ConcurrencyLimitExceeded: If no slot frees up in time
+        """
+        if self._has_slot():
+            self._in_flight += 1
+            return time.perf_counter(), self._in_flight
+
+        self._turned_away = True
+        wait = self.max_wait if deadline is None else deadline.timeout(self.max_wait)
+        if wait > 0:
+            self._stats['waited'] += 1
+            self._waiting += 1
+            try:
+                async with self._slot_available:
+                    await asyncio.wait_for(self._slot_available.wait_for(self._has_slot), wait)
+                    self._in_flight += 1
+                    return time.perf_counter(), self._in_flight
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                self._waiting -= 1
+
+        self._stats['rejected'] += 1
+        performance_monitor.record_gauge("pqc_concurrency_rejections_total",
+                                         self._stats['rejected'], limiter=self.name)
+        pqc_logger.log_pqc_operation(
+            "debug",
+            f"Concurrency limit reached for {self.name}",
+            pqc_operation="limiter_reject",
+            limiter=self.name,
+            limit=self.limit,
+            in_flight=self._in_flight
+        )
+        raise ConcurrencyLimitExceeded(self.name, self.limit, self._in_flight)
+
+    async def release(self, admission: Tuple[float, int], outcome: str = "success"):
+        """
+        Release a slot and update the limit from the request's latency.
+
+        Args:
+            admission: Value returned by acquire()
+            outcome: "success" to sample latency, "dropped" for a request
+                that ran out of time, which lowers the limit, or "ignored"
+                for failures that say nothing about load
+        """
+        admitted_at, in_flight = admission
+        self._in_flight -= 1
+
+        if outcome == "success":
+            self._sample(time.perf_counter() - admitted_at, in_flight)
+        elif outcome == "dropped":
+            self._stats['dropped'] += 1
+            self._set_limit(self._limit * self.backoff_ratio)
+
+        if self._waiting:
+            async with self._slot_available:
+                self._slot_available.notify(max(0, int(self._limit) - self._in_flight))
+
+    @asynccontextmanager
+    async def limit_context(self, deadline: Optional[Deadline] = None,
+                            admission: Optional[Tuple[float, int]] = None):
+        """
+        Hold a slot for the duration of a block.
+
+        Args:
+            deadline: Request deadline, which also bounds the wait for a slot
+            admission: Slot already taken with acquire(), to hold instead of
+                taking another
+
+        Raises:
+            ConcurrencyLimitExceeded: If no slot is available
+        """
+        if admission is None:
+            admission = await self.acquire(deadline)
+        outcome = "ignored"
+        try:
+            yield
+            outcome = "success"
+        except (DeadlineExceeded, asyncio.TimeoutError):
+            outcome = "dropped"
+            raise
+        finally:
+            await self.release(admission, outcome)
+
+    async def run(self, func: Callable[..., Awaitable[Any]], *args: Any,
+                  deadline: Optional[Deadline] = None) -> Any:
+        """
+        Await a coroutine function under the limit.
+
+        Args:
+            func: Coroutine function to call
+            *args: Positional arguments
+            deadline: Request deadline, which also bounds the wait for a slot
+
+        Returns:
+            The coroutine's result
+        """
+        async with self.limit_context(deadline):
+            return await func(*args)
+
+    def _sample(self, rtt: float, in_flight: int):
+        """Update the limit from one request's latency and the requests in flight when it was admitted."""
+        self._samples += 1
+        self._stats['samples'] += 1
+        if self.algorithm == LimitAlgorithm.VEGAS:
+            new_limit = self._vegas_limit(rtt, in_flight)
+        else:
+            new_limit = self._gradient2_limit(rtt, in_flight)
+        self._set_limit(new_limit)
+
+    def _gradient2_limit(self, rtt: float, in_flight: int) -> float:
+        """Scale the limit by long-run over recent latency, growing it only while requests are turned away."""
+        if self._samples <= _WARMUP_SAMPLES:
+            self._long_rtt += (rtt - self._long_rtt) / self._samples
+        elif rtt <= self._long_rtt or in_flight <= self.min_limit:
+            # The baseline only moves up from a request running alone: any
+            # queued sample would pull it up, and the limit after it, so it
+            # would follow the queue under sustained overload.
+            self._long_rtt += (rtt - self._long_rtt) * 2 / (self.long_window + 1)
+
+        if in_flight * 2 < self._limit:
+            return self._limit  # Not enough load to tell anything
+
+        gradient = max(0.5, min(1.0, self.tolerance * self._long_rtt / rtt))
+        if gradient < 1.0:
+            return self._limit * (1 - self.smoothing * (1 - gradient))
+        if not self._turned_away:
+            return self._limit  # Every request got a slot: no reason to grow
+        self._turned_away = False
+        # A smoothed sqrt(limit) more per limit's worth of completions
+        return self._limit + self.smoothing * math.sqrt(self._limit) / self._limit
+
+    def _vegas_limit(self, rtt: float, in_flight: int) -> float:
+        """Grow or shrink the limit by the queue estimated from latency over the no-load latency."""
+        # Re-probe the no-load latency now and then, from a request that was
+        # not queued behind others, so the baseline can also move up.
+        probe_due = self._samples - self._last_probe >= max(30, int(30 * self._limit))
+        if (not self._noload_rtt or rtt < self._noload_rtt
+                or (probe_due and in_flight <= self.min_limit)):
+            self._noload_rtt = rtt
+            self._last_probe = self._samples
+            return self._limit
+
+        if in_flight * 2 < self._limit:
+            return self._limit
+
+        step = max(1.0, math.log10(self._limit))
+        queue = math.ceil(self._limit * (1 - self._noload_rtt / rtt))
+        if queue > 6 * step:
+            return self._limit - step
+        if queue >= 3 * step or not self._turned_away:
+            return self._limit  # Queue in range, or every request got a slot
+        self._turned_away = False
+        return self._limit + (6 * step if queue <= step else step)
+
+    def _set_limit(self, new_limit: float):
+        """Clamp and store a new limit, exporting it when the integer limit changes."""
+        previous = int(self._limit)
+        self._limit = max(float(self.min_limit), min(float(self.max_limit), new_limit))
+        if int(self._limit) != previous:
+            self._stats['limit_changes'] += 1
+            self._record_limit()
+
+    def _record_limit(self):
+        """Export the current limit."""
+        performance_monitor.record_gauge("pqc_concurrency_limit", int(self._limit), limiter=self.name)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get limiter statistics.
+
+        Returns:
+            Dictionary with limiter statistics
+        """
+        return {
+            "name": self.name,
+            "algorithm": self.algorithm.value,
+            "limit": self.limit,
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "in_flight": self._in_flight,
+            "waiting": self._waiting,
+            "long_rtt_ms": self._long_rtt * 1000,
+            "noload_rtt_ms": self._noload_rtt * 1000,
+            "stats": dict(self._stats)
+        }
@@ -4,20 +4,217 @@ PQC Connection Pool and Resource Management
 This module provides connection pooling and resource management for
 Post-Quantum Cryptography operations to optimize performance and resource usage.
 
+Each pooled connection owns native resources that are expensive to set up
+per call: its own PQC library handle, preallocated FFI input buffers and a
+cache of converted key handles. Connections are health-checked when acquired
+and recycled after a set number of operations.
+
+The pool grows between a minimum and maximum size as callers wait, can
+reserve capacity per tenant, and exports acquire-wait histograms and
+utilization gauges through the performance monitor.
+
 Compliance:
 - NIST SP 800-53 (SC-13): Cryptographic Protection
 - NIST SP 800-53 (AU-3): Audit and Accountability
 """
 
 import asyncio
+import ctypes
 import time
 import threading
-from typing import Dict, Optional, Any, List
+from typing import Dict, Optional, Any, Callable, List, Tuple
 from dataclasses import dataclass, field
-from collections import defaultdict
+from collections import OrderedDict, defaultdict, deque
 from contextlib import asynccontextmanager
 
 from ..monitoring.pqc_logger import pqc_logger
+from ..monitoring.performance_monitor import performance_monitor
+from .cache_manager import PQCCacheManager, pqc_cached
+from .deadline import Deadline, DeadlineExceeded
+
+# Initial staging buffer sizes in bytes (ML-KEM-768 ciphertext, ML-DSA-65 signature)
+_BUFFER_SIZES = {
+    "ciphertext": 1088,
+    "signature": 3309,
+    "message": 4096,
+}
+
+# Verification results, keyed by a digest of (public key, message, signature)
+_verify_cache = PQCCacheManager(max_size=4096, max_memory_mb=1, default_ttl=300.0,
+                                hash_key_params=True)
+
+def _default_library_factory():
+    """Load a PQC library handle for one connection."""
+    from ..pqc_ffi import PQCLibrary
+    return PQCLibrary()
+
+class ConnectionResources:
+    """
+    Native resources owned by one pooled connection.
+
+    Keys are converted to C arrays once and kept in a small LRU cache, and
+    per-call inputs (ciphertexts, messages, signatures) are copied into
+    preallocated buffers, so repeated operations skip the per-byte
+    conversion the library does for each call. Not thread-safe: the pool
+    hands a connection to one holder at a time.
+    """
+
+    def __init__(self, library: Any, key_cache_size: int = 32):
+        """
+        Initialize connection resources.
+
+        Args:
+            library: PQCLibrary handle, or None if the library is unavailable
+            key_cache_size: Maximum number of converted keys kept
+        """
+        self.library = library
+        self.key_cache_size = key_cache_size
+        self.failed = False
+        self._buffers = {slot: (ctypes.c_uint8 * size)() for slot, size in _BUFFER_SIZES.items()}
+        self._key_handles: "OrderedDict[bytes, ctypes.Array]" = OrderedDict()
+        self._stats = defaultdict(int)
+
+    def key_handle(self, key: Any) -> Tuple[ctypes.Array, int]:
+        """
+        Get the C array for a key, converting it on first use.
+
+        Args:
+            key: Key as bytes or list of ints
+
+        Returns:
+            Tuple of (C array, length)
+        """
+        key_bytes = bytes(key)
+        handle = self._key_handles.get(key_bytes)
+        if handle is not None:
+            self._key_handles.move_to_end(key_bytes)
+            self._stats['key_cache_hits'] += 1
+            return handle, len(key_bytes)
+
+        self._stats['key_cache_misses'] += 1
+        handle = (ctypes.c_uint8 * len(key_bytes)).from_buffer_copy(key_bytes)
+        self._key_handles[key_bytes] = handle
+        if len(self._key_handles) > self.key_cache_size:
+            _, evicted = self._key_handles.popitem(last=False)
+            ctypes.memset(evicted, 0, ctypes.sizeof(evicted))
+            self._stats['key_cache_evictions'] += 1
+        return handle, len(key_bytes)
+
+    def _stage(self, slot: str, data: Any) -> Tuple[ctypes.Array, int]:
+        """Copy per-call input into a preallocated buffer, growing it if needed."""
+        data = data.encode('utf-8') if isinstance(data, str) else bytes(data)
+        buffer = self._buffers[slot]
+        if len(data) > len(buffer):
+            buffer = self._buffers[slot] = (ctypes.c_uint8 * len(data))()
+            self._stats['buffer_grows'] += 1
+        ctypes.memmove(buffer, data, len(data))
+        return buffer, len(data)
+
+    def _library(self):
+        """Library handle for an operation."""
+        if self.library is None:
+            from ..pqc_ffi import PQCLibraryError
+            raise PQCLibraryError("PQC library is not available for this connection")
+        return self.library
+
+    def _call(self, func_name: str, *args) -> Dict[str, Any]:
+        """Call a JSON-returning library function, marking the connection failed on error."""
+        library = self._library()
+        self._stats['operations'] += 1
+        try:
+            return library._call_and_parse_json(getattr(library.lib, func_name), *args)
+        except Exception:
+            self.failed = True
+            raise
+
+    def encapsulate(self, public_key: Any) -> Dict[str, Any]:
+        """
+        Perform ML-KEM-768 encapsulation.
+
+        Args:
+            public_key: The public key as bytes or list
+
+        Returns:
+            Dictionary with shared_secret and ciphertext
+        """
+        result = self._call("pqc_ml_kem_768_encaps", *self.key_handle(public_key))
+        return {'shared_secret': result['shared_secret'], 'ciphertext': result['ciphertext']}
+
+    def decapsulate(self, private_key: Any, ciphertext: Any) -> Dict[str, Any]:
+        """
+        Perform ML-KEM-768 decapsulation.
+
+        Args:
+            private_key: The private key as bytes or list
+            ciphertext: The ciphertext as bytes or list
+
+        Returns:
+            Dictionary with shared_secret
+        """
+        result = self._call("pqc_ml_kem_768_decaps",
+                            *self.key_handle(private_key), *self._stage("ciphertext", ciphertext))
+        return {'shared_secret': result['shared_secret']}
+
+    def sign(self, private_key: Any, message: Any) -> Dict[str, Any]:
+        """
+        Sign a message using ML-DSA-65.
+
+        Args:
+            private_key: The private key as bytes or list
+            message: The message to sign as bytes, str or list
+
+        Returns:
+            Dictionary with signature
+        """
+        result = self._call("pqc_ml_dsa_65_sign",
+                            *self._stage("message", message), *self.key_handle(private_key))
+        return {'signature': result['signature']}
+
+    @pqc_cached(operation="ml_dsa_verify", algorithm="ML-DSA-65",
+                key_args=("public_key", "message", "signature"), cache=_verify_cache)
+    def verify(self, public_key: Any, message: Any, signature: Any) -> bool:
+        """
+        Verify a signature using ML-DSA-65.
+
+        Results are cached, so a signature presented again (a replayed
+        token, a retried request) is not verified twice.
+
+        Args:
+            public_key: The public key as bytes or list
+            message: The original message as bytes, str or list
+            signature: The signature as bytes or list
+
+        Returns:
+            True if signature is valid, False otherwise
+        """
+        library = self._library()
+        self._stats['operations'] += 1
+        return bool(library.lib.pqc_ml_dsa_65_verify(
+            *self._stage("signature", signature),
+            *self._stage("message", message),
+            *self.key_handle(public_key)
+        ))
+
+    def health_check(self) -> bool:
+        """
+        Check that the resources are usable.
+
+        Returns:
+            True if the library is loaded and no operation has failed
+        """
+        return (self.library is not None and not self.failed
+                and hasattr(self.library.lib, "pqc_ml_kem_768_encaps"))
+
+    def close(self):
+        """Zero cached key material and drop the library handle."""
+        for handle in self._key_handles.values():
+            ctypes.memset(handle, 0, ctypes.sizeof(handle))
+        self._key_handles.clear()
+        self.library = None
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get resource statistics."""
+        return {**self._stats, "cached_keys": len(self._key_handles)}
 
 @dataclass
 class ConnectionContext:
@@ -28,6 +225,7 @@ class ConnectionContext:
     last_used: float = field(default_factory=time.time)
     is_active: bool = True
     metadata: Dict[str, Any] = field(default_factory=dict)
+    resources: Optional[ConnectionResources] = field(default=None, repr=False)
 
 class PQCConnectionPool:
     """
@@ -35,10 +233,23 @@ class PQCConnectionPool:
     
     This class manages a pool of connection contexts to optimize
     resource usage and provide connection reuse for PQC operations.
+    
+    The pool is elastic: it starts with ``min_connections`` contexts, adds
+    one when an admitted caller has waited ``grow_after`` seconds for a
+    returned context, up to ``max_connections``, and the cleanup task closes
+    contexts idle for ``idle_timeout`` down to ``min_connections`` again.
+    Tenants listed in ``tenant_reservations`` are guaranteed that many
+    connections; everyone else shares the remaining capacity.
     """
     
     def __init__(self, max_connections: int = 10, connection_timeout: float = 30.0,
-                 cleanup_interval: float = 60.0):
+                 cleanup_interval: float = 60.0, max_operations_per_connection: int = 1000,
+                 key_cache_size: int = 32,
+                 library_factory: Optional[Callable[[], Any]] = None,
+                 min_connections: Optional[int] = None, grow_after: float = 0.01,
+                 idle_timeout: float = 300.0,
+                 tenant_reservations: Optional[Dict[str, int]] = None,
+                 name: str = "default"):
         """
         Initialize PQC connection pool.
         
@@ -46,15 +257,58 @@ class PQCConnectionPool:
             max_connections: Maximum number of connections in the pool
             connection_timeout: Timeout for acquiring connections (seconds)
             cleanup_interval: Interval for cleaning up stale connections (seconds)
+            max_operations_per_connection: Uses after which a connection is
+                recycled (0 disables recycling)
+            key_cache_size: Converted keys cached per connection
+            library_factory: Creates the PQC library handle for a connection
+                (loads PQCLibrary if None)
+            min_connections: Connections created up front and kept when idle
+                (defaults to max_connections, a fixed-size pool)
+            grow_after: Wait in seconds for a returned connection before
+                creating a new one
+            idle_timeout: Idle time in seconds after which connections above
+                min_connections are closed by the cleanup task
+            tenant_reservations: Connections reserved per tenant
+            name: Pool name used as a metric label
+            
+        Raises:
+            ValueError: If the sizing or reservations do not fit in max_connections
         """
+        reservations = dict(tenant_reservations or {})
+        min_connections = max_connections if min_connections is None else min_connections
+        if not 0 <= min_connections <= max_connections or max_connections < 1:
+            raise ValueError(
+                f"Invalid pool size: min {min_connections}, max {max_connections}"
+            )
+        if any(reserved < 0 for reserved in reservations.values()) or sum(reservations.values()) > max_connections:
+            raise ValueError(
+                f"Tenant reservations {reservations} exceed max_connections {max_connections}"
+            )
+        
         self.max_connections = max_connections
+        self.min_connections = min_connections
         self.connection_timeout = connection_timeout
         self.cleanup_interval = cleanup_interval
+        self.max_operations_per_connection = max_operations_per_connection
+        self.key_cache_size = key_cache_size
+        self.grow_after = grow_after
+        self.idle_timeout = idle_timeout
+        self.tenant_reservations = reservations
+        self.name = name
+        self._shared_capacity = max_connections - sum(reservations.values())
+        self._library_factory = library_factory or _default_library_factory
+        self._library_error_logged = False
         
-        self._connections: asyncio.Queue = asyncio.Queue(maxsize=max_connections)
+        self._idle: deque = deque()
+        self._size = 0
+        self._next_id = 0
+        self._in_use = 0
+        self._tenant_in_use: Dict[str, int] = defaultdict(int)
+        self._waiting = 0
         self._active_connections: Dict[str, ConnectionContext] = {}
         self._stats = defaultdict(int)
         self._lock = asyncio.Lock()
+        self._available = asyncio.Condition(self._lock)
         self._cleanup_task: Optional[asyncio.Task] = None
         self._shutdown_event = asyncio.Event()
         
@@ -62,39 +316,138 @@ class PQCConnectionPool:
         
         pqc_logger.log_pqc_operation(
             "info",
-            f"PQC connection pool initialized with {max_connections} connections",
+            f"PQC connection pool initialized with {min_connections}-{max_connections} connections",
             pqc_operation="pool_init",
+            min_connections=min_connections,
             max_connections=max_connections,
-            connection_timeout=connection_timeout
+            connection_timeout=connection_timeout,
+            tenant_reservations=reservations
         )
     
     def _initialize_pool(self):
-        """Initialize the connection pool with available connections."""
-        for i in range(self.max_connections):
-            connection = self._create_connection(f"conn_{i}")
-            try:
-                self._connections.put_nowait(connection)
-            except asyncio.QueueFull:
-                break
+        """Initialize the connection pool with the minimum connections."""
+        for _ in range(self.min_connections):
+            self._idle.append(self._new_connection())
+        self._record_utilization()
     
-    def _create_connection(self, connection_id: str) -> ConnectionContext:
+    def _new_connection(self) -> ConnectionContext:
+        """Create a connection with the next free id and count it in the pool size."""
+        connection = self._create_connection(f"conn_{self._next_id}")
+        self._next_id += 1
+        self._size += 1
+        return connection
+    
+    def _create_connection(self, connection_id: str, generation: int = 0) -> ConnectionContext:
         """
-        Create a new connection context.
+        Create a new connection context with its own resources.
         
         Args:
             connection_id: Unique identifier for the connection
+            generation: Number of times this connection has been recycled
             
         Returns:
             ConnectionContext instance
         """
+        try:
+            library = self._library_factory()
+        except Exception as e:
+            library = None
+            self._stats['library_unavailable'] += 1
+            if not self._library_error_logged:
+                self._library_error_logged = True
+                pqc_logger.log_pqc_operation(
+                    "warning",
+                    f"PQC library unavailable for pooled connections: {str(e)}",
+                    pqc_operation="connection_create",
+                    connection_id=connection_id
+                )
+        
+        self._stats['connections_created'] += 1
         return ConnectionContext(
             id=connection_id,
             created_at=time.time(),
             metadata={
                 "thread_id": threading.get_ident(),
-                "process_id": id(threading.current_thread())
-            }
+                "process_id": id(threading.current_thread()),
+                "generation": generation
+            },
+            resources=ConnectionResources(library, key_cache_size=self.key_cache_size)
+        )
+    
+    def _close_connection(self, connection: ConnectionContext):
+        """Close a connection's resources and remove it from the pool size."""
+        connection.is_active = False
+        connection.resources.close()
+        self._size -= 1
+    
+    def _is_healthy(self, connection: ConnectionContext) -> bool:
+        """Whether a connection can be handed out as is."""
+        return connection.is_active and connection.resources is not None and connection.resources.health_check()
+    
+    def _needs_recycle(self, connection: ConnectionContext) -> bool:
+        """Whether a returned connection has reached its operation limit."""
+        return 0 < self.max_operations_per_connection <= connection.operations_count
+    
+    def _recycle_connection(self, connection: ConnectionContext, reason: str) -> ConnectionContext:
+        """
+        Close a connection's resources and create its replacement.
+        
+        Args:
+            connection: Connection to retire
+            reason: Why the connection is recycled, for logging
+            
+        Returns:
+            Fresh ConnectionContext with the same id
+        """
+        connection.is_active = False
+        if connection.resources is not None:
+            connection.resources.close()
+        self._stats['connections_recycled'] += 1
+        
+        pqc_logger.log_pqc_operation(
+            "debug",
+            f"Recycling connection {connection.id}: {reason}",
+            pqc_operation="connection_recycle",
+            connection_id=connection.id,
+            reason=reason,
+            operations_count=connection.operations_count
         )
+        
+        return self._create_connection(connection.id, connection.metadata.get("generation", 0) + 1)
+    
+    def _tenant_label(self, tenant: Optional[str]) -> str:
+        """Metric label for a tenant: its name if it has a reservation, else "shared"."""
+        return tenant if tenant in self.tenant_reservations else "shared"
+    
+    def _shared_in_use(self) -> int:
+        """Connections in use beyond the tenants' reservations."""
+        reserved_in_use = sum(
+            min(self._tenant_in_use[tenant], reserved)
+            for tenant, reserved in self.tenant_reservations.items()
+        )
+        return self._in_use - reserved_in_use
+    
+    def _can_admit(self, tenant: Optional[str]) -> bool:
+        """Whether a caller for the tenant may take a connection now."""
+        if self._shutdown_event.is_set():
+            return True  # Let waiters out; _acquire raises for them
+        if self._tenant_in_use[tenant] < self.tenant_reservations.get(tenant, 0):
+            return True
+        return self._shared_in_use() < self._shared_capacity
+    
+    def _record_utilization(self):
+        """Export pool size and utilization gauges."""
+        labels = {"pool": self.name}
+        performance_monitor.record_gauge("pqc_pool_connections", len(self._idle), state="idle", **labels)
+        performance_monitor.record_gauge("pqc_pool_connections", self._in_use, state="in_use", **labels)
+        performance_monitor.record_gauge("pqc_pool_utilization", self._in_use / self.max_connections, **labels)
+        performance_monitor.record_gauge("pqc_pool_waiting", self._waiting, **labels)
+        for tenant, reserved in self.tenant_reservations.items():
+            performance_monitor.record_gauge(
+                "pqc_pool_tenant_utilization",
+                self._tenant_in_use[tenant] / reserved if reserved else 0.0,
+                tenant=tenant, **labels
+            )
     
     async def start_cleanup_task(self):
         """Start the background cleanup task."""
@@ -102,7 +455,7 @@ class PQCConnectionPool:
             self._cleanup_task = asyncio.create_task(self._cleanup_loop())
     
     async def _cleanup_loop(self):
-        """Background task to clean up stale connections."""
+        """Background task to clean up stale connections and shrink the pool."""
         while not self._shutdown_event.is_set():
             try:
                 await asyncio.wait_for(
@@ -112,6 +465,7 @@ class PQCConnectionPool:
                 break  # Shutdown requested
             except asyncio.TimeoutError:
                 await self._cleanup_stale_connections()
+                await self._shrink_idle_connections()
     
     async def _cleanup_stale_connections(self):
         """Clean up stale and inactive connections."""
@@ -137,33 +491,137 @@ class PQCConnectionPool:
                     age_seconds=current_time - conn.created_at
                 )
     
+    async def _shrink_idle_connections(self):
+        """Close connections idle for longer than idle_timeout, keeping min_connections."""
+        current_time = time.time()
+        
+        async with self._lock:
+            # Idle connections are reused most recent first, so the oldest are at the left.
+            while (self._idle and self._size > self.min_connections
+                   and current_time - self._idle[0].last_used > self.idle_timeout):
+                connection = self._idle.popleft()
+                self._close_connection(connection)
+                self._stats['connections_shrunk'] += 1
+                
+                pqc_logger.log_pqc_operation(
+                    "debug",
+                    f"Closed idle connection: {connection.id}",
+                    pqc_operation="connection_shrink",
+                    connection_id=connection.id,
+                    idle_seconds=current_time - connection.last_used,
+                    pool_size=self._size
+                )
+            self._record_utilization()
+    
+    async def _acquire(self, tenant: Optional[str],
+                       request_deadline: Optional[Deadline] = None) -> ConnectionContext:
+        """
+        Take a connection for a tenant, growing the pool on sustained waits.
+        
+        Raises:
+            asyncio.TimeoutError: If no connection is admitted within connection_timeout
+            DeadlineExceeded: If the request deadline passes first
+            RuntimeError: If the pool is shut down
+        """
+        if request_deadline is not None:
+            try:
+                request_deadline.check("connection acquire")
+            except DeadlineExceeded:
+                self._stats['acquires_expired'] += 1
+                raise
+        
+        start = time.perf_counter()
+        timeout = self.connection_timeout if request_deadline is None else request_deadline.timeout(self.connection_timeout)
+        wait_until = start + timeout
+        
+        async with self._available:
+            self._waiting += 1
+            try:
+                if not self._can_admit(tenant):
+                    await asyncio.wait_for(
+                        self._available.wait_for(lambda: self._can_admit(tenant)),
+                        timeout=max(0.0, wait_until - time.perf_counter())
+                    )
+            except asyncio.TimeoutError:
+                if timeout < self.connection_timeout:  # The request deadline came first
+                    self._stats['acquires_expired'] += 1
+                    raise DeadlineExceeded("connection acquire", -request_deadline.remaining()) from None
+                raise
+            finally:
+                self._waiting -= 1
+            if self._shutdown_event.is_set():
+                raise RuntimeError("PQC connection pool is shut down")
+            
+            # Admitted: count the connection as in use while waiting for one to come back.
+            self._in_use += 1
+            self._tenant_in_use[tenant] += 1
+            try:
+                if not self._idle and self._size >= self.min_connections:
+                    try:
+                        await asyncio.wait_for(
+                            self._available.wait_for(lambda: self._idle or self._shutdown_event.is_set()),
+                            timeout=max(0.0, min(self.grow_after, wait_until - time.perf_counter()))
+                        )
+                    except asyncio.TimeoutError:
+                        pass
+                if self._shutdown_event.is_set():
+                    raise RuntimeError("PQC connection pool is shut down")
+                
+                if self._idle:
+                    connection = self._idle.pop()
+                else:
+                    # Admission keeps in-use below max_connections, so there is room to grow.
+                    connection = self._new_connection()
+                    self._stats['connections_grown'] += 1
+            except BaseException:
+                self._release_slot(tenant)
+                raise
+            
+            self._active_connections[connection.id] = connection
+            self._record_utilization()
+        
+        performance_monitor.observe_histogram(
+            "pqc_pool_acquire_wait_seconds", time.perf_counter() - start,
+            pool=self.name, tenant=self._tenant_label(tenant)
+        )
+        return connection
+    
+    def _release_slot(self, tenant: Optional[str]):
+        """Give back an admission slot and wake waiting callers (lock held)."""
+        self._in_use -= 1
+        self._tenant_in_use[tenant] -= 1
+        self._available.notify_all()
+    
     @asynccontextmanager
-    async def get_connection(self, user_id: str = "unknown"):
+    async def get_connection(self, user_id: str = "unknown", tenant: Optional[str] = None,
+                             deadline: Optional[Deadline] = None):
         """
         Get a connection from the pool with context management.
         
         Args:
             user_id: User identifier for logging and tracking
+            tenant: Tenant whose reservation the connection counts against
+                (shared capacity if None or not reserved)
+            deadline: Optional request deadline; the wait for a connection
+                ends when it passes
             
         Yields:
             ConnectionContext instance
             
         Raises:
             asyncio.TimeoutError: If connection acquisition times out
+            DeadlineExceeded: If the deadline passes before a connection is acquired
         """
         connection = None
         try:
-            connection = await asyncio.wait_for(
-                self._connections.get(),
-                timeout=self.connection_timeout
-            )
+            connection = await self._acquire(tenant, deadline)
+            
+            if not self._is_healthy(connection):
+                self._stats['health_check_failures'] += 1
+                connection = self._recycle_connection(connection, "failed health check")
             
             connection.last_used = time.time()
             connection.operations_count += 1
-            
-            async with self._lock:
-                self._active_connections[connection.id] = connection
-            
             self._stats['connections_acquired'] += 1
             
             pqc_logger.log_pqc_operation(
@@ -172,11 +630,15 @@ class PQCConnectionPool:
                 pqc_operation="connection_acquire",
                 connection_id=connection.id,
                 user_id=user_id,
+                tenant=tenant,
                 operations_count=connection.operations_count
             )
             
             yield connection
             
+        except DeadlineExceeded:
+            raise
+            
         except asyncio.TimeoutError:
             self._stats['connection_timeouts'] += 1
             pqc_logger.log_pqc_operation(
@@ -184,6 +646,7 @@ class PQCConnectionPool:
                 f"Connection pool timeout for user: {user_id}",
                 pqc_operation="connection_timeout",
                 user_id=user_id,
+                tenant=tenant,
                 timeout=self.connection_timeout
             )
             raise
@@ -192,20 +655,26 @@ class PQCConnectionPool:
             if connection:
                 async with self._lock:
                     self._active_connections.pop(connection.id, None)
-                
-                try:
-                    self._connections.put_nowait(connection)
-                    self._stats['connections_returned'] += 1
                     
-                    pqc_logger.log_pqc_operation(
-                        "debug",
-                        f"Connection returned: {connection.id}",
-                        pqc_operation="connection_return",
-                        connection_id=connection.id,
-                        user_id=user_id
-                    )
-                except asyncio.QueueFull:
-                    self._stats['connections_discarded'] += 1
+                    if self._shutdown_event.is_set():
+                        self._close_connection(connection)
+                    else:
+                        if self._needs_recycle(connection):
+                            connection = self._recycle_connection(connection, "operation limit reached")
+                        connection.last_used = time.time()
+                        self._idle.append(connection)
+                        self._stats['connections_returned'] += 1
+                        
+                        pqc_logger.log_pqc_operation(
+                            "debug",
+                            f"Connection returned: {connection.id}",
+                            pqc_operation="connection_return",
+                            connection_id=connection.id,
+                            user_id=user_id
+                        )
+                    
+                    self._release_slot(tenant)
+                    self._record_utilization()
     
     async def get_pool_status(self) -> Dict[str, Any]:
         """
@@ -215,14 +684,23 @@ class PQCConnectionPool:
             Dictionary with pool status information
         """
         async with self._lock:
-            active_count = len(self._active_connections)
-            available_count = self._connections.qsize()
+            active_count = self._in_use
+            available_count = len(self._idle)
+            total_count = self._size
+            tenant_in_use = {tenant: self._tenant_in_use[tenant] for tenant in self.tenant_reservations}
+            waiting = self._waiting
         
         return {
+            "min_connections": self.min_connections,
             "max_connections": self.max_connections,
+            "max_operations_per_connection": self.max_operations_per_connection,
             "active_connections": active_count,
             "available_connections": available_count,
-            "total_connections": active_count + available_count,
+            "total_connections": total_count,
+            "waiting": waiting,
+            "utilization": active_count / self.max_connections,
+            "tenant_reservations": dict(self.tenant_reservations),
+            "tenant_in_use": tenant_in_use,
             "stats": dict(self._stats),
             "cleanup_task_running": self._cleanup_task is not None and not self._cleanup_task.done()
         }
@@ -248,18 +726,18 @@ class PQCConnectionPool:
             for conn in self._active_connections.values():
                 conn.is_active = False
             self._active_connections.clear()
-        
-        while not self._connections.empty():
-            try:
-                self._connections.get_nowait()
-            except asyncio.QueueEmpty:
-                break
+            
+            while self._idle:
+                self._close_connection(self._idle.pop())
+            self._available.notify_all()
+            self._record_utilization()
     
     def get_stats(self) -> Dict[str, int]:
         """Get connection pool statistics."""
         return dict(self._stats)
 
-pqc_pool = PQCConnectionPool()
+
+pqc_pool = PQCConnectionPool(min_connections=2)
 
 async def initialize_pool():
     """Initialize the global connection pool."""
@@ -270,15 +748,18 @@ async def shutdown_pool():
     await pqc_pool.shutdown()
 
 @asynccontextmanager
-async def get_pqc_connection(user_id: str = "unknown"):
+async def get_pqc_connection(user_id: str = "unknown", tenant: Optional[str] = None,
+                             deadline: Optional[Deadline] = None):
     """
     Convenience function to get a connection from the global pool.
     
     Args:
         user_id: User identifier for logging and tracking
+        tenant: Tenant whose reservation the connection counts against
+        deadline: Optional request deadline for the acquire
         
     Yields:
         ConnectionContext instance
     """
-    async with pqc_pool.get_connection(user_id) as connection:
+    async with pqc_pool.get_connection(user_id, tenant, deadline) as connection:
         yield connection
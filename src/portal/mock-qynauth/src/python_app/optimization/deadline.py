@@ -0,0 +1,92 @@
+"""
+Request Deadlines for PQC Operations
+
+This module provides the deadline passed down the async PQC stack, so
+work for a request whose caller has already given up is dropped instead
+of run. Deadlines are checked before dispatch to an executor, when a
+batch is formed and when a pooled connection is acquired.
+
+Compliance:
+- NIST SP 800-53 (SC-5): Denial of Service Protection
+- NIST SP 800-53 (AU-3): Audit and Accountability
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+class DeadlineExceeded(asyncio.TimeoutError):
+    """Raised when work is dropped because its deadline has passed."""
+
+    def __init__(self, stage: str, overdue: float):
+        super().__init__(f"Deadline exceeded by {overdue * 1000:.1f}ms at {stage}")
+        self.stage = stage
+        self.overdue = overdue
+
+@dataclass(frozen=True)
+class Deadline:
+    """Point in time, on the monotonic clock, after which a result is no longer wanted."""
+    expires_at: float
+
+    @classmethod
+    def after(cls, seconds: float) -> "Deadline":
+        """
+        Deadline a number of seconds from now.
+
+        Args:
+            seconds: Time budget for the request
+
+        Returns:
+            Deadline instance
+        """
+        return cls(time.monotonic() + seconds)
+
+    @classmethod
+    def at_timestamp(cls, timestamp: float) -> "Deadline":
+        """
+        Deadline at a wall-clock time, such as one sent by another process.
+
+        Args:
+            timestamp: Unix timestamp in seconds
+
+        Returns:
+            Deadline instance
+        """
+        return cls.after(timestamp - time.time())
+
+    def remaining(self) -> float:
+        """Seconds left, negative once the deadline has passed."""
+        return self.expires_at - time.monotonic()
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        return self.remaining() <= 0
+
+    def timeout(self, limit: Optional[float] = None) -> float:
+        """
+        Time to wait for a step: what is left, capped at ``limit``.
+
+        Args:
+            limit: The step's own timeout, if any
+
+        Returns:
+            Non-negative timeout in seconds
+        """
+        remaining = max(0.0, self.remaining())
+        return remaining if limit is None else min(remaining, limit)
+
+    def check(self, stage: str):
+        """
+        Raise if the deadline has passed.
+
+        Args:
+            stage: Where the check happens, for the error message
+
+        Raises:
+            DeadlineExceeded: If the deadline has passed
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise DeadlineExceeded(stage, -remaining)
@@ -0,0 +1,409 @@
+"""
+PQC Executor Backends
+
+This module provides pluggable executors for CPU-bound Post-Quantum
+Cryptography work. The thread backend matches the previous behaviour; the
+process backend runs work in a process pool, so Python-side processing in
+a batch (validation, encoding) is not serialized by the GIL.
+
+Process workers load the PQC library once, in the pool initializer. Batch
+results that are byte strings, such as ciphertexts and signatures, are
+returned through shared memory segments that each worker reuses from
+batch to batch, instead of a pickled list.
+
+Compliance:
+- NIST SP 800-53 (SC-13): Cryptographic Protection
+- NIST SP 800-53 (AU-3): Audit and Accountability
+"""
+
+import asyncio
+import functools
+import multiprocessing
+import os
+import threading
+from array import array
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from ..monitoring.pqc_logger import pqc_logger
+from .deadline import Deadline, DeadlineExceeded
+from .shared_segments import open_shared_memory, unlink_shared_memory
+
+class ExecutorBackend(Enum):
+    """Execution backends for PQC work."""
+    THREAD = "thread"  # Thread pool in this process
+    PROCESS = "process"  # Process pool with the PQC library loaded per worker
+
+_worker_library = None
+
+def _init_worker(lib_path: Optional[str]):
+    """Process pool initializer: load the PQC library once for this worker."""
+    global _worker_library
+    try:
+        from ..pqc_ffi import PQCLibrary
+        _worker_library = PQCLibrary(lib_path)
+    except Exception as e:
+        _worker_library = None
+        pqc_logger.log_pqc_operation(
+            "warning",
+            f"PQC library unavailable in executor worker: {str(e)}",
+            pqc_operation="executor_worker_init",
+            pid=os.getpid()
+        )
+
+def get_worker_library():
+    """
+    PQC library loaded by this process's pool initializer.
+
+    Returns:
+        PQCLibrary instance, or None outside a process worker or if loading failed
+    """
+    return _worker_library
+
+# Result segments start with a state byte: free, or holding results the
+# parent has not read yet. Results follow the header.
+_SEGMENT_FREE = 0
+_SEGMENT_FULL = 1
+_SEGMENT_HEADER = 8
+_MAX_WORKER_SEGMENTS = 8
+
+_worker_segments: List[Any] = []
+
+def _release_segment(segment):
+    """Close and remove a shared memory segment opened without tracking."""
+    segment.close()
+    unlink_shared_memory(segment)
+
+def _free_segment(total: int):
+    """
+    Worker side: a free result segment of this worker with room for ``total`` bytes.
+
+    Segments are reused once the parent has read them. A worker whose
+    segments are all waiting to be read, or too small, creates another, up
+    to ``_MAX_WORKER_SEGMENTS``, replacing a free but too small one past
+    that; otherwise None is returned and the results are pickled.
+    """
+    small = None
+    for segment in _worker_segments:
+        if segment.buf[0] == _SEGMENT_FREE:
+            if segment.size - _SEGMENT_HEADER >= total:
+                return segment
+            small = segment
+
+    if len(_worker_segments) >= _MAX_WORKER_SEGMENTS:
+        if small is None:
+            return None
+        _worker_segments.remove(small)
+        _release_segment(small)
+
+    segment = open_shared_memory(None, True, _SEGMENT_HEADER + total + total // 4)
+    _worker_segments.append(segment)
+    return segment
+
+def _pack_results(results: Sequence[Any], threshold: Optional[int]) -> Tuple[Optional[str], Any]:
+    """
+    Prepare batch results for return to the parent process.
+
+    Byte string results totalling at least ``threshold`` bytes are copied into
+    one of the worker's result segments, and only its name and the result
+    lengths are returned; anything else is returned as is.
+    """
+    results = list(results)
+    if (threshold is None or not results or
+            not all(isinstance(result, (bytes, bytearray)) for result in results)):
+        return None, results
+
+    lengths = array('Q', map(len, results))
+    total = sum(lengths)
+    segment = _free_segment(total) if total >= max(threshold, 1) else None
+    if segment is None:
+        return None, results
+
+    buf = segment.buf
+    offset = _SEGMENT_HEADER
+    for result, length in zip(results, lengths):
+        buf[offset:offset + length] = result
+        offset += length
+    buf[0] = _SEGMENT_FULL
+    del buf
+    return segment.name, lengths.tobytes()
+
+def _run_packed(func: Callable[[List[Any]], Sequence[Any]], items: List[Any],
+                threshold: Optional[int]) -> Tuple[Optional[str], Any]:
+    """Worker entry point: run a batch function and pack its results."""
+    return _pack_results(func(items), threshold)
+
+class _ResultSegments:
+    """
+    Parent side of the workers' result segments.
+
+    Segments stay attached between batches. Reading a batch copies its
+    results out, zeroes them in the segment and marks the segment free for
+    its worker to reuse, so steady-state batches cost no segment setup,
+    page faults or unlinking. All segments seen are removed on close.
+    """
+
+    def __init__(self, max_attached: int):
+        self.max_attached = max_attached
+        self._attached: "OrderedDict[str, Any]" = OrderedDict()
+        self._names = set()
+        self._lock = threading.Lock()
+
+    def _attach(self, name: str):
+        """Attached segment by name, keeping the most recently used attached."""
+        with self._lock:
+            segment = self._attached.pop(name, None)
+            if segment is None:
+                segment = open_shared_memory(name, False)
+                self._names.add(name)
+            self._attached[name] = segment
+            while len(self._attached) > self.max_attached:
+                self._attached.popitem(last=False)[1].close()
+        return segment
+
+    def read(self, name: str, payload: bytes) -> List[bytes]:
+        """Copy out the results of a batch and hand the segment back to its worker."""
+        lengths = array('Q')
+        lengths.frombytes(payload)
+        buf = self._attach(name).buf
+        results = []
+        offset = _SEGMENT_HEADER
+        for length in lengths:
+            results.append(bytes(buf[offset:offset + length]))
+            offset += length
+        buf[_SEGMENT_HEADER:offset] = bytes(offset - _SEGMENT_HEADER)
+        buf[0] = _SEGMENT_FREE
+        del buf
+        return results
+
+    def discard(self, future: asyncio.Future):
+        """Hand back the segment of a batch whose caller went away."""
+        if future.cancelled() or future.exception() is not None:
+            return
+        name, payload = future.result()
+        if name is not None:
+            try:
+                self.read(name, payload)
+            except FileNotFoundError:
+                pass
+
+    def close(self):
+        """Detach and remove every segment seen; call once the workers have exited."""
+        with self._lock:
+            attached, self._attached = self._attached, OrderedDict()
+            names, self._names = self._names, set()
+        for segment in attached.values():
+            segment.close()
+        for name in names:
+            try:
+                _release_segment(open_shared_memory(name, False))
+            except FileNotFoundError:
+                continue
+
+def _cpu_count() -> int:
+    """CPUs available to this process."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+@functools.lru_cache(maxsize=None)
+def optimal_batch_size() -> int:
+    """
+    Batch size suited to this host.
+
+    Asks the native library (``HardwareFeatures::optimal_batch_size``), and
+    applies the same rule to the CPU flags when the loaded library predates
+    that export: four items per core with AVX2, two with SSE4.1, else one.
+
+    Returns:
+        Number of items per batch
+    """
+    try:
+        from ..pqc_ffi import get_pqc_library
+        batch_size = get_pqc_library().optimal_batch_size()
+        if batch_size:
+            return batch_size
+    except Exception:
+        pass
+
+    flags = set()
+    try:
+        with open("/proc/cpuinfo") as cpuinfo:
+            for line in cpuinfo:
+                if line.startswith("flags"):
+                    flags.update(line.split(":", 1)[1].split())
+                    break
+    except OSError:
+        pass
+
+    per_core = 4 if "avx2" in flags else 2 if "sse4_1" in flags else 1
+    return _cpu_count() * per_core
+
+class PQCExecutor:
+    """
+    Executor for PQC work with a pluggable thread or process backend.
+
+    Functions and batch items run on the process backend must be picklable,
+    which rules out closures; batch functions there can reach the worker's
+    PQC library through ``get_worker_library()``.
+    """
+
+    def __init__(self, backend: ExecutorBackend = ExecutorBackend.THREAD,
+                 max_workers: Optional[int] = None, lib_path: Optional[str] = None,
+                 shared_memory_threshold: Optional[int] = 64 * 1024, start_method: str = "spawn"):
+        """
+        Initialize executor.
+
+        Args:
+            backend: Thread or process execution
+            max_workers: Number of workers (defaults to the available CPUs)
+            lib_path: PQC library path for process workers (found automatically if None)
+            shared_memory_threshold: Smallest total result size, in bytes,
+                returned through shared memory by process workers (None to
+                always pickle results)
+            start_method: multiprocessing start method for process workers
+        """
+        self.backend = backend
+        self.max_workers = max_workers or _cpu_count()
+        self.shared_memory_threshold = shared_memory_threshold
+        self._segments = _ResultSegments(self.max_workers * _MAX_WORKER_SEGMENTS)
+        self._stats = defaultdict(int)
+
+        if backend == ExecutorBackend.PROCESS:
+            self.executor: Executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context(start_method),
+                initializer=_init_worker,
+                initargs=(lib_path,)
+            )
+        else:
+            self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
+
+        pqc_logger.log_pqc_operation(
+            "info",
+            f"PQC executor initialized: {backend.value} with {self.max_workers} workers",
+            pqc_operation="executor_init",
+            backend=backend.value,
+            max_workers=self.max_workers
+        )
+
+    def batch_size(self) -> int:
+        """Items per batch suited to this host, for sizing batches to the pool."""
+        return optimal_batch_size()
+
+    async def run(self, func: Callable[..., Any], *args: Any,
+                  deadline: Optional[Deadline] = None) -> Any:
+        """
+        Run a function on the backend.
+
+        With a deadline, the call is dropped if the deadline has passed
+        before dispatch, and abandoned if it passes while waiting; a call
+        still queued in the pool is then cancelled before it starts.
+
+        Args:
+            func: Function to call (picklable for the process backend)
+            *args: Positional arguments
+            deadline: Deadline of the request the call belongs to
+
+        Returns:
+            The function's return value
+
+        Raises:
+            DeadlineExceeded: If the deadline passes before the call returns
+        """
+        if deadline is None:
+            self._stats['calls'] += 1
+            return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+
+        try:
+            deadline.check("executor dispatch")
+        except DeadlineExceeded:
+            self._stats['expired_before_dispatch'] += 1
+            raise
+
+        self._stats['calls'] += 1
+        future = asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+        try:
+            return await asyncio.wait_for(future, deadline.timeout())
+        except asyncio.TimeoutError:
+            self._stats['expired_in_flight'] += 1
+            raise DeadlineExceeded("executor wait", -deadline.remaining()) from None
+
+    async def run_batch(self, func: Callable[[List[Any]], Sequence[Any]],
+                        items: List[Any], deadline: Optional[Deadline] = None) -> List[Any]:
+        """
+        Run a batch function on the backend.
+
+        Deadlines are handled as in ``run``.
+
+        Args:
+            func: Batch function returning one result per item
+            items: Batch items
+            deadline: Deadline of the request the batch belongs to
+
+        Returns:
+            List of results
+
+        Raises:
+            DeadlineExceeded: If the deadline passes before the batch returns
+        """
+        if deadline is None:
+            return await self._run_batch(func, items)
+
+        try:
+            deadline.check("executor dispatch")
+        except DeadlineExceeded:
+            self._stats['expired_before_dispatch'] += 1
+            raise
+
+        try:
+            return await asyncio.wait_for(self._run_batch(func, items), deadline.timeout())
+        except asyncio.TimeoutError:
+            self._stats['expired_in_flight'] += 1
+            raise DeadlineExceeded("executor wait", -deadline.remaining()) from None
+
+    async def _run_batch(self, func: Callable[[List[Any]], Sequence[Any]],
+                         items: List[Any]) -> List[Any]:
+        """Run a batch, returning byte string results through shared memory where possible."""
+        self._stats['batches'] += 1
+        self._stats['batch_items'] += len(items)
+        if self.backend == ExecutorBackend.THREAD:
+            return list(await asyncio.get_running_loop().run_in_executor(self.executor, func, items))
+
+        future = asyncio.get_running_loop().run_in_executor(
+            self.executor, _run_packed, func, items, self.shared_memory_threshold)
+        try:
+            name, payload = await asyncio.shield(future)
+        except asyncio.CancelledError:
+            future.add_done_callback(self._segments.discard)
+            raise
+
+        if name is None:
+            return payload
+        self._stats['shared_memory_batches'] += 1
+        return self._segments.read(name, payload)
+
+    def shutdown(self, wait: bool = True):
+        """Shut down the underlying pool and remove its result segments."""
+        self.executor.shutdown(wait=wait)
+        if wait:
+            self._segments.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get executor statistics.
+
+        Returns:
+            Dictionary with executor statistics
+        """
+        workers = getattr(self.executor, '_processes', None) or getattr(self.executor, '_threads', ())
+        return {
+            "backend": self.backend.value,
+            "max_workers": self.max_workers,
+            "workers": len(workers),
+            "shutdown": getattr(self.executor, '_shutdown_thread', False) or getattr(self.executor, '_shutdown', False),
+            "batch_size": self.batch_size(),
+            "stats": dict(self._stats)
+        }
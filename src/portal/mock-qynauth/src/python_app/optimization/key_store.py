@@ -0,0 +1,116 @@
+"""
+Compact PQC Key Storage
+
+This module keeps users' PQC keys as bytes in a slotted StoredKey, instead
+of the integer lists the FFI returns. A list holds an 8-byte pointer per
+key byte, so an ML-DSA-65 private key takes over 32 KB as a list and about
+4 KB as bytes.
+
+Compliance:
+- NIST SP 800-53 (SC-12): Cryptographic Key Establishment and Management
+- NIST SP 800-53 (SC-28): Protection of Information at Rest
+"""
+
+import threading
+from collections import defaultdict
+from typing import Any, Dict, Optional
+
+from ..monitoring.pqc_logger import pqc_logger
+from ..pqc_ffi import PQCLibrary, get_pqc_library
+
+# Keygen method of PQCLibrary per algorithm
+_ALGORITHMS = {
+    "ML-KEM-768": "generate_ml_kem_keypair",
+    "ML-DSA-65": "generate_ml_dsa_keypair",
+}
+
+class StoredKey:
+    """A user's keypair as kept at rest, with both keys as bytes."""
+    __slots__ = ("algorithm", "public_key", "private_key")
+
+    def __init__(self, algorithm: str, public_key: bytes, private_key: bytes):
+        self.algorithm = algorithm
+        self.public_key = public_key
+        self.private_key = private_key
+
+    def __repr__(self) -> str:
+        return f"StoredKey({self.algorithm}, {len(self.private_key)} byte private key)"
+
+class PQCKeyStore:
+    """
+    Key generation for keys stored as bytes.
+
+    Thread-safe.
+    """
+
+    def __init__(self, library: Optional[PQCLibrary] = None):
+        """
+        Initialize key store.
+
+        Args:
+            library: PQC library to use (the shared instance if None)
+        """
+        self.library = library or get_pqc_library()
+        self._lock = threading.Lock()
+        self._stats = defaultdict(int)
+
+        pqc_logger.log_pqc_operation(
+            "info",
+            "PQC key store initialized",
+            pqc_operation="key_store_init"
+        )
+
+    def generate(self, algorithm: str) -> StoredKey:
+        """
+        Generate a keypair to store.
+
+        Args:
+            algorithm: "ML-KEM-768" or "ML-DSA-65"
+
+        Returns:
+            StoredKey holding the keys as bytes
+
+        Raises:
+            ValueError: If the algorithm is not supported
+        """
+        if algorithm not in _ALGORITHMS:
+            raise ValueError(f"Unsupported algorithm: {algorithm}")
+
+        keypair = getattr(self.library, _ALGORITHMS[algorithm])()
+        with self._lock:
+            self._stats['generated'] += 1
+        return StoredKey(algorithm, bytes(keypair['public_key']), bytes(keypair['private_key']))
+
+    def keypair(self, stored_key: StoredKey) -> Dict[str, Any]:
+        """
+        Keypair of a stored key.
+
+        Args:
+            stored_key: Key from generate()
+
+        Returns:
+            Dictionary with public_key and private_key as bytes, and algorithm
+        """
+        return {
+            'public_key': stored_key.public_key,
+            'private_key': stored_key.private_key,
+            'algorithm': stored_key.algorithm
+        }
+
+    def public_key(self, stored_key: StoredKey) -> bytes:
+        """Public key of a stored key."""
+        return stored_key.public_key
+
+    def private_key(self, stored_key: StoredKey) -> bytes:
+        """Private key of a stored key."""
+        return stored_key.private_key
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get key store statistics.
+
+        Returns:
+            Dictionary with key store statistics
+        """
+        with self._lock:
+            return {"stats": dict(self._stats)}
@@ -0,0 +1,314 @@
+"""
+Native Completion Queue for Async PQC Operations
+
+This module runs signing, verification, encapsulation and decapsulation on
+worker threads owned by the Rust library, instead of one executor thread
+per call. Completions are signalled on a pipe that the event loop watches
+with ``loop.add_reader``, and each call awaits a plain asyncio future, so a
+single process can keep thousands of operations in flight with no Python
+thread parked on any of them.
+
+The queue needs a library built with the ``ffi_async_*`` exports; with an
+older build ``open_native_queue()`` returns None and callers keep using
+the executor.
+
+Experimental: the library build checked in with the service predates the
+``ffi_async_*`` exports, so the queue only runs against a library rebuilt
+from the current Rust sources, and the executor remains the default path.
+
+Compliance:
+- NIST SP 800-53 (SC-13): Cryptographic Protection
+- NIST SP 800-53 (AU-3): Audit and Accountability
+"""
+
+import asyncio
+import ctypes
+import itertools
+from collections import defaultdict
+from typing import Any, Dict, Optional, Tuple
+
+from ..monitoring.pqc_logger import pqc_logger
+from ..pqc_ffi import CAsyncCompletion, PQCLibrary, PQCLibraryError, get_pqc_library
+from .deadline import Deadline, DeadlineExceeded
+
+_SUCCESS = 0
+_SIGNATURE_VERIFICATION_FAILED = -7
+
+def _c_buffer(data: bytes) -> Tuple[Any, int]:
+    """C copy of a byte string; the library copies it again on submission."""
+    return (ctypes.c_uint8 * len(data)).from_buffer_copy(data), len(data)
+
+class NativeAsyncQueue:
+    """
+    PQC operations on the native library's worker threads, awaited as futures.
+
+    Not thread-safe: use one queue per event loop. The loop is bound on the
+    first submission.
+    """
+
+    def __init__(self, library: Optional[PQCLibrary] = None, workers: int = 0,
+                 poll_batch: int = 64):
+        """
+        Initialize queue.
+
+        Args:
+            library: PQC library to use (the shared instance if None)
+            workers: Native worker threads (one per CPU if 0)
+            poll_batch: Completions collected per poll of the library
+
+        Raises:
+            PQCLibraryError: If the library has no completion queue or it cannot be opened
+        """
+        self.library = library or get_pqc_library()
+        if not self.library.supports_native_async():
+            raise PQCLibraryError("PQC library does not export the native completion queue")
+
+        self._lib = self.library.lib
+        self._queue = self._lib.ffi_async_open(workers)
+        if not self._queue:
+            raise PQCLibraryError("Failed to open native completion queue")
+
+        self._fd = self._lib.ffi_async_fd(self._queue)
+        self._completions = (CAsyncCompletion * poll_batch)()
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._request_ids = itertools.count(1)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stats = defaultdict(int)
+
+        pqc_logger.log_pqc_operation(
+            "info",
+            f"Native completion queue opened on fd {self._fd}",
+            pqc_operation="native_queue_init",
+            workers=workers,
+            fd=self._fd
+        )
+
+    @property
+    def in_flight(self) -> int:
+        """Operations submitted and not yet completed."""
+        return len(self._pending)
+
+    def _bind_loop(self) -> asyncio.AbstractEventLoop:
+        """Watch the completion pipe on the running loop, the first time round."""
+        loop = asyncio.get_running_loop()
+        if self._loop is None:
+            if self._queue is None:
+                raise PQCLibraryError("Native completion queue is closed")
+            loop.add_reader(self._fd, self._drain)
+            self._loop = loop
+        elif self._loop is not loop:
+            raise RuntimeError("Native completion queue is bound to another event loop")
+        return loop
+
+    def _drain(self):
+        """Resolve the futures of all waiting completions (reader callback)."""
+        capacity = len(self._completions)
+        while True:
+            count = self._lib.ffi_async_poll(self._queue, self._completions, capacity)
+            for completion in self._completions[:count]:
+                self._complete(completion)
+            if count < capacity:
+                return
+
+    def _complete(self, completion: CAsyncCompletion):
+        """Copy out and free one completion's buffers and resolve its future."""
+        output = self._take_buffer(completion.output_ptr, completion.output_len)
+        extra = self._take_buffer(completion.extra_ptr, completion.extra_len)
+
+        future = self._pending.pop(completion.request_id, None)
+        if future is None or future.done():
+            self._stats['abandoned'] += 1  # Caller gave up: deadline or cancellation
+            return
+        self._stats['completed'] += 1
+        future.set_result((completion.status, output, extra))
+
+    def _take_buffer(self, pointer, length: int) -> bytes:
+        """Bytes of a library-allocated buffer, which is then freed."""
+        if not length:
+            return b""
+        data = ctypes.string_at(pointer, length)
+        self._lib.ffi_buffer_free(pointer, length)
+        return data
+
+    async def _submit(self, submit, *buffers: bytes,
+                      deadline: Optional[Deadline] = None) -> Tuple[int, bytes, bytes]:
+        """Submit an operation and await its status and output buffers."""
+        loop = self._bind_loop()
+        if deadline is not None:
+            try:
+                deadline.check("native dispatch")
+            except DeadlineExceeded:
+                self._stats['expired_before_dispatch'] += 1
+                raise
+
+        request_id = next(self._request_ids)
+        args = []
+        for data in buffers:
+            args.extend(_c_buffer(data))
+
+        status = submit(self._queue, request_id, *args)
+        if status != _SUCCESS:
+            raise PQCLibraryError(f"Native submission failed with FFI error code {status}")
+
+        future = loop.create_future()
+        self._pending[request_id] = future
+        self._stats['submitted'] += 1
+        try:
+            if deadline is None:
+                return await future
+            try:
+                return await asyncio.wait_for(future, deadline.timeout())
+            except asyncio.TimeoutError:
+                self._stats['expired_in_flight'] += 1
+                raise DeadlineExceeded("native wait", -deadline.remaining()) from None
+        finally:
+            self._pending.pop(request_id, None)
+
+    @staticmethod
+    def _check(status: int, operation: str):
+        """Raise for a failed operation."""
+        if status != _SUCCESS:
+            raise PQCLibraryError(f"Native {operation} failed with FFI error code {status}")
+
+    async def verify(self, public_key: bytes, message: bytes, signature: bytes,
+                     deadline: Optional[Deadline] = None) -> bool:
+        """
+        Verify an ML-DSA-65 signature.
+
+        Args:
+            public_key: Signer's public key
+            message: Signed message
+            signature: Signature to verify
+            deadline: Optional deadline; the wait is abandoned once it passes
+
+        Returns:
+            True if the signature is valid, False otherwise
+        """
+        status, _, _ = await self._submit(self._lib.ffi_async_submit_verify,
+                                          public_key, message, signature, deadline=deadline)
+        if status == _SIGNATURE_VERIFICATION_FAILED:
+            return False
+        self._check(status, "verification")
+        return True
+
+    async def sign(self, private_key: bytes, message: bytes,
+                   deadline: Optional[Deadline] = None) -> bytes:
+        """
+        Sign a message with ML-DSA-65.
+
+        Args:
+            private_key: Signer's private key
+            message: Message to sign
+            deadline: Optional deadline; the wait is abandoned once it passes
+
+        Returns:
+            Signature bytes
+        """
+        status, signature, _ = await self._submit(self._lib.ffi_async_submit_sign,
+                                                  private_key, message, deadline=deadline)
+        self._check(status, "signing")
+        return signature
+
+    async def encapsulate(self, public_key: bytes,
+                          deadline: Optional[Deadline] = None) -> Tuple[bytes, bytes]:
+        """
+        Encapsulate a shared secret with ML-KEM-768.
+
+        Args:
+            public_key: Recipient's public key
+            deadline: Optional deadline; the wait is abandoned once it passes
+
+        Returns:
+            Tuple of (shared_secret, ciphertext)
+        """
+        status, shared_secret, ciphertext = await self._submit(
+            self._lib.ffi_async_submit_encaps, public_key, deadline=deadline)
+        self._check(status, "encapsulation")
+        return shared_secret, ciphertext
+
+    async def decapsulate(self, private_key: bytes, ciphertext: bytes,
+                          deadline: Optional[Deadline] = None) -> bytes:
+        """
+        Recover a shared secret with ML-KEM-768.
+
+        Args:
+            private_key: Recipient's private key
+            ciphertext: Ciphertext to decapsulate
+            deadline: Optional deadline; the wait is abandoned once it passes
+
+        Returns:
+            Shared secret bytes
+        """
+        status, shared_secret, _ = await self._submit(self._lib.ffi_async_submit_decaps,
+                                                      private_key, ciphertext, deadline=deadline)
+        self._check(status, "decapsulation")
+        return shared_secret
+
+    def _detach(self) -> Optional[int]:
+        """Stop watching the pipe and cancel waiting callers; return the queue to free."""
+        queue, self._queue = self._queue, None
+        if queue is None:
+            return None
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.remove_reader(self._fd)
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        return queue
+
+    def close(self):
+        """
+        Stop watching the pipe, cancel waiting callers and free the queue.
+
+        Blocks until the native workers finish operations already submitted;
+        on the event loop, use ``aclose()`` instead.
+        """
+        queue = self._detach()
+        if queue is not None:
+            self._lib.ffi_async_close(queue)
+
+    async def aclose(self):
+        """
+        Close the queue without blocking the event loop.
+
+        The native workers are joined in a worker thread.
+        """
+        queue = self._detach()
+        if queue is not None:
+            await asyncio.to_thread(self._lib.ffi_async_close, queue)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get queue statistics.
+
+        Returns:
+            Dictionary with queue statistics
+        """
+        return {
+            "fd": self._fd,
+            "in_flight": len(self._pending),
+            "closed": self._queue is None,
+            "stats": dict(self._stats)
+        }
+
+def open_native_queue(library: Optional[PQCLibrary] = None,
+                      workers: int = 0) -> Optional[NativeAsyncQueue]:
+    """
+    Open a native completion queue if the library supports one.
+
+    Args:
+        library: PQC library to use (the shared instance if None)
+        workers: Native worker threads (one per CPU if 0)
+
+    Returns:
+        NativeAsyncQueue, or None if the library is missing or predates the queue
+    """
+    try:
+        return NativeAsyncQueue(library, workers)
+    except (PQCLibraryError, OSError) as e:
+        pqc_logger.log_pqc_operation(
+            "info",
+            f"Native completion queue unavailable, using the executor: {str(e)}",
+            pqc_operation="native_queue_init"
+        )
+        return None
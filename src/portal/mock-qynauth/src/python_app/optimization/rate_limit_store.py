@@ -0,0 +1,341 @@
+"""
+PQC Shared Rate Limit Store
+
+This module provides a fixed-size rate limit state table in POSIX shared
+memory, so that every worker process on a host enforces one budget per
+user and operation instead of one budget per process.
+
+The table is an open-addressed array of fixed-size cells keyed by a
+64-bit digest of the rate limit key. Cells are grouped into stripes; each
+stripe is guarded by a thread lock within the process and a byte-range
+lock on a companion lock file across processes.
+
+Compliance:
+- NIST SP 800-53 (SC-5): Denial of Service Protection
+- NIST SP 800-53 (SC-13): Cryptographic Protection
+"""
+
+import hashlib
+import os
+import struct
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+from ..monitoring.pqc_logger import pqc_logger
+from .shared_segments import open_shared_memory, unlink_shared_memory
+
+_TABLE_MAGIC = b"PQCRLv02"
+_TABLE_HEADER = struct.Struct("<8sII")  # magic, slot_count, stripe_count
+_TABLE_HEADER_SIZE = 64
+# digest, tat, window_id, window_count, previous_count, blocked_until,
+# reclaim_at, total_requests, blocked_requests
+_CELL = struct.Struct("<QdqddddII")
+_CELL_FIELDS = (
+    "tat", "window_id", "window_count", "previous_count",
+    "blocked_until", "reclaim_at", "total_requests", "blocked_requests"
+)
+_RECLAIM_AT_INDEX = 6
+_get_cell_fields = attrgetter(*_CELL_FIELDS)
+_COUNTER_MAX = 0xFFFFFFFF
+_MAX_PROBE = 8
+
+def _key_digest(key: str) -> int:
+    """Non-zero 64-bit digest of a rate limit key."""
+    digest = int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "little")
+    return digest or 1
+
+class SharedRateLimitTable:
+    """
+    Host-wide rate limit state table in shared memory.
+
+    The first process to open a table name creates it; later processes
+    attach to the existing segment. When every cell in a key's probe
+    window holds live state, the cell that goes idle soonest is reused.
+    """
+
+    def __init__(self, name: str = "pqc_rate_limit", slots: int = 65536, stripes: int = 64,
+                 lock_dir: Optional[str] = None):
+        """
+        Open or create a shared table.
+
+        Args:
+            name: Shared memory segment name, shared by all workers
+            slots: Number of cells (ignored when attaching)
+            stripes: Number of lock stripes (ignored when attaching)
+            lock_dir: Directory for the lock file (defaults to the temp directory)
+        """
+        self.name = name
+        self._lock_path = os.path.join(lock_dir or tempfile.gettempdir(), f"{name}.lock")
+        self._lock_fd = os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        self._stats = defaultdict(int)
+
+        with self._file_lock(0, 1):
+            try:
+                stripes = max(1, stripes)
+                slots = max(stripes, slots // stripes * stripes)
+                self._shm = open_shared_memory(
+                    name, True, _TABLE_HEADER_SIZE + slots * _CELL.size)
+                _TABLE_HEADER.pack_into(self._shm.buf, 0, _TABLE_MAGIC, slots, stripes)
+                created = True
+            except FileExistsError:
+                self._shm = open_shared_memory(name, False)
+                magic, slots, stripes = _TABLE_HEADER.unpack_from(self._shm.buf, 0)
+                if magic != _TABLE_MAGIC:
+                    self._shm.close()
+                    raise ValueError(f"Shared memory segment {name} is not a rate limit table")
+                created = False
+
+        self.slots = slots
+        self.stripes = stripes
+        self._stripe_slots = slots // stripes
+        self._buf = self._shm.buf
+        self._thread_locks = [threading.Lock() for _ in range(stripes)]
+
+        pqc_logger.log_pqc_operation(
+            "info",
+            f"Shared rate limit table {'created' if created else 'attached'}: {name}",
+            pqc_operation="rate_limit_shared_open",
+            slots=slots,
+            stripes=stripes,
+            cross_process_locking=fcntl is not None
+        )
+
+    @contextmanager
+    def _file_lock(self, offset: int, length: int) -> Iterator[None]:
+        """Hold an exclusive byte-range lock on the lock file."""
+        if fcntl is None:
+            yield
+            return
+        fcntl.lockf(self._lock_fd, fcntl.LOCK_EX, length, offset)
+        try:
+            yield
+        finally:
+            fcntl.lockf(self._lock_fd, fcntl.LOCK_UN, length, offset)
+
+    def _acquire(self, stripe: int):
+        """Lock a stripe against other threads and other processes."""
+        self._thread_locks[stripe].acquire()
+        if fcntl is not None:
+            try:
+                fcntl.lockf(self._lock_fd, fcntl.LOCK_EX, 1, stripe + 1)
+            except BaseException:
+                self._thread_locks[stripe].release()
+                raise
+
+    def _release(self, stripe: int):
+        """Unlock a stripe."""
+        try:
+            if fcntl is not None:
+                fcntl.lockf(self._lock_fd, fcntl.LOCK_UN, 1, stripe + 1)
+        finally:
+            self._thread_locks[stripe].release()
+
+    @contextmanager
+    def _stripe_lock(self, stripe: int) -> Iterator[None]:
+        """Hold a stripe for the duration of a block."""
+        self._acquire(stripe)
+        try:
+            yield
+        finally:
+            self._release(stripe)
+
+    def _offsets(self, digest: int) -> List[int]:
+        """Cell offsets of the probe window for a digest, within its stripe."""
+        stripe_slots = self._stripe_slots
+        base = _TABLE_HEADER_SIZE + (digest % self.stripes) * stripe_slots * _CELL.size
+        start = (digest >> 16) % stripe_slots
+        return [
+            base + ((start + i) % stripe_slots) * _CELL.size
+            for i in range(min(_MAX_PROBE, stripe_slots))
+        ]
+
+    def _find(self, digest: int, current_time: float) -> Tuple[int, Optional[tuple]]:
+        """
+        Locate a key's cell, or the cell to use for it. Must hold the stripe lock.
+
+        Returns:
+            (offset, cell fields or None if the key has no live state)
+        """
+        buf = self._buf
+        free_offset = None
+        oldest_offset = None
+        oldest_reclaim = None
+
+        for offset in self._offsets(digest):
+            cell = _CELL.unpack_from(buf, offset)
+            if cell[0] == digest:
+                return offset, cell[1:]
+            if cell[0] == 0 or cell[_RECLAIM_AT_INDEX] <= current_time:
+                if free_offset is None:
+                    free_offset = offset
+            elif oldest_reclaim is None or cell[_RECLAIM_AT_INDEX] < oldest_reclaim:
+                oldest_offset = offset
+                oldest_reclaim = cell[_RECLAIM_AT_INDEX]
+
+        if free_offset is None:
+            free_offset = oldest_offset
+            self._stats['evictions'] += 1
+        elif _CELL.unpack_from(buf, free_offset)[0] != 0:
+            self._stats['reclaimed'] += 1
+        return free_offset, None
+
+    def update(self, key: str, apply: Callable[[Any], Any], factory: Callable[..., Any],
+               current_time: Optional[float] = None) -> Any:
+        """
+        Atomically read, modify and write back the state for a key.
+
+        Args:
+            key: Rate limit key
+            apply: Function mutating the state object and returning a result
+            factory: State constructor taking the cell fields positionally,
+                in ``_CELL_FIELDS`` order
+            current_time: Time used to decide which cells are idle
+
+        Returns:
+            The result of ``apply``
+        """
+        digest = _key_digest(key)
+        stripe = digest % self.stripes
+        if current_time is None:
+            current_time = time.time()
+
+        self._acquire(stripe)
+        try:
+            offset, fields = self._find(digest, current_time)
+            state = factory() if fields is None else factory(*fields)
+            result = apply(state)
+            self._store(offset, digest, state)
+        finally:
+            self._release(stripe)
+        return result
+
+    @contextmanager
+    def transaction(self, keys: List[str], factory: Callable[..., Any],
+                    current_time: Optional[float] = None) -> Iterator[List[Any]]:
+        """
+        Lock the states of several keys together and write them back on exit.
+
+        Stripes are locked in ascending order, so concurrent transactions
+        cannot deadlock. Leaving the block with an exception discards changes.
+
+        Args:
+            keys: Distinct rate limit keys
+            factory: State constructor, as for ``update``
+            current_time: Time used to decide which cells are idle
+
+        Yields:
+            States in the order of ``keys``
+        """
+        digests = [_key_digest(key) for key in keys]
+        if current_time is None:
+            current_time = time.time()
+
+        acquired = []
+        try:
+            for stripe in sorted({digest % self.stripes for digest in digests}):
+                self._acquire(stripe)
+                acquired.append(stripe)
+
+            offsets = []
+            states = []
+            for digest in digests:
+                offset, fields = self._find(digest, current_time)
+                if fields is None:
+                    state = factory()
+                    # Claim the cell so later keys in the same window skip it.
+                    self._store(offset, digest, state)
+                else:
+                    state = factory(*fields)
+                offsets.append(offset)
+                states.append(state)
+
+            yield states
+
+            for digest, offset, state in zip(digests, offsets, states):
+                self._store(offset, digest, state)
+        finally:
+            for stripe in reversed(acquired):
+                self._release(stripe)
+
+    def _store(self, offset: int, digest: int, state: Any):
+        """Write a state into a cell. Must hold the stripe lock."""
+        (tat, window_id, window_count, previous_count,
+         blocked_until, reclaim_at, total_requests, blocked_requests) = _get_cell_fields(state)
+        _CELL.pack_into(
+            self._buf, offset, digest, tat, window_id,
+            window_count, previous_count, blocked_until, reclaim_at,
+            min(total_requests, _COUNTER_MAX), min(blocked_requests, _COUNTER_MAX)
+        )
+
+    def peek(self, key: str, factory: Callable[..., Any]) -> Optional[Any]:
+        """Return a copy of the state for a key, or None if it has none."""
+        digest = _key_digest(key)
+        with self._stripe_lock(digest % self.stripes):
+            for offset in self._offsets(digest):
+                cell = _CELL.unpack_from(self._buf, offset)
+                if cell[0] == digest:
+                    return factory(*cell[1:])
+        return None
+
+    def remove(self, key: str) -> bool:
+        """Delete the state for a key."""
+        digest = _key_digest(key)
+        with self._stripe_lock(digest % self.stripes):
+            for offset in self._offsets(digest):
+                if _CELL.unpack_from(self._buf, offset)[0] == digest:
+                    self._buf[offset:offset + _CELL.size] = bytes(_CELL.size)
+                    return True
+        return False
+
+    def clear(self):
+        """Delete every entry."""
+        for stripe in range(self.stripes):
+            with self._stripe_lock(stripe):
+                start = _TABLE_HEADER_SIZE + stripe * self._stripe_slots * _CELL.size
+                end = start + self._stripe_slots * _CELL.size
+                self._buf[start:end] = bytes(end - start)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Table occupancy and this process's reuse counters.
+
+        Scans every cell, so it is meant for monitoring rather than hot paths.
+        """
+        current_time = time.time()
+        live = 0
+        for index in range(self.slots):
+            cell = _CELL.unpack_from(self._buf, _TABLE_HEADER_SIZE + index * _CELL.size)
+            if cell[0] and cell[_RECLAIM_AT_INDEX] > current_time:
+                live += 1
+        return {
+            "name": self.name,
+            "slots": self.slots,
+            "stripes": self.stripes,
+            "live_entries": live,
+            "reclaimed": self._stats['reclaimed'],
+            "evictions": self._stats['evictions']
+        }
+
+    def close(self):
+        """Detach from the shared segment."""
+        self._buf = None
+        self._shm.close()
+        os.close(self._lock_fd)
+
+    def unlink(self):
+        """Remove the shared segment and lock file once no worker needs them."""
+        for remove in (lambda: unlink_shared_memory(self._shm), lambda: os.remove(self._lock_path)):
+            try:
+                remove()
+            except FileNotFoundError:
+                pass
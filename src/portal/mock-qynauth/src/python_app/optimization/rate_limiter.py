@@ -9,15 +9,19 @@ Compliance:
 - NIST SP 800-53 (AU-3): Audit and Accountability
 """
 
-import asyncio
+import sys
+import threading
 import time
 import functools
-from typing import Dict, List, Optional, Any, Callable
-from dataclasses import dataclass, field
-from collections import defaultdict
+from contextlib import ExitStack, nullcontext
+from typing import Dict, List, Optional, Any, Callable, Tuple
+from dataclasses import dataclass, replace
+from collections import OrderedDict, defaultdict
 from enum import Enum
 
 from ..monitoring.pqc_logger import pqc_logger
+from ..monitoring.performance_monitor import performance_monitor
+from .rate_limit_store import SharedRateLimitTable
 
 class RateLimitStrategy(Enum):
     """Rate limiting strategies."""
@@ -25,6 +29,17 @@ class RateLimitStrategy(Enum):
     SLIDING_WINDOW = "sliding_window"
     TOKEN_BUCKET = "token_bucket"
 
+class RateLimitBackend(Enum):
+    """Where rate limit state is kept."""
+    LOCAL = "local"  # Per-process memory
+    SHARED_MEMORY = "shared_memory"  # Host-wide shared memory table
+
+class QuotaLevel(Enum):
+    """Levels of the shared quota hierarchy, outermost first."""
+    GLOBAL = "global"
+    TENANT = "tenant"  # Tenant or client IP
+    USER = "user"
+
 @dataclass
 class RateLimitConfig:
     """Rate limit configuration."""
@@ -33,31 +48,84 @@ class RateLimitConfig:
     strategy: RateLimitStrategy = RateLimitStrategy.SLIDING_WINDOW
     burst_allowance: int = 0  # Additional requests allowed in burst
     cooldown_period: float = 0.0  # Cooldown after limit exceeded
+    backend: RateLimitBackend = RateLimitBackend.LOCAL
+    shared_table: str = "pqc_rate_limit"  # Shared memory table name for SHARED_MEMORY
 
 @dataclass
 class RateLimitState:
-    """Rate limit state for a user/operation."""
-    requests: List[float] = field(default_factory=list)
-    tokens: float = 0.0
-    last_refill: float = field(default_factory=time.time)
+    """
+    Rate limit state for a user/operation.
+    
+    Every strategy keeps a fixed number of fields, so memory and time per
+    check do not grow with the request rate.
+    """
+    tat: float = 0.0  # GCRA theoretical arrival time (token bucket)
+    window_id: int = -1  # Index of the current fixed window
+    window_count: float = 0  # Request cost allowed in the current window
+    previous_count: float = 0  # Request cost allowed in the previous window
     blocked_until: float = 0.0
+    reclaim_at: float = 0.0  # Time after which the state is indistinguishable from a fresh one
     total_requests: int = 0
     blocked_requests: int = 0
 
+_STATE_BYTES = sys.getsizeof(RateLimitState()) + sys.getsizeof(vars(RateLimitState())) + 100
+_RECLAIM_BATCH_SIZE = 8
+
+_QUOTA_KEY_PREFIX = "\0quota"
+
+_OUTCOME_STATS = {
+    "allowed": "requests_allowed",
+    "blocked": "requests_blocked",
+    "cooldown": "requests_blocked_cooldown"
+}
+
+class _RateLimitShard:
+    """
+    One lock-protected partition of the rate limit state.
+    
+    States are kept in least recently used order. Idle states are reclaimed
+    lazily from the cold end on each access, and the least recently used
+    state is evicted when the shard exceeds its memory share.
+    """
+    
+    def __init__(self, max_memory_bytes: int):
+        self.lock = threading.Lock()
+        self.states: "OrderedDict[str, RateLimitState]" = OrderedDict()
+        self.max_memory_bytes = max_memory_bytes
+        self.memory = 0
+        self.stats = defaultdict(int)
+
 class PQCRateLimiter:
     """
     Rate limiter for PQC operations with multiple strategies.
     
     This class provides rate limiting capabilities with different strategies
     to prevent abuse and ensure fair usage of PQC operations.
+    
+    State is sharded by key hash with a lock per shard, so checks for
+    different users rarely contend. A state is reclaimed once it has gone
+    idle long enough to be equivalent to a fresh one, and the memory budget
+    bounds the number of states kept for floods of distinct user IDs.
+    
+    Operations configured with the SHARED_MEMORY backend keep their state
+    in a host-wide shared memory table instead, so all worker processes
+    enforce a single budget.
+    
+    Optional quotas add global, tenant (or client IP) and user budgets on
+    top of the per user/operation limits. Quotas are measured in cost
+    units, where each operation is charged its configured cost weight, and
+    a request is only recorded if every level admits it.
     """
     
-    def __init__(self, default_config: Optional[RateLimitConfig] = None):
+    def __init__(self, default_config: Optional[RateLimitConfig] = None,
+                 max_memory_mb: float = 64.0, shards: int = 16):
         """
         Initialize PQC rate limiter.
         
         Args:
             default_config: Default rate limit configuration
+            max_memory_mb: Memory budget for per-user state in megabytes
+            shards: Number of state shards (rounded down to a power of two)
         """
         self.default_config = default_config or RateLimitConfig(
             max_requests=100,
@@ -65,10 +133,17 @@ class PQCRateLimiter:
             strategy=RateLimitStrategy.SLIDING_WINDOW
         )
         
-        self._user_states: Dict[str, RateLimitState] = defaultdict(RateLimitState)
+        shard_count = 1 << (max(1, shards).bit_length() - 1)
+        self.max_memory_bytes = int(max_memory_mb * 1024 * 1024)
+        self._shards = [
+            _RateLimitShard(self.max_memory_bytes // shard_count) for _ in range(shard_count)
+        ]
+        self._shard_mask = shard_count - 1
         self._operation_configs: Dict[str, RateLimitConfig] = {}
-        self._lock = asyncio.Lock()
-        self._stats = defaultdict(int)
+        self._shared_tables: Dict[str, SharedRateLimitTable] = {}
+        self._shared_tables_lock = threading.Lock()
+        self._quota_configs: Dict[QuotaLevel, RateLimitConfig] = {}
+        self._operation_costs: Dict[str, float] = {}
         
         pqc_logger.log_pqc_operation(
             "info",
@@ -103,121 +178,452 @@ class PQCRateLimiter:
         """Get rate limit configuration for an operation."""
         return self._operation_configs.get(operation, self.default_config)
     
-    def _cleanup_old_requests(self, requests: List[float], time_window: float):
-        """Remove requests outside the time window."""
-        current_time = time.time()
-        cutoff_time = current_time - time_window
+    def configure_quota(self, level: QuotaLevel, config: Optional[RateLimitConfig]):
+        """
+        Configure a quota level.
         
-        while requests and requests[0] < cutoff_time:
-            requests.pop(0)
+        The level's max_requests is its budget in cost units per time
+        window, shared by all operations.
+        
+        Args:
+            level: Quota level
+            config: Quota configuration (None to remove the level)
+        """
+        quota_configs = dict(self._quota_configs)
+        if config is None:
+            quota_configs.pop(level, None)
+        else:
+            quota_configs[level] = config
+        # Keep levels ordered outermost first for evaluation.
+        self._quota_configs = {
+            quota_level: quota_configs[quota_level]
+            for quota_level in QuotaLevel if quota_level in quota_configs
+        }
+        
+        pqc_logger.log_pqc_operation(
+            "info",
+            f"Rate limit quota configured: {level.value}",
+            pqc_operation="rate_limit_quota_config",
+            quota_level=level.value,
+            max_cost=config.max_requests if config else None,
+            time_window=config.time_window if config else None
+        )
     
-    def _check_fixed_window(self, state: RateLimitState, config: RateLimitConfig) -> bool:
-        """Check rate limit using fixed window strategy."""
-        current_time = time.time()
-        window_start = int(current_time / config.time_window) * config.time_window
+    def set_operation_cost(self, operation: str, cost: float):
+        """
+        Set the cost weight charged to quotas for an operation.
         
-        requests_in_window = sum(
-            1 for req_time in state.requests
-            if req_time >= window_start
+        Args:
+            operation: PQC operation name
+            cost: Cost in units relative to the cheapest operation (default 1.0)
+        """
+        if cost <= 0:
+            raise ValueError(f"Operation cost must be positive, got {cost}")
+        self._operation_costs[operation] = cost
+    
+    def get_operation_cost(self, operation: str) -> float:
+        """Get the cost weight charged to quotas for an operation."""
+        return self._operation_costs.get(operation, 1.0)
+    
+    def calibrate_costs(self, latencies_ms: Optional[Dict[str, float]] = None,
+                        reference_operation: Optional[str] = None) -> Dict[str, float]:
+        """
+        Set operation costs proportional to measured latencies.
+        
+        Args:
+            latencies_ms: Mean latency per operation (defaults to the
+                performance monitor's aggregated averages)
+            reference_operation: Operation that costs 1.0 (defaults to the fastest)
+            
+        Returns:
+            Calibrated cost per operation
+        """
+        if latencies_ms is None:
+            latencies_ms = {
+                operation: metrics["avg_duration_ms"]
+                for operation, metrics in performance_monitor.get_aggregated_metrics().items()
+            }
+        latencies_ms = {op: latency for op, latency in latencies_ms.items() if latency > 0}
+        if not latencies_ms:
+            return {}
+        
+        if reference_operation is not None:
+            reference_ms = latencies_ms[reference_operation]
+        else:
+            reference_ms = min(latencies_ms.values())
+        
+        costs = {op: latency / reference_ms for op, latency in latencies_ms.items()}
+        self._operation_costs.update(costs)
+        
+        pqc_logger.log_pqc_operation(
+            "info",
+            "Rate limit operation costs calibrated",
+            pqc_operation="rate_limit_cost_calibration",
+            costs=costs
         )
+        return costs
+    
+    def _quota_key(self, level: QuotaLevel, identifier: Optional[str] = None) -> str:
+        """State key of a quota level; user IDs cannot produce it."""
+        if level == QuotaLevel.GLOBAL:
+            return f"{_QUOTA_KEY_PREFIX}:global"
+        return f"{_QUOTA_KEY_PREFIX}:{level.value}:{identifier}"
+    
+    def _shard_for(self, key: str) -> _RateLimitShard:
+        """Shard holding the state for a key."""
+        return self._shards[hash(key) & self._shard_mask]
+    
+    def _reclaim_idle(self, shard: _RateLimitShard, current_time: float):
+        """Drop idle states from the cold end of a shard."""
+        states = shard.states
+        for _ in range(_RECLAIM_BATCH_SIZE):
+            if not states:
+                return
+            key = next(iter(states))
+            if states[key].reclaim_at > current_time:
+                return
+            del states[key]
+            shard.memory -= _STATE_BYTES + len(key)
+            shard.stats['states_reclaimed'] += 1
+    
+    def _get_state(self, shard: _RateLimitShard, key: str, current_time: float,
+                   reclaim: bool = True) -> RateLimitState:
+        """
+        Look up or create the state for a key. Must hold the shard lock.
         
-        return requests_in_window < config.max_requests
+        Callers fetching several states from one shard reclaim once up front
+        and pass ``reclaim=False``, since a state created by an earlier fetch
+        still looks idle until it is charged.
+        """
+        if reclaim:
+            self._reclaim_idle(shard, current_time)
+        
+        state = shard.states.get(key)
+        if state is not None:
+            shard.states.move_to_end(key)
+            return state
+        
+        state = shard.states[key] = RateLimitState()
+        shard.memory += _STATE_BYTES + len(key)
+        while shard.memory > shard.max_memory_bytes and len(shard.states) > 1:
+            evicted_key, _ = shard.states.popitem(last=False)
+            shard.memory -= _STATE_BYTES + len(evicted_key)
+            shard.stats['states_evicted'] += 1
+        return state
     
-    def _check_sliding_window(self, state: RateLimitState, config: RateLimitConfig) -> bool:
-        """Check rate limit using sliding window strategy."""
-        self._cleanup_old_requests(state.requests, config.time_window)
-        return len(state.requests) < config.max_requests
+    def _shared_table(self, config: RateLimitConfig) -> SharedRateLimitTable:
+        """Open (once per process) the shared table named by a config."""
+        table = self._shared_tables.get(config.shared_table)
+        if table is None:
+            with self._shared_tables_lock:
+                table = self._shared_tables.get(config.shared_table)
+                if table is None:
+                    table = SharedRateLimitTable(config.shared_table)
+                    self._shared_tables[config.shared_table] = table
+        return table
     
-    def _check_token_bucket(self, state: RateLimitState, config: RateLimitConfig) -> bool:
-        """Check rate limit using token bucket strategy."""
-        current_time = time.time()
+    def _update_reclaim_time(self, state: RateLimitState, config: RateLimitConfig):
+        """Record when the state stops influencing future decisions."""
+        if config.strategy == RateLimitStrategy.TOKEN_BUCKET:
+            reclaim_at = state.tat
+        elif config.strategy == RateLimitStrategy.SLIDING_WINDOW:
+            reclaim_at = (state.window_id + 2) * config.time_window
+        else:
+            reclaim_at = (state.window_id + 1) * config.time_window
+        state.reclaim_at = max(reclaim_at, state.blocked_until)
+    
+    def _roll_window(self, state: RateLimitState, config: RateLimitConfig,
+                     current_time: float) -> float:
+        """
+        Advance the window counters to the window containing current_time.
+        
+        Returns:
+            Fraction of the current window that has elapsed
+        """
+        position = current_time / config.time_window
+        window_id = int(position)
+        if window_id != state.window_id:
+            if window_id == state.window_id + 1:
+                state.previous_count = state.window_count
+            else:
+                state.previous_count = 0
+            state.window_id = window_id
+            state.window_count = 0
+        return position - window_id
+    
+    def _check_fixed_window(self, state: RateLimitState, config: RateLimitConfig,
+                            current_time: float, cost: float = 1.0) -> bool:
+        """Check and record a request using a counter per fixed window."""
+        self._roll_window(state, config, current_time)
+        if state.window_count >= config.max_requests:
+            return False
+        state.window_count += cost
+        return True
+    
+    def _sliding_window_count(self, state: RateLimitState, config: RateLimitConfig,
+                              current_time: float) -> float:
+        """Estimate requests in the trailing window from the current and previous counters."""
+        elapsed = self._roll_window(state, config, current_time)
+        return state.previous_count * (1.0 - elapsed) + state.window_count
+    
+    def _check_sliding_window(self, state: RateLimitState, config: RateLimitConfig,
+                              current_time: float, cost: float = 1.0) -> bool:
+        """
+        Check and record a request using the two-bucket sliding window approximation.
         
-        time_passed = current_time - state.last_refill
-        tokens_to_add = time_passed * (config.max_requests / config.time_window)
-        state.tokens = min(config.max_requests + config.burst_allowance, 
-                          state.tokens + tokens_to_add)
-        state.last_refill = current_time
+        The previous window's count is weighted by how much of it still
+        overlaps the trailing window, assuming its requests were evenly spread.
+        """
+        if self._sliding_window_count(state, config, current_time) >= config.max_requests:
+            return False
+        state.window_count += cost
+        return True
+    
+    def _check_token_bucket(self, state: RateLimitState, config: RateLimitConfig,
+                            current_time: float, cost: float = 1.0) -> bool:
+        """
+        Check and record a request using GCRA (generic cell rate algorithm).
         
-        if state.tokens >= 1.0:
-            state.tokens -= 1.0
-            return True
+        Equivalent to a token bucket refilled at max_requests per time_window
+        with capacity max_requests + burst_allowance, tracked as a single
+        theoretical arrival time.
+        """
+        emission_interval = config.time_window / config.max_requests
+        burst_tolerance = emission_interval * (config.max_requests + config.burst_allowance - 1)
         
-        return False
+        tat = max(state.tat, current_time)
+        if tat - current_time > burst_tolerance:
+            return False
+        state.tat = tat + emission_interval * cost
+        return True
+    
+    def _token_bucket_tokens(self, state: RateLimitState, config: RateLimitConfig,
+                             current_time: float) -> float:
+        """Tokens currently available in the GCRA bucket."""
+        emission_interval = config.time_window / config.max_requests
+        capacity = config.max_requests + config.burst_allowance
+        backlog = max(0.0, state.tat - current_time) / emission_interval
+        return max(0.0, capacity - backlog)
     
-    async def check_rate_limit(self, user_id: str, operation: str = "default") -> bool:
+    def _apply_limit(self, state: RateLimitState, config: RateLimitConfig,
+                     current_time: float, cost: float = 1.0) -> str:
+        """
+        Decide and record one request against a state.
+        
+        A request is admitted while any budget remains and is then charged
+        its full cost, so an expensive operation can overdraw the budget
+        once and later requests wait for it to be repaid.
+        
+        Returns:
+            "allowed", "blocked", or "cooldown" if blocked by an earlier cooldown
+        """
+        if state.blocked_until > current_time:
+            state.blocked_requests += 1
+            return "cooldown"
+        
+        allowed = False
+        
+        if config.strategy == RateLimitStrategy.FIXED_WINDOW:
+            allowed = self._check_fixed_window(state, config, current_time, cost)
+        elif config.strategy == RateLimitStrategy.SLIDING_WINDOW:
+            allowed = self._check_sliding_window(state, config, current_time, cost)
+        elif config.strategy == RateLimitStrategy.TOKEN_BUCKET:
+            allowed = self._check_token_bucket(state, config, current_time, cost)
+        
+        if allowed:
+            state.total_requests += 1
+        else:
+            state.blocked_requests += 1
+            if config.cooldown_period > 0:
+                state.blocked_until = current_time + config.cooldown_period
+        
+        self._update_reclaim_time(state, config)
+        return "allowed" if allowed else "blocked"
+    
+    def _check_hierarchy(self, user_id: str, operation: str, tenant_id: Optional[str],
+                         config: RateLimitConfig,
+                         current_time: float) -> Tuple[str, RateLimitState, Optional[str]]:
+        """
+        Check the quota levels and the user/operation limit as one decision.
+        
+        All involved states are locked together (local shards in index
+        order, then shared tables by name with stripes in ascending order)
+        and evaluated outermost level first. Either every level is charged,
+        or only the rejecting level records the rejection.
+        
+        Returns:
+            (outcome, user/operation state, rejecting quota level or None)
+        """
+        cost = self._operation_costs.get(operation, 1.0)
+        levels: List[Tuple[str, RateLimitConfig, float, Optional[str]]] = []
+        for level, level_config in self._quota_configs.items():
+            if level is QuotaLevel.GLOBAL:
+                levels.append((f"{_QUOTA_KEY_PREFIX}:global", level_config, cost, "global"))
+            elif level is QuotaLevel.USER:
+                levels.append((f"{_QUOTA_KEY_PREFIX}:user:{user_id}", level_config, cost, "user"))
+            elif tenant_id is not None:
+                levels.append((f"{_QUOTA_KEY_PREFIX}:tenant:{tenant_id}", level_config, cost, "tenant"))
+        levels.append((f"{user_id}:{operation}", config, 1.0, None))
+        
+        shard_indexes = {
+            i: hash(level[0]) & self._shard_mask for i, level in enumerate(levels)
+            if level[1].backend is RateLimitBackend.LOCAL
+        }
+        locks = [self._shards[index].lock for index in sorted(set(shard_indexes.values()))]
+        has_shared = len(shard_indexes) < len(levels)
+        
+        with ExitStack() if has_shared else nullcontext() as stack:
+            for lock in locks:
+                lock.acquire()
+            try:
+                states: List[Optional[RateLimitState]] = [None] * len(levels)
+                for index in set(shard_indexes.values()):
+                    self._reclaim_idle(self._shards[index], current_time)
+                for i, index in shard_indexes.items():
+                    states[i] = self._get_state(
+                        self._shards[index], levels[i][0], current_time, reclaim=False)
+                if has_shared:
+                    self._lock_shared_levels(stack, levels, states, current_time)
+                
+                snapshots = []
+                for (_, level_config, level_cost, label), state in zip(levels, states):
+                    snapshot = vars(state).copy()
+                    outcome = self._apply_limit(state, level_config, current_time, level_cost)
+                    if outcome != "allowed":
+                        for earlier_state, earlier_snapshot in zip(states, snapshots):
+                            vars(earlier_state).update(earlier_snapshot)
+                        return outcome, states[-1], label
+                    snapshots.append(snapshot)
+                return "allowed", states[-1], None
+            finally:
+                for lock in reversed(locks):
+                    lock.release()
+    
+    def _lock_shared_levels(self, stack: ExitStack,
+                            levels: List[Tuple[str, RateLimitConfig, float, Optional[str]]],
+                            states: List[Optional[RateLimitState]], current_time: float):
+        """Open transactions on the shared tables used by quota levels, in name order."""
+        shared: Dict[str, List[int]] = defaultdict(list)
+        for i, level in enumerate(levels):
+            if level[1].backend is RateLimitBackend.SHARED_MEMORY:
+                shared[level[1].shared_table].append(i)
+        
+        for table_name in sorted(shared):
+            indexes = shared[table_name]
+            table = self._shared_table(levels[indexes[0]][1])
+            table_states = stack.enter_context(table.transaction(
+                [levels[i][0] for i in indexes], RateLimitState, current_time))
+            for i, table_state in zip(indexes, table_states):
+                states[i] = table_state
+    
+    async def check_rate_limit(self, user_id: str, operation: str = "default",
+                               tenant_id: Optional[str] = None) -> bool:
         """
         Check if request is within rate limits.
         
         Args:
             user_id: User identifier
             operation: PQC operation name
+            tenant_id: Tenant or client IP for the tenant quota level
+            
+        Returns:
+            True if request is allowed, False if rate limited
+        """
+        return self.check_rate_limit_sync(user_id, operation, tenant_id)
+    
+    def check_rate_limit_sync(self, user_id: str, operation: str = "default",
+                              tenant_id: Optional[str] = None) -> bool:
+        """
+        Check if request is within rate limits without awaiting.
+        
+        Safe to call from coroutines and from worker threads.
+        
+        Args:
+            user_id: User identifier
+            operation: PQC operation name
+            tenant_id: Tenant or client IP for the tenant quota level
             
         Returns:
             True if request is allowed, False if rate limited
         """
         config = self._get_config(operation)
         current_time = time.time()
+        key = f"{user_id}:{operation}"
+        shard = self._shard_for(key)
+        rejected_level = None
         
-        async with self._lock:
-            state = self._user_states[f"{user_id}:{operation}"]
-            
-            if state.blocked_until > current_time:
-                state.blocked_requests += 1
-                self._stats['requests_blocked_cooldown'] += 1
-                
-                pqc_logger.log_pqc_operation(
-                    "warning",
-                    f"Request blocked due to cooldown: {user_id}",
-                    pqc_operation="rate_limit_cooldown",
-                    user_id=user_id,
-                    operation=operation,
-                    remaining_cooldown=state.blocked_until - current_time
-                )
-                
-                return False
+        if self._quota_configs:
+            outcome, state, rejected_level = self._check_hierarchy(
+                user_id, operation, tenant_id, config, current_time)
+            with shard.lock:
+                shard.stats[_OUTCOME_STATS[outcome]] += 1
+                if rejected_level is not None:
+                    shard.stats[f"quota_rejected_{rejected_level}"] += 1
+        elif config.backend == RateLimitBackend.SHARED_MEMORY:
+            outcome, state = self._shared_table(config).update(
+                key,
+                lambda state: (self._apply_limit(state, config, current_time), state),
+                RateLimitState,
+                current_time
+            )
+            with shard.lock:
+                shard.stats[_OUTCOME_STATS[outcome]] += 1
+        else:
+            with shard.lock:
+                state = self._get_state(shard, key, current_time)
+                outcome = self._apply_limit(state, config, current_time)
+                shard.stats[_OUTCOME_STATS[outcome]] += 1
+        
+        if rejected_level is not None:
+            pqc_logger.log_pqc_operation(
+                "warning",
+                f"Quota exceeded: {user_id}",
+                pqc_operation="rate_limit_quota_exceed",
+                user_id=user_id,
+                operation=operation,
+                tenant_id=tenant_id,
+                quota_level=rejected_level,
+                cooldown=outcome == "cooldown"
+            )
             
-            allowed = False
+            return False
+        
+        if outcome == "cooldown":
+            remaining_cooldown = state.blocked_until - current_time
+            pqc_logger.log_pqc_operation(
+                "warning",
+                f"Request blocked due to cooldown: {user_id}",
+                pqc_operation="rate_limit_cooldown",
+                user_id=user_id,
+                operation=operation,
+                remaining_cooldown=remaining_cooldown
+            )
             
-            if config.strategy == RateLimitStrategy.FIXED_WINDOW:
-                allowed = self._check_fixed_window(state, config)
-            elif config.strategy == RateLimitStrategy.SLIDING_WINDOW:
-                allowed = self._check_sliding_window(state, config)
-            elif config.strategy == RateLimitStrategy.TOKEN_BUCKET:
-                allowed = self._check_token_bucket(state, config)
+            return False
+        
+        if outcome == "allowed":
+            pqc_logger.log_pqc_operation(
+                "debug",
+                f"Request allowed: {user_id}",
+                pqc_operation="rate_limit_allow",
+                user_id=user_id,
+                operation=operation,
+                total_requests=state.total_requests
+            )
             
-            if allowed:
-                state.requests.append(current_time)
-                state.total_requests += 1
-                self._stats['requests_allowed'] += 1
-                
-                pqc_logger.log_pqc_operation(
-                    "debug",
-                    f"Request allowed: {user_id}",
-                    pqc_operation="rate_limit_allow",
-                    user_id=user_id,
-                    operation=operation,
-                    total_requests=state.total_requests
-                )
-                
-                return True
-            else:
-                state.blocked_requests += 1
-                self._stats['requests_blocked'] += 1
-                
-                if config.cooldown_period > 0:
-                    state.blocked_until = current_time + config.cooldown_period
-                
-                pqc_logger.log_pqc_operation(
-                    "warning",
-                    f"Rate limit exceeded: {user_id}",
-                    pqc_operation="rate_limit_exceed",
-                    user_id=user_id,
-                    operation=operation,
-                    blocked_requests=state.blocked_requests,
-                    cooldown_applied=config.cooldown_period > 0
-                )
-                
-                return False
+            return True
+        
+        pqc_logger.log_pqc_operation(
+            "warning",
+            f"Rate limit exceeded: {user_id}",
+            pqc_operation="rate_limit_exceed",
+            user_id=user_id,
+            operation=operation,
+            blocked_requests=state.blocked_requests,
+            cooldown_applied=config.cooldown_period > 0
+        )
+        
+        return False
     
     async def reset_user_limits(self, user_id: str, operation: Optional[str] = None):
         """
@@ -227,20 +633,49 @@ class PQCRateLimiter:
             user_id: User identifier
             operation: Specific operation to reset (None for all)
         """
-        async with self._lock:
-            if operation:
-                key = f"{user_id}:{operation}"
-                if key in self._user_states:
-                    del self._user_states[key]
-                    self._stats['limits_reset'] += 1
-            else:
-                keys_to_remove = [
-                    key for key in self._user_states.keys()
-                    if key.startswith(f"{user_id}:")
-                ]
+        if operation:
+            shards = [self._shard_for(f"{user_id}:{operation}")]
+        else:
+            shards = self._shards
+        
+        for shard in shards:
+            with shard.lock:
+                if operation:
+                    keys_to_remove = [f"{user_id}:{operation}"]
+                else:
+                    keys_to_remove = [
+                        key for key in shard.states.keys()
+                        if key.startswith(f"{user_id}:")
+                    ]
                 for key in keys_to_remove:
-                    del self._user_states[key]
-                    self._stats['limits_reset'] += 1
+                    if shard.states.pop(key, None) is not None:
+                        shard.memory -= _STATE_BYTES + len(key)
+                        shard.stats['limits_reset'] += 1
+        
+        # Shared tables are keyed by digest, so only the configured
+        # operations (and the requested one) can be looked up.
+        operations = [operation] if operation else ["default", *self._operation_configs]
+        for name in operations:
+            config = self._get_config(name)
+            if config.backend == RateLimitBackend.SHARED_MEMORY:
+                if self._shared_table(config).remove(f"{user_id}:{name}"):
+                    shard = self._shard_for(f"{user_id}:{name}")
+                    with shard.lock:
+                        shard.stats['limits_reset'] += 1
+        
+        quota_config = self._quota_configs.get(QuotaLevel.USER)
+        if operation is None and quota_config is not None:
+            key = self._quota_key(QuotaLevel.USER, user_id)
+            shard = self._shard_for(key)
+            if quota_config.backend == RateLimitBackend.SHARED_MEMORY:
+                removed = self._shared_table(quota_config).remove(key)
+                with shard.lock:
+                    shard.stats['limits_reset'] += removed
+            else:
+                with shard.lock:
+                    if shard.states.pop(key, None) is not None:
+                        shard.memory -= _STATE_BYTES + len(key)
+                        shard.stats['limits_reset'] += 1
         
         pqc_logger.log_pqc_operation(
             "info",
@@ -264,28 +699,69 @@ class PQCRateLimiter:
         config = self._get_config(operation)
         current_time = time.time()
         
-        async with self._lock:
-            state = self._user_states[f"{user_id}:{operation}"]
-            
-            if config.strategy == RateLimitStrategy.SLIDING_WINDOW:
-                self._cleanup_old_requests(state.requests, config.time_window)
-            
-            remaining_requests = max(0, config.max_requests - len(state.requests))
-            
-            return {
-                "user_id": user_id,
-                "operation": operation,
-                "max_requests": config.max_requests,
-                "time_window": config.time_window,
-                "current_requests": len(state.requests),
-                "remaining_requests": remaining_requests,
-                "total_requests": state.total_requests,
-                "blocked_requests": state.blocked_requests,
-                "blocked_until": state.blocked_until,
-                "is_blocked": state.blocked_until > current_time,
-                "strategy": config.strategy.value,
-                "tokens": getattr(state, 'tokens', 0.0)
-            }
+        key = f"{user_id}:{operation}"
+        
+        if config.backend == RateLimitBackend.SHARED_MEMORY:
+            state = self._shared_table(config).peek(key, RateLimitState)
+        else:
+            shard = self._shard_for(key)
+            with shard.lock:
+                state = shard.states.get(key)
+                if state is not None:
+                    state = replace(state)
+        state = state or RateLimitState()
+        tokens = 0.0
+        
+        if config.strategy == RateLimitStrategy.TOKEN_BUCKET:
+            tokens = self._token_bucket_tokens(state, config, current_time)
+            current_requests = config.max_requests + config.burst_allowance - tokens
+        elif config.strategy == RateLimitStrategy.SLIDING_WINDOW:
+            current_requests = self._sliding_window_count(state, config, current_time)
+        else:
+            self._roll_window(state, config, current_time)
+            current_requests = state.window_count
+        
+        current_requests = int(round(current_requests))
+        remaining_requests = max(0, config.max_requests - current_requests)
+        
+        return {
+            "user_id": user_id,
+            "operation": operation,
+            "max_requests": config.max_requests,
+            "time_window": config.time_window,
+            "current_requests": current_requests,
+            "remaining_requests": remaining_requests,
+            "total_requests": state.total_requests,
+            "blocked_requests": state.blocked_requests,
+            "blocked_until": state.blocked_until,
+            "is_blocked": state.blocked_until > current_time,
+            "strategy": config.strategy.value,
+            "tokens": tokens
+        }
+    
+    def purge_idle_states(self) -> int:
+        """
+        Reclaim every idle state, not just those at the cold end of each shard.
+        
+        Returns:
+            Number of states reclaimed
+        """
+        current_time = time.time()
+        reclaimed = 0
+        
+        for shard in self._shards:
+            with shard.lock:
+                idle_keys = [
+                    key for key, state in shard.states.items()
+                    if state.reclaim_at <= current_time
+                ]
+                for key in idle_keys:
+                    del shard.states[key]
+                    shard.memory -= _STATE_BYTES + len(key)
+                shard.stats['states_reclaimed'] += len(idle_keys)
+                reclaimed += len(idle_keys)
+        
+        return reclaimed
     
     async def get_stats(self) -> Dict[str, Any]:
         """
@@ -294,22 +770,51 @@ class PQCRateLimiter:
         Returns:
             Dictionary with rate limiter statistics
         """
-        async with self._lock:
-            active_users = len(set(
-                key.split(':')[0] for key in self._user_states.keys()
-            ))
-            
-            return {
-                "active_users": active_users,
-                "active_states": len(self._user_states),
-                "configured_operations": len(self._operation_configs),
-                "default_config": {
-                    "max_requests": self.default_config.max_requests,
-                    "time_window": self.default_config.time_window,
-                    "strategy": self.default_config.strategy.value
-                },
-                "stats": dict(self._stats)
-            }
+        stats = defaultdict(int)
+        users = set()
+        active_states = 0
+        memory = 0
+        
+        for shard in self._shards:
+            with shard.lock:
+                users.update(
+                    key.split(':')[0] for key in shard.states.keys()
+                    if not key.startswith(_QUOTA_KEY_PREFIX)
+                )
+                active_states += len(shard.states)
+                memory += shard.memory
+                for name, value in shard.stats.items():
+                    stats[name] += value
+        
+        return {
+            "active_users": len(users),
+            "active_states": active_states,
+            "configured_operations": len(self._operation_configs),
+            "shards": len(self._shards),
+            "memory_bytes": memory,
+            "memory_budget_bytes": self.max_memory_bytes,
+            "states_reclaimed": stats['states_reclaimed'],
+            "states_evicted": stats['states_evicted'],
+            "shared_tables": {
+                name: table.get_stats() for name, table in list(self._shared_tables.items())
+            },
+            "quotas": {
+                level.value: {
+                    "max_cost": config.max_requests,
+                    "time_window": config.time_window,
+                    "strategy": config.strategy.value,
+                    "backend": config.backend.value
+                }
+                for level, config in self._quota_configs.items()
+            },
+            "operation_costs": dict(self._operation_costs),
+            "default_config": {
+                "max_requests": self.default_config.max_requests,
+                "time_window": self.default_config.time_window,
+                "strategy": self.default_config.strategy.value
+            },
+            "stats": dict(stats)
+        }
 
 pqc_rate_limiter = PQCRateLimiter()
 
@@ -341,7 +846,8 @@ def rate_limit(max_requests: int = 100, time_window: float = 60.0,
                 if isinstance(args[0], str):
                     user_id = args[0]
             
-            allowed = await pqc_rate_limiter.check_rate_limit(user_id, operation)
+            allowed = await pqc_rate_limiter.check_rate_limit(
+                user_id, operation, kwargs.get('tenant_id'))
             
             if not allowed:
                 raise Exception(f"Rate limit exceeded for user {user_id} on operation {operation}")
@@ -351,9 +857,10 @@ def rate_limit(max_requests: int = 100, time_window: float = 60.0,
         return wrapper
     return decorator
 
-async def check_user_rate_limit(user_id: str, operation: str = "default") -> bool:
+async def check_user_rate_limit(user_id: str, operation: str = "default",
+                                tenant_id: Optional[str] = None) -> bool:
     """Check if user is within rate limits."""
-    return await pqc_rate_limiter.check_rate_limit(user_id, operation)
+    return await pqc_rate_limiter.check_rate_limit(user_id, operation, tenant_id)
 
 async def reset_user_rate_limits(user_id: str, operation: Optional[str] = None):
     """Reset rate limits for a user."""
@@ -0,0 +1,51 @@
+"""
+PQC Shared Memory Segments
+
+This module opens POSIX shared memory segments that are not registered
+with the multiprocessing resource tracker. A tracked segment is removed
+when the process that created it exits, even while other workers still
+use it, so the owner of an untracked segment removes it explicitly with
+``unlink_shared_memory``.
+
+Compliance:
+- NIST SP 800-53 (SC-4): Information in Shared System Resources
+"""
+
+import inspect
+from multiprocessing import resource_tracker, shared_memory
+from typing import Optional
+
+SUPPORTS_TRACK = "track" in inspect.signature(shared_memory.SharedMemory).parameters
+
+def open_shared_memory(name: Optional[str], create: bool, size: int = 0) -> shared_memory.SharedMemory:
+    """
+    Open a shared memory segment without registering it for cleanup at exit.
+
+    Args:
+        name: Segment name (a random name if None and creating)
+        create: Create the segment instead of attaching to it
+        size: Segment size in bytes when creating
+
+    Returns:
+        SharedMemory segment
+    """
+    if SUPPORTS_TRACK:
+        return shared_memory.SharedMemory(name=name, create=create, size=size, track=False)
+    segment = shared_memory.SharedMemory(name=name, create=create, size=size)
+    resource_tracker.unregister(segment._name, "shared_memory")
+    return segment
+
+def unlink_shared_memory(segment: shared_memory.SharedMemory):
+    """
+    Remove a segment opened with ``open_shared_memory``.
+
+    Args:
+        segment: Segment to remove
+
+    Raises:
+        FileNotFoundError: If the segment was already removed
+    """
+    if not SUPPORTS_TRACK:
+        # unlink() unregisters the segment, so undo the earlier unregister.
+        resource_tracker.register(segment._name, "shared_memory")
+    segment.unlink()
@@ -3,6 +3,12 @@ Async Support for Enhanced PQC Bindings
 
 This module provides asynchronous wrappers for Post-Quantum Cryptography
 operations to enable non-blocking integration with the Portal Backend.
+Batched helpers (``verify_many`` and friends) run many operations in a few
+executor submissions and yield results as they become available. The
+library has no batch entry point, so each item is still its own FFI call;
+batching saves executor round trips, not per-call FFI overhead. With a
+native completion queue, single operations run on the library's own
+worker threads and no executor thread waits on them.
 
 Compliance:
 - NIST SP 800-53 (SC-13): Cryptographic Protection
@@ -10,42 +16,123 @@ Compliance:
 """
 
 import asyncio
+import functools
+import itertools
+import math
 import threading
-from concurrent.futures import ThreadPoolExecutor
-from typing import Dict, Any, Optional, Tuple, Union
-from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Dict, Any, Iterable, List, Optional, Tuple, Union
 
 from .kyber import KyberKeyPair
 from .dilithium import DilithiumKeyPair
 from .exceptions import PQCError, KyberError, DilithiumError
 from ..monitoring.pqc_logger import pqc_logger
 from ..monitoring.performance_monitor import performance_monitor
+from ..optimization.concurrency_limiter import AdaptiveConcurrencyLimiter, ConcurrencyLimitExceeded
+from ..optimization.deadline import Deadline, DeadlineExceeded
+from ..optimization.executor_backend import ExecutorBackend, PQCExecutor
+from ..optimization.native_async import NativeAsyncQueue
+
+def _create_kyber_keypair() -> KyberKeyPair:
+    """Create a Kyber keypair; module level so process workers can run it."""
+    from ..pqc_bindings import PQCLibraryV2
+    return KyberKeyPair(PQCLibraryV2())
+
+def _create_dilithium_keypair() -> DilithiumKeyPair:
+    """Create a Dilithium keypair; module level so process workers can run it."""
+    from ..pqc_bindings import PQCLibraryV2
+    return DilithiumKeyPair(PQCLibraryV2())
+
+def _encapsulation_result(result: Any) -> Tuple[bytes, bytes]:
+    """
+    Encapsulation result as (shared_secret, ciphertext).
+    
+    ``KyberKeyPair.encapsulate`` returns a dict, while the native queue
+    returns a tuple.
+    """
+    if isinstance(result, dict):
+        return result['shared_secret'], result['ciphertext']
+    return result
+
+def _run_chunk(method: str, calls: List[Tuple[Any, Tuple[Any, ...]]]) -> List[Any]:
+    """
+    Call ``method`` on each target in one executor submission.
+    
+    The library has no batch entry point, so this is one FFI call per item;
+    a chunk saves the executor submission and result transfer per item.
+    Failures are returned in place of results, so one bad item does not
+    fail the rest of its chunk.
+    """
+    results = []
+    for target, args in calls:
+        try:
+            results.append(getattr(target, method)(*args))
+        except Exception as e:
+            results.append(e)
+    return results
+
+class _TrackedOperation:
+    """Registers the running task under an operation ID for the duration of a block."""
+    
+    __slots__ = ("operations", "operation_id")
+    
+    def __init__(self, operations: Dict[str, Optional[asyncio.Task]], operation_id: str):
+        self.operations = operations
+        self.operation_id = operation_id
+    
+    async def __aenter__(self):
+        if self.operation_id in self.operations:
+            raise ValueError(f"Operation {self.operation_id} is already active")
+        self.operations[self.operation_id] = asyncio.current_task()
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.operations.pop(self.operation_id, None)
+        return False
 
 class AsyncPQCManager:
     """
-    Asynchronous manager for PQC operations with thread pool execution.
+    Asynchronous manager for PQC operations with pooled execution.
     
     This class provides async wrappers for CPU-intensive PQC operations
-    while maintaining thread safety and performance monitoring.
+    while maintaining thread safety and performance monitoring. Operations
+    run on a thread pool by default, or on any ``PQCExecutor``, including a
+    process pool; operation durations are measured in the caller. With a
+    limiter, operations over its adaptive in-flight limit are rejected with
+    ``ConcurrencyLimitExceeded`` instead of queueing in the executor.
+    With a native queue, signing, verification, encapsulation and
+    decapsulation of generated keypairs skip the executor altogether.
     """
     
-    def __init__(self, max_workers: int = 4):
+    def __init__(self, max_workers: int = 4, backend: ExecutorBackend = ExecutorBackend.THREAD,
+                 executor: Optional[PQCExecutor] = None,
+                 limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+                 native_queue: Optional[NativeAsyncQueue] = None):
         """
         Initialize async PQC manager.
         
         Args:
-            max_workers: Maximum number of worker threads for PQC operations
+            max_workers: Maximum number of workers for PQC operations
+            backend: Execution backend used when no executor is given
+            executor: Executor to run operations on (created if None)
+            limiter: Adaptive limit on operations in flight (unlimited if None)
+            native_queue: Native completion queue for single operations, such
+                as one from ``open_native_queue()`` (executor only if None;
+                experimental, see ``native_async``)
         """
-        self.max_workers = max_workers
-        self.executor = ThreadPoolExecutor(max_workers=max_workers)
-        self.active_operations: Dict[str, asyncio.Task] = {}
-        self.operation_lock = asyncio.Lock()
+        self.pqc_executor = executor or PQCExecutor(backend, max_workers)
+        self.max_workers = self.pqc_executor.max_workers
+        self.executor = self.pqc_executor.executor
+        self.limiter = limiter
+        self.native_queue = native_queue
+        self.active_operations: Dict[str, Optional[asyncio.Task]] = {}
+        self._operation_ids = itertools.count(1)
         
         pqc_logger.log_pqc_operation(
             "info", 
-            f"AsyncPQCManager initialized with {max_workers} workers",
+            f"AsyncPQCManager initialized with {self.max_workers} workers",
             pqc_operation="manager_init",
-            max_workers=max_workers
+            max_workers=self.max_workers,
+            backend=self.pqc_executor.backend.value,
+            native_queue=native_queue is not None
         )
     
     async def __aenter__(self):
@@ -64,72 +151,87 @@ class AsyncPQCManager:
             pqc_operation="manager_shutdown"
         )
         
-        async with self.operation_lock:
-            for operation_id, task in self.active_operations.items():
-                if not task.done():
-                    task.cancel()
-                    try:
-                        await task
-                    except asyncio.CancelledError:
-                        pass
-            
-            self.active_operations.clear()
+        current_task = asyncio.current_task()
+        for task in list(self.active_operations.values()):
+            if task is not None and task is not current_task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        
+        self.active_operations.clear()
         
-        self.executor.shutdown(wait=True)
+        self.pqc_executor.shutdown(wait=True)
+        if self.native_queue is not None:
+            await self.native_queue.aclose()
     
-    @asynccontextmanager
-    async def track_operation(self, operation_id: str):
+    def track_operation(self, operation_id: str) -> "_TrackedOperation":
         """
         Context manager to track async operations.
         
+        Operations are only started and finished on the event loop thread,
+        so the registry is a plain dict and needs no lock.
+        
         Args:
             operation_id: Unique identifier for the operation
         """
-        async with self.operation_lock:
-            if operation_id in self.active_operations:
-                raise ValueError(f"Operation {operation_id} is already active")
+        return _TrackedOperation(self.active_operations, operation_id)
+    
+    def _operation_id(self, kind: str, user_id: str) -> str:
+        """Unique operation ID from a per-manager counter."""
+        return f"{kind}_{user_id}_{next(self._operation_ids)}"
+    
+    async def _dispatch(self, func, *args, deadline: Optional[Deadline] = None,
+                        native: bool = False, batch: bool = False,
+                        admission: Optional[Tuple[float, int]] = None):
+        """
+        Run an operation under the limiter if there is one.
         
-        try:
-            current_task = asyncio.current_task()
-            if current_task is not None:
-                async with self.operation_lock:
-                    self.active_operations[operation_id] = current_task
-            
-            yield
-            
-        finally:
-            async with self.operation_lock:
-                self.active_operations.pop(operation_id, None)
+        The function runs on the executor, as a batch function with ``batch``
+        so byte string results can come back through shared memory, or with
+        ``native`` it is a native queue coroutine function and is awaited
+        directly. A limiter slot already taken by the caller is passed as
+        ``admission``.
+        """
+        if native:
+            call = lambda: func(*args, deadline=deadline)
+        elif batch:
+            call = lambda: self.pqc_executor.run_batch(func, *args, deadline=deadline)
+        else:
+            call = lambda: self.pqc_executor.run(func, *args, deadline=deadline)
+        if self.limiter is None:
+            return await call()
+        async with self.limiter.limit_context(deadline, admission):
+            return await call()
     
     async def generate_kyber_keypair_async(self, user_id: str, 
-                                         metadata: Optional[Dict[str, Any]] = None) -> KyberKeyPair:
+                                         metadata: Optional[Dict[str, Any]] = None,
+                                         deadline: Optional[Deadline] = None) -> KyberKeyPair:
         """
         Asynchronously generate Kyber keypair.
         
         Args:
             user_id: User identifier for the keypair
             metadata: Optional metadata for the operation
+            deadline: Optional deadline; the operation is dropped once it passes
             
         Returns:
             KyberKeyPair instance
             
         Raises:
             KyberError: If key generation fails
+            DeadlineExceeded: If the deadline passes before the operation completes
+            ConcurrencyLimitExceeded: If the limiter is saturated
         """
-        operation_id = f"kyber_keygen_{user_id}_{asyncio.get_event_loop().time()}"
+        operation_id = self._operation_id("kyber_keygen", user_id)
         
         async with self.track_operation(operation_id):
-            def _generate_keypair():
+            try:
                 with performance_monitor.monitor_operation(
                     "async_key_generation", user_id, "ML-KEM-768", metadata or {}
                 ):
-                    from ..pqc_bindings import PQCLibraryV2
-                    lib = PQCLibraryV2()
-                    return KyberKeyPair(lib)
-            
-            try:
-                loop = asyncio.get_event_loop()
-                keypair = await loop.run_in_executor(self.executor, _generate_keypair)
+                    keypair = await self._dispatch(_create_kyber_keypair, deadline=deadline)
                 
                 pqc_logger.log_key_generation(
                     user_id, "ML-KEM-768", 0, True, 1184  # Duration will be logged by monitor
@@ -137,6 +239,8 @@ class AsyncPQCManager:
                 
                 return keypair
                 
+            except (DeadlineExceeded, ConcurrencyLimitExceeded):
+                raise
             except Exception as e:
                 pqc_logger.log_key_generation(
                     user_id, "ML-KEM-768", 0, False
@@ -144,7 +248,8 @@ class AsyncPQCManager:
                 raise KyberError(f"Async Kyber key generation failed: {str(e)}") from e
     
     async def kyber_encapsulate_async(self, keypair: KyberKeyPair, user_id: str,
-                                    metadata: Optional[Dict[str, Any]] = None) -> Tuple[bytes, bytes]:
+                                    metadata: Optional[Dict[str, Any]] = None,
+                                    deadline: Optional[Deadline] = None) -> Tuple[bytes, bytes]:
         """
         Asynchronously perform Kyber encapsulation.
         
@@ -152,25 +257,29 @@ class AsyncPQCManager:
             keypair: KyberKeyPair instance
             user_id: User identifier
             metadata: Optional metadata for the operation
+            deadline: Optional deadline; the operation is dropped once it passes
             
         Returns:
             Tuple of (shared_secret, ciphertext)
             
         Raises:
             KyberError: If encapsulation fails
+            DeadlineExceeded: If the deadline passes before the operation completes
+            ConcurrencyLimitExceeded: If the limiter is saturated
         """
-        operation_id = f"kyber_encap_{user_id}_{asyncio.get_event_loop().time()}"
+        operation_id = self._operation_id("kyber_encap", user_id)
         
         async with self.track_operation(operation_id):
-            def _encapsulate():
+            try:
                 with performance_monitor.monitor_operation(
                     "async_encapsulation", user_id, "ML-KEM-768", metadata or {}
                 ):
-                    return keypair.encapsulate()
-            
-            try:
-                loop = asyncio.get_event_loop()
-                result = await loop.run_in_executor(self.executor, _encapsulate)
+                    if self.native_queue is not None:
+                        result = await self._dispatch(self.native_queue.encapsulate, keypair.public_key,
+                                                      deadline=deadline, native=True)
+                    else:
+                        result = await self._dispatch(keypair.encapsulate, deadline=deadline)
+                result = _encapsulation_result(result)
                 
                 pqc_logger.log_encapsulation(
                     user_id, "ML-KEM-768", 0, True, len(result[1])
@@ -178,6 +287,8 @@ class AsyncPQCManager:
                 
                 return result
                 
+            except (DeadlineExceeded, ConcurrencyLimitExceeded):
+                raise
             except Exception as e:
                 pqc_logger.log_encapsulation(
                     user_id, "ML-KEM-768", 0, False
@@ -185,7 +296,8 @@ class AsyncPQCManager:
                 raise KyberError(f"Async Kyber encapsulation failed: {str(e)}") from e
     
     async def kyber_decapsulate_async(self, keypair: KyberKeyPair, ciphertext: bytes,
-                                    user_id: str, metadata: Optional[Dict[str, Any]] = None) -> bytes:
+                                    user_id: str, metadata: Optional[Dict[str, Any]] = None,
+                                    deadline: Optional[Deadline] = None) -> bytes:
         """
         Asynchronously perform Kyber decapsulation.
         
@@ -194,25 +306,30 @@ class AsyncPQCManager:
             ciphertext: Ciphertext to decapsulate
             user_id: User identifier
             metadata: Optional metadata for the operation
+            deadline: Optional deadline; the operation is dropped once it passes
             
         Returns:
             Shared secret bytes
             
         Raises:
             KyberError: If decapsulation fails
+            DeadlineExceeded: If the deadline passes before the operation completes
+            ConcurrencyLimitExceeded: If the limiter is saturated
         """
-        operation_id = f"kyber_decap_{user_id}_{asyncio.get_event_loop().time()}"
+        operation_id = self._operation_id("kyber_decap", user_id)
         
         async with self.track_operation(operation_id):
-            def _decapsulate():
+            try:
                 with performance_monitor.monitor_operation(
                     "async_decapsulation", user_id, "ML-KEM-768", metadata or {}
                 ):
-                    return keypair.decapsulate(ciphertext)
-            
-            try:
-                loop = asyncio.get_event_loop()
-                shared_secret = await loop.run_in_executor(self.executor, _decapsulate)
+                    if self.native_queue is not None:
+                        shared_secret = await self._dispatch(self.native_queue.decapsulate,
+                                                             keypair.private_key, ciphertext,
+                                                             deadline=deadline, native=True)
+                    else:
+                        shared_secret = await self._dispatch(keypair.decapsulate, ciphertext,
+                                                             deadline=deadline)
                 
                 pqc_logger.log_encapsulation(
                     user_id, "ML-KEM-768", 0, True, len(ciphertext)
@@ -220,6 +337,8 @@ class AsyncPQCManager:
                 
                 return shared_secret
                 
+            except (DeadlineExceeded, ConcurrencyLimitExceeded):
+                raise
             except Exception as e:
                 pqc_logger.log_encapsulation(
                     user_id, "ML-KEM-768", 0, False
@@ -227,34 +346,32 @@ class AsyncPQCManager:
                 raise KyberError(f"Async Kyber decapsulation failed: {str(e)}") from e
     
     async def generate_dilithium_keypair_async(self, user_id: str,
-                                             metadata: Optional[Dict[str, Any]] = None) -> DilithiumKeyPair:
+                                             metadata: Optional[Dict[str, Any]] = None,
+                                             deadline: Optional[Deadline] = None) -> DilithiumKeyPair:
         """
         Asynchronously generate Dilithium keypair.
         
         Args:
             user_id: User identifier for the keypair
             metadata: Optional metadata for the operation
+            deadline: Optional deadline; the operation is dropped once it passes
             
         Returns:
             DilithiumKeyPair instance
             
         Raises:
             DilithiumError: If key generation fails
+            DeadlineExceeded: If the deadline passes before the operation completes
+            ConcurrencyLimitExceeded: If the limiter is saturated
         """
-        operation_id = f"dilithium_keygen_{user_id}_{asyncio.get_event_loop().time()}"
+        operation_id = self._operation_id("dilithium_keygen", user_id)
         
         async with self.track_operation(operation_id):
-            def _generate_keypair():
+            try:
                 with performance_monitor.monitor_operation(
                     "async_key_generation", user_id, "ML-DSA-65", metadata or {}
                 ):
-                    from ..pqc_bindings import PQCLibraryV2
-                    lib = PQCLibraryV2()
-                    return DilithiumKeyPair(lib)
-            
-            try:
-                loop = asyncio.get_event_loop()
-                keypair = await loop.run_in_executor(self.executor, _generate_keypair)
+                    keypair = await self._dispatch(_create_dilithium_keypair, deadline=deadline)
                 
                 pqc_logger.log_key_generation(
                     user_id, "ML-DSA-65", 0, True, 2592  # ML-DSA-65 key size
@@ -262,6 +379,8 @@ class AsyncPQCManager:
                 
                 return keypair
                 
+            except (DeadlineExceeded, ConcurrencyLimitExceeded):
+                raise
             except Exception as e:
                 pqc_logger.log_key_generation(
                     user_id, "ML-DSA-65", 0, False
@@ -269,7 +388,8 @@ class AsyncPQCManager:
                 raise DilithiumError(f"Async Dilithium key generation failed: {str(e)}") from e
     
     async def dilithium_sign_async(self, keypair: DilithiumKeyPair, message: bytes,
-                                 user_id: str, metadata: Optional[Dict[str, Any]] = None) -> bytes:
+                                 user_id: str, metadata: Optional[Dict[str, Any]] = None,
+                                 deadline: Optional[Deadline] = None) -> bytes:
         """
         Asynchronously sign message with Dilithium.
         
@@ -278,25 +398,28 @@ class AsyncPQCManager:
             message: Message to sign
             user_id: User identifier
             metadata: Optional metadata for the operation
+            deadline: Optional deadline; the operation is dropped once it passes
             
         Returns:
             Signature bytes
             
         Raises:
             DilithiumError: If signing fails
+            DeadlineExceeded: If the deadline passes before the operation completes
+            ConcurrencyLimitExceeded: If the limiter is saturated
         """
-        operation_id = f"dilithium_sign_{user_id}_{asyncio.get_event_loop().time()}"
+        operation_id = self._operation_id("dilithium_sign", user_id)
         
         async with self.track_operation(operation_id):
-            def _sign():
+            try:
                 with performance_monitor.monitor_operation(
                     "async_signature", user_id, "ML-DSA-65", metadata or {}
                 ):
-                    return keypair.sign(message)
-            
-            try:
-                loop = asyncio.get_event_loop()
-                signature = await loop.run_in_executor(self.executor, _sign)
+                    if self.native_queue is not None:
+                        signature = await self._dispatch(self.native_queue.sign, keypair.private_key,
+                                                         message, deadline=deadline, native=True)
+                    else:
+                        signature = await self._dispatch(keypair.sign, message, deadline=deadline)
                 
                 pqc_logger.log_signature(
                     user_id, "ML-DSA-65", 0, True, len(signature)
@@ -304,6 +427,8 @@ class AsyncPQCManager:
                 
                 return signature
                 
+            except (DeadlineExceeded, ConcurrencyLimitExceeded):
+                raise
             except Exception as e:
                 pqc_logger.log_signature(
                     user_id, "ML-DSA-65", 0, False
@@ -312,7 +437,8 @@ class AsyncPQCManager:
     
     async def dilithium_verify_async(self, keypair: DilithiumKeyPair, message: bytes,
                                    signature: bytes, user_id: str,
-                                   metadata: Optional[Dict[str, Any]] = None) -> bool:
+                                   metadata: Optional[Dict[str, Any]] = None,
+                                   deadline: Optional[Deadline] = None) -> bool:
         """
         Asynchronously verify Dilithium signature.
         
@@ -322,25 +448,30 @@ class AsyncPQCManager:
             signature: Signature to verify
             user_id: User identifier
             metadata: Optional metadata for the operation
+            deadline: Optional deadline; the operation is dropped once it passes
             
         Returns:
             True if signature is valid, False otherwise
             
         Raises:
             DilithiumError: If verification fails
+            DeadlineExceeded: If the deadline passes before the operation completes
+            ConcurrencyLimitExceeded: If the limiter is saturated
         """
-        operation_id = f"dilithium_verify_{user_id}_{asyncio.get_event_loop().time()}"
+        operation_id = self._operation_id("dilithium_verify", user_id)
         
         async with self.track_operation(operation_id):
-            def _verify():
+            try:
                 with performance_monitor.monitor_operation(
                     "async_verification", user_id, "ML-DSA-65", metadata or {}
                 ):
-                    return keypair.verify(message, signature)
-            
-            try:
-                loop = asyncio.get_event_loop()
-                is_valid = await loop.run_in_executor(self.executor, _verify)
+                    if self.native_queue is not None:
+                        is_valid = await self._dispatch(self.native_queue.verify, keypair.public_key,
+                                                        message, signature, deadline=deadline,
+                                                        native=True)
+                    else:
+                        is_valid = await self._dispatch(keypair.verify, message, signature,
+                                                        deadline=deadline)
                 
                 pqc_logger.log_signature(
                     user_id, "ML-DSA-65", 0, True, len(signature)
@@ -348,59 +479,293 @@ class AsyncPQCManager:
                 
                 return is_valid
                 
+            except (DeadlineExceeded, ConcurrencyLimitExceeded):
+                raise
             except Exception as e:
                 pqc_logger.log_signature(
                     user_id, "ML-DSA-65", 0, False
                 )
                 raise DilithiumError(f"Async Dilithium verification failed: {str(e)}") from e
     
-    async def get_operation_status(self) -> Dict[str, Any]:
+    def _chunk_size(self, item_count: int) -> int:
+        """Items per executor submission: about four chunks per worker, at least a native batch."""
+        return max(self.pqc_executor.batch_size(), math.ceil(item_count / (self.max_workers * 4)))
+    
+    def _has_limiter_slot(self) -> bool:
+        """Whether the limiter, if any, would admit another operation now."""
+        return self.limiter is None or self.limiter.in_flight < self.limiter.limit
+    
+    async def _run_many(self, kind: str, method: str, calls: Iterable[Tuple[Any, Tuple[Any, ...]]],
+                        user_id: str, algorithm: str, error_type: type, chunk_size: Optional[int],
+                        ordered: bool, metadata: Optional[Dict[str, Any]],
+                        deadline: Optional[Deadline],
+                        convert: Optional[Callable[[Any], Any]] = None) -> AsyncIterator[Tuple[int, Any]]:
+        """
+        Run calls in chunks, yielding (index, result) per call.
+        
+        Successful results are passed through ``convert`` if given.
+        
+        With a limiter, each chunk takes a slot before it is started, and
+        further chunks start only while the limiter has slots free, so a
+        batch never turns away its own chunks; it is rejected only if no
+        slot is free when none of its chunks is running.
+        """
+        calls = list(calls)
+        if not calls:
+            return
+        size = chunk_size or self._chunk_size(len(calls))
+        
+        # Limiter slots taken for chunks that have not started yet
+        admissions: Dict[int, Tuple[float, int]] = {}
+        
+        async def run_chunk(start: int) -> List[Any]:
+            admission = admissions.pop(start, None)
+            chunk = calls[start:start + size]
+            with performance_monitor.monitor_operation(
+                f"async_{kind}_batch", user_id, algorithm, {**(metadata or {}), "batch_size": len(chunk)}
+            ):
+                return await self._dispatch(functools.partial(_run_chunk, method), chunk,
+                                            deadline=deadline, batch=True, admission=admission)
+        
+        async with self.track_operation(self._operation_id(f"{kind}_many", user_id)):
+            waiting = list(range(0, len(calls), size))
+            waiting.reverse()
+            running: Dict[int, asyncio.Future] = {}
+            finished: Dict[int, List[Any]] = {}
+            next_start = 0
+            try:
+                while waiting or running:
+                    while waiting and (not running or self._has_limiter_slot()):
+                        if self.limiter is not None:
+                            admissions[waiting[-1]] = await self.limiter.acquire(deadline)
+                        start = waiting.pop()
+                        running[start] = asyncio.ensure_future(run_chunk(start))
+                    
+                    await asyncio.wait(running.values(), return_when=asyncio.FIRST_COMPLETED)
+                    for start in [start for start, task in running.items() if task.done()]:
+                        try:
+                            finished[start] = running.pop(start).result()
+                        except (DeadlineExceeded, ConcurrencyLimitExceeded):
+                            raise
+                        except Exception as e:
+                            raise error_type(f"Async batch {kind} failed: {str(e)}") from e
+                    
+                    for start in (sorted(finished) if not ordered else []):
+                        for offset, result in enumerate(finished.pop(start)):
+                            yield start + offset, self._item_result(kind, error_type, result, convert)
+                    while next_start in finished:
+                        for offset, result in enumerate(finished.pop(next_start)):
+                            yield next_start + offset, self._item_result(kind, error_type, result, convert)
+                        next_start += size
+            finally:
+                for task in running.values():
+                    task.cancel()
+                await asyncio.gather(*running.values(), return_exceptions=True)
+                for admission in admissions.values():
+                    await self.limiter.release(admission, "ignored")
+    
+    @staticmethod
+    def _item_result(kind: str, error_type: type, result: Any,
+                     convert: Optional[Callable[[Any], Any]] = None) -> Any:
+        """A chunk's per-item result, with failures wrapped in the operation's error type."""
+        if isinstance(result, Exception):
+            error = error_type(f"Async {kind} failed: {str(result)}")
+            error.__cause__ = result
+            return error
+        return result if convert is None else convert(result)
+    
+    def verify_many(self, items: Iterable[Tuple[DilithiumKeyPair, bytes, bytes]], user_id: str,
+                    chunk_size: Optional[int] = None, ordered: bool = True,
+                    metadata: Optional[Dict[str, Any]] = None,
+                    deadline: Optional[Deadline] = None) -> AsyncIterator[Tuple[int, Any]]:
+        """
+        Verify many Dilithium signatures in chunked executor submissions.
+        
+        Args:
+            items: (keypair, message, signature) tuples
+            user_id: User identifier
+            chunk_size: Items per executor submission (sized to the executor if None)
+            ordered: Yield in input order, or as chunks complete if False
+            metadata: Optional metadata for the operation
+            deadline: Optional deadline; chunks not yet run are dropped once it passes
+            
+        Returns:
+            Async iterator of (input index, bool or DilithiumError) pairs
+            
+        Raises:
+            DeadlineExceeded: If the deadline passes before all chunks complete
+            ConcurrencyLimitExceeded: If the limiter is saturated
+        """
+        return self._run_many(
+            "verification", "verify",
+            ((keypair, (message, signature)) for keypair, message, signature in items),
+            user_id, "ML-DSA-65", DilithiumError, chunk_size, ordered, metadata, deadline
+        )
+    
+    def sign_many(self, items: Iterable[Tuple[DilithiumKeyPair, bytes]], user_id: str,
+                  chunk_size: Optional[int] = None, ordered: bool = True,
+                  metadata: Optional[Dict[str, Any]] = None,
+                  deadline: Optional[Deadline] = None) -> AsyncIterator[Tuple[int, Any]]:
+        """
+        Sign many messages with Dilithium in chunked executor submissions.
+        
+        Args:
+            items: (keypair, message) tuples
+            user_id: User identifier
+            chunk_size: Items per executor submission (sized to the executor if None)
+            ordered: Yield in input order, or as chunks complete if False
+            metadata: Optional metadata for the operation
+            deadline: Optional deadline; chunks not yet run are dropped once it passes
+            
+        Returns:
+            Async iterator of (input index, signature bytes or DilithiumError) pairs
+            
+        Raises:
+            DeadlineExceeded: If the deadline passes before all chunks complete
+            ConcurrencyLimitExceeded: If the limiter is saturated
+        """
+        return self._run_many(
+            "signing", "sign", ((keypair, (message,)) for keypair, message in items),
+            user_id, "ML-DSA-65", DilithiumError, chunk_size, ordered, metadata, deadline
+        )
+    
+    def encapsulate_many(self, keypairs: Iterable[KyberKeyPair], user_id: str,
+                         chunk_size: Optional[int] = None, ordered: bool = True,
+                         metadata: Optional[Dict[str, Any]] = None,
+                         deadline: Optional[Deadline] = None) -> AsyncIterator[Tuple[int, Any]]:
+        """
+        Encapsulate to many Kyber public keys in chunked executor submissions.
+        
+        Args:
+            keypairs: KyberKeyPair instances to encapsulate to
+            user_id: User identifier
+            chunk_size: Items per executor submission (sized to the executor if None)
+            ordered: Yield in input order, or as chunks complete if False
+            metadata: Optional metadata for the operation
+            deadline: Optional deadline; chunks not yet run are dropped once it passes
+            
+        Returns:
+            Async iterator of (input index, (shared_secret, ciphertext) or KyberError) pairs
+            
+        Raises:
+            DeadlineExceeded: If the deadline passes before all chunks complete
+            ConcurrencyLimitExceeded: If the limiter is saturated
+        """
+        return self._run_many(
+            "encapsulation", "encapsulate", ((keypair, ()) for keypair in keypairs),
+            user_id, "ML-KEM-768", KyberError, chunk_size, ordered, metadata, deadline,
+            _encapsulation_result
+        )
+    
+    def decapsulate_many(self, items: Iterable[Tuple[KyberKeyPair, bytes]], user_id: str,
+                         chunk_size: Optional[int] = None, ordered: bool = True,
+                         metadata: Optional[Dict[str, Any]] = None,
+                         deadline: Optional[Deadline] = None) -> AsyncIterator[Tuple[int, Any]]:
+        """
+        Decapsulate many Kyber ciphertexts in chunked executor submissions.
+        
+        Args:
+            items: (keypair, ciphertext) tuples
+            user_id: User identifier
+            chunk_size: Items per executor submission (sized to the executor if None)
+            ordered: Yield in input order, or as chunks complete if False
+            metadata: Optional metadata for the operation
+            deadline: Optional deadline; chunks not yet run are dropped once it passes
+            
+        Returns:
+            Async iterator of (input index, shared secret or KyberError) pairs
+            
+        Raises:
+            DeadlineExceeded: If the deadline passes before all chunks complete
+            ConcurrencyLimitExceeded: If the limiter is saturated
+        """
+        return self._run_many(
+            "decapsulation", "decapsulate", ((keypair, (ciphertext,)) for keypair, ciphertext in items),
+            user_id, "ML-KEM-768", KyberError, chunk_size, ordered, metadata, deadline
+        )
+    
+    async def get_operation_status(self, sample_size: int = 20) -> Dict[str, Any]:
         """
         Get status of active operations.
         
+        Args:
+            sample_size: Most active operation IDs to include
+        
         Returns:
             Dictionary with operation status information
         """
-        async with self.operation_lock:
-            active_count = len(self.active_operations)
-            operation_ids = list(self.active_operations.keys())
+        active_count = len(self.active_operations)
+        operation_ids = list(itertools.islice(self.active_operations, sample_size))
         
         return {
             "active_operations": active_count,
             "max_workers": self.max_workers,
             "operation_ids": operation_ids,
-            "executor_status": {
-                "shutdown": self.executor._shutdown,
-                "threads": len(self.executor._threads) if hasattr(self.executor, '_threads') else 0
-            }
+            "executor_status": self.pqc_executor.get_stats(),
+            "limiter_status": self.limiter.get_stats() if self.limiter else None,
+            "native_queue_status": self.native_queue.get_stats() if self.native_queue else None
         }
 
 async_pqc_manager = AsyncPQCManager()
 
-async def async_generate_kyber_keypair(user_id: str, metadata: Optional[Dict[str, Any]] = None) -> KyberKeyPair:
+async def async_generate_kyber_keypair(user_id: str, metadata: Optional[Dict[str, Any]] = None,
+                                       deadline: Optional[Deadline] = None) -> KyberKeyPair:
     """Generate Kyber keypair asynchronously."""
-    return await async_pqc_manager.generate_kyber_keypair_async(user_id, metadata)
+    return await async_pqc_manager.generate_kyber_keypair_async(user_id, metadata, deadline)
 
 async def async_kyber_encapsulate(keypair: KyberKeyPair, user_id: str,
-                                metadata: Optional[Dict[str, Any]] = None) -> Tuple[bytes, bytes]:
+                                metadata: Optional[Dict[str, Any]] = None,
+                                deadline: Optional[Deadline] = None) -> Tuple[bytes, bytes]:
     """Perform Kyber encapsulation asynchronously."""
-    return await async_pqc_manager.kyber_encapsulate_async(keypair, user_id, metadata)
+    return await async_pqc_manager.kyber_encapsulate_async(keypair, user_id, metadata, deadline)
 
 async def async_kyber_decapsulate(keypair: KyberKeyPair, ciphertext: bytes, user_id: str,
-                                metadata: Optional[Dict[str, Any]] = None) -> bytes:
+                                metadata: Optional[Dict[str, Any]] = None,
+                                deadline: Optional[Deadline] = None) -> bytes:
     """Perform Kyber decapsulation asynchronously."""
-    return await async_pqc_manager.kyber_decapsulate_async(keypair, ciphertext, user_id, metadata)
+    return await async_pqc_manager.kyber_decapsulate_async(keypair, ciphertext, user_id, metadata, deadline)
 
-async def async_generate_dilithium_keypair(user_id: str, metadata: Optional[Dict[str, Any]] = None) -> DilithiumKeyPair:
+async def async_generate_dilithium_keypair(user_id: str, metadata: Optional[Dict[str, Any]] = None,
+                                           deadline: Optional[Deadline] = None) -> DilithiumKeyPair:
     """Generate Dilithium keypair asynchronously."""
-    return await async_pqc_manager.generate_dilithium_keypair_async(user_id, metadata)
+    return await async_pqc_manager.generate_dilithium_keypair_async(user_id, metadata, deadline)
 
 async def async_dilithium_sign(keypair: DilithiumKeyPair, message: bytes, user_id: str,
-                             metadata: Optional[Dict[str, Any]] = None) -> bytes:
+                             metadata: Optional[Dict[str, Any]] = None,
+                             deadline: Optional[Deadline] = None) -> bytes:
     """Sign message with Dilithium asynchronously."""
-    return await async_pqc_manager.dilithium_sign_async(keypair, message, user_id, metadata)
+    return await async_pqc_manager.dilithium_sign_async(keypair, message, user_id, metadata, deadline)
 
 async def async_dilithium_verify(keypair: DilithiumKeyPair, message: bytes, signature: bytes,
-                               user_id: str, metadata: Optional[Dict[str, Any]] = None) -> bool:
+                               user_id: str, metadata: Optional[Dict[str, Any]] = None,
+                               deadline: Optional[Deadline] = None) -> bool:
     """Verify Dilithium signature asynchronously."""
-    return await async_pqc_manager.dilithium_verify_async(keypair, message, signature, user_id, metadata)
+    return await async_pqc_manager.dilithium_verify_async(keypair, message, signature, user_id, metadata, deadline)
+
+def verify_many(items: Iterable[Tuple[DilithiumKeyPair, bytes, bytes]], user_id: str,
+                chunk_size: Optional[int] = None, ordered: bool = True,
+                metadata: Optional[Dict[str, Any]] = None,
+                deadline: Optional[Deadline] = None) -> AsyncIterator[Tuple[int, Any]]:
+    """Verify many Dilithium signatures, yielding (index, result) pairs."""
+    return async_pqc_manager.verify_many(items, user_id, chunk_size, ordered, metadata, deadline)
+
+def sign_many(items: Iterable[Tuple[DilithiumKeyPair, bytes]], user_id: str,
+              chunk_size: Optional[int] = None, ordered: bool = True,
+              metadata: Optional[Dict[str, Any]] = None,
+              deadline: Optional[Deadline] = None) -> AsyncIterator[Tuple[int, Any]]:
+    """Sign many messages with Dilithium, yielding (index, result) pairs."""
+    return async_pqc_manager.sign_many(items, user_id, chunk_size, ordered, metadata, deadline)
+
+def encapsulate_many(keypairs: Iterable[KyberKeyPair], user_id: str,
+                     chunk_size: Optional[int] = None, ordered: bool = True,
+                     metadata: Optional[Dict[str, Any]] = None,
+                     deadline: Optional[Deadline] = None) -> AsyncIterator[Tuple[int, Any]]:
+    """Encapsulate to many Kyber public keys, yielding (index, result) pairs."""
+    return async_pqc_manager.encapsulate_many(keypairs, user_id, chunk_size, ordered, metadata, deadline)
+
+def decapsulate_many(items: Iterable[Tuple[KyberKeyPair, bytes]], user_id: str,
+                     chunk_size: Optional[int] = None, ordered: bool = True,
+                     metadata: Optional[Dict[str, Any]] = None,
+                     deadline: Optional[Deadline] = None) -> AsyncIterator[Tuple[int, Any]]:
+    """Decapsulate many Kyber ciphertexts, yielding (index, result) pairs."""
+    return async_pqc_manager.decapsulate_many(items, user_id, chunk_size, ordered, metadata, deadline)
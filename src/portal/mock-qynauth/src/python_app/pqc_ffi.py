@@ -12,6 +12,17 @@ class PQCLibraryError(Exception):
     """Exception raised for PQC library errors."""
     pass
 
+class CAsyncCompletion(ctypes.Structure):
+    """Result of one operation on the native completion queue."""
+    _fields_ = [
+        ("request_id", ctypes.c_uint64),
+        ("status", ctypes.c_int),
+        ("output_ptr", ctypes.POINTER(c_uint8)),  # Signature or shared secret
+        ("output_len", c_size_t),
+        ("extra_ptr", ctypes.POINTER(c_uint8)),  # Ciphertext of an encapsulation
+        ("extra_len", c_size_t),
+    ]
+
 class PQCLibrary:
     """Python interface for the Rust PQC library using ctypes FFI."""
     
@@ -101,6 +112,46 @@ class PQCLibrary:
         if hasattr(self.lib, 'free_string'):
             self.lib.free_string.argtypes = [ctypes.c_void_p]
             self.lib.free_string.restype = None
+        
+        if hasattr(self.lib, 'ffi_optimal_batch_size'):
+            self.lib.ffi_optimal_batch_size.argtypes = []
+            self.lib.ffi_optimal_batch_size.restype = c_size_t
+        
+        if self.supports_native_async():
+            queue_p = ctypes.c_void_p
+            bytes_p = ctypes.POINTER(c_uint8)
+            self.lib.ffi_async_open.argtypes = [c_size_t]
+            self.lib.ffi_async_open.restype = queue_p
+            self.lib.ffi_async_fd.argtypes = [queue_p]
+            self.lib.ffi_async_fd.restype = ctypes.c_int
+            self.lib.ffi_async_submit_verify.argtypes = [
+                queue_p, ctypes.c_uint64,
+                bytes_p, c_size_t,  # public_key, public_key_len
+                bytes_p, c_size_t,  # message, message_len
+                bytes_p, c_size_t   # signature, signature_len
+            ]
+            self.lib.ffi_async_submit_sign.argtypes = [
+                queue_p, ctypes.c_uint64,
+                bytes_p, c_size_t,  # secret_key, secret_key_len
+                bytes_p, c_size_t   # message, message_len
+            ]
+            self.lib.ffi_async_submit_encaps.argtypes = [
+                queue_p, ctypes.c_uint64,
+                bytes_p, c_size_t   # public_key, public_key_len
+            ]
+            self.lib.ffi_async_submit_decaps.argtypes = [
+                queue_p, ctypes.c_uint64,
+                bytes_p, c_size_t,  # secret_key, secret_key_len
+                bytes_p, c_size_t   # ciphertext, ciphertext_len
+            ]
+            for name in ('verify', 'sign', 'encaps', 'decaps'):
+                getattr(self.lib, f'ffi_async_submit_{name}').restype = ctypes.c_int
+            self.lib.ffi_async_poll.argtypes = [queue_p, ctypes.POINTER(CAsyncCompletion), c_size_t]
+            self.lib.ffi_async_poll.restype = c_size_t
+            self.lib.ffi_async_close.argtypes = [queue_p]
+            self.lib.ffi_async_close.restype = None
+            self.lib.ffi_buffer_free.argtypes = [bytes_p, c_size_t]
+            self.lib.ffi_buffer_free.restype = None
     
     def _call_and_parse_json(self, func, *args) -> Dict[str, Any]:
         """Battle-hardened FFI call with segfault immunity and resilient cleanup."""
@@ -339,6 +390,26 @@ class PQCLibrary:
         logger.info(f"ML-DSA-65 signature verification: {'VALID' if result else 'INVALID'}")
         return bool(result)
     
+    def optimal_batch_size(self) -> Optional[int]:
+        """
+        Get the batch size suited to this host's CPU.
+        
+        Returns:
+            Batch size from HardwareFeatures, or None if the library does not export it
+        """
+        if not hasattr(self.lib, 'ffi_optimal_batch_size'):
+            return None
+        return int(self.lib.ffi_optimal_batch_size())
+    
+    def supports_native_async(self) -> bool:
+        """
+        Check whether the library exports the native completion queue.
+        
+        Returns:
+            True if the ``ffi_async_*`` functions are available
+        """
+        return hasattr(self.lib, 'ffi_async_open')
+    
     def create_key_manager(self) -> int:
         """
         Create a new key manager instance.
@@ -13,7 +13,7 @@ import faulthandler
 import base64
 import time
 import uuid
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 faulthandler.enable()
 
@@ -41,6 +41,39 @@ if PQC_SERVICE_AVAILABLE:
 else:
     pqc_service = None
 
+def check_deadline(params: Dict[str, Any], stage: str) -> Optional[Dict[str, Any]]:
+    """
+    Check the request deadline sent by the backend.
+    
+    Args:
+        params: Request parameters; 'deadline' is a Unix timestamp in seconds
+        stage: Where the check happens, for logging
+        
+    Returns:
+        Error response if the deadline has passed, else None
+    """
+    deadline = params.get('deadline')
+    if deadline is None:
+        return None
+    
+    try:
+        overdue = time.time() - float(deadline)
+    except (TypeError, ValueError):
+        return {
+            'success': False,
+            'error_message': f'Invalid deadline: {deadline!r}'
+        }
+    
+    if overdue < 0:
+        return None
+    
+    logger.warning(f"Dropping request at {stage}: deadline exceeded by {overdue * 1000:.1f}ms")
+    return {
+        'success': False,
+        'deadline_exceeded': True,
+        'error_message': f'Deadline exceeded before {stage}'
+    }
+
 def handle_generate_session_key(params: Dict[str, Any]) -> Dict[str, Any]:
     """Handle session key generation request using real ML-KEM-768."""
     try:
@@ -63,6 +96,10 @@ def handle_generate_session_key(params: Dict[str, Any]) -> Dict[str, Any]:
         public_key = keypair['public_key']
         private_key = keypair['private_key']
         
+        expired = check_deadline(params, 'session key encapsulation')
+        if expired:
+            return expired
+        
         encaps_result = pqc_service.ml_kem_encapsulate(public_key)
         ciphertext = encaps_result['ciphertext']
         shared_secret = encaps_result['shared_secret']
@@ -440,6 +477,10 @@ def handle_handshake(params: Dict[str, Any]) -> Dict[str, Any]:
         kem_keypair = pqc_service.generate_ml_kem_keypair()
         kem_encaps = pqc_service.ml_kem_encapsulate(kem_keypair['public_key'])
         
+        expired = check_deadline(params, 'handshake signing')
+        if expired:
+            return expired
+        
         dsa_keypair = pqc_service.generate_ml_dsa_keypair()
         handshake_data = f"{user_id}:{handshake_id}:{int(timestamp)}"
         signature_result = pqc_service.ml_dsa_sign(dsa_keypair['private_key'], handshake_data.encode('utf-8'))
@@ -518,6 +559,12 @@ def main():
         }))
         sys.exit(1)
     
+    expired = check_deadline(params, operation)
+    if expired:
+        print(json.dumps(expired))
+        sys.stdout.flush()
+        sys.exit(0)
+    
     try:
         result = handler(params)
         
@@ -0,0 +1,642 @@
+//! Completion-queue interface for running PQC operations off the caller's thread.
+//!
+//! Operations are submitted with a caller-chosen request ID and run on a fixed
+//! set of worker threads owned by the queue. Each completion is pushed onto a
+//! queue and signalled by writing a byte to a non-blocking pipe, whose read end
+//! an event loop can watch (for example with asyncio's `loop.add_reader`) and
+//! then drain with `ffi_async_poll`. Callers therefore need no thread of their
+//! own per operation in flight.
+
+use crate::ffi::memory::{safe_slice_from_raw, set_last_error, FFIBuffer, FFIErrorCode};
+use crate::ffi::monitoring::record_operation_time;
+use crate::{
+    mldsa_sign as core_mldsa_sign, mldsa_verify as core_mldsa_verify,
+    mlkem_decapsulate as core_mlkem_decapsulate, mlkem_encapsulate as core_mlkem_encapsulate,
+};
+use libc::size_t;
+use secrecy::ExposeSecret;
+use std::collections::VecDeque;
+use std::os::raw::c_int;
+use std::sync::mpsc::{channel, Receiver, Sender};
+use std::sync::{Arc, Mutex};
+use std::thread::JoinHandle;
+use zeroize::Zeroizing;
+
+enum AsyncJob {
+    Verify {
+        public_key: Vec<u8>,
+        message: Vec<u8>,
+        signature: Vec<u8>,
+    },
+    Sign {
+        secret_key: Zeroizing<Vec<u8>>,
+        message: Vec<u8>,
+    },
+    Encapsulate {
+        public_key: Vec<u8>,
+    },
+    Decapsulate {
+        secret_key: Zeroizing<Vec<u8>>,
+        ciphertext: Vec<u8>,
+    },
+}
+
+struct AsyncResult {
+    request_id: u64,
+    status: FFIErrorCode,
+    output: Zeroizing<Vec<u8>>,
+    extra: Vec<u8>,
+}
+
+/// Result of one operation, as returned by `ffi_async_poll`.
+///
+/// `output` holds the signature or shared secret and `extra` the ciphertext
+/// of an encapsulation; both are null when empty and must be released with
+/// `ffi_buffer_free`.
+#[repr(C)]
+pub struct CAsyncCompletion {
+    pub request_id: u64,
+    pub status: c_int,
+    pub output_ptr: *mut u8,
+    pub output_len: size_t,
+    pub extra_ptr: *mut u8,
+    pub extra_len: size_t,
+}
+
+pub struct AsyncQueue {
+    sender: Mutex<Option<Sender<(u64, AsyncJob)>>>,
+    completions: Arc<Mutex<VecDeque<AsyncResult>>>,
+    workers: Mutex<Vec<JoinHandle<()>>>,
+    read_fd: c_int,
+    write_fd: c_int,
+}
+
+fn open_notify_pipe() -> Result<(c_int, c_int), String> {
+    let mut fds: [c_int; 2] = [-1, -1];
+    unsafe {
+        if libc::pipe(fds.as_mut_ptr()) != 0 {
+            return Err(format!(
+                "Failed to create notification pipe: {}",
+                std::io::Error::last_os_error()
+            ));
+        }
+        for fd in fds {
+            let flags = libc::fcntl(fd, libc::F_GETFL);
+            libc::fcntl(fd, libc::F_SETFL, flags | libc::O_NONBLOCK);
+            libc::fcntl(fd, libc::F_SETFD, libc::FD_CLOEXEC);
+        }
+    }
+    Ok((fds[0], fds[1]))
+}
+
+fn run_job(request_id: u64, job: AsyncJob) -> AsyncResult {
+    let (status, output, extra) = match job {
+        AsyncJob::Verify {
+            public_key,
+            message,
+            signature,
+        } => record_operation_time("mldsa_verify", || {
+            match core_mldsa_verify(&public_key, &message, &signature) {
+                Ok(true) => (FFIErrorCode::Success, Vec::new(), Vec::new()),
+                Ok(false) => (
+                    FFIErrorCode::SignatureVerificationFailed,
+                    Vec::new(),
+                    Vec::new(),
+                ),
+                Err(_) => (FFIErrorCode::CryptoError, Vec::new(), Vec::new()),
+            }
+        }),
+        AsyncJob::Sign {
+            secret_key,
+            message,
+        } => record_operation_time("mldsa_sign", || {
+            match core_mldsa_sign(&secret_key, &message) {
+                Ok(result) => (
+                    FFIErrorCode::Success,
+                    result.signature.expose_secret().clone(),
+                    Vec::new(),
+                ),
+                Err(_) => (FFIErrorCode::CryptoError, Vec::new(), Vec::new()),
+            }
+        }),
+        AsyncJob::Encapsulate { public_key } => record_operation_time("mlkem_encap", || {
+            match core_mlkem_encapsulate(&public_key, b"") {
+                Ok(result) => (
+                    FFIErrorCode::Success,
+                    result.shared_secret.expose_secret().clone(),
+                    result.ciphertext,
+                ),
+                Err(_) => (FFIErrorCode::CryptoError, Vec::new(), Vec::new()),
+            }
+        }),
+        AsyncJob::Decapsulate {
+            secret_key,
+            ciphertext,
+        } => record_operation_time("mlkem_decap", || {
+            match core_mlkem_decapsulate(&secret_key, &ciphertext) {
+                Ok(shared_secret) => (
+                    FFIErrorCode::Success,
+                    shared_secret.expose_secret().clone(),
+                    Vec::new(),
+                ),
+                Err(_) => (FFIErrorCode::CryptoError, Vec::new(), Vec::new()),
+            }
+        }),
+    };
+
+    AsyncResult {
+        request_id,
+        status,
+        output: Zeroizing::new(output),
+        extra,
+    }
+}
+
+fn worker_loop(
+    jobs: Arc<Mutex<Receiver<(u64, AsyncJob)>>>,
+    completions: Arc<Mutex<VecDeque<AsyncResult>>>,
+    write_fd: c_int,
+) {
+    loop {
+        let next = match jobs.lock() {
+            Ok(receiver) => receiver.recv(),
+            Err(_) => return,
+        };
+        let (request_id, job) = match next {
+            Ok(submitted) => submitted,
+            Err(_) => return, // Queue closed
+        };
+
+        let result = run_job(request_id, job);
+        if let Ok(mut queue) = completions.lock() {
+            queue.push_back(result);
+        }
+
+        // A full pipe already has a wakeup pending, so EAGAIN is ignored.
+        let signal: u8 = 1;
+        unsafe {
+            libc::write(write_fd, &signal as *const u8 as *const libc::c_void, 1);
+        }
+    }
+}
+
+impl AsyncQueue {
+    fn open(workers: usize) -> Result<Self, String> {
+        let (read_fd, write_fd) = open_notify_pipe()?;
+        let (sender, receiver) = channel();
+        let jobs = Arc::new(Mutex::new(receiver));
+        let completions = Arc::new(Mutex::new(VecDeque::new()));
+
+        let handles = (0..workers)
+            .map(|index| {
+                let jobs = Arc::clone(&jobs);
+                let completions = Arc::clone(&completions);
+                std::thread::Builder::new()
+                    .name(format!("pqc-async-{index}"))
+                    .spawn(move || worker_loop(jobs, completions, write_fd))
+            })
+            .collect::<Result<Vec<_>, _>>()
+            .map_err(|e| format!("Failed to start async worker: {e}"))?;
+
+        Ok(AsyncQueue {
+            sender: Mutex::new(Some(sender)),
+            completions,
+            workers: Mutex::new(handles),
+            read_fd,
+            write_fd,
+        })
+    }
+
+    fn submit(&self, request_id: u64, job: AsyncJob) -> c_int {
+        let sender = match self.sender.lock() {
+            Ok(sender) => sender,
+            Err(_) => {
+                set_last_error("Async queue lock poisoned");
+                return FFIErrorCode::InvalidInput as c_int;
+            }
+        };
+        match sender.as_ref().map(|s| s.send((request_id, job))) {
+            Some(Ok(())) => FFIErrorCode::Success as c_int,
+            _ => {
+                set_last_error("Async queue is closed");
+                FFIErrorCode::InvalidInput as c_int
+            }
+        }
+    }
+
+    fn drain_notifications(&self) {
+        let mut buffer = [0u8; 256];
+        loop {
+            let read = unsafe {
+                libc::read(
+                    self.read_fd,
+                    buffer.as_mut_ptr() as *mut libc::c_void,
+                    buffer.len(),
+                )
+            };
+            if read <= 0 {
+                break;
+            }
+        }
+    }
+}
+
+impl Drop for AsyncQueue {
+    fn drop(&mut self) {
+        if let Ok(mut sender) = self.sender.lock() {
+            sender.take();
+        }
+        if let Ok(mut workers) = self.workers.lock() {
+            for handle in workers.drain(..) {
+                let _ = handle.join();
+            }
+        }
+        unsafe {
+            libc::close(self.read_fd);
+            libc::close(self.write_fd);
+        }
+    }
+}
+
+fn copy_to_buffer(data: &[u8]) -> Result<(*mut u8, size_t), FFIErrorCode> {
+    if data.is_empty() {
+        return Ok((std::ptr::null_mut(), 0));
+    }
+    let mut buffer = FFIBuffer::new(data.len()).map_err(|e| {
+        set_last_error(&format!("Failed to allocate completion buffer: {e}"));
+        FFIErrorCode::AllocationFailed
+    })?;
+    unsafe {
+        std::ptr::copy_nonoverlapping(data.as_ptr(), buffer.as_mut_ptr(), data.len());
+    }
+    Ok((buffer.into_raw(), data.len()))
+}
+
+fn queue_ref<'a>(queue: *mut AsyncQueue) -> Option<&'a AsyncQueue> {
+    if queue.is_null() {
+        set_last_error("Async queue cannot be null");
+        return None;
+    }
+    unsafe { Some(&*queue) }
+}
+
+fn copy_input(ptr: *const u8, len: size_t, name: &str) -> Result<Vec<u8>, c_int> {
+    match safe_slice_from_raw(ptr, len) {
+        Ok(slice) => Ok(slice.to_vec()),
+        Err(e) => {
+            set_last_error(&format!("Invalid {name} buffer: {e}"));
+            Err(FFIErrorCode::InvalidInput as c_int)
+        }
+    }
+}
+
+/// Open a completion queue with `workers` threads (one per CPU if 0).
+#[no_mangle]
+pub extern "C" fn ffi_async_open(workers: size_t) -> *mut AsyncQueue {
+    let workers = if workers == 0 {
+        num_cpus::get()
+    } else {
+        workers
+    };
+    match AsyncQueue::open(workers) {
+        Ok(queue) => Box::into_raw(Box::new(queue)),
+        Err(e) => {
+            set_last_error(&e);
+            std::ptr::null_mut()
+        }
+    }
+}
+
+/// File descriptor that becomes readable when completions are waiting.
+#[no_mangle]
+pub extern "C" fn ffi_async_fd(queue: *mut AsyncQueue) -> c_int {
+    match queue_ref(queue) {
+        Some(queue) => queue.read_fd,
+        None => -1,
+    }
+}
+
+#[no_mangle]
+pub extern "C" fn ffi_async_submit_verify(
+    queue: *mut AsyncQueue,
+    request_id: u64,
+    public_key_ptr: *const u8,
+    public_key_len: size_t,
+    message_ptr: *const u8,
+    message_len: size_t,
+    signature_ptr: *const u8,
+    signature_len: size_t,
+) -> c_int {
+    let Some(queue) = queue_ref(queue) else {
+        return FFIErrorCode::NullPointer as c_int;
+    };
+    let job = (|| -> Result<AsyncJob, c_int> {
+        Ok(AsyncJob::Verify {
+            public_key: copy_input(public_key_ptr, public_key_len, "public key")?,
+            message: copy_input(message_ptr, message_len, "message")?,
+            signature: copy_input(signature_ptr, signature_len, "signature")?,
+        })
+    })();
+    match job {
+        Ok(job) => queue.submit(request_id, job),
+        Err(code) => code,
+    }
+}
+
+#[no_mangle]
+pub extern "C" fn ffi_async_submit_sign(
+    queue: *mut AsyncQueue,
+    request_id: u64,
+    secret_key_ptr: *const u8,
+    secret_key_len: size_t,
+    message_ptr: *const u8,
+    message_len: size_t,
+) -> c_int {
+    let Some(queue) = queue_ref(queue) else {
+        return FFIErrorCode::NullPointer as c_int;
+    };
+    let job = (|| -> Result<AsyncJob, c_int> {
+        Ok(AsyncJob::Sign {
+            secret_key: Zeroizing::new(copy_input(secret_key_ptr, secret_key_len, "secret key")?),
+            message: copy_input(message_ptr, message_len, "message")?,
+        })
+    })();
+    match job {
+        Ok(job) => queue.submit(request_id, job),
+        Err(code) => code,
+    }
+}
+
+#[no_mangle]
+pub extern "C" fn ffi_async_submit_encaps(
+    queue: *mut AsyncQueue,
+    request_id: u64,
+    public_key_ptr: *const u8,
+    public_key_len: size_t,
+) -> c_int {
+    let Some(queue) = queue_ref(queue) else {
+        return FFIErrorCode::NullPointer as c_int;
+    };
+    match copy_input(public_key_ptr, public_key_len, "public key") {
+        Ok(public_key) => queue.submit(request_id, AsyncJob::Encapsulate { public_key }),
+        Err(code) => code,
+    }
+}
+
+#[no_mangle]
+pub extern "C" fn ffi_async_submit_decaps(
+    queue: *mut AsyncQueue,
+    request_id: u64,
+    secret_key_ptr: *const u8,
+    secret_key_len: size_t,
+    ciphertext_ptr: *const u8,
+    ciphertext_len: size_t,
+) -> c_int {
+    let Some(queue) = queue_ref(queue) else {
+        return FFIErrorCode::NullPointer as c_int;
+    };
+    let job = (|| -> Result<AsyncJob, c_int> {
+        Ok(AsyncJob::Decapsulate {
+            secret_key: Zeroizing::new(copy_input(secret_key_ptr, secret_key_len, "secret key")?),
+            ciphertext: copy_input(ciphertext_ptr, ciphertext_len, "ciphertext")?,
+        })
+    })();
+    match job {
+        Ok(job) => queue.submit(request_id, job),
+        Err(code) => code,
+    }
+}
+
+/// Move up to `max` completions into `out`, returning how many were written.
+///
+/// The notification pipe is drained first, so a completion pushed after this
+/// call returns always leaves the descriptor readable again.
+#[no_mangle]
+pub extern "C" fn ffi_async_poll(
+    queue: *mut AsyncQueue,
+    out: *mut CAsyncCompletion,
+    max: size_t,
+) -> size_t {
+    let Some(queue) = queue_ref(queue) else {
+        return 0;
+    };
+    if out.is_null() || max == 0 {
+        return 0;
+    }
+    queue.drain_notifications();
+
+    let mut completions = match queue.completions.lock() {
+        Ok(completions) => completions,
+        Err(_) => return 0,
+    };
+
+    let mut written = 0;
+    while written < max {
+        let Some(result) = completions.pop_front() else {
+            break;
+        };
+        let buffers = copy_to_buffer(&result.output)
+            .and_then(|output| copy_to_buffer(&result.extra).map(|extra| (output, extra)));
+        let completion = match buffers {
+            Ok(((output_ptr, output_len), (extra_ptr, extra_len))) => CAsyncCompletion {
+                request_id: result.request_id,
+                status: result.status as c_int,
+                output_ptr,
+                output_len,
+                extra_ptr,
+                extra_len,
+            },
+            Err(code) => CAsyncCompletion {
+                request_id: result.request_id,
+                status: code as c_int,
+                output_ptr: std::ptr::null_mut(),
+                output_len: 0,
+                extra_ptr: std::ptr::null_mut(),
+                extra_len: 0,
+            },
+        };
+        unsafe {
+            *out.add(written) = completion;
+        }
+        written += 1;
+    }
+    written
+}
+
+/// Stop the workers, after they finish submitted operations, and free the queue.
+#[no_mangle]
+pub extern "C" fn ffi_async_close(queue: *mut AsyncQueue) {
+    if !queue.is_null() {
+        unsafe {
+            drop(Box::from_raw(queue));
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::ffi::memory::ffi_buffer_free;
+    use crate::ffi::monitoring::{ffi_free_performance_report, ffi_get_performance_metrics};
+    use crate::{generate_mldsa_keypair, generate_mlkem_keypair};
+
+    fn kyber_encap_count() -> u64 {
+        let report = ffi_get_performance_metrics();
+        let count = unsafe { (*report).kyber_encap_count };
+        ffi_free_performance_report(report as *mut _);
+        count
+    }
+
+    fn wait_for(queue: *mut AsyncQueue, count: usize) -> Vec<CAsyncCompletion> {
+        let mut results = Vec::new();
+        while results.len() < count {
+            let mut out: Vec<CAsyncCompletion> = (0..count)
+                .map(|_| CAsyncCompletion {
+                    request_id: 0,
+                    status: 0,
+                    output_ptr: std::ptr::null_mut(),
+                    output_len: 0,
+                    extra_ptr: std::ptr::null_mut(),
+                    extra_len: 0,
+                })
+                .collect();
+            let written = ffi_async_poll(queue, out.as_mut_ptr(), count);
+            out.truncate(written);
+            results.extend(out);
+            std::thread::sleep(std::time::Duration::from_millis(1));
+        }
+        results
+    }
+
+    #[test]
+    fn test_sign_and_verify_complete_on_queue() {
+        let keypair = generate_mldsa_keypair().unwrap();
+        let secret_key = keypair.private_key.expose_secret();
+        let message = b"async message";
+        let queue = ffi_async_open(2);
+        assert!(!queue.is_null());
+        assert!(ffi_async_fd(queue) >= 0);
+
+        let status = ffi_async_submit_sign(
+            queue,
+            7,
+            secret_key.as_ptr(),
+            secret_key.len(),
+            message.as_ptr(),
+            message.len(),
+        );
+        assert_eq!(status, FFIErrorCode::Success as c_int);
+
+        let signed = wait_for(queue, 1);
+        assert_eq!(signed[0].request_id, 7);
+        assert_eq!(signed[0].status, FFIErrorCode::Success as c_int);
+        let signature =
+            unsafe { std::slice::from_raw_parts(signed[0].output_ptr, signed[0].output_len) };
+
+        ffi_async_submit_verify(
+            queue,
+            8,
+            keypair.public_key.as_ptr(),
+            keypair.public_key.len(),
+            message.as_ptr(),
+            message.len(),
+            signature.as_ptr(),
+            signature.len(),
+        );
+        let verified = wait_for(queue, 1);
+        assert_eq!(verified[0].request_id, 8);
+        assert_eq!(verified[0].status, FFIErrorCode::Success as c_int);
+
+        ffi_buffer_free(signed[0].output_ptr, signed[0].output_len);
+        ffi_async_close(queue);
+    }
+
+    #[test]
+    fn test_encapsulation_roundtrip_on_queue() {
+        let keypair = generate_mlkem_keypair().unwrap();
+        let secret_key = keypair.private_key.expose_secret();
+        let encaps_before = kyber_encap_count();
+        let queue = ffi_async_open(1);
+
+        ffi_async_submit_encaps(
+            queue,
+            1,
+            keypair.public_key.as_ptr(),
+            keypair.public_key.len(),
+        );
+        let encapsulated = wait_for(queue, 1);
+        let ciphertext = unsafe {
+            std::slice::from_raw_parts(encapsulated[0].extra_ptr, encapsulated[0].extra_len)
+        };
+
+        ffi_async_submit_decaps(
+            queue,
+            2,
+            secret_key.as_ptr(),
+            secret_key.len(),
+            ciphertext.as_ptr(),
+            ciphertext.len(),
+        );
+        let decapsulated = wait_for(queue, 1);
+        unsafe {
+            assert_eq!(
+                std::slice::from_raw_parts(encapsulated[0].output_ptr, encapsulated[0].output_len),
+                std::slice::from_raw_parts(decapsulated[0].output_ptr, decapsulated[0].output_len)
+            );
+        }
+        assert!(kyber_encap_count() > encaps_before);
+
+        for completion in encapsulated.iter().chain(decapsulated.iter()) {
+            ffi_buffer_free(completion.output_ptr, completion.output_len);
+            ffi_buffer_free(completion.extra_ptr, completion.extra_len);
+        }
+        ffi_async_close(queue);
+    }
+
+    #[test]
+    fn test_each_request_completes_once() {
+        let keypair = generate_mldsa_keypair().unwrap();
+        let message = b"async message";
+        let queue = ffi_async_open(4);
+
+        for request_id in 0..64u64 {
+            // Every other signature is corrupted
+            let signature = if request_id % 2 == 0 {
+                vec![0u8; 16]
+            } else {
+                vec![1u8; 3309]
+            };
+            let status = ffi_async_submit_verify(
+                queue,
+                request_id,
+                keypair.public_key.as_ptr(),
+                keypair.public_key.len(),
+                message.as_ptr(),
+                message.len(),
+                signature.as_ptr(),
+                signature.len(),
+            );
+            assert_eq!(status, FFIErrorCode::Success as c_int);
+        }
+
+        let mut completed: Vec<u64> = wait_for(queue, 64)
+            .iter()
+            .map(|completion| {
+                assert_ne!(completion.status, FFIErrorCode::Success as c_int);
+                assert!(completion.output_ptr.is_null() && completion.extra_ptr.is_null());
+                completion.request_id
+            })
+            .collect();
+        completed.sort_unstable();
+        assert_eq!(completed, (0..64).collect::<Vec<_>>());
+
+        ffi_async_close(queue);
+    }
+
+    #[test]
+    fn test_null_queue_rejected() {
+        let status = ffi_async_submit_encaps(std::ptr::null_mut(), 1, [0u8].as_ptr(), 1);
+        assert_eq!(status, FFIErrorCode::NullPointer as c_int);
+        assert_eq!(ffi_async_fd(std::ptr::null_mut()), -1);
+    }
+}
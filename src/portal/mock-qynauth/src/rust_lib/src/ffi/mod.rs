@@ -1,8 +1,14 @@
+pub mod async_ops;
 pub mod memory;
 pub mod mldsa_ffi;
 pub mod mlkem_ffi;
 pub mod monitoring;
 
+pub use async_ops::{
+    ffi_async_close, ffi_async_fd, ffi_async_open, ffi_async_poll, ffi_async_submit_decaps,
+    ffi_async_submit_encaps, ffi_async_submit_sign, ffi_async_submit_verify, AsyncQueue,
+    CAsyncCompletion,
+};
 pub use memory::{
     ffi_buffer_free, ffi_get_last_error_message, validate_buffer_params, FFIBuffer, FFIErrorCode,
 };
@@ -12,4 +18,6 @@ pub use mldsa_ffi::{
 pub use mlkem_ffi::{
     mlkem_decapsulate, mlkem_encapsulate, mlkem_keypair_free, mlkem_keypair_generate, CMLKEMKeyPair,
 };
-pub use monitoring::{ffi_enable_optimizations, record_operation_time, FFIMetrics};
+pub use monitoring::{
+    ffi_enable_optimizations, ffi_optimal_batch_size, record_operation_time, FFIMetrics,
+};
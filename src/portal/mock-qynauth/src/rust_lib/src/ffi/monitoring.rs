@@ -1,3 +1,4 @@
+use crate::hardware::HardwareFeatures;
 use once_cell::sync::Lazy;
 use std::fs::OpenOptions;
 use std::io::Write;
@@ -291,6 +292,12 @@ pub extern "C" fn ffi_enable_optimizations(_flags: u32) -> c_int {
     0
 }
 
+/// Batch size suited to this host, from `HardwareFeatures::optimal_batch_size`.
+#[no_mangle]
+pub extern "C" fn ffi_optimal_batch_size() -> usize {
+    HardwareFeatures::detect().optimal_batch_size()
+}
+
 #[no_mangle]
 pub extern "C" fn ffi_get_performance_metrics() -> *const FFIPerformanceReport {
     let report = Box::new(FFIPerformanceReport {
@@ -0,0 +1,59 @@
+//! CPU features of the host, and the batch size they suit.
+
+#[derive(Debug, Clone)]
+pub struct HardwareFeatures {
+    pub avx2_available: bool,
+    pub aes_ni_available: bool,
+    pub sse4_available: bool,
+    pub cpu_cores: usize,
+}
+
+impl HardwareFeatures {
+    pub fn detect() -> Self {
+        #[cfg(any(target_arch = "x86", target_arch = "x86_64"))]
+        let (avx2_available, aes_ni_available, sse4_available) = (
+            is_x86_feature_detected!("avx2"),
+            is_x86_feature_detected!("aes"),
+            is_x86_feature_detected!("sse4.1"),
+        );
+        #[cfg(not(any(target_arch = "x86", target_arch = "x86_64")))]
+        let (avx2_available, aes_ni_available, sse4_available) = (false, false, false);
+
+        Self {
+            avx2_available,
+            aes_ni_available,
+            sse4_available,
+            cpu_cores: num_cpus::get(),
+        }
+    }
+
+    pub fn optimal_batch_size(&self) -> usize {
+        if self.avx2_available {
+            self.cpu_cores * 4
+        } else if self.sse4_available {
+            self.cpu_cores * 2
+        } else {
+            self.cpu_cores
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_batch_size_follows_features() {
+        let mut features = HardwareFeatures {
+            avx2_available: true,
+            aes_ni_available: false,
+            sse4_available: true,
+            cpu_cores: 4,
+        };
+        assert_eq!(features.optimal_batch_size(), 16);
+        features.avx2_available = false;
+        assert_eq!(features.optimal_batch_size(), 8);
+        features.sse4_available = false;
+        assert_eq!(features.optimal_batch_size(), 4);
+    }
+}
@@ -18,6 +18,7 @@ use std::os::raw::c_char;
 use thiserror::Error;
 
 pub mod ffi;
+pub mod hardware;
 pub mod security;
 
 #[derive(Error, Debug)]
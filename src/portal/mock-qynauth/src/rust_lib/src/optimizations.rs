@@ -5,35 +5,7 @@ use rayon::prelude::*;
 use pqcrypto_mlkem::mlkem768::{keypair as mlkem_keypair, PublicKey as MLKEMPublicKey, SecretKey as MLKEMSecretKey};
 use pqcrypto_mldsa::mldsa65::{keypair as mldsa_keypair, PublicKey as MLDSAPublicKey, SecretKey as MLDSASecretKey, DetachedSignature as MLDSASignature, sign_detached, verify_detached};
 use crate::errors::CryptoError;
-
-#[derive(Debug, Clone)]
-pub struct HardwareFeatures {
-    pub avx2_available: bool,
-    pub aes_ni_available: bool,
-    pub sse4_available: bool,
-    pub cpu_cores: usize,
-}
-
-impl HardwareFeatures {
-    pub fn detect() -> Self {
-        Self {
-            avx2_available: is_x86_feature_detected!("avx2"),
-            aes_ni_available: is_x86_feature_detected!("aes"),
-            sse4_available: is_x86_feature_detected!("sse4.1"),
-            cpu_cores: num_cpus::get(),
-        }
-    }
-
-    pub fn optimal_batch_size(&self) -> usize {
-        if self.avx2_available {
-            self.cpu_cores * 4
-        } else if self.sse4_available {
-            self.cpu_cores * 2
-        } else {
-            self.cpu_cores
-        }
-    }
-}
+use crate::hardware::HardwareFeatures;
 
 pub struct MemoryPool {
     kyber_buffers: Arc<Mutex<VecDeque<Vec<u8>>>>,
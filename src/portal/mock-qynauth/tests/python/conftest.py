@@ -4,6 +4,7 @@ Pytest Configuration for PQC Integration Tests
 This module provides shared fixtures and configuration for all PQC tests.
 """
 
+import asyncio
 import pytest
 import sys
 import os
@@ -56,6 +57,11 @@ def test_metadata():
         "compliance_level": "NIST_SP_800_53"
     }
 
+@pytest.fixture
+def run():
+    """Run a coroutine to completion on a fresh event loop."""
+    return asyncio.run
+
 @pytest.fixture(autouse=True)
 def setup_test_logging():
     """Setup test-specific logging configuration."""
@@ -116,3 +122,6 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "requires_ffi: Tests that require actual FFI library"
     )
+    config.addinivalue_line(
+        "markers", "experimental: Tests of experimental paths, skipped unless the library supports them"
+    )
@@ -0,0 +1,123 @@
+"""
+Performance Tests for PQC Batch Processor
+
+This module measures end-to-end throughput and submit-to-result latency
+of the PQC batch processor with up to 100k items in flight, and the
+latency of interactive items behind a bulk job.
+"""
+
+import asyncio
+import pytest
+import time
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../../src'))
+
+from python_app.optimization.batch_processor import BatchConfig, BatchPriority, PQCBatchProcessor
+
+def echo_batch(batch_items):
+    """Batch function returning each item's data."""
+    return [item.data for item in batch_items]
+
+def slow_batch(batch_items):
+    """Batch function costing 2ms per batch."""
+    time.sleep(0.002)
+    return [item.data for item in batch_items]
+
+def percentile(values, fraction):
+    """Value at the given fraction of the sorted values."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+async def measure_end_to_end(items):
+    """Submit `items` at once; return per-item cost in microseconds and latencies in seconds."""
+    processor = PQCBatchProcessor(echo_batch, BatchConfig(
+        max_batch_size=256, max_wait_time=0.005, max_concurrent_batches=4, max_queue_size=0))
+    latencies = []
+
+    async def submit(i):
+        start = time.perf_counter()
+        result = await processor.submit(i, f"user_{i % 1000}", "sign")
+        latencies.append(time.perf_counter() - start)
+        return result
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*[submit(i) for i in range(items)])
+    elapsed = time.perf_counter() - start
+
+    assert results == list(range(items)), "Results were not routed to their submitters"
+    return elapsed / items * 1e6, latencies
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestBatchProcessorPerformance:
+    """End-to-end benchmarks for the PQC batch processor."""
+
+    def test_100k_items_throughput_and_latency(self):
+        """Every item completes, and per-item cost does not grow with items in flight."""
+        small_us, _ = asyncio.run(measure_end_to_end(10_000))
+        large_us, latencies = asyncio.run(measure_end_to_end(100_000))
+
+        print(f"Batch processor 100k items - {1e6 / large_us:,.0f} items/s, "
+              f"per item: {large_us:.1f}us (10k: {small_us:.1f}us), "
+              f"latency p50: {percentile(latencies, 0.5) * 1e3:.0f}ms, "
+              f"p99: {percentile(latencies, 0.99) * 1e3:.0f}ms")
+
+        assert len(latencies) == 100_000
+        assert large_us < small_us * 2, f"Per-item cost grew from {small_us:.1f}us to {large_us:.1f}us"
+
+async def interactive_latency_under_bulk(interactive_priority, bulk_items=3000, interactive_items=100):
+    """
+    Interactive items trickled in behind a bulk flood.
+
+    Returns each interactive item's submit-to-result latency, and the
+    number of bulk items that completed while it waited: a measure of
+    scheduling order that does not depend on how fast the host is.
+    """
+    processor = PQCBatchProcessor(slow_batch, BatchConfig(
+        max_batch_size=32, max_wait_time=0.002, max_concurrent_batches=2, max_queue_size=0))
+    bulk_done = 0
+
+    async def bulk(i):
+        nonlocal bulk_done
+        await processor.submit(i, "migration", "sign", priority=BatchPriority.BULK)
+        bulk_done += 1
+
+    bulk_tasks = [asyncio.ensure_future(bulk(i)) for i in range(bulk_items)]
+    latencies, overtaken = [], []
+
+    async def interactive(i):
+        start, done_before = time.perf_counter(), bulk_done
+        await processor.submit(i, f"user_{i}", "sign", priority=interactive_priority)
+        latencies.append(time.perf_counter() - start)
+        overtaken.append(bulk_done - done_before)
+
+    tasks = []
+    for i in range(interactive_items):
+        tasks.append(asyncio.ensure_future(interactive(i)))
+        await asyncio.sleep(0.001)
+    await asyncio.gather(*tasks, *bulk_tasks)
+    return latencies, overtaken
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestPriorityLanePerformance:
+    """Interactive latency behind bulk work."""
+
+    def test_interactive_latency_isolated_from_bulk(self):
+        """With lanes, interactive items skip ahead of a queued bulk job."""
+        shared, shared_overtaken = asyncio.run(interactive_latency_under_bulk(BatchPriority.BULK))
+        laned, laned_overtaken = asyncio.run(interactive_latency_under_bulk(BatchPriority.INTERACTIVE))
+
+        shared_p99, laned_p99 = percentile(shared, 0.99), percentile(laned, 0.99)
+        print(f"Interactive p99 behind 3k bulk items - shared lane: {shared_p99 * 1e3:.0f}ms "
+              f"(max {max(shared_overtaken)} bulk items first), "
+              f"interactive lane: {laned_p99 * 1e3:.0f}ms (max {max(laned_overtaken)})")
+
+        # An interactive item waits for the 2 bulk batches in flight and shares
+        # the next batch with bulk items: about 3 batches of 32, with slack for
+        # bulk completions the loop only counts after the item was submitted.
+        # In the shared lane it waits behind the queued bulk job.
+        assert max(laned_overtaken) <= 6 * 32
+        assert max(shared_overtaken) > 10 * max(laned_overtaken)
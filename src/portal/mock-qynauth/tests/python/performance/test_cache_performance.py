@@ -0,0 +1,147 @@
+"""
+Performance Tests for PQC Cache Manager
+
+This module benchmarks per-operation cost of the PQC cache manager as
+the cache fills up, and the per-call cost of cache keys and sizing.
+"""
+
+import asyncio
+import gc
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+import pickle
+import pytest
+import time
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../../src'))
+
+from python_app.optimization.cache_manager import PQCCacheManager, CachePolicy, estimate_size
+
+def legacy_cache_key(operation, user_id, algorithm, **kwargs):
+    """Previous key scheme: hash of the sorted parameter dict."""
+    key_data = {"operation": operation, "user_id": user_id, "algorithm": algorithm, **kwargs}
+    return hashlib.sha256(str(sorted(key_data.items())).encode()).hexdigest()[:16]
+
+def legacy_size(value):
+    """Previous sizing scheme: pickled length."""
+    return len(pickle.dumps(value))
+
+def time_per_call(func, iterations=20000):
+    """Average wall time of func() in microseconds."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+async def measure_full_cache_sets(max_size, policy, operations=2000):
+    """Fill a cache to capacity, then time sets that each force an eviction."""
+    cache = PQCCacheManager(max_size=max_size, max_memory_mb=1024, policy=policy)
+    for i in range(max_size):
+        await cache.set("keygen", f"user_{i}", "ML-KEM-768", i)
+
+    # Like timeit, pause the cyclic GC so full collections over the
+    # large heap do not dominate the per-operation timing.
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for i in range(operations):
+            await cache.set("keygen", f"new_user_{i}", "ML-KEM-768", i)
+            await cache.get("keygen", f"user_{max_size - 1 - i}", "ML-KEM-768")
+        return (time.perf_counter() - start) / operations * 1e6
+    finally:
+        gc.enable()
+
+def populated_cache(users=2000):
+    """Cache preloaded with the benchmark working set."""
+    cache = PQCCacheManager(max_size=4096)
+    for i in range(users):
+        cache.set_sync("keygen", f"user_{i}", "ML-KEM-768", b"k" * 64)
+    return cache
+
+def cache_workload(cache, worker_id, operations):
+    """Read-mostly workload: 9 gets per set over a working set that fits."""
+    for i in range(operations):
+        user = f"user_{(worker_id * 7919 + i) % 2000}"
+        if i % 10 == 0:
+            cache.set_sync("keygen", user, "ML-KEM-768", b"k" * 64)
+        else:
+            cache.get_sync("keygen", user, "ML-KEM-768")
+
+async def measure_task_throughput(tasks, total=128_000):
+    """Operations per second with `tasks` coroutines sharing one cache."""
+    cache = populated_cache()
+
+    async def worker(worker_id, operations):
+        for i in range(operations):
+            user = f"user_{(worker_id * 7919 + i) % 2000}"
+            if i % 10 == 0:
+                await cache.set("keygen", user, "ML-KEM-768", b"k" * 64)
+            else:
+                await cache.get("keygen", user, "ML-KEM-768")
+            if i % 50 == 0:
+                await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(w, total // tasks) for w in range(tasks)))
+    return total / (time.perf_counter() - start)
+
+def measure_thread_throughput(threads, total=128_000):
+    """Operations per second with `threads` pool workers sharing one cache."""
+    cache = populated_cache()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(lambda w: cache_workload(cache, w, total // threads), range(threads)))
+    return total / (time.perf_counter() - start)
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestCachePerformance:
+    """Per-operation cost benchmarks for the PQC cache."""
+
+    @pytest.mark.parametrize("policy", [CachePolicy.LRU, CachePolicy.LFU, CachePolicy.TTL])
+    def test_eviction_cost_is_flat(self, policy):
+        """Per-operation cost at 100k entries stays close to the cost at 1k entries."""
+        small_us = asyncio.run(measure_full_cache_sets(1_000, policy))
+        large_us = asyncio.run(measure_full_cache_sets(100_000, policy))
+
+        print(f"Cache {policy.value} set+get at capacity - 1k: {small_us:.1f}us, 100k: {large_us:.1f}us")
+
+        assert large_us < small_us * 3, f"Per-operation cost grew from {small_us:.1f}us to {large_us:.1f}us"
+
+    def test_key_and_size_overhead(self):
+        """Structural keys and size estimates are cheaper than hashing and pickling."""
+        cache = PQCCacheManager()
+        signature = os.urandom(3309)
+        key_material = {"public_key": list(os.urandom(1952)), "secret_key": list(os.urandom(4032))}
+
+        legacy_key_us = time_per_call(lambda: legacy_cache_key(
+            "verify", "user_1", "ML-DSA-65", signature_hash="ab" * 16, context="login"))
+        key_us = time_per_call(lambda: cache._generate_cache_key(
+            "verify", "user_1", "ML-DSA-65", signature_hash="ab" * 16, context="login"))
+        legacy_size_us = time_per_call(lambda: legacy_size(key_material), 2000)
+        size_us = time_per_call(lambda: estimate_size(key_material), 2000)
+        bytes_legacy_us = time_per_call(lambda: legacy_size(signature))
+        bytes_us = time_per_call(lambda: estimate_size(signature))
+
+        print(f"Cache key: {legacy_key_us:.2f}us -> {key_us:.2f}us; "
+              f"list key material size: {legacy_size_us:.2f}us -> {size_us:.2f}us; "
+              f"bytes size: {bytes_legacy_us:.2f}us -> {bytes_us:.2f}us")
+
+        assert key_us < legacy_key_us / 2
+        assert size_us < legacy_size_us / 2
+        assert bytes_us < bytes_legacy_us
+
+    def test_concurrent_throughput(self):
+        """Throughput holds up with 64 concurrent tasks and 64 pool workers."""
+        single_task = asyncio.run(measure_task_throughput(1))
+        many_tasks = asyncio.run(measure_task_throughput(64))
+        single_thread = measure_thread_throughput(1)
+        many_threads = measure_thread_throughput(64)
+
+        print(f"Cache ops/s - tasks 1: {single_task:.0f}, 64: {many_tasks:.0f}; "
+              f"threads 1: {single_thread:.0f}, 64: {many_threads:.0f}")
+
+        assert many_tasks > single_task * 0.7
+        assert many_threads > single_thread * 0.3
@@ -0,0 +1,80 @@
+"""
+Performance Tests for Adaptive Concurrency Limiting
+
+This module overloads a simulated PQC backend with fixed capacity and
+compares tail latency and completed requests under a static limit against
+the adaptive limiter.
+"""
+
+import asyncio
+import os
+import pytest
+import statistics
+import time
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../../src'))
+
+from python_app.optimization.concurrency_limiter import (
+    AdaptiveConcurrencyLimiter, ConcurrencyLimitExceeded, LimitAlgorithm
+)
+
+CAPACITY = 2
+SERVICE_TIME = 0.005
+CLIENTS = 32
+DURATION = 1.5
+RETRY_AFTER = SERVICE_TIME * 4  # Client back-off after a rejection
+
+async def overload(limiter):
+    """Latencies of admitted requests and the rejection count under overload."""
+    backend = asyncio.Semaphore(CAPACITY)
+    latencies, rejected = [], 0
+    stop = time.perf_counter() + DURATION
+
+    async def operation():
+        async with backend:
+            await asyncio.sleep(SERVICE_TIME)
+
+    async def client():
+        nonlocal rejected
+        while time.perf_counter() < stop:
+            start = time.perf_counter()
+            try:
+                await limiter.run(operation)
+            except ConcurrencyLimitExceeded:
+                rejected += 1
+                await asyncio.sleep(RETRY_AFTER)
+                continue
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*[client() for _ in range(CLIENTS)])
+    return latencies, rejected
+
+def p99(latencies):
+    """99th percentile latency in seconds."""
+    return statistics.quantiles(latencies, n=100)[98]
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestConcurrencyLimiterPerformance:
+    """Tail latency under overload."""
+
+    @pytest.mark.parametrize("algorithm", list(LimitAlgorithm))
+    def test_adaptive_limit_cuts_tail_latency(self, algorithm):
+        """The adaptive limit at least halves p99 against a static limit sized for the clients, and completes nearly as many requests."""
+        static = AdaptiveConcurrencyLimiter("static", initial_limit=CLIENTS,
+                                            min_limit=CLIENTS, max_limit=CLIENTS)
+        adaptive = AdaptiveConcurrencyLimiter(f"adaptive_{algorithm.value}", algorithm,
+                                              initial_limit=CAPACITY * 2, max_limit=CLIENTS)
+
+        static_latencies, _ = asyncio.run(overload(static))
+        adaptive_latencies, rejected = asyncio.run(overload(adaptive))
+
+        print(f"{algorithm.value} p99 - static: {p99(static_latencies) * 1000:.1f}ms "
+              f"({len(static_latencies)} ok), adaptive: {p99(adaptive_latencies) * 1000:.1f}ms "
+              f"({len(adaptive_latencies)} ok, {rejected} rejected, limit {adaptive.limit})")
+
+        # The backend is saturated either way; only the queue in front of it differs.
+        assert len(adaptive_latencies) > len(static_latencies) * 0.8
+        assert p99(adaptive_latencies) < p99(static_latencies) * 0.5
+        assert rejected > 0 and adaptive.limit < CLIENTS // 2
@@ -0,0 +1,66 @@
+"""
+Performance Tests for PQC Connection Pool
+
+This module compares operations on a warm pooled connection against
+loading the library and converting keys for every call.
+"""
+
+import asyncio
+import logging
+import os
+import pytest
+import time
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../../src'))
+
+from python_app.optimization.connection_pool import PQCConnectionPool
+from python_app.pqc_ffi import PQCLibrary
+
+try:
+    PQCLibrary()
+    LIBRARY_AVAILABLE = True
+except Exception:
+    LIBRARY_AVAILABLE = False
+
+OPERATIONS = 200
+
+async def pooled_decapsulations(pool, keypair, ciphertext):
+    """Seconds per acquire plus decapsulation on a pooled connection."""
+    start = time.perf_counter()
+    for _ in range(OPERATIONS):
+        async with pool.get_connection("user_1") as connection:
+            connection.resources.decapsulate(keypair['private_key'], ciphertext)
+    return (time.perf_counter() - start) / OPERATIONS
+
+def unpooled_decapsulations(keypair, ciphertext):
+    """Seconds per decapsulation with a freshly loaded library."""
+    start = time.perf_counter()
+    for _ in range(OPERATIONS):
+        PQCLibrary().ml_kem_decapsulate(keypair['private_key'], ciphertext)
+    return (time.perf_counter() - start) / OPERATIONS
+
+@pytest.mark.performance
+@pytest.mark.slow
+@pytest.mark.skipif(not LIBRARY_AVAILABLE, reason="PQC library not built")
+class TestConnectionPoolPerformance:
+    """Warm connection benchmarks."""
+
+    def test_warm_connection_saves_setup(self):
+        """Acquiring a warm connection costs less than per-call setup."""
+        logging.disable(logging.INFO)
+        try:
+            library = PQCLibrary()
+            keypair = library.generate_ml_kem_keypair()
+            ciphertext = library.ml_kem_encapsulate(keypair['public_key'])['ciphertext']
+
+            pool = PQCConnectionPool(max_connections=2)
+            pooled_s = asyncio.run(pooled_decapsulations(pool, keypair, ciphertext))
+            unpooled_s = unpooled_decapsulations(keypair, ciphertext)
+        finally:
+            logging.disable(logging.NOTSET)
+
+        print(f"ML-KEM-768 decapsulation - pooled: {pooled_s * 1e6:.0f}us, "
+              f"per-call setup: {unpooled_s * 1e6:.0f}us")
+
+        assert pooled_s < unpooled_s * 0.75
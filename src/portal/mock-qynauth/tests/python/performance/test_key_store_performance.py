@@ -0,0 +1,83 @@
+"""
+Performance Tests for Compact Key Storage
+
+This module compares the memory held per user by keys kept as the integer
+lists the FFI returns against the same keys in a StoredKey, as bytes.
+"""
+
+import os
+import pytest
+import sys
+import tracemalloc
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../../src'))
+
+from python_app.optimization.key_store import StoredKey
+from python_app.pqc_ffi import PQCLibrary
+
+USERS = 500
+
+class ListLibrary:
+    """PQCLibrary stand-in returning random keys as integer lists, like the FFI."""
+
+    def generate_ml_kem_keypair(self):
+        return {'public_key': list(os.urandom(1184)), 'private_key': list(os.urandom(2400)),
+                'algorithm': 'ML-KEM-768'}
+
+    def generate_ml_dsa_keypair(self):
+        return {'public_key': list(os.urandom(1952)), 'private_key': list(os.urandom(4032)),
+                'algorithm': 'ML-DSA-65'}
+
+def key_library():
+    """The built PQC library, or the stand-in if it is not built."""
+    try:
+        return PQCLibrary()
+    except Exception:
+        return ListLibrary()
+
+def bytes_per_user(keypairs, store_keys):
+    """Traced allocation per user for storing each user's keypairs with store_keys."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        users = {f"user_{i}": store_keys(*user_keys) for i, user_keys in enumerate(keypairs)}
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    assert len(users) == USERS
+    return (after - before) / USERS
+
+def as_lists(kem, dsa):
+    """A user's keys as previously stored: the FFI's integer lists."""
+    return {
+        "ml_kem": {"public_key": list(kem['public_key']), "private_key": list(kem['private_key']),
+                   "algorithm": "ML-KEM-768"},
+        "ml_dsa": {"public_key": list(dsa['public_key']), "private_key": list(dsa['private_key']),
+                   "algorithm": "ML-DSA-65"},
+    }
+
+def as_stored_keys(kem, dsa):
+    """A user's keys as PQCKeyStore.generate() stores them."""
+    return {
+        "ml_kem": StoredKey("ML-KEM-768", bytes(kem['public_key']), bytes(kem['private_key'])),
+        "ml_dsa": StoredKey("ML-DSA-65", bytes(dsa['public_key']), bytes(dsa['private_key'])),
+    }
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestKeyStorePerformance:
+    """Memory per user."""
+
+    def test_bytes_storage_footprint(self):
+        """Keys kept as bytes take over 5x less memory per user than integer lists."""
+        library = key_library()
+        keypairs = [(library.generate_ml_kem_keypair(), library.generate_ml_dsa_keypair())
+                    for _ in range(USERS)]
+
+        lists = bytes_per_user(keypairs, as_lists)
+        stored = bytes_per_user(keypairs, as_stored_keys)
+
+        print(f"Key memory per user ({type(library).__name__}) - integer lists: {lists:.0f} B, "
+              f"bytes: {stored:.0f} B ({lists / stored:.1f}x)")
+
+        assert lists > stored * 5
@@ -0,0 +1,82 @@
+"""
+Performance Tests for PQC Log Redaction
+
+This module benchmarks the single-pass redaction engine against the
+previous per-pattern substring filter.
+"""
+
+import logging
+import pytest
+import time
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../../src'))
+
+from python_app.monitoring.redaction import PQCRedactionEngine
+
+RECORDS_PER_RUN = 100_000
+
+LEGACY_PATTERNS = [
+    'private_key', 'secret_key', 'shared_secret',
+    'password', 'token', 'signature', 'ciphertext'
+]
+
+def legacy_filter(record):
+    """Reference implementation of the previous PQCSecurityFilter."""
+    message = record.getMessage().lower()
+    for pattern in LEGACY_PATTERNS:
+        if pattern in message:
+            if record.args and len(record.args) > 0:
+                first_arg = str(record.args[0]) if record.args[0] is not None else ''
+                record.msg = str(record.msg).replace(first_arg, '[REDACTED]')
+            break
+    return True
+
+def make_records(count):
+    """Build a representative mix of mostly clean PQC log records."""
+    records = []
+    for i in range(count):
+        if i % 100 == 0:
+            record = logging.LogRecord(
+                "pqc", logging.DEBUG, __file__, 1,
+                f'Decoded JSON string: {{"private_key": {list(range(32))}}}', None, None
+            )
+        else:
+            record = logging.LogRecord(
+                "pqc", logging.DEBUG, __file__, 1,
+                "Cache hit: %s", (f"{i:016x}",), None
+            )
+            record.pqc_operation = "cache_hit"
+            record.user_id = f"user_{i % 50}"
+            record.algorithm = "ML-KEM-768"
+        records.append(record)
+    return records
+
+@pytest.mark.performance
+class TestLogRedactionPerformance:
+    """Throughput benchmarks for log redaction."""
+
+    def test_redaction_throughput(self):
+        """Redaction engine sustains 100k records/s on a typical mix."""
+        engine = PQCRedactionEngine()
+
+        legacy_records = make_records(RECORDS_PER_RUN)
+        start = time.perf_counter()
+        for record in legacy_records:
+            legacy_filter(record)
+        legacy_elapsed = time.perf_counter() - start
+
+        records = make_records(RECORDS_PER_RUN)
+        start = time.perf_counter()
+        for record in records:
+            engine.redact_record(record)
+        elapsed = time.perf_counter() - start
+
+        throughput = RECORDS_PER_RUN / elapsed
+        legacy_throughput = RECORDS_PER_RUN / legacy_elapsed
+
+        print(f"Log redaction - engine: {throughput:,.0f} records/s, legacy: {legacy_throughput:,.0f} records/s")
+
+        assert throughput > 100_000, f"Redaction throughput {throughput:,.0f} records/s too low"
+        assert "[REDACTED]" in records[0].getMessage()
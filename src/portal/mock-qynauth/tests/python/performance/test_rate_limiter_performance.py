@@ -0,0 +1,140 @@
+"""
+Performance Tests for PQC Rate Limiter
+
+This module benchmarks per-check cost of the rate limiting strategies
+under a sustained 10k requests per second on a single key.
+"""
+
+import asyncio
+import pytest
+import time
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../../src'))
+
+from python_app.optimization import rate_limiter as rate_limiter_module
+from python_app.optimization.rate_limiter import (
+    PQCRateLimiter, QuotaLevel, RateLimitBackend, RateLimitConfig, RateLimitStrategy
+)
+
+REQUEST_RATE = 10_000
+TIME_WINDOW = 60.0
+
+def legacy_fixed_window(requests, now, time_window):
+    """Previous fixed window check: count timestamps in the window."""
+    window_start = int(now / time_window) * time_window
+    return sum(1 for req_time in requests if req_time >= window_start)
+
+class SimulatedClock:
+    """Stand-in for the time module advancing one request interval per call."""
+
+    def __init__(self, interval):
+        self.now = 1_000_000.0
+        self.interval = interval
+
+    def time(self):
+        self.now += self.interval
+        return self.now
+
+async def measure_check_cost(strategy, requests, sample=10_000):
+    """Per-check cost in microseconds over the first and last `sample` requests."""
+    limiter = PQCRateLimiter(RateLimitConfig(int(REQUEST_RATE * TIME_WINDOW), TIME_WINDOW, strategy))
+
+    async def timed(count):
+        start = time.perf_counter()
+        for _ in range(count):
+            await limiter.check_rate_limit("user_1", "sign")
+        return (time.perf_counter() - start) / count * 1e6
+
+    first_us = await timed(sample)
+    await timed(requests - 2 * sample)
+    last_us = await timed(sample)
+    return first_us, last_us
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestRateLimiterPerformance:
+    """Per-check cost benchmarks for the PQC rate limiter."""
+
+    @pytest.mark.parametrize("strategy", list(RateLimitStrategy))
+    def test_check_cost_is_flat_at_10k_rps(self, monkeypatch, strategy):
+        """Cost per check does not grow as a key accumulates requests."""
+        monkeypatch.setattr(rate_limiter_module, "time", SimulatedClock(1.0 / REQUEST_RATE))
+
+        first_us, last_us = asyncio.run(measure_check_cost(strategy, 100_000))
+
+        print(f"Rate limiter {strategy.value} at {REQUEST_RATE} req/s - "
+              f"first 10k: {first_us:.2f}us, after 100k: {last_us:.2f}us")
+
+        assert last_us < first_us * 2, f"Per-check cost grew from {first_us:.2f}us to {last_us:.2f}us"
+
+    def test_fixed_window_against_timestamp_list(self, monkeypatch):
+        """The window counter is far cheaper than counting stored timestamps."""
+        clock = SimulatedClock(1.0 / REQUEST_RATE)
+        monkeypatch.setattr(rate_limiter_module, "time", clock)
+        requests = [clock.time() for _ in range(REQUEST_RATE * 5)]
+
+        iterations = 50
+        start = time.perf_counter()
+        for _ in range(iterations):
+            legacy_fixed_window(requests, clock.time(), TIME_WINDOW)
+        legacy_us = (time.perf_counter() - start) / iterations * 1e6
+
+        _, counter_us = asyncio.run(measure_check_cost(RateLimitStrategy.FIXED_WINDOW, 30_000))
+
+        print(f"Fixed window check with 5s of traffic - timestamp list: {legacy_us:.1f}us, "
+              f"counter: {counter_us:.2f}us")
+
+        assert counter_us < legacy_us / 10
+
+def measure_sync_check_cost(limiter, checks=20_000):
+    """Per-check cost in microseconds of the synchronous entry point."""
+    start = time.perf_counter()
+    for i in range(checks):
+        limiter.check_rate_limit_sync(f"user_{i % 1000}", "sign")
+    return (time.perf_counter() - start) / checks * 1e6
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestSharedRateLimiterPerformance:
+    """Per-check cost of the shared memory backend."""
+
+    def test_shared_backend_overhead(self):
+        """Host-wide enforcement costs a small constant factor over local state."""
+        name = f"pqc_rl_bench_{os.getpid()}"
+        local = PQCRateLimiter(RateLimitConfig(1_000_000, TIME_WINDOW, RateLimitStrategy.TOKEN_BUCKET))
+        shared = PQCRateLimiter(RateLimitConfig(
+            1_000_000, TIME_WINDOW, RateLimitStrategy.TOKEN_BUCKET,
+            backend=RateLimitBackend.SHARED_MEMORY, shared_table=name))
+        try:
+            local_us = measure_sync_check_cost(local)
+            shared_us = measure_sync_check_cost(shared)
+        finally:
+            table = shared._shared_tables[name]
+            table.close()
+            table.unlink()
+
+        print(f"Rate limiter check - local: {local_us:.2f}us, shared memory: {shared_us:.2f}us")
+
+        assert shared_us < local_us * 5
+
+    def test_quota_hierarchy_overhead(self):
+        """Checking three quota levels with the operation limit costs about one check per level."""
+        plain = PQCRateLimiter(RateLimitConfig(1_000_000, TIME_WINDOW, RateLimitStrategy.TOKEN_BUCKET))
+        hierarchical = PQCRateLimiter(RateLimitConfig(1_000_000, TIME_WINDOW, RateLimitStrategy.TOKEN_BUCKET))
+        for level in QuotaLevel:
+            hierarchical.configure_quota(
+                level, RateLimitConfig(10_000_000, TIME_WINDOW, RateLimitStrategy.TOKEN_BUCKET))
+        hierarchical.set_operation_cost("sign", 8.0)
+
+        plain_us = measure_sync_check_cost(plain)
+        start = time.perf_counter()
+        for i in range(20_000):
+            hierarchical.check_rate_limit_sync(f"user_{i % 1000}", "sign", f"tenant_{i % 10}")
+        hierarchical_us = (time.perf_counter() - start) / 20_000 * 1e6
+
+        print(f"Rate limiter check - single level: {plain_us:.2f}us, "
+              f"global+tenant+user+operation: {hierarchical_us:.2f}us")
+
+        assert hierarchical_us < plain_us * 6
@@ -0,0 +1,318 @@
+"""
+Unit Tests for PQC Batch Processor
+
+This module tests batch dispatch timing, adaptive batch sizing, result
+routing, failure isolation, and priority lanes with bounded admission.
+"""
+
+import asyncio
+import time
+import pytest
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../../src'))
+
+from python_app.monitoring.performance_monitor import performance_monitor
+from python_app.optimization.batch_processor import (
+    AdaptiveBatchController, BatchConfig, BatchOverloadError, BatchPriority, BatchStrategy,
+    OverloadPolicy, PQCBatchProcessor, batch_process
+)
+
+class RecordingProcessor:
+    """Batch function that records when and how large each batch was."""
+
+    def __init__(self, poison=()):
+        self.batches = []
+        self.poison = set(poison)
+
+    def __call__(self, batch_items):
+        self.batches.append((time.time(), len(batch_items)))
+        if any(item.data in self.poison for item in batch_items):
+            raise RuntimeError("poisoned batch")
+        return [item.data * 10 for item in batch_items]
+
+async def trickle(processor, count, interval):
+    """Submit items at a steady rate and return the submit tasks."""
+    tasks = []
+    for i in range(count):
+        tasks.append(asyncio.ensure_future(processor.submit(i, f"user_{i}", "sign")))
+        await asyncio.sleep(interval)
+    return tasks
+
+@pytest.mark.unit
+class TestAdaptiveBatchController:
+    """Unit tests for AdaptiveBatchController."""
+
+    def make_controller(self):
+        return AdaptiveBatchController(
+            target_p99=0.05, min_batch_size=1, max_batch_size=32,
+            min_wait_time=0.001, max_wait_time=0.033, min_samples=10)
+
+    def test_grows_additively_under_target(self):
+        """Batches within target grow batch size by one and wait time by one step."""
+        controller = self.make_controller()
+        controller.observe([0.01] * 10)
+        controller.observe([0.01] * 10)
+
+        assert controller.batch_size == 3
+        assert controller.wait_time == pytest.approx(0.003)
+
+    def test_shrinks_multiplicatively_over_target(self):
+        """A p99 over target halves both targets once and restarts the window."""
+        controller = self.make_controller()
+        for _ in range(40):
+            controller.observe([0.01] * 10)
+        assert controller.batch_size == 32
+        assert controller.wait_time == pytest.approx(0.033)
+
+        controller.observe([0.2] * 5)
+        assert controller.batch_size == 16
+        assert controller.wait_time == pytest.approx(0.0165)
+        assert controller.latency_p99() is None
+
+        controller.observe([0.2] * 5)
+        assert controller.batch_size == 16
+
+    def test_respects_bounds(self):
+        """Targets never leave the configured bounds."""
+        controller = self.make_controller()
+        for _ in range(20):
+            controller.observe([1.0] * 10)
+
+        assert controller.batch_size == 1
+        assert controller.wait_time == pytest.approx(0.001)
+        assert controller.get_stats()["decreases"] == 20
+
+@pytest.mark.unit
+class TestBatchDispatch:
+    """Unit tests for PQCBatchProcessor dispatch timing."""
+
+    def test_deadline_anchored_to_oldest_item(self, run):
+        """A steady trickle does not postpone the first flush."""
+        recorder = RecordingProcessor()
+
+        async def scenario():
+            processor = PQCBatchProcessor(recorder, BatchConfig(max_batch_size=100, max_wait_time=0.1))
+            started = time.time()
+            tasks = await trickle(processor, 15, 0.02)
+            await asyncio.gather(*tasks)
+            return started
+
+        started = run(scenario())
+
+        assert recorder.batches
+        first_dispatch, _ = recorder.batches[0]
+        assert first_dispatch - started < 0.16
+        assert sum(size for _, size in recorder.batches) == 15
+
+    def test_size_based_dispatch_uses_target_size(self, run):
+        """Full batches dispatch immediately at the target size."""
+        recorder = RecordingProcessor()
+
+        async def scenario():
+            processor = PQCBatchProcessor(
+                recorder, BatchConfig(max_batch_size=4, strategy=BatchStrategy.SIZE_BASED))
+            await asyncio.gather(*[processor.submit(i, "u1", "sign") for i in range(8)])
+
+        run(scenario())
+
+        assert [size for _, size in recorder.batches] == [4, 4]
+
+    def test_adaptive_batch_size_exported(self, run):
+        """The chosen batch size is published as a gauge."""
+        recorder = RecordingProcessor()
+
+        async def scenario():
+            processor = PQCBatchProcessor(
+                recorder, BatchConfig(max_batch_size=16, max_wait_time=0.01, adaptive=True),
+                name="adaptive_test")
+            tasks = await trickle(processor, 30, 0.001)
+            await asyncio.gather(*tasks)
+            return await processor.get_stats()
+
+        stats = run(scenario())
+        gauges = performance_monitor.get_gauges("batch_size")["batch_size"]
+
+        assert stats["adaptive"]["increases"] > 0
+        assert any(series["labels"] == {"processor": "adaptive_test"} for series in gauges)
+        assert 'pqc_batch_size{processor="adaptive_test"}' in performance_monitor.export_metrics("prometheus")
+
+@pytest.mark.unit
+class TestBatchResults:
+    """Unit tests for result routing and failure isolation."""
+
+    def test_results_reach_their_submitters(self, run):
+        """Every submitter receives the result for its own item."""
+        async def scenario():
+            processor = PQCBatchProcessor(RecordingProcessor(), BatchConfig(max_batch_size=7, max_wait_time=0.01))
+            return await asyncio.gather(*[processor.submit(i, f"user_{i}", "sign") for i in range(50)])
+
+        assert run(scenario()) == [i * 10 for i in range(50)]
+
+    def test_batch_process_with_remainder(self, run):
+        """batch_process() completes promptly when the items do not fill the last batch."""
+        async def scenario():
+            started = time.perf_counter()
+            results = await asyncio.wait_for(
+                batch_process(list(range(15)), lambda x: x * 2, batch_size=10, max_wait_time=5.0), 5)
+            return results, time.perf_counter() - started
+
+        results, elapsed = run(scenario())
+
+        assert results == [i * 2 for i in range(15)]
+        assert elapsed < 1.0
+
+    def test_failed_batch_is_bisected(self, run):
+        """One bad item fails alone; the rest of its batch still succeeds."""
+        recorder = RecordingProcessor(poison={5})
+
+        async def scenario():
+            processor = PQCBatchProcessor(recorder, BatchConfig(
+                max_batch_size=16, strategy=BatchStrategy.SIZE_BASED, retry_attempts=2, retry_delay=0))
+            results = await asyncio.gather(
+                *[processor.submit(i, f"user_{i}", "sign") for i in range(16)], return_exceptions=True)
+            return results, await processor.get_stats()
+
+        results, stats = run(scenario())
+
+        assert isinstance(results[5], Exception)
+        assert [r for i, r in enumerate(results) if i != 5] == [i * 10 for i in range(16) if i != 5]
+        assert stats["stats"]["batch_splits"] == 4
+        assert stats["stats"]["items_retried"] == 1
+        assert stats["stats"]["items_processed"] == 15
+        assert len(recorder.batches) == 1 + 2 * 4 + 1
+
+    def test_per_item_errors_do_not_split(self, run):
+        """Exceptions returned in place of results fail only that item."""
+        def processor_func(batch_items):
+            return [ValueError("bad") if item.data == 2 else item.data for item in batch_items]
+
+        async def scenario():
+            processor = PQCBatchProcessor(processor_func, BatchConfig(max_batch_size=4, strategy=BatchStrategy.SIZE_BASED))
+            results = await asyncio.gather(
+                *[processor.submit(i, "u1", "sign") for i in range(4)], return_exceptions=True)
+            return results, await processor.get_stats()
+
+        results, stats = run(scenario())
+
+        assert results[:2] == [0, 1] and results[3] == 3
+        assert isinstance(results[2], ValueError)
+        assert "batch_splits" not in stats["stats"]
+
+    def test_cancelled_submitter_is_skipped(self, run):
+        """A cancelled submit does not break the batch for the others."""
+        async def scenario():
+            processor = PQCBatchProcessor(RecordingProcessor(), BatchConfig(max_batch_size=3, max_wait_time=0.02))
+            tasks = [asyncio.ensure_future(processor.submit(i, "u1", "sign")) for i in range(3)]
+            await asyncio.sleep(0)
+            tasks[1].cancel()
+            return await asyncio.gather(*tasks, return_exceptions=True)
+
+        results = run(scenario())
+
+        assert results[0] == 0 and results[2] == 20
+        assert isinstance(results[1], asyncio.CancelledError)
+
+class LaneRecorder:
+    """Batch function that records the lane of every item it processes."""
+
+    def __init__(self):
+        self.lanes = []
+
+    def __call__(self, batch_items):
+        self.lanes.extend(item.priority for item in batch_items)
+        return [item.data for item in batch_items]
+
+async def fill_then_release(processor, submissions):
+    """Queue submissions while batching is held back, then flush them."""
+    processor.config.max_concurrent_batches = 0
+    tasks = [asyncio.ensure_future(processor.submit(i, "u1", "sign", priority=priority))
+             for i, priority in enumerate(submissions)]
+    await asyncio.sleep(0)
+    processor.config.max_concurrent_batches = 1
+    await processor.flush()
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
+@pytest.mark.unit
+class TestPriorityLanes:
+    """Unit tests for weighted-fair lanes and bounded admission."""
+
+    def test_weighted_fair_dequeue(self, run):
+        """Lanes share batches by weight, and bulk work is not starved."""
+        recorder = LaneRecorder()
+
+        async def scenario():
+            processor = PQCBatchProcessor(recorder, BatchConfig(
+                max_batch_size=13, strategy=BatchStrategy.SIZE_BASED, max_queue_size=0))
+            submissions = [BatchPriority.BULK] * 100 + [BatchPriority.INTERACTIVE] * 100
+            return await fill_then_release(processor, submissions)
+
+        run(scenario())
+        first_batch = recorder.lanes[:13]
+
+        assert first_batch.count(BatchPriority.INTERACTIVE) == 12
+        assert first_batch.count(BatchPriority.BULK) == 1
+        assert len(recorder.lanes) == 200
+
+    def test_full_lane_rejects(self, run):
+        """A full lane raises an overload error; other lanes still accept."""
+        async def scenario():
+            processor = PQCBatchProcessor(LaneRecorder(), BatchConfig(
+                max_batch_size=100, max_wait_time=0.01, max_queue_size=3))
+            results = await fill_then_release(processor, [BatchPriority.BULK] * 5 + [BatchPriority.INTERACTIVE])
+            return results, await processor.get_stats()
+
+        results, stats = run(scenario())
+
+        assert results[:3] == [0, 1, 2] and results[5] == 5
+        assert all(isinstance(result, BatchOverloadError) for result in results[3:5])
+        assert results[3].priority == BatchPriority.BULK
+        assert stats["stats"]["items_rejected_bulk"] == 2
+
+    def test_block_policy_waits_for_space(self, run):
+        """Blocked submitters proceed once a batch frees space in their lane."""
+        async def scenario():
+            processor = PQCBatchProcessor(LaneRecorder(), BatchConfig(
+                max_batch_size=2, max_wait_time=0.01, max_queue_size=2,
+                overload_policy=OverloadPolicy.BLOCK, max_block_time=1.0))
+            results = await asyncio.gather(*[processor.submit(i, "u1", "sign") for i in range(10)])
+            return results, await processor.get_stats()
+
+        results, stats = run(scenario())
+
+        assert results == list(range(10))
+        assert stats["stats"]["items_blocked"] > 0
+        assert "items_rejected" not in stats["stats"]
+
+    def test_block_policy_times_out(self, run):
+        """A submitter blocked past max_block_time gets the overload error."""
+        async def scenario():
+            processor = PQCBatchProcessor(LaneRecorder(), BatchConfig(
+                max_concurrent_batches=0, max_queue_size=1,
+                overload_policy=OverloadPolicy.BLOCK, max_block_time=0.05))
+            first = asyncio.ensure_future(processor.submit(0, "u1", "sign"))
+            await asyncio.sleep(0)
+            with pytest.raises(BatchOverloadError):
+                await processor.submit(1, "u1", "sign")
+            first.cancel()
+
+        run(scenario())
+
+    def test_queue_time_histograms_per_lane(self, run):
+        """Queue time is exported as a histogram for each lane."""
+        async def scenario():
+            processor = PQCBatchProcessor(LaneRecorder(), BatchConfig(max_batch_size=4, max_wait_time=0.01),
+                                          name="lanes_test")
+            await fill_then_release(processor, [BatchPriority.INTERACTIVE, BatchPriority.BULK] * 3)
+
+        run(scenario())
+        series = {
+            entry["labels"]["lane"]: entry
+            for entry in performance_monitor.get_histograms("batch_queue_time_seconds")["batch_queue_time_seconds"]
+            if entry["labels"]["processor"] == "lanes_test"
+        }
+
+        assert series["interactive"]["count"] == 3 and series["bulk"]["count"] == 3
+        assert 'pqc_batch_queue_time_seconds_bucket{lane="bulk",processor="lanes_test",le="+Inf"} 3' in \
+            performance_monitor.export_metrics("prometheus")
@@ -0,0 +1,196 @@
+"""
+Unit Tests for Batched Async PQC Operations
+
+This module tests chunking, result ordering, per-item failures,
+deadlines and concurrency limiting of the verify_many, sign_many, encapsulate_many and
+decapsulate_many helpers.
+"""
+
+import os
+import pytest
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../../src'))
+
+from python_app.optimization.concurrency_limiter import AdaptiveConcurrencyLimiter, ConcurrencyLimitExceeded
+from python_app.optimization.deadline import Deadline, DeadlineExceeded
+from python_app.pqc_bindings.async_support import AsyncPQCManager
+from python_app.pqc_bindings.exceptions import DilithiumError, KyberError
+
+class StubKeyPair:
+    """Keypair stand-in with instant operations and an optional delay."""
+
+    def __init__(self, name, delay=0.0):
+        self.name = name
+        self.delay = delay
+
+    def verify(self, message, signature):
+        time.sleep(self.delay)
+        if signature == b"malformed":
+            raise ValueError("malformed signature")
+        return signature == b"sig:" + message
+
+    def sign(self, message):
+        return b"sig:" + message
+
+    def encapsulate(self):
+        return {"shared_secret": self.name.encode(), "ciphertext": b"ct:" + self.name.encode()}
+
+    def decapsulate(self, ciphertext):
+        time.sleep(self.delay)
+        return ciphertext[3:]
+
+async def collect(iterator):
+    """All (index, result) pairs from an async iterator."""
+    return [pair async for pair in iterator]
+
+@pytest.mark.unit
+class TestBatchedOperations:
+    """Unit tests for the batched AsyncPQCManager helpers."""
+
+    def test_results_in_input_order(self, run):
+        """Results follow input order, with one executor batch per chunk."""
+        keypair = StubKeyPair("a")
+        messages = [f"m{i}".encode() for i in range(10)]
+
+        async def scenario():
+            async with AsyncPQCManager(max_workers=2) as manager:
+                signatures = await collect(manager.sign_many([(keypair, m) for m in messages],
+                                                             "user_1", chunk_size=4))
+                verified = await collect(manager.verify_many(
+                    [(keypair, m, s) for m, (_, s) in zip(messages, signatures)], "user_1", chunk_size=4))
+                return signatures, verified, await manager.get_operation_status()
+
+        signatures, verified, status = run(scenario())
+
+        assert [index for index, _ in signatures] == list(range(10))
+        assert [s for _, s in signatures] == [b"sig:" + m for m in messages]
+        assert verified == [(i, True) for i in range(10)]
+        assert status["executor_status"]["stats"]["batches"] == 6
+        assert status["active_operations"] == 0
+
+    def test_completion_order(self, run):
+        """With ordered=False, fast chunks are yielded before slow ones."""
+        items = [(StubKeyPair("slow", delay=0.1), b"ct:slow"), (StubKeyPair("fast"), b"ct:fast")]
+
+        async def scenario():
+            async with AsyncPQCManager(max_workers=2) as manager:
+                return await collect(manager.decapsulate_many(items, "user_1", chunk_size=1,
+                                                              ordered=False))
+
+        assert run(scenario()) == [(1, b"fast"), (0, b"slow")]
+
+    def test_failed_items_yielded_as_errors(self, run):
+        """A failing item yields a wrapped error without failing its chunk."""
+        keypair = StubKeyPair("a")
+
+        async def scenario():
+            async with AsyncPQCManager(max_workers=1) as manager:
+                verified = await collect(manager.verify_many(
+                    [(keypair, b"m", b"sig:m"), (keypair, b"m", b"malformed"), (keypair, b"m", b"bad")],
+                    "user_1"))
+                encapsulated = await collect(manager.encapsulate_many([keypair, None], "user_1"))
+                return verified, encapsulated
+
+        verified, encapsulated = run(scenario())
+
+        assert verified[0] == (0, True) and verified[2] == (2, False)
+        assert isinstance(verified[1][1], DilithiumError)
+        assert isinstance(verified[1][1].__cause__, ValueError)
+        assert encapsulated[0][1] == (b"a", b"ct:a")
+        assert isinstance(encapsulated[1][1], KyberError)
+
+    def test_encapsulation_results_match_single_call(self, run):
+        """Single and batched encapsulation both yield (shared_secret, ciphertext)."""
+        keypair = StubKeyPair("a")
+
+        async def scenario():
+            async with AsyncPQCManager(max_workers=1) as manager:
+                single = await manager.kyber_encapsulate_async(keypair, "user_1")
+                batched = await collect(manager.encapsulate_many([keypair], "user_1"))
+                return single, batched
+
+        single, batched = run(scenario())
+
+        assert single == (b"a", b"ct:a")
+        assert batched == [(0, single)]
+
+    def test_expired_deadline_stops_iteration(self, run):
+        """Chunks are dropped once the deadline passes, and the error reaches the caller."""
+        async def scenario():
+            async with AsyncPQCManager(max_workers=1) as manager:
+                with pytest.raises(DeadlineExceeded):
+                    await collect(manager.sign_many([(StubKeyPair("a"), b"m")] * 3, "user_1",
+                                                    deadline=Deadline.after(-1)))
+                return await manager.get_operation_status()
+
+        status = run(scenario())
+
+        assert status["active_operations"] == 0
+        assert "calls" not in status["executor_status"]["stats"]
+
+    def test_chunks_sized_to_executor(self, run):
+        """Without a chunk size, each worker gets a few chunks of at least a native batch."""
+        async def scenario():
+            async with AsyncPQCManager(max_workers=2) as manager:
+                await collect(manager.encapsulate_many([StubKeyPair("a")] * 1000, "user_1"))
+                return manager, await manager.get_operation_status()
+
+        manager, status = run(scenario())
+        size = manager._chunk_size(1000)
+
+        assert size >= manager.pqc_executor.batch_size()
+        assert status["executor_status"]["stats"]["batches"] == -(-1000 // size) <= 8
+
+    def test_empty_input(self, run):
+        """No items yield no results and no executor calls."""
+        async def scenario():
+            async with AsyncPQCManager(max_workers=1) as manager:
+                return await collect(manager.verify_many([], "user_1"))
+
+        assert run(scenario()) == []
+
+    def test_batch_within_limiter(self, run):
+        """A batch with more chunks than the limit runs them a window at a time, rejecting none."""
+        keypair = StubKeyPair("a", delay=0.005)
+        items = [(keypair, b"m%d" % i, b"sig:m%d" % i) for i in range(64)]
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2)
+        peak = 0
+
+        async def scenario():
+            nonlocal peak
+            async with AsyncPQCManager(max_workers=4, limiter=limiter) as manager:
+                results = []
+                async for pair in manager.verify_many(items, "user_1", chunk_size=4, ordered=False):
+                    peak = max(peak, limiter.in_flight)
+                    results.append(pair)
+                
+                abandoned = manager.verify_many(items, "user_1", chunk_size=4)
+                await abandoned.__anext__()
+                await abandoned.aclose()
+                return results
+
+        results = run(scenario())
+        stats = limiter.get_stats()
+
+        assert sorted(results) == [(i, True) for i in range(64)]
+        assert peak <= 2
+        assert stats["stats"].get("rejected", 0) == 0
+        assert stats["in_flight"] == 0
+
+    def test_batch_rejected_when_limiter_saturated(self, run):
+        """A batch is rejected only if other callers hold every slot."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+
+        async def scenario():
+            async with AsyncPQCManager(max_workers=1, limiter=limiter) as manager:
+                admission = await limiter.acquire()
+                try:
+                    with pytest.raises(ConcurrencyLimitExceeded):
+                        await collect(manager.verify_many([(StubKeyPair("a"), b"m", b"sig:m")], "user_1"))
+                finally:
+                    await limiter.release(admission)
+                return await collect(manager.verify_many([(StubKeyPair("a"), b"m", b"sig:m")], "user_1"))
+
+        assert run(scenario()) == [(0, True)]
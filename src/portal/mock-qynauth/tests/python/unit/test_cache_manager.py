@@ -0,0 +1,451 @@
+"""
+Unit Tests for PQC Cache Manager
+
+This module tests the PQC cache manager and its eviction policies.
+"""
+
+import asyncio
+import pytest
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import sys
+import os
+from unittest.mock import patch
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../../src'))
+
+from python_app.optimization.cache_manager import (
+    PQCCacheManager, CachePolicy, estimate_size, stable_key_hash, pqc_cached
+)
+from python_app.optimization.cache_policies import (
+    LFUPolicy, ExpiryHeap, FrequencySketch, WindowTinyLFUPolicy
+)
+
+@pytest.mark.unit
+class TestCacheEviction:
+    """Unit tests for cache eviction policies."""
+
+    def test_lru_evicts_least_recently_used(self, run):
+        """LRU keeps recently read entries."""
+        async def scenario():
+            cache = PQCCacheManager(max_size=3, policy=CachePolicy.LRU)
+            for user in ("a", "b", "c"):
+                await cache.set("keygen", user, "ML-KEM-768", user)
+            await cache.get("keygen", "a", "ML-KEM-768")
+            await cache.set("keygen", "d", "ML-KEM-768", "d")
+            return [await cache.get("keygen", user, "ML-KEM-768") for user in "abcd"]
+
+        assert run(scenario()) == ["a", None, "c", "d"]
+
+    def test_lfu_evicts_least_frequently_used(self, run):
+        """LFU keeps frequently read entries."""
+        async def scenario():
+            cache = PQCCacheManager(max_size=3, policy=CachePolicy.LFU)
+            for user in ("a", "b", "c"):
+                await cache.set("keygen", user, "ML-KEM-768", user)
+            for user in ("a", "a", "b", "c"):
+                await cache.get("keygen", user, "ML-KEM-768")
+            await cache.set("keygen", "d", "ML-KEM-768", "d")
+            return [await cache.get("keygen", user, "ML-KEM-768") for user in "abcd"]
+
+        assert run(scenario()) == ["a", None, "c", "d"]
+
+    def test_ttl_evicts_soonest_expiring(self, run):
+        """TTL policy evicts the entry closest to expiry."""
+        async def scenario():
+            cache = PQCCacheManager(max_size=3, policy=CachePolicy.TTL)
+            await cache.set("keygen", "a", "ML-KEM-768", "a", ttl=300)
+            await cache.set("keygen", "b", "ML-KEM-768", "b", ttl=100)
+            await cache.set("keygen", "c", "ML-KEM-768", "c", ttl=200)
+            await cache.set("keygen", "d", "ML-KEM-768", "d", ttl=400)
+            return [await cache.get("keygen", user, "ML-KEM-768") for user in "abcd"]
+
+        assert run(scenario()) == ["a", None, "c", "d"]
+
+    def test_expired_entries_purged_before_eviction(self, run):
+        """Expired entries are purged in batches without touching live ones."""
+        async def scenario():
+            cache = PQCCacheManager(max_size=100, expiry_batch_size=0)
+            with patch('python_app.optimization.cache_manager.time.time', return_value=1000.0):
+                for i in range(10):
+                    await cache.set("keygen", f"short_{i}", "ML-KEM-768", i, ttl=5)
+                await cache.set("keygen", "long", "ML-KEM-768", "long", ttl=500)
+            with patch('python_app.optimization.cache_manager.time.time', return_value=1010.0):
+                purged = await cache.purge_expired(limit=4)
+                purged += await cache.purge_expired()
+                stats = await cache.get_stats()
+                value = await cache.get("keygen", "long", "ML-KEM-768")
+            return purged, stats, value
+
+        purged, stats, value = run(scenario())
+
+        assert purged == 10
+        assert stats["current_size"] == 1
+        assert value == "long"
+
+    def test_lfu_policy_structure(self):
+        """LFU buckets track the minimum frequency through removals."""
+        policy = LFUPolicy()
+        for key in "abc":
+            policy.on_insert(key, None)
+        policy.on_access("a")
+        policy.on_access("b")
+        policy.on_remove("c")
+
+        assert policy.victim() == "a"
+
+    def test_expiry_heap_ignores_stale_items(self):
+        """Re-pushed keys only expire at their latest deadline."""
+        heap = ExpiryHeap()
+        heap.push("k", 10.0)
+        heap.push("k", 50.0)
+        heap.push("j", 20.0)
+
+        assert heap.pop_expired(30.0) == ["j"]
+        assert heap.pop_expired(60.0) == ["k"]
+        assert len(heap) == 0
+
+@pytest.mark.unit
+class TestCacheKeysAndSizing:
+    """Unit tests for structural cache keys and size estimation."""
+
+    def test_structural_keys_ignore_parameter_order(self):
+        """Keys are tuples independent of keyword order."""
+        cache = PQCCacheManager()
+        first = cache._generate_cache_key("verify", "u1", "ML-DSA-65", message=b"m", context="c")
+        second = cache._generate_cache_key("verify", "u1", "ML-DSA-65", context="c", message=b"m")
+
+        assert first == second == ("verify", "u1", "ML-DSA-65", ("context", "c"), ("message", b"m"))
+        assert cache._generate_cache_key("keygen", "u1", "ML-KEM-768") == ("keygen", "u1", "ML-KEM-768")
+
+    def test_unhashable_parameters_are_frozen(self):
+        """Dict, list and bytearray parameters produce equal hashable keys."""
+        cache = PQCCacheManager()
+        first = cache._generate_cache_key("sign", "u1", "ML-DSA-65",
+                                          options={"b": [1, 2], "a": bytearray(b"x")})
+        second = cache._generate_cache_key("sign", "u1", "ML-DSA-65",
+                                           options={"a": b"x", "b": (1, 2)})
+
+        assert hash(first) == hash(second)
+        assert first == second
+
+    def test_hashed_parameters_keep_key_prefix(self):
+        """hash_key_params replaces parameters with a stable digest."""
+        cache = PQCCacheManager(hash_key_params=True)
+        key = cache._generate_cache_key("verify", "u1", "ML-DSA-65", signature=b"s" * 3309)
+
+        assert key[:3] == ("verify", "u1", "ML-DSA-65")
+        assert key[3] == stable_key_hash([("signature", b"s" * 3309)])
+        assert len(key[3]) == 16
+
+    def test_size_estimates_for_binary_values(self):
+        """Buffers are measured by length without serialization."""
+        assert estimate_size(b"x" * 1184) == 1184
+        assert estimate_size(bytearray(2400)) == 2400
+        assert estimate_size(memoryview(b"x" * 64)) == 64
+        assert estimate_size({"pk": b"x" * 1184, "sk": b"y" * 2400}) == 1184 + 2400 + 4
+        assert estimate_size(list(range(100))) == 800
+
+    def test_known_size_and_invalidation(self, run):
+        """Caller-supplied sizes are used and invalidation matches key fields."""
+        async def scenario():
+            cache = PQCCacheManager()
+            await cache.set("keygen", "u1", "ML-KEM-768", {"pk": b"x" * 10}, size_bytes=5000)
+            await cache.set("keygen", "u2", "ML-KEM-768", b"y" * 100, nonce=1)
+            before = await cache.get_stats()
+            await cache.invalidate(user_id="u2")
+            after = await cache.get_stats()
+            return before, after, await cache.get("keygen", "u1", "ML-KEM-768")
+
+        before, after, value = run(scenario())
+
+        assert before["current_memory_bytes"] == 5100
+        assert after["current_memory_bytes"] == 5000
+        assert value == {"pk": b"x" * 10}
+
+@pytest.mark.unit
+class TestCacheConcurrency:
+    """Unit tests for lock striping and thread-pool use."""
+
+    def test_stripes_share_size_budget(self, run):
+        """Striped caches never exceed max_size in total."""
+        async def scenario():
+            cache = PQCCacheManager(max_size=256, lock_stripes=4)
+            for i in range(2000):
+                await cache.set("keygen", f"user_{i}", "ML-KEM-768", b"k" * 32)
+            return await cache.get_stats()
+
+        stats = run(scenario())
+
+        assert stats["lock_stripes"] == 4
+        assert 200 < stats["current_size"] <= 256
+        assert stats["current_memory_bytes"] == stats["current_size"] * 32
+
+    def test_thread_pool_workers(self, run):
+        """Sync entry points keep accounting consistent across threads."""
+        cache = PQCCacheManager(max_size=512, lock_stripes=8)
+
+        def worker(worker_id):
+            hits = 0
+            for i in range(2000):
+                user = f"user_{(worker_id * 31 + i) % 700}"
+                if cache.get_sync("keygen", user, "ML-KEM-768") is None:
+                    cache.set_sync("keygen", user, "ML-KEM-768", b"k" * 16)
+                else:
+                    hits += 1
+            return hits
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            hits = sum(executor.map(worker, range(16)))
+        stats = run(cache.get_stats())
+
+        assert hits > 0
+        assert stats["current_size"] <= 512
+        assert stats["current_memory_bytes"] == stats["current_size"] * 16
+
+@pytest.mark.unit
+class TestPQCCachedDecorator:
+    """Unit tests for the pqc_cached decorator."""
+
+    def test_async_single_flight(self, run):
+        """Concurrent async misses on one key run the function once."""
+        calls = []
+
+        @pqc_cached(operation="verify", cache=PQCCacheManager())
+        async def verify(user_id, message, signature):
+            calls.append(message)
+            await asyncio.sleep(0.01)
+            return message == signature
+
+        async def scenario():
+            results = await asyncio.gather(*(verify("u1", b"m", b"m") for _ in range(50)))
+            other = await verify("u1", b"n", b"m")
+            again = await verify(user_id="u1", message=b"m", signature=b"m")
+            return results, other, again
+
+        results, other, again = run(scenario())
+
+        assert results == [True] * 50 and other is False and again is True
+        assert calls == [b"m", b"n"]
+        assert verify.cache_stats["coalesced"] == 49
+
+    def test_cancelled_caller_does_not_cancel_shared_call(self, run):
+        """Waiters still get the result when the first caller is cancelled."""
+        calls = []
+
+        @pqc_cached(operation="keygen", cache=PQCCacheManager())
+        async def keygen(user_id):
+            calls.append(user_id)
+            await asyncio.sleep(0.02)
+            return b"key"
+
+        async def scenario():
+            first = asyncio.ensure_future(keygen("u1"))
+            await asyncio.sleep(0)
+            second = asyncio.ensure_future(keygen("u1"))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second
+
+        assert run(scenario()) == b"key"
+        assert calls == ["u1"]
+
+    def test_sync_single_flight_across_threads(self):
+        """Concurrent sync misses from pool workers run the function once."""
+        calls = []
+        lock = threading.Lock()
+
+        @pqc_cached(operation="lookup", cache=PQCCacheManager())
+        def lookup_key(user_id, algorithm="ML-KEM-768"):
+            with lock:
+                calls.append(user_id)
+            time.sleep(0.05)
+            return b"pk-" + user_id.encode()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: lookup_key("u1"), range(8)))
+
+        assert results == [b"pk-u1"] * 8
+        assert calls == ["u1"]
+
+    def test_negative_caching(self):
+        """Failures are cached for negative_ttl and then retried."""
+        calls = []
+
+        @pqc_cached(operation="decapsulate", negative_ttl=0.05, cache=PQCCacheManager())
+        def decapsulate(user_id, ciphertext):
+            calls.append(ciphertext)
+            raise ValueError("invalid ciphertext")
+
+        for _ in range(3):
+            with pytest.raises(ValueError):
+                decapsulate("u1", b"bad")
+        time.sleep(0.06)
+        with pytest.raises(ValueError):
+            decapsulate("u1", b"bad")
+
+        assert calls == [b"bad", b"bad"]
+        assert decapsulate.cache_stats["negative_hits"] == 2
+
+    def test_shared_failures_raised_as_copies(self, run):
+        """Each negative hit and coalesced waiter gets its own exception object."""
+        @pqc_cached(operation="decapsulate", negative_ttl=10, cache=PQCCacheManager())
+        def decapsulate(user_id, ciphertext):
+            raise ValueError("invalid ciphertext")
+
+        raised = []
+        for _ in range(3):
+            with pytest.raises(ValueError, match="invalid ciphertext") as excinfo:
+                decapsulate("u1", b"bad")
+            raised.append(excinfo.value)
+        assert len({id(e) for e in raised}) == 3
+
+        @pqc_cached(operation="public_key", cache=PQCCacheManager())
+        async def public_key(user_id):
+            await asyncio.sleep(0.01)
+            raise KeyError(user_id)
+
+        async def scenario():
+            return await asyncio.gather(*(public_key("u1") for _ in range(3)),
+                                        return_exceptions=True)
+
+        errors = run(scenario())
+        assert all(isinstance(e, KeyError) for e in errors)
+        assert len({id(e) for e in errors}) == 3
+        assert errors[1].__cause__ is errors[0]
+
+    def test_stale_while_revalidate(self, run):
+        """Stale results are served while one background call refreshes them."""
+        versions = iter(range(1, 10))
+
+        @pqc_cached(operation="public_key", ttl=0.05, stale_ttl=10, cache=PQCCacheManager())
+        async def public_key(user_id):
+            await asyncio.sleep(0)
+            return next(versions)
+
+        async def scenario():
+            first = await public_key("u1")
+            await asyncio.sleep(0.06)
+            stale = [await public_key("u1") for _ in range(3)]
+            for _ in range(5):
+                await asyncio.sleep(0)
+            return first, stale, await public_key("u1")
+
+        first, stale, refreshed = run(scenario())
+
+        assert first == 1
+        assert stale == [1, 1, 1]
+        assert refreshed == 2
+        assert public_key.cache_stats["refreshes"] == 1
+
+    def test_key_derivation(self):
+        """self is not keyed with key_args, user_id/algorithm fill key fields, key_args filters params."""
+        cache = PQCCacheManager()
+
+        class Service:
+            @pqc_cached(operation="sign", algorithm="ML-DSA-65", key_args=("message",), cache=cache)
+            def sign(self, user_id, message, request_id=None):
+                return b"sig:" + message
+
+        Service().sign("u1", b"m", request_id=1)
+        assert Service().sign("u1", b"m", request_id=2) == b"sig:m"
+
+        assert cache._get_by_key(("sign", "u1", "ML-DSA-65", ("message", b"m"))) is not None
+        assert Service.sign.cache_stats["hits"] == 1
+
+    def test_methods_need_key_args(self):
+        """Methods without key_args are rejected; classmethods are keyed on the class."""
+        with pytest.raises(TypeError):
+            class Service:
+                @pqc_cached(operation="sign")
+                def sign(self, user_id, message):
+                    return message
+
+        cache = PQCCacheManager()
+
+        class Base:
+            @classmethod
+            @pqc_cached(operation="name", cache=cache)
+            def name(cls, user_id):
+                return cls.__name__
+
+        class Derived(Base):
+            pass
+
+        assert Base.name("u1") == "Base"
+        assert Derived.name("u1") == "Derived"
+
+@pytest.mark.unit
+class TestTinyLFUAdmission:
+    """Unit tests for the TinyLFU admission policy."""
+
+    def test_sketch_counts_and_ages(self):
+        """Counters track frequency and are halved after the sample size."""
+        sketch = FrequencySketch(capacity=8, sample_factor=10)
+        for _ in range(6):
+            sketch.increment("hot")
+        sketch.increment("cold")
+
+        assert sketch.frequency("hot") >= 6
+        assert sketch.frequency("missing") <= 1
+
+        for i in range(80):
+            sketch.increment(f"noise_{i}")
+
+        assert sketch.resets >= 1
+        assert sketch.frequency("hot") < 6
+
+    def test_candidate_needs_higher_frequency(self):
+        """A one-hit window candidate loses to a frequently used main entry."""
+        policy = WindowTinyLFUPolicy(capacity=3, window_ratio=0.34)
+        for key in ("a", "b"):
+            policy.on_insert(key, None)
+            for _ in range(3):
+                policy.on_access(key)
+        policy.on_insert("scan_1", None)
+        policy.on_insert("scan_2", None)
+
+        victim = policy.victim()
+
+        assert victim == "scan_1"
+        assert policy.victim() == victim and policy.rejected == 0
+        policy.on_evict(victim)
+        assert policy.rejected == 1
+
+    def test_candidate_admitted_on_eviction(self):
+        """A frequently used window candidate moves to the main area when the victim is evicted."""
+        policy = WindowTinyLFUPolicy(capacity=3, window_ratio=0.34)
+        policy.on_insert("a", None)
+        policy.on_insert("b", None)
+        policy.on_insert("hot", None)
+        for _ in range(3):
+            policy.on_access("hot")
+
+        victim = policy.victim()
+
+        assert victim == "a" and policy.admitted == 0
+        policy.on_evict(victim)
+        assert policy.admitted == 1
+        assert policy.get_stats()["probation"] == 2
+
+    def test_scan_does_not_flush_hot_set(self, run):
+        """A one-pass scan leaves frequently read entries cached."""
+        async def scenario(policy):
+            cache = PQCCacheManager(max_size=100, policy=policy, lock_stripes=1)
+            hot = [f"active_{i}" for i in range(50)]
+            for _ in range(5):
+                for user in hot:
+                    if await cache.get("keygen", user, "ML-KEM-768") is None:
+                        await cache.set("keygen", user, "ML-KEM-768", b"k")
+            for i in range(1000):
+                await cache.set("keygen", f"migrated_{i}", "ML-KEM-768", b"k")
+            survivors = [await cache.get("keygen", user, "ML-KEM-768") for user in hot]
+            return sum(value is not None for value in survivors), await cache.get_stats()
+
+        tinylfu_survivors, stats = run(scenario(CachePolicy.TINYLFU))
+        lru_survivors, _ = run(scenario(CachePolicy.LRU))
+
+        assert lru_survivors == 0
+        assert tinylfu_survivors >= 45
+        assert stats["admission"]["rejected"] > 0
@@ -0,0 +1,178 @@
+"""
+Unit Tests for PQC Cache L2 Store
+
+This module tests the memory-mapped L2 store and the two-tier cache
+built on it.
+"""
+
+import pytest
+import sys
+import os
+import threading
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../../src'))
+
+from python_app.optimization.cache_manager import PQCCacheManager
+from python_app.optimization.cache_store import L2CacheStore, MmapSlotStore
+
+KEY_PAIR = {"public_key": b"p" * 1184, "secret_key": b"s" * 2400}
+
+@pytest.mark.unit
+class TestL2CacheStore:
+    """Unit tests for L2CacheStore."""
+
+    def test_round_trip_and_reopen(self, tmp_path):
+        """Values survive closing and reopening the store."""
+        store = L2CacheStore(tmp_path, capacity_bytes=4 * 1024 * 1024)
+        assert store.put(("keygen", "u1", "ML-KEM-768"), KEY_PAIR, None)
+        assert store.put(("sign", "u1", "ML-DSA-65", ("message", b"m")), b"g" * 3309, 4102444800.0)
+        store.close()
+
+        reopened = L2CacheStore(tmp_path, capacity_bytes=4 * 1024 * 1024)
+        value, expires_at, size = reopened.get(("keygen", "u1", "ML-KEM-768"))
+        signature = reopened.get(("sign", "u1", "ML-DSA-65", ("message", b"m")))
+        reopened.close()
+
+        assert value == KEY_PAIR and expires_at is None and size > 3584
+        assert signature[0] == b"g" * 3309 and signature[1] == 4102444800.0
+
+    def test_unsupported_and_expired_values(self, tmp_path):
+        """Arbitrary objects are not stored and expired entries are not returned."""
+        store = L2CacheStore(tmp_path, capacity_bytes=1024 * 1024)
+
+        assert not store.put(("op", "u", "alg"), object(), None)
+        assert not store.put(("op", "u", "alg"), b"x" * 100000, None)
+        store.put(("op", "u", "old"), b"x", 1.0)
+
+        assert store.get(("op", "u", "alg")) is None
+        assert store.get(("op", "u", "old")) is None
+        store.close()
+
+    def test_value_moves_between_size_classes(self, tmp_path):
+        """Replacing a value with a larger one leaves no stale copy."""
+        store = L2CacheStore(tmp_path, capacity_bytes=4 * 1024 * 1024)
+        store.put(("keygen", "u1", "alg"), b"a" * 100, None)
+        store.put(("keygen", "u1", "alg"), b"b" * 4000, None)
+        items = list(store.items())
+        store.close()
+
+        assert [(key, value) for key, value, _, _ in items] == [(("keygen", "u1", "alg"), b"b" * 4000)]
+
+    def test_removed_values_zeroed_on_disk(self, tmp_path):
+        """Removed, replaced and cleared values leave no key material in the store files."""
+        def on_disk():
+            return b"".join(path.read_bytes() for path in tmp_path.glob("*.bin"))
+
+        store = L2CacheStore(tmp_path, capacity_bytes=4 * 1024 * 1024)
+        store.put(("keygen", "u1", "ML-KEM-768"), KEY_PAIR, None)
+        store.put(("keygen", "u2", "ML-KEM-768"), b"S" * 1000, None)
+        store.put(("keygen", "u2", "ML-KEM-768"), b"T" * 10, None)
+        store.put(("keygen", "u3", "ML-KEM-768"), b"U" * 1000, None)
+        store.remove(("keygen", "u1", "ML-KEM-768"))
+        store.flush()
+
+        data = on_disk()
+        assert b"s" * 2400 not in data and b"S" * 32 not in data
+        assert b"U" * 1000 in data
+
+        store.clear()
+        store.close()
+        assert b"U" * 32 not in on_disk() and b"T" * 10 not in on_disk()
+
+    def test_full_probe_window_displaces_soonest_expiring(self, tmp_path):
+        """A full single-slot store replaces its entry."""
+        store = MmapSlotStore(tmp_path / "slots.bin", slot_size=64, slot_count=1)
+        store.put(b"d" * 16, b"k1", 0, b"v1", 0.0, 0.0)
+        displaced = store.put(b"e" * 16, b"k2", 0, b"v2", 0.0, 0.0)
+
+        assert displaced
+        assert store.get(b"d" * 16, b"k1", 0.0) is None
+        assert store.get(b"e" * 16, b"k2", 0.0) == (0, b"v2", 0.0)
+        store.close()
+
+@pytest.mark.unit
+class TestTwoTierCache:
+    """Unit tests for the L1/L2 cache."""
+
+    def test_l1_miss_promotes_from_l2(self, tmp_path, run):
+        """Entries evicted from L1 are served from L2."""
+        async def scenario():
+            cache = PQCCacheManager(max_size=2, l2_store=L2CacheStore(tmp_path, 4 * 1024 * 1024))
+            for user in ("a", "b", "c"):
+                await cache.set("keygen", user, "ML-KEM-768", KEY_PAIR)
+            value = await cache.get("keygen", "a", "ML-KEM-768")
+            stats = await cache.get_stats()
+            cache.l2_store.close()
+            return value, stats
+
+        value, stats = run(scenario())
+
+        assert value == KEY_PAIR
+        assert stats["stats"]["l2_promotions"] == 1
+        assert stats["stats"].get("cache_misses", 0) == 0
+
+    def test_new_worker_warms_from_snapshot(self, tmp_path, run):
+        """A new cache warms L1 from a snapshot written by another."""
+        async def scenario():
+            first = PQCCacheManager(l2_store=L2CacheStore(tmp_path, 4 * 1024 * 1024),
+                                    l2_write_through=False)
+            await first.set("keygen", "u1", "ML-KEM-768", KEY_PAIR, nonce=1)
+            await first.set("sign", "u1", "ML-DSA-65", b"g" * 3309)
+            written = await first.snapshot_to_l2()
+            first.l2_store.close()
+
+            second = PQCCacheManager(l2_store=L2CacheStore(tmp_path, 4 * 1024 * 1024))
+            loaded = await second.warm_from_l2()
+            stats = await second.get_stats()
+            value = await second.get("keygen", "u1", "ML-KEM-768", nonce=1)
+            second.l2_store.close()
+            return written, loaded, stats, value
+
+        written, loaded, stats, value = run(scenario())
+
+        assert written == loaded == 2
+        assert stats["current_size"] == 2
+        assert value == KEY_PAIR
+
+    def test_warm_runs_off_loop_and_skips_expired(self, run):
+        """L2 is read in a worker thread, and entries that expired meanwhile are skipped."""
+        class RecordingStore:
+            threads = []
+
+            def items(self):
+                self.threads.append(threading.get_ident())
+                yield ("keygen", "live", "ML-KEM-768"), b"1", time.time() + 60, 1
+                yield ("keygen", "expired", "ML-KEM-768"), b"2", time.time() - 1, 1
+
+            def get(self, key):
+                return None
+
+        async def scenario():
+            cache = PQCCacheManager(l2_store=RecordingStore())
+            loaded = await cache.warm_from_l2()
+            expired = await cache.get("keygen", "expired", "ML-KEM-768")
+            return loaded, expired
+
+        loaded, expired = run(scenario())
+
+        assert loaded == 1 and expired is None
+        assert RecordingStore.threads and RecordingStore.threads[0] != threading.get_ident()
+
+    def test_invalidate_and_clear_reach_l2(self, tmp_path, run):
+        """Invalidated entries are not promoted back from L2."""
+        async def scenario():
+            cache = PQCCacheManager(l2_store=L2CacheStore(tmp_path, 4 * 1024 * 1024))
+            await cache.set("keygen", "u1", "ML-KEM-768", b"1")
+            await cache.set("keygen", "u2", "ML-KEM-768", b"2")
+            await cache.invalidate(user_id="u1")
+            after_invalidate = [await cache.get("keygen", user, "ML-KEM-768") for user in ("u1", "u2")]
+            await cache.clear()
+            after_clear = await cache.get("keygen", "u2", "ML-KEM-768")
+            cache.l2_store.close()
+            return after_invalidate, after_clear
+
+        after_invalidate, after_clear = run(scenario())
+
+        assert after_invalidate == [None, b"2"]
+        assert after_clear is None
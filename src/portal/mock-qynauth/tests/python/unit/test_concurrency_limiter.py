@@ -0,0 +1,202 @@
+"""
+Unit Tests for Adaptive Concurrency Limiting
+
+This module tests admission, rejection, limit adjustment and metrics of the
+adaptive concurrency limiter, and its use by AsyncPQCManager.
+"""
+
+import asyncio
+import os
+import pytest
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../../src'))
+
+from python_app.monitoring.performance_monitor import performance_monitor
+from python_app.optimization.concurrency_limiter import (
+    AdaptiveConcurrencyLimiter, ConcurrencyLimitExceeded, LimitAlgorithm
+)
+from python_app.optimization.deadline import Deadline, DeadlineExceeded
+from python_app.pqc_bindings.async_support import AsyncPQCManager
+
+async def hold(limiter, seconds, deadline=None):
+    """Hold a slot for a while."""
+    async with limiter.limit_context(deadline):
+        await asyncio.sleep(seconds)
+
+@pytest.mark.unit
+class TestAdmission:
+    """Unit tests for admission and rejection."""
+
+    def test_rejects_when_saturated(self, run):
+        """Requests over the limit are rejected at once by default."""
+        async def scenario():
+            limiter = AdaptiveConcurrencyLimiter("reject", initial_limit=2)
+            held = [asyncio.ensure_future(hold(limiter, 0.05)) for _ in range(2)]
+            await asyncio.sleep(0)
+            with pytest.raises(ConcurrencyLimitExceeded) as excinfo:
+                await limiter.acquire()
+            await asyncio.gather(*held)
+            return limiter, excinfo.value
+
+        limiter, error = run(scenario())
+
+        assert (error.limit, error.in_flight) == (2, 2)
+        assert limiter.in_flight == 0
+        assert limiter.get_stats()["stats"]["rejected"] == 1
+
+    def test_waits_for_released_slot(self, run):
+        """With max_wait, a request over the limit takes the next free slot."""
+        async def scenario():
+            limiter = AdaptiveConcurrencyLimiter("wait", initial_limit=1, max_wait=1.0)
+            await asyncio.gather(hold(limiter, 0.02), hold(limiter, 0))
+            return limiter.get_stats()["stats"]
+
+        stats = run(scenario())
+
+        assert stats["waited"] == 1
+        assert "rejected" not in stats
+
+    def test_wait_bounded_by_deadline(self, run):
+        """The wait for a slot ends at the request's deadline."""
+        async def scenario():
+            limiter = AdaptiveConcurrencyLimiter("deadline", initial_limit=1, max_wait=5.0)
+            held = asyncio.ensure_future(hold(limiter, 0.2))
+            await asyncio.sleep(0)
+            with pytest.raises(ConcurrencyLimitExceeded):
+                await limiter.acquire(Deadline.after(0.02))
+            await held
+
+        run(scenario())
+
+    @pytest.mark.parametrize("limits", [(0, 1, 2), (2, 1, 4), (1, 8, 4)])
+    def test_invalid_limits_rejected(self, limits):
+        """Limits must satisfy 1 <= min <= initial <= max."""
+        min_limit, initial_limit, max_limit = limits
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(initial_limit=initial_limit, min_limit=min_limit,
+                                       max_limit=max_limit)
+
+def feed(limiter, rtts, in_flight=None, turned_away=True):
+    """Feed latency samples taken at full load, with requests turned away between them."""
+    for rtt in rtts:
+        limiter._turned_away = limiter._turned_away or turned_away
+        limiter._sample(rtt, in_flight or limiter.limit)
+
+@pytest.mark.unit
+class TestLimitAdjustment:
+    """Unit tests for the gradient2 and Vegas limit algorithms."""
+
+    @pytest.mark.parametrize("algorithm", list(LimitAlgorithm))
+    def test_grows_with_steady_latency(self, algorithm):
+        """Flat latency under full load raises the limit."""
+        limiter = AdaptiveConcurrencyLimiter("grow", algorithm, initial_limit=4)
+        feed(limiter, [0.010] * 50)
+
+        assert limiter.limit > 4
+
+    @pytest.mark.parametrize("algorithm", list(LimitAlgorithm))
+    def test_holds_when_no_request_turned_away(self, algorithm):
+        """Flat latency at full load does not raise the limit if every request got a slot."""
+        limiter = AdaptiveConcurrencyLimiter("hold", algorithm, initial_limit=4)
+        feed(limiter, [0.010] * 50, turned_away=False)
+
+        assert limiter.limit == 4
+
+    def test_queued_latency_does_not_raise_baseline(self):
+        """Queued samples leave the gradient2 baseline alone; a request running alone moves it."""
+        limiter = AdaptiveConcurrencyLimiter("creep", initial_limit=8)
+        feed(limiter, [0.010] * 20)
+        baseline = limiter.get_stats()["long_rtt_ms"]
+
+        feed(limiter, [0.014] * 500)
+        assert limiter.get_stats()["long_rtt_ms"] == pytest.approx(baseline)
+
+        feed(limiter, [0.014] * 10, in_flight=1)
+        assert limiter.get_stats()["long_rtt_ms"] > baseline
+
+    @pytest.mark.parametrize("algorithm", list(LimitAlgorithm))
+    def test_shrinks_when_latency_rises(self, algorithm):
+        """Latency well above its earlier level lowers the limit."""
+        limiter = AdaptiveConcurrencyLimiter("shrink", algorithm, initial_limit=32)
+        feed(limiter, [0.010] * 20)
+        before = limiter.limit
+        feed(limiter, [0.050] * 20)
+
+        assert limiter.limit < before
+
+    def test_unchanged_when_lightly_loaded(self):
+        """Samples taken well under the limit say nothing about capacity."""
+        limiter = AdaptiveConcurrencyLimiter("idle", initial_limit=16)
+        feed(limiter, [0.010] * 50, in_flight=2)
+
+        assert limiter.limit == 16
+
+    def test_dropped_request_backs_off(self, run):
+        """A request that ran out of time lowers the limit, down to the minimum."""
+        async def scenario():
+            limiter = AdaptiveConcurrencyLimiter("drop", initial_limit=10, min_limit=8,
+                                                 backoff_ratio=0.5)
+            for _ in range(2):
+                with pytest.raises(DeadlineExceeded):
+                    async with limiter.limit_context():
+                        Deadline.after(-1).check("test")
+            return limiter
+
+        limiter = run(scenario())
+
+        assert limiter.limit == 8
+        assert limiter.get_stats()["stats"]["dropped"] == 2
+
+    def test_failed_request_ignored(self, run):
+        """Other failures release the slot without sampling latency."""
+        async def scenario():
+            limiter = AdaptiveConcurrencyLimiter("error", initial_limit=4)
+            with pytest.raises(RuntimeError):
+                async with limiter.limit_context():
+                    raise RuntimeError("boom")
+            return limiter
+
+        limiter = run(scenario())
+
+        assert limiter.in_flight == 0 and limiter.limit == 4
+        assert "samples" not in limiter.get_stats()["stats"]
+
+@pytest.mark.unit
+class TestLimiterIntegration:
+    """Unit tests for metrics and AsyncPQCManager integration."""
+
+    def test_limit_and_rejections_exported(self, run):
+        """The current limit and rejection count are exported as gauges."""
+        async def scenario():
+            limiter = AdaptiveConcurrencyLimiter("gauges", initial_limit=1)
+            held = asyncio.ensure_future(hold(limiter, 0.02))
+            await asyncio.sleep(0)
+            for _ in range(2):
+                with pytest.raises(ConcurrencyLimitExceeded):
+                    await limiter.acquire()
+            await held
+
+        run(scenario())
+
+        def gauge(name):
+            return [g["value"] for g in performance_monitor.get_gauges(name)[name]
+                    if g["labels"]["limiter"] == "gauges"]
+
+        assert gauge("pqc_concurrency_limit") == [1]
+        assert gauge("pqc_concurrency_rejections_total") == [2]
+
+    def test_manager_rejects_over_limit(self, run):
+        """Manager operations over the limit raise ConcurrencyLimitExceeded unwrapped."""
+        async def scenario():
+            limiter = AdaptiveConcurrencyLimiter("manager", initial_limit=1)
+            async with AsyncPQCManager(max_workers=1, limiter=limiter) as manager:
+                await limiter.acquire()
+                with pytest.raises(ConcurrencyLimitExceeded):
+                    await manager.generate_kyber_keypair_async("user_1")
+                return await manager.get_operation_status()
+
+        status = run(scenario())
+
+        assert status["limiter_status"]["stats"] == {"rejected": 1}
+        assert status["executor_status"]["stats"] == {}
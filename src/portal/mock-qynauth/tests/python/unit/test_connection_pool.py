@@ -0,0 +1,284 @@
+"""
+Unit Tests for PQC Connection Pool
+
+This module tests the per-connection native resources, health checks,
+recycling, elastic sizing and tenant reservations of the PQC connection pool.
+"""
+
+import asyncio
+import os
+import pytest
+import sys
+from types import SimpleNamespace
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../../src'))
+
+from python_app.optimization.connection_pool import ConnectionResources, PQCConnectionPool
+from python_app.pqc_ffi import PQCLibrary, PQCLibraryError
+
+try:
+    PQCLibrary()
+    LIBRARY_AVAILABLE = True
+except Exception:
+    LIBRARY_AVAILABLE = False
+
+requires_library = pytest.mark.skipif(not LIBRARY_AVAILABLE, reason="PQC library not built")
+
+def fake_library():
+    """Library stand-in exposing the symbol the health check looks for."""
+    return SimpleNamespace(lib=SimpleNamespace(pqc_ml_kem_768_encaps=None))
+
+@pytest.mark.unit
+class TestConnectionResources:
+    """Unit tests for ConnectionResources."""
+
+    def test_key_handles_cached_and_evicted(self):
+        """Keys are converted once, and evicted handles are zeroed."""
+        resources = ConnectionResources(fake_library(), key_cache_size=2)
+        first, length = resources.key_handle(b"\x01" * 32)
+
+        assert resources.key_handle(list(b"\x01" * 32))[0] is first
+        assert length == 32
+
+        resources.key_handle(b"\x02" * 32)
+        resources.key_handle(b"\x03" * 32)
+
+        assert bytes(first) == bytes(32)
+        assert resources.get_stats() == {
+            "key_cache_hits": 1, "key_cache_misses": 3, "key_cache_evictions": 1, "cached_keys": 2
+        }
+
+    def test_staging_buffer_reused_and_grown(self):
+        """Per-call inputs reuse one buffer per slot until they outgrow it."""
+        resources = ConnectionResources(fake_library())
+        buffer, length = resources._stage("message", "hello")
+
+        assert resources._stage("message", b"world")[0] is buffer
+        assert bytes(buffer[:length]) == b"world"
+
+        grown, length = resources._stage("message", b"x" * 10000)
+
+        assert grown is not buffer and length == 10000
+        assert resources.get_stats()["buffer_grows"] == 1
+
+    def test_unavailable_library_raises(self):
+        """Operations without a library raise a library error and fail the health check."""
+        resources = ConnectionResources(None)
+
+        assert not resources.health_check()
+        with pytest.raises(PQCLibraryError):
+            resources.encapsulate(b"\x00" * 1184)
+
+    @requires_library
+    def test_operations_roundtrip(self):
+        """KEM and signature operations match the library's own results."""
+        library = PQCLibrary()
+        resources = ConnectionResources(library)
+        kem = library.generate_ml_kem_keypair()
+        dsa = library.generate_ml_dsa_keypair()
+
+        encapsulated = resources.encapsulate(kem['public_key'])
+        decapsulated = resources.decapsulate(kem['private_key'], encapsulated['ciphertext'])
+        signature = resources.sign(dsa['private_key'], "message")['signature']
+
+        assert decapsulated['shared_secret'] == encapsulated['shared_secret']
+        assert resources.verify(dsa['public_key'], b"message", signature)
+        assert not resources.verify(dsa['public_key'], b"tampered", signature)
+        assert library.ml_dsa_verify(dsa['public_key'], b"message", signature)
+
+    @requires_library
+    def test_verify_results_cached(self):
+        """A signature verified again on any connection is served from the cache."""
+        library = PQCLibrary()
+        dsa = library.generate_ml_dsa_keypair()
+        signature = library.ml_dsa_sign(dsa['private_key'], b"cached")['signature']
+        first, second = ConnectionResources(library), ConnectionResources(library)
+
+        assert first.verify(dsa['public_key'], b"cached", signature)
+        assert second.verify(dsa['public_key'], b"cached", signature)
+        assert not second.verify(dsa['public_key'], b"other", signature)
+
+        assert first.get_stats()["operations"] == 1
+        assert second.get_stats()["operations"] == 1
+
+@pytest.mark.unit
+class TestConnectionRecycling:
+    """Unit tests for connection health checks and recycling."""
+
+    def test_connection_reused_until_operation_limit(self, run):
+        """A connection keeps its resources until it reaches the operation limit."""
+        async def scenario():
+            pool = PQCConnectionPool(max_connections=1, max_operations_per_connection=3,
+                                     library_factory=fake_library)
+            seen = []
+            for _ in range(4):
+                async with pool.get_connection("user_1") as connection:
+                    seen.append((connection.resources, connection.metadata["generation"]))
+            return seen, pool.get_stats()
+
+        seen, stats = run(scenario())
+
+        assert seen[0][0] is seen[1][0] is seen[2][0]
+        assert seen[3][0] is not seen[0][0]
+        assert [generation for _, generation in seen] == [0, 0, 0, 1]
+        assert seen[0][0].library is None  # closed on recycle
+        assert stats["connections_recycled"] == 1
+
+    def test_failed_connection_replaced_on_acquire(self, run):
+        """A connection whose operation failed is replaced before it is handed out again."""
+        async def scenario():
+            pool = PQCConnectionPool(max_connections=1, library_factory=fake_library)
+            async with pool.get_connection() as connection:
+                connection.resources.failed = True
+                failed = connection.resources
+            async with pool.get_connection() as connection:
+                return failed, connection.resources, pool.get_stats()
+
+        failed, replacement, stats = run(scenario())
+
+        assert replacement is not failed and replacement.health_check()
+        assert stats["health_check_failures"] == 1
+
+    def test_unavailable_library_logged_and_counted(self):
+        """Connections are still created when the library cannot be loaded."""
+        def broken_factory():
+            raise PQCLibraryError("not built")
+
+        pool = PQCConnectionPool(max_connections=2, library_factory=broken_factory)
+
+        assert pool.get_stats()["library_unavailable"] == 2
+
+    def test_shutdown_closes_resources(self, run):
+        """Idle and in-use connections release their resources on shutdown."""
+        async def scenario():
+            pool = PQCConnectionPool(max_connections=2, library_factory=fake_library)
+            async with pool.get_connection() as connection:
+                in_use = connection.resources
+                idle = (await pool.get_pool_status())["available_connections"]
+                await pool.shutdown()
+            return in_use, idle, await pool.get_pool_status()
+
+        in_use, idle, status = run(scenario())
+
+        assert idle == 1
+        assert in_use.library is None
+        assert status["total_connections"] == 0
+
+def elastic_pool(name, **overrides):
+    """Pool with fake libraries, starting at one connection."""
+    options = dict(min_connections=1, max_connections=3, grow_after=0.01,
+                   library_factory=fake_library, name=name)
+    options.update(overrides)
+    return PQCConnectionPool(**options)
+
+async def hold(pool, seconds, tenant=None):
+    """Hold a connection for a while and return its resources."""
+    async with pool.get_connection(tenant=tenant) as connection:
+        await asyncio.sleep(seconds)
+        return connection.resources
+
+@pytest.mark.unit
+class TestElasticSizing:
+    """Unit tests for elastic sizing and tenant reservations."""
+
+    def test_grows_on_sustained_wait(self, run):
+        """A caller waiting longer than grow_after gets a new connection."""
+        async def scenario():
+            pool = elastic_pool("grow")
+            resources = await asyncio.gather(hold(pool, 0.1), hold(pool, 0.1))
+            return resources, await pool.get_pool_status()
+
+        (first, second), status = run(scenario())
+
+        assert first is not second
+        assert status["total_connections"] == 2
+        assert status["stats"]["connections_grown"] == 1
+
+    def test_short_wait_reuses_connection(self, run):
+        """A connection returned within grow_after is reused instead of growing."""
+        async def scenario():
+            pool = elastic_pool("reuse", grow_after=1.0)
+            resources = await asyncio.gather(hold(pool, 0.01), hold(pool, 0))
+            return resources, await pool.get_pool_status()
+
+        (first, second), status = run(scenario())
+
+        assert first is second
+        assert status["total_connections"] == 1
+        assert "connections_grown" not in status["stats"]
+
+    def test_idle_connections_shrink_to_minimum(self, run):
+        """The cleanup pass closes idle connections above min_connections."""
+        async def scenario():
+            pool = elastic_pool("shrink", idle_timeout=0)
+            resources = await asyncio.gather(*[hold(pool, 0.05) for _ in range(3)])
+            grown = (await pool.get_pool_status())["total_connections"]
+            await asyncio.sleep(0.01)
+            await pool._shrink_idle_connections()
+            return resources, grown, await pool.get_pool_status()
+
+        resources, grown, status = run(scenario())
+
+        assert grown == 3
+        assert status["total_connections"] == status["available_connections"] == 1
+        assert status["stats"]["connections_shrunk"] == 2
+        assert sum(r.library is None for r in resources) == 2
+
+    def test_reserved_capacity_held_for_tenant(self, run):
+        """Shared callers cannot take a tenant's reserved connection."""
+        async def scenario():
+            pool = elastic_pool("reserve", max_connections=2, connection_timeout=0.05,
+                                tenant_reservations={"tenant_a": 1})
+            async with pool.get_connection(tenant="tenant_b"):
+                with pytest.raises(asyncio.TimeoutError):
+                    async with pool.get_connection(tenant="tenant_c"):
+                        pass
+                async with pool.get_connection(tenant="tenant_a"):
+                    status = await pool.get_pool_status()
+            return status, pool.get_stats()
+
+        status, stats = run(scenario())
+
+        assert status["active_connections"] == 2
+        assert status["tenant_in_use"] == {"tenant_a": 1}
+        assert stats["connection_timeouts"] == 1
+
+    def test_tenant_overflows_into_shared_capacity(self, run):
+        """A tenant past its reservation competes for shared connections."""
+        async def scenario():
+            pool = elastic_pool("overflow", max_connections=3, tenant_reservations={"tenant_a": 1})
+            await asyncio.gather(*[hold(pool, 0.05, tenant="tenant_a") for _ in range(3)])
+            return pool.get_stats()
+
+        assert run(scenario())["connections_grown"] == 2
+
+    def test_wait_and_utilization_metrics_exported(self, run):
+        """Acquire waits are observed per tenant and utilization gauges follow the pool."""
+        from python_app.monitoring.performance_monitor import performance_monitor
+
+        async def scenario():
+            pool = elastic_pool("metrics", tenant_reservations={"tenant_a": 1})
+            async with pool.get_connection(tenant="tenant_a"):
+                in_use = performance_monitor.get_gauges("pqc_pool_utilization")
+            async with pool.get_connection():
+                pass
+            return in_use
+
+        in_use = run(scenario())
+        utilization = [g for g in in_use["pqc_pool_utilization"] if g["labels"]["pool"] == "metrics"]
+        waits = {tuple(sorted(h["labels"].items())): h["count"]
+                 for h in performance_monitor.get_histograms("pqc_pool_acquire_wait_seconds")
+                 ["pqc_pool_acquire_wait_seconds"] if h["labels"]["pool"] == "metrics"}
+
+        assert utilization[0]["value"] == pytest.approx(1 / 3)
+        assert waits == {(("pool", "metrics"), ("tenant", "tenant_a")): 1,
+                         (("pool", "metrics"), ("tenant", "shared")): 1}
+
+    @pytest.mark.parametrize("options", [
+        {"min_connections": 4, "max_connections": 3},
+        {"max_connections": 2, "tenant_reservations": {"a": 2, "b": 1}},
+    ])
+    def test_invalid_sizing_rejected(self, options):
+        """Sizes and reservations must fit in max_connections."""
+        with pytest.raises(ValueError):
+            PQCConnectionPool(library_factory=fake_library, **options)
@@ -0,0 +1,187 @@
+"""
+Unit Tests for Request Deadlines
+
+This module tests that expired work is dropped and counted by the
+executor, batch processor, connection pool, async manager and service
+bridge.
+"""
+
+import asyncio
+import json
+import os
+import pytest
+import subprocess
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../../src'))
+
+from python_app.optimization.batch_processor import BatchConfig, PQCBatchProcessor
+from python_app.optimization.connection_pool import PQCConnectionPool
+from python_app.optimization.deadline import Deadline, DeadlineExceeded
+from python_app.optimization.executor_backend import ExecutorBackend, PQCExecutor
+from python_app.pqc_bindings.async_support import AsyncPQCManager
+
+BRIDGE = os.path.join(os.path.dirname(__file__), '../../../src/python_app/pqc_service_bridge.py')
+
+def echo_batch(batch_items):
+    """Batch function returning each item's data."""
+    return [item.data for item in batch_items]
+
+@pytest.mark.unit
+class TestDeadline:
+    """Unit tests for Deadline."""
+
+    def test_remaining_and_check(self):
+        """A live deadline passes its check; an expired one raises a timeout."""
+        live, expired = Deadline.after(10), Deadline.after(-0.5)
+
+        live.check("test")
+        assert 9 < live.timeout() <= 10 and live.timeout(1.0) == 1.0
+        assert expired.expired and expired.timeout() == 0.0
+        with pytest.raises(asyncio.TimeoutError, match="at test"):
+            expired.check("test")
+
+    def test_wall_clock_timestamp(self):
+        """Deadlines from other processes are converted to the monotonic clock."""
+        assert Deadline.at_timestamp(time.time() + 5).remaining() == pytest.approx(5, abs=0.1)
+
+@pytest.mark.unit
+class TestExecutorDeadline:
+    """Unit tests for deadlines in PQCExecutor."""
+
+    def test_expired_call_not_dispatched(self, run):
+        """A call whose deadline has passed never reaches the pool."""
+        executor = PQCExecutor(ExecutorBackend.THREAD, max_workers=1)
+        calls = []
+        try:
+            with pytest.raises(DeadlineExceeded):
+                run(executor.run(calls.append, 1, deadline=Deadline.after(-1)))
+        finally:
+            executor.shutdown()
+
+        assert calls == []
+        assert executor.get_stats()["stats"] == {"expired_before_dispatch": 1}
+
+    def test_queued_call_cancelled_when_deadline_passes(self, run):
+        """A call still queued behind busy workers is cancelled at its deadline."""
+        executor = PQCExecutor(ExecutorBackend.THREAD, max_workers=1)
+        release = threading.Event()
+        calls = []
+
+        async def scenario():
+            busy = asyncio.ensure_future(executor.run(release.wait))
+            await asyncio.sleep(0.01)
+            with pytest.raises(DeadlineExceeded):
+                await executor.run(calls.append, 1, deadline=Deadline.after(0.05))
+            release.set()
+            await busy
+
+        try:
+            run(scenario())
+        finally:
+            executor.shutdown()
+
+        assert calls == []
+        assert executor.get_stats()["stats"]["expired_in_flight"] == 1
+
+@pytest.mark.unit
+class TestBatchDeadline:
+    """Unit tests for deadlines in PQCBatchProcessor."""
+
+    def test_expired_items_dropped_when_batch_formed(self, run):
+        """Items that expire while queued are left out of their batch."""
+        batches = []
+
+        def recording_batch(batch_items):
+            batches.append([item.data for item in batch_items])
+            return echo_batch(batch_items)
+
+        async def scenario():
+            processor = PQCBatchProcessor(recording_batch, BatchConfig(max_batch_size=10, max_wait_time=0.05))
+            results = await asyncio.gather(
+                processor.submit(1, "user_1", "sign"),
+                processor.submit(2, "user_2", "sign", deadline=Deadline.after(0.01)),
+                processor.submit(3, "user_3", "sign", deadline=Deadline.after(10)),
+                return_exceptions=True
+            )
+            return results, await processor.get_stats()
+
+        results, stats = run(scenario())
+
+        assert results[0] == 1 and results[2] == 3
+        assert isinstance(results[1], DeadlineExceeded)
+        assert batches == [[1, 3]]
+        assert stats["stats"]["items_expired"] == 1
+        assert "items_failed" not in stats["stats"]
+
+    def test_expired_submit_rejected(self, run):
+        """An item submitted after its deadline is never queued."""
+        async def scenario():
+            processor = PQCBatchProcessor(echo_batch, BatchConfig(max_batch_size=1))
+            with pytest.raises(DeadlineExceeded):
+                await processor.submit(1, "user_1", "sign", deadline=Deadline.after(-1))
+            return await processor.get_stats()
+
+        stats = run(scenario())
+
+        assert stats["stats"] == {"items_expired": 1}
+
+@pytest.mark.unit
+class TestPoolDeadline:
+    """Unit tests for deadlines in PQCConnectionPool."""
+
+    def test_acquire_wait_ends_at_deadline(self, run):
+        """A caller waiting for a connection gives up at its deadline, not the pool timeout."""
+        async def scenario():
+            pool = PQCConnectionPool(max_connections=1, connection_timeout=5.0,
+                                     library_factory=lambda: SimpleNamespace(lib=None))
+            async with pool.get_connection():
+                start = time.perf_counter()
+                with pytest.raises(DeadlineExceeded):
+                    async with pool.get_connection(deadline=Deadline.after(0.05)):
+                        pass
+                waited = time.perf_counter() - start
+            with pytest.raises(DeadlineExceeded):
+                async with pool.get_connection(deadline=Deadline.after(-1)):
+                    pass
+            return waited, pool.get_stats()
+
+        waited, stats = run(scenario())
+
+        assert waited < 1.0
+        assert stats["acquires_expired"] == 2
+        assert "connection_timeouts" not in stats
+
+@pytest.mark.unit
+class TestManagerDeadline:
+    """Unit tests for deadlines in AsyncPQCManager."""
+
+    def test_expired_operation_raises_deadline_exceeded(self, run):
+        """Expired operations are dropped and not reported as crypto failures."""
+        async def scenario():
+            async with AsyncPQCManager(max_workers=1) as manager:
+                with pytest.raises(DeadlineExceeded):
+                    await manager.generate_kyber_keypair_async("user_1", deadline=Deadline.after(-1))
+                return await manager.get_operation_status()
+
+        status = run(scenario())
+
+        assert status["executor_status"]["stats"] == {"expired_before_dispatch": 1}
+
+@pytest.mark.unit
+class TestBridgeDeadline:
+    """Unit tests for deadlines in the service bridge."""
+
+    def test_expired_request_dropped(self):
+        """The bridge answers an expired request without running the operation."""
+        params = json.dumps({"user_id": "user_1", "deadline": time.time() - 1})
+        completed = subprocess.run([sys.executable, BRIDGE, "handshake", params],
+                                   capture_output=True, text=True, timeout=60)
+
+        response = json.loads(completed.stdout.strip().splitlines()[-1])
+
+        assert completed.returncode == 0
+        assert response["success"] is False and response["deadline_exceeded"] is True
@@ -0,0 +1,148 @@
+"""
+Unit Tests for PQC Executor Backends
+
+This module tests the thread and process executors, shared memory result
+transfer, and their use by the batch processor and async manager.
+"""
+
+import asyncio
+import os
+import pytest
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../../src'))
+
+from python_app.optimization.batch_processor import BatchConfig, PQCBatchProcessor
+from python_app.optimization.executor_backend import (
+    ExecutorBackend, PQCExecutor, _ResultSegments, _pack_results, _worker_segments,
+    get_worker_library, optimal_batch_size
+)
+from python_app.pqc_bindings.async_support import AsyncPQCManager
+from python_app.pqc_bindings.kyber import KyberKeyPair
+
+def ciphertext_batch(batch_items):
+    """Batch function returning a ciphertext-sized result per item."""
+    return [bytes([item.data % 256]) * 1088 for item in batch_items]
+
+class SigningKeyPair:
+    """Keypair stand-in returning signature-sized results."""
+
+    def sign(self, message):
+        return message[:1] * 3309
+
+def worker_identity(items):
+    """Batch function reporting the worker process and its PQC library."""
+    return [(os.getpid(), id(get_worker_library())) for _ in items]
+
+@pytest.fixture
+def process_executor():
+    executor = PQCExecutor(ExecutorBackend.PROCESS, max_workers=1, shared_memory_threshold=4096)
+    yield executor
+    executor.shutdown()
+
+@pytest.mark.unit
+class TestResultTransfer:
+    """Unit tests for packing results into shared memory."""
+
+    def test_large_bytes_results_use_shared_memory(self):
+        """Byte results over the threshold round-trip through segments reused once read."""
+        segments = _ResultSegments(max_attached=4)
+        results = [os.urandom(1088) for _ in range(8)]
+        try:
+            first = _pack_results(results, threshold=4096)
+            second = _pack_results(results, threshold=4096)
+            assert None not in (first[0], second[0]) and first[0] != second[0]
+
+            assert segments.read(*first) == results
+            assert segments.read(*second) == results
+            third = _pack_results(results[:4], threshold=4096)
+            assert third[0] == first[0]
+            assert segments.read(*third) == results[:4]
+        finally:
+            segments.close()
+            _worker_segments.clear()
+
+        with pytest.raises(FileNotFoundError):
+            segments.read(*first)
+
+    @pytest.mark.parametrize("results", [[b"small"], [b"x" * 8192, 42], []])
+    def test_other_results_returned_as_is(self, results):
+        """Small or non-bytes results skip shared memory."""
+        assert _pack_results(results, threshold=4096) == (None, results)
+        assert _pack_results([b"x" * 8192], threshold=None) == (None, [b"x" * 8192])
+
+@pytest.mark.unit
+class TestPQCExecutor:
+    """Unit tests for PQCExecutor."""
+
+    def test_thread_backend_runs_batches(self, run):
+        """The thread backend runs closures as before."""
+        executor = PQCExecutor(ExecutorBackend.THREAD, max_workers=2)
+        try:
+            assert run(executor.run_batch(lambda items: [i * 2 for i in items], [1, 2, 3])) == [2, 4, 6]
+            assert run(executor.run(sum, [1, 2, 3])) == 6
+        finally:
+            executor.shutdown()
+
+    def test_process_backend_returns_results_via_shared_memory(self, process_executor, run):
+        """Ciphertext batches come back intact through shared memory."""
+        async def scenario():
+            processor = PQCBatchProcessor(
+                ciphertext_batch, BatchConfig(max_batch_size=8, max_wait_time=0.01),
+                executor=process_executor)
+            return await asyncio.gather(*[processor.submit(i, f"user_{i}", "encapsulate") for i in range(16)])
+
+        results = run(scenario())
+
+        assert results == [bytes([i]) * 1088 for i in range(16)]
+        assert process_executor.get_stats()["stats"]["shared_memory_batches"] == 2
+
+    def test_worker_loads_library_once(self, process_executor, run):
+        """The initializer runs once per worker, not once per batch."""
+        first = run(process_executor.run_batch(worker_identity, [1]))
+        second = run(process_executor.run_batch(worker_identity, [1, 2]))
+
+        assert first[0] == second[0] == second[1]
+        assert first[0][0] != os.getpid()
+
+    def test_batches_sized_to_pool(self):
+        """Pool-sized configuration uses the host batch size and one batch per worker."""
+        executor = PQCExecutor(ExecutorBackend.THREAD, max_workers=3)
+        try:
+            config = BatchConfig.for_executor(executor, max_wait_time=0.05)
+        finally:
+            executor.shutdown()
+
+        assert config.max_batch_size == optimal_batch_size() >= 1
+        assert config.max_concurrent_batches == 3
+        assert config.max_wait_time == 0.05
+
+@pytest.mark.unit
+class TestAsyncManagerBackend:
+    """Unit tests for AsyncPQCManager on a process pool."""
+
+    def test_keygen_on_process_backend(self, run):
+        """Operations run in worker processes and return their results."""
+        async def scenario():
+            async with AsyncPQCManager(max_workers=1, backend=ExecutorBackend.PROCESS) as manager:
+                keypair = await manager.generate_kyber_keypair_async("user_1")
+                return keypair, await manager.get_operation_status()
+
+        keypair, status = run(scenario())
+
+        assert isinstance(keypair, KyberKeyPair)
+        assert status["executor_status"]["backend"] == "process"
+
+    def test_batched_results_use_shared_memory(self, process_executor, run):
+        """Chunks of batched operations return byte results through shared memory."""
+        messages = [bytes([i]) for i in range(8)]
+
+        async def scenario():
+            async with AsyncPQCManager(executor=process_executor) as manager:
+                return [pair async for pair in manager.sign_many(
+                    [(SigningKeyPair(), m) for m in messages], "user_1", chunk_size=4)]
+
+        signatures = run(scenario())
+
+        assert signatures == [(i, m * 3309) for i, m in enumerate(messages)]
+        assert process_executor.get_stats()["stats"]["shared_memory_batches"] == 2
@@ -0,0 +1,70 @@
+"""
+Unit Tests for Compact Key Storage
+
+This module tests key generation and access in PQCKeyStore, which keeps
+keys as bytes rather than the integer lists the FFI returns.
+"""
+
+import os
+import pytest
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../../src'))
+
+from python_app.optimization.key_store import PQCKeyStore, StoredKey
+from python_app.pqc_ffi import PQCLibrary
+
+try:
+    PQCLibrary()
+    LIBRARY_AVAILABLE = True
+except Exception:
+    LIBRARY_AVAILABLE = False
+
+class StubLibrary:
+    """PQCLibrary stand-in returning keys as integer lists, like the FFI."""
+
+    def generate_ml_kem_keypair(self):
+        return {'public_key': [1] * 1184, 'private_key': [2] * 2400, 'algorithm': 'ML-KEM-768'}
+
+    def generate_ml_dsa_keypair(self):
+        return {'public_key': [3] * 1952, 'private_key': [4] * 4032, 'algorithm': 'ML-DSA-65'}
+
+@pytest.mark.unit
+class TestPQCKeyStore:
+    """Unit tests for PQCKeyStore."""
+
+    def test_keys_stored_as_bytes(self):
+        """Generated keys are held as bytes, not lists."""
+        store = PQCKeyStore(StubLibrary())
+
+        kem_key = store.generate("ML-KEM-768")
+        dsa_key = store.generate("ML-DSA-65")
+
+        assert isinstance(kem_key, StoredKey) and not hasattr(kem_key, "__dict__")
+        assert kem_key.private_key == bytes([2] * 2400)
+        assert store.public_key(kem_key) == bytes([1] * 1184)
+        assert store.private_key(dsa_key) == bytes([4] * 4032)
+        assert store.keypair(dsa_key) == {'public_key': bytes([3] * 1952),
+                                          'private_key': bytes([4] * 4032),
+                                          'algorithm': 'ML-DSA-65'}
+        assert store.get_stats()["stats"]["generated"] == 2
+
+    def test_unknown_algorithm_rejected(self):
+        """Only ML-KEM-768 and ML-DSA-65 keys can be generated."""
+        with pytest.raises(ValueError):
+            PQCKeyStore(StubLibrary()).generate("RSA-2048")
+
+    @pytest.mark.skipif(not LIBRARY_AVAILABLE, reason="PQC library not built")
+    def test_stored_keys_usable_with_library(self):
+        """Keys stored as bytes still sign, verify and decapsulate with the library."""
+        library = PQCLibrary()
+        store = PQCKeyStore(library)
+        dsa_key = store.generate("ML-DSA-65")
+        kem_key = store.generate("ML-KEM-768")
+
+        signature = library.ml_dsa_sign(store.private_key(dsa_key), b"message")['signature']
+        assert library.ml_dsa_verify(store.public_key(dsa_key), b"message", signature)
+
+        encapsulated = library.ml_kem_encapsulate(store.public_key(kem_key))
+        shared_secret = library.ml_kem_decapsulate(store.private_key(kem_key), encapsulated['ciphertext'])
+        assert bytes(shared_secret['shared_secret']) == bytes(encapsulated['shared_secret'])
@@ -0,0 +1,129 @@
+"""
+Unit Tests for PQC Log Redaction
+
+This module tests the single-pass redaction engine used by the PQC
+security log filter.
+"""
+
+import logging
+import pytest
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../../src'))
+
+from python_app.monitoring.redaction import PQCRedactionEngine, REDACTED
+from python_app.monitoring.pqc_logger import PQCSecurityFilter
+
+def make_record(msg, args=None, **extra):
+    """Create a log record with optional extra fields."""
+    record = logging.LogRecord("pqc", logging.INFO, __file__, 1, msg, args, None)
+    for key, value in extra.items():
+        setattr(record, key, value)
+    return record
+
+@pytest.mark.unit
+class TestRedactionEngine:
+    """Unit tests for PQCRedactionEngine."""
+
+    def test_clean_message_untouched(self):
+        """Records without sensitive markers are not rewritten."""
+        engine = PQCRedactionEngine()
+        record = make_record("PQC signature succeeded for user %s", ("alice",))
+
+        assert engine.redact_record(record) == 0
+        assert record.args == ("alice",)
+        assert record.getMessage() == "PQC signature succeeded for user alice"
+
+    def test_fstring_key_dump_redacted(self):
+        """Secrets embedded directly in the message are redacted."""
+        engine = PQCRedactionEngine()
+        key_bytes = list(range(40))
+        record = make_record(f'Decoded JSON string: {{"private_key": {key_bytes}, "success": true}}')
+
+        engine.redact_record(record)
+        message = record.getMessage()
+
+        assert '"private_key": [REDACTED]' in message
+        assert "39" not in message
+        assert '"success": true' in message
+
+    def test_args_are_redacted_not_just_first(self):
+        """Secrets passed through any format argument are redacted."""
+        engine = PQCRedactionEngine()
+        record = make_record("user=%s token=%s", ("alice", "abc.def.ghi"))
+
+        engine.redact_record(record)
+
+        assert record.args is None
+        assert record.getMessage() == f"user=alice token={REDACTED}"
+
+    def test_unlabelled_blobs_redacted(self):
+        """Long int lists, byte literals and hex runs are redacted."""
+        engine = PQCRedactionEngine()
+
+        text, count = engine.redact_text(f"blob {list(range(20))} end")
+        assert text == "blob [REDACTED 20 items] end"
+        assert count == 1
+
+        text, _ = engine.redact_text("hex " + "ab" * 32)
+        assert text == f"hex {REDACTED}"
+
+        text, _ = engine.redact_text("short [1, 2, 3] and abcdef")
+        assert text == "short [1, 2, 3] and abcdef"
+
+    def test_sizes_and_digests_kept(self):
+        """Sizes, counts and labelled digests in messages are not redacted."""
+        engine = PQCRedactionEngine()
+        digest = "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
+
+        text = f"signature_size=3309 bytes, tokens_remaining=5, sha256={digest}"
+        assert engine.redact_text(text) == (text, 0)
+
+        text, count = engine.redact_text(f"signature_size=3309 signature={digest}")
+        assert text == f"signature_size=3309 signature={REDACTED}"
+        assert count == 1
+
+    def test_whole_reprs_and_credentials_redacted(self):
+        """Byte reprs holding quotes, and auth scheme plus token, are redacted whole."""
+        engine = PQCRedactionEngine()
+        key = bytes(range(256)) * 10
+
+        assert engine.redact_text(f"Generated key: {key!r}") == (f"Generated key: {REDACTED}", 1)
+        assert engine.redact_text(f"secret_key={key!r}") == (f"secret_key={REDACTED}", 1)
+        single_quoted = key[:64].replace(b'"', b'')  # repr delimited by double quotes
+        assert repr(single_quoted).startswith('b"')
+        assert engine.redact_text(f"secret_key={single_quoted!r} done") == (f"secret_key={REDACTED} done", 1)
+
+        text, _ = engine.redact_text("token: Bearer eyJhbGciOiJIUzI1NiJ9.eyJzdWIiOiIxIn0.sig")
+        assert text == f"token: {REDACTED}"
+
+    def test_structured_extras_redacted(self):
+        """Sensitive and blob-valued extra fields are redacted."""
+        engine = PQCRedactionEngine()
+        metadata = {"session": "s1", "shared_secret": b"\x00" * 32}
+        record = make_record(
+            "PQC encapsulation succeeded",
+            private_key=b"\x01" * 2400,
+            key_material=list(range(64)),
+            ciphertext_size=1088,
+            private_key_hash="0123456789abcdef",
+            metadata=metadata
+        )
+
+        engine.redact_record(record)
+
+        assert record.private_key == REDACTED
+        assert record.key_material == "[REDACTED 64 items]"
+        assert record.ciphertext_size == 1088
+        assert record.private_key_hash == "0123456789abcdef"
+        assert record.metadata["shared_secret"] == REDACTED
+        assert metadata["shared_secret"] == b"\x00" * 32
+
+    def test_security_filter_uses_engine(self):
+        """PQCSecurityFilter delegates to the redaction engine."""
+        security_filter = PQCSecurityFilter(PQCRedactionEngine())
+        record = make_record("password=%s", ("hunter2",))
+
+        assert security_filter.filter(record) is True
+        assert record.getMessage() == f"password={REDACTED}"
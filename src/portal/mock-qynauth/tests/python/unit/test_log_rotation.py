@@ -0,0 +1,115 @@
+"""
+Unit Tests for PQC Log Rotation
+
+This module tests size-triggered rotation with background compression
+and byte-budget retention.
+"""
+
+import gzip
+import logging
+import pytest
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../../src'))
+
+from python_app.monitoring.log_rotation import CompressingRotatingFileHandler, segment_compressor
+
+def write_records(handler, count, size=100):
+    """Emit fixed-size records through a handler."""
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    for i in range(count):
+        record = logging.LogRecord("pqc", logging.INFO, __file__, 1, f"{i:05d}" + "x" * size, None, None)
+        handler.handle(record)
+
+@pytest.mark.unit
+class TestLogRotation:
+    """Unit tests for CompressingRotatingFileHandler."""
+
+    def test_rollover_seals_time_named_compressed_segments(self, tmp_path):
+        """Full files are sealed under time-based names and gzip-compressed."""
+        handler = CompressingRotatingFileHandler(
+            tmp_path / "pqc_operations.log", max_bytes=1000,
+            max_total_bytes=10 * 1024 * 1024, compression="gzip"
+        )
+        write_records(handler, 30)
+        segment_compressor.wait_idle()
+        handler.close()
+
+        segments = sorted(tmp_path.glob("pqc_operations.*.log.gz"))
+        assert handler.rollovers == len(segments) >= 2
+        assert not list(tmp_path.glob("pqc_operations.*.log"))
+
+        with gzip.open(segments[0], "rt") as segment:
+            first_line = segment.readline()
+        assert first_line.startswith("00000")
+        assert (tmp_path / "pqc_operations.log").stat().st_size <= 1000
+
+    def test_retention_enforces_byte_budget(self, tmp_path):
+        """Oldest segments are deleted once the byte budget is exceeded."""
+        handler = CompressingRotatingFileHandler(
+            tmp_path / "pqc_security.log", max_bytes=500,
+            max_total_bytes=1500, compression=None
+        )
+        write_records(handler, 100)
+        segment_compressor.wait_idle()
+        handler.close()
+
+        segments = list(tmp_path.glob("pqc_security.*.log"))
+        total = sum(segment.stat().st_size for segment in segments)
+
+        assert handler.rollovers > len(segments)
+        assert total <= 1500
+
+    def test_uncompressed_segments_recovered_on_startup(self, tmp_path):
+        """Segments left uncompressed by a previous process are compressed, and partial files removed."""
+        leftover = tmp_path / "pqc_performance.20250101T000000_000000.log"
+        leftover.write_text("leftover\n")
+        partial = leftover.with_name(leftover.name + ".gz.partial")
+        partial.write_bytes(b"\x1f\x8b")
+
+        handler = CompressingRotatingFileHandler(
+            tmp_path / "pqc_performance.log", max_bytes=1000,
+            max_total_bytes=10 * 1024 * 1024, compression="gzip"
+        )
+        segment_compressor.wait_idle()
+        handler.close()
+
+        assert not leftover.exists() and not partial.exists()
+        with gzip.open(leftover.with_name(leftover.name + ".gz"), "rt") as segment:
+            assert segment.read() == "leftover\n"
+
+    def test_compressor_failures_logged(self, tmp_path, caplog):
+        """A failed compression is logged as well as counted."""
+        handler = CompressingRotatingFileHandler(
+            tmp_path / "pqc_audit.log", max_bytes=1000,
+            max_total_bytes=None, compression="gzip"
+        )
+        errors = segment_compressor.errors
+        segment = tmp_path / "pqc_audit.20250101T000000_000000.log"
+        segment.mkdir()  # unreadable as a file
+
+        with caplog.at_level(logging.ERROR, logger="python_app.monitoring.log_rotation"):
+            segment_compressor.submit(handler, segment)
+            segment_compressor.wait_idle()
+        handler.close()
+
+        assert segment_compressor.errors == errors + 1
+        assert any(str(segment) in record.getMessage() and record.exc_info for record in caplog.records)
+
+    def test_retention_without_byte_budget_keeps_unexpired(self, tmp_path):
+        """With no byte budget, segments are kept until they pass the retention age."""
+        expired = tmp_path / "pqc_security.20000101T000000_000000.log"
+        expired.write_text("expired\n")
+        os.utime(expired, (0, 0))
+
+        handler = CompressingRotatingFileHandler(
+            tmp_path / "pqc_security.log", max_bytes=500,
+            max_total_bytes=None, compression=None, retention_days=1
+        )
+        write_records(handler, 100)
+        segment_compressor.wait_idle()
+        handler.close()
+
+        assert not expired.exists()
+        assert len(list(tmp_path.glob("pqc_security.*.log"))) == handler.rollovers
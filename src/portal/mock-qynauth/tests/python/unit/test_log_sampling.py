@@ -0,0 +1,107 @@
+"""
+Unit Tests for PQC Log Sampling
+
+This module tests head sampling, per-operation token-bucket caps and
+suppression summaries applied by PQCLogger.
+"""
+
+import logging
+import pytest
+import sys
+import os
+import time
+from unittest.mock import patch
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../../src'))
+
+from python_app.monitoring.log_sampling import PQCLogSampler, LogSamplingConfig, SamplingRule
+from python_app.monitoring.pqc_logger import PQCLogger
+
+@pytest.mark.unit
+class TestLogSampling:
+    """Unit tests for PQCLogSampler."""
+
+    def test_head_sampling_is_deterministic(self):
+        """A 1-in-10 rule keeps exactly one event in ten."""
+        sampler = PQCLogSampler(LogSamplingConfig(
+            rules={"cache_hit": SamplingRule(sample_rate=0.1)}
+        ))
+
+        emitted = sum(sampler.check(logging.DEBUG, "cache_hit").emit for _ in range(100))
+
+        assert emitted == 10
+
+    def test_token_bucket_caps_bursts(self):
+        """Events beyond the bucket capacity are suppressed."""
+        sampler = PQCLogSampler(LogSamplingConfig(
+            rules={"rate_limit_allow": SamplingRule(max_per_second=0.001, burst=5)}
+        ))
+
+        emitted = sum(sampler.check(logging.DEBUG, "rate_limit_allow").emit for _ in range(50))
+
+        assert emitted == 5
+        assert sampler.get_stats()["stats"]["events_suppressed"] == 45
+
+    def test_warnings_and_unkeyed_records_bypass_sampling(self):
+        """Warnings and records without pqc_operation are never sampled."""
+        sampler = PQCLogSampler(LogSamplingConfig(
+            default_rule=SamplingRule(sample_rate=0.0)
+        ))
+
+        assert sampler.check(logging.INFO, "cache_hit").emit
+        assert not sampler.check(logging.INFO, "cache_hit").emit
+        assert sampler.check(logging.WARNING, "cache_hit").emit
+        assert sampler.check(logging.INFO, None).emit
+
+    def test_summary_after_interval(self):
+        """A summary reports suppressed events once the interval elapses."""
+        sampler = PQCLogSampler(LogSamplingConfig(
+            rules={"cache_hit": SamplingRule(sample_rate=0.0)},
+            summary_interval=5.0
+        ))
+
+        with patch('python_app.monitoring.log_sampling.time.monotonic', return_value=100.0):
+            assert sampler.check(logging.DEBUG, "cache_hit").emit
+            for _ in range(7):
+                assert sampler.check(logging.DEBUG, "cache_hit").summary is None
+
+        with patch('python_app.monitoring.log_sampling.time.monotonic', return_value=106.0):
+            decision = sampler.check(logging.DEBUG, "cache_hit")
+
+        assert decision.summary["suppressed_count"] == 8
+        assert decision.summary["sampled_operation"] == "cache_hit"
+        assert decision.summary["window_seconds"] == pytest.approx(6.0)
+
+    def test_logger_applies_sampling_before_logging(self):
+        """PQCLogger drops sampled records and emits suppression summaries."""
+        pqc_log = PQCLogger("pqc.test_sampling", "DEBUG", LogSamplingConfig(
+            rules={"cache_hit": SamplingRule(sample_rate=0.25)}
+        ))
+
+        with patch.object(pqc_log.logger, 'debug') as mock_debug, \
+             patch.object(pqc_log.logger, 'info') as mock_info:
+            for _ in range(8):
+                pqc_log.log_pqc_operation("debug", "Cache hit", pqc_operation="cache_hit")
+            pqc_log.flush_sampling_summaries()
+
+        assert mock_debug.call_count == 2
+        assert mock_info.call_count == 1
+        assert "6 similar cache_hit events suppressed" in mock_info.call_args[0][0]
+
+    def test_due_summaries_emitted_without_later_events(self):
+        """Summaries are emitted once due even if no later event of the operation arrives."""
+        pqc_log = PQCLogger("pqc.test_sampling_timer", "DEBUG", LogSamplingConfig(
+            rules={"cache_hit": SamplingRule(sample_rate=0.0)},
+            summary_interval=0.05
+        ))
+
+        with patch.object(pqc_log.logger, 'debug'), \
+             patch.object(pqc_log.logger, 'info') as mock_info:
+            for _ in range(4):
+                pqc_log.log_pqc_operation("debug", "Cache hit", pqc_operation="cache_hit")
+            deadline = time.monotonic() + 2.0
+            while not mock_info.called and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        assert mock_info.call_count == 1
+        assert "3 similar cache_hit events suppressed" in mock_info.call_args[0][0]
@@ -0,0 +1,250 @@
+"""
+Unit Tests for the Native Completion Queue
+
+This module tests NativeAsyncQueue and its use by AsyncPQCManager against
+a stand-in for the ``ffi_async_*`` exports that completes operations on a
+worker thread and signals them on a real pipe, and against the built PQC
+library when it provides those exports.
+"""
+
+import asyncio
+import ctypes
+import os
+import pytest
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../../src'))
+
+from python_app.optimization.deadline import Deadline, DeadlineExceeded
+from python_app.optimization.native_async import NativeAsyncQueue, open_native_queue
+from python_app.pqc_bindings.async_support import AsyncPQCManager
+from python_app.pqc_ffi import PQCLibrary, PQCLibraryError
+
+try:
+    NATIVE_ASYNC = PQCLibrary().supports_native_async()
+except Exception:
+    NATIVE_ASYNC = False
+
+class StubAsyncExports:
+    """Completion queue exports backed by one worker thread and a pipe."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.read_fd, self.write_fd = os.pipe()
+        os.set_blocking(self.read_fd, False)
+        self.worker = ThreadPoolExecutor(max_workers=1)
+        self.completions = deque()
+        self.buffers = {}
+        self.freed = 0
+        self.close_thread = None
+
+    def ffi_async_open(self, workers):
+        return 1
+
+    def ffi_async_fd(self, queue):
+        return self.read_fd
+
+    def _complete(self, request_id, status, output=b"", extra=b""):
+        time.sleep(self.delay)
+        self.completions.append((request_id, status, output, extra))
+        os.write(self.write_fd, b"\x01")
+
+    def ffi_async_submit_verify(self, queue, request_id, pk, pk_len, msg, msg_len, sig, sig_len):
+        valid = bytes(sig) == b"sig:" + bytes(msg)
+        self.worker.submit(self._complete, request_id, 0 if valid else -7)
+        return 0
+
+    def ffi_async_submit_sign(self, queue, request_id, sk, sk_len, msg, msg_len):
+        self.worker.submit(self._complete, request_id, 0, b"sig:" + bytes(msg))
+        return 0
+
+    def ffi_async_submit_encaps(self, queue, request_id, pk, pk_len):
+        self.worker.submit(self._complete, request_id, 0, b"secret", b"ct:secret")
+        return 0
+
+    def ffi_async_submit_decaps(self, queue, request_id, sk, sk_len, ct, ct_len):
+        self.worker.submit(self._complete, request_id, 0, bytes(ct)[3:])
+        return 0
+
+    def _buffer(self, data):
+        if not data:
+            return None, 0
+        buffer = (ctypes.c_uint8 * len(data)).from_buffer_copy(data)
+        pointer = ctypes.cast(buffer, ctypes.POINTER(ctypes.c_uint8))
+        self.buffers[ctypes.addressof(buffer)] = buffer
+        return pointer, len(data)
+
+    def ffi_async_poll(self, queue, out, max_count):
+        try:
+            os.read(self.read_fd, 4096)
+        except BlockingIOError:
+            pass
+        written = 0
+        while written < max_count and self.completions:
+            request_id, status, output, extra = self.completions.popleft()
+            output_ptr, output_len = self._buffer(output)
+            extra_ptr, extra_len = self._buffer(extra)
+            out[written].request_id = request_id
+            out[written].status = status
+            out[written].output_ptr = output_ptr
+            out[written].output_len = output_len
+            out[written].extra_ptr = extra_ptr
+            out[written].extra_len = extra_len
+            written += 1
+        return written
+
+    def ffi_buffer_free(self, pointer, length):
+        self.freed += 1
+        self.buffers.pop(ctypes.addressof(pointer.contents), None)
+
+    def ffi_async_close(self, queue):
+        self.close_thread = threading.get_ident()
+        self.worker.shutdown(wait=True)
+        os.close(self.read_fd)
+        os.close(self.write_fd)
+
+class StubLibrary:
+    """PQCLibrary stand-in, with or without the completion queue exports."""
+
+    def __init__(self, exports=None):
+        self.lib = exports
+
+    def supports_native_async(self):
+        return self.lib is not None
+
+class StubKeyPair:
+    """Keypair stand-in with keys and no executor-side operations."""
+    public_key = b"pk"
+    private_key = b"sk"
+
+@pytest.mark.unit
+class TestNativeAsyncQueue:
+    """Unit tests for NativeAsyncQueue."""
+
+    def test_unavailable_without_exports(self):
+        """A library without the exports gives no queue, so callers fall back to the executor."""
+        assert open_native_queue(StubLibrary()) is None
+        with pytest.raises(PQCLibraryError):
+            NativeAsyncQueue(StubLibrary())
+
+    def test_operations_resolved_from_pipe(self, run):
+        """Each operation's future is resolved by the loop's reader on the completion pipe."""
+        exports = StubAsyncExports()
+
+        async def scenario():
+            queue = NativeAsyncQueue(StubLibrary(exports))
+            signature = await queue.sign(b"sk", b"m")
+            results = (
+                signature,
+                await queue.verify(b"pk", b"m", signature),
+                await queue.verify(b"pk", b"m", b"forged"),
+                await queue.encapsulate(b"pk"),
+                await queue.decapsulate(b"sk", b"ct:secret"),
+            )
+            stats = queue.get_stats()
+            await queue.aclose()
+            return results, stats
+
+        results, stats = run(scenario())
+
+        assert results == (b"sig:m", True, False, (b"secret", b"ct:secret"), b"secret")
+        assert stats["in_flight"] == 0
+        assert stats["stats"] == {"submitted": 5, "completed": 5}
+        assert exports.freed == 4 and not exports.buffers
+
+    def test_many_operations_in_flight(self, run):
+        """Thousands of operations wait on futures, not on Python threads."""
+        exports = StubAsyncExports()
+
+        async def scenario():
+            queue = NativeAsyncQueue(StubLibrary(exports), poll_batch=16)
+            signatures = await asyncio.gather(*[queue.sign(b"sk", b"m%d" % i) for i in range(2000)])
+            await queue.aclose()
+            return signatures
+
+        signatures = run(scenario())
+
+        assert signatures == [b"sig:m%d" % i for i in range(2000)]
+        assert len(exports.worker._threads) <= 1
+
+    def test_deadline_abandons_wait(self, run):
+        """A caller past its deadline stops waiting, and the late result is freed."""
+        exports = StubAsyncExports(delay=0.05)
+
+        async def scenario():
+            queue = NativeAsyncQueue(StubLibrary(exports))
+            with pytest.raises(DeadlineExceeded):
+                await queue.sign(b"sk", b"m", deadline=Deadline.after(0.01))
+            with pytest.raises(DeadlineExceeded):
+                await queue.sign(b"sk", b"m", deadline=Deadline.after(-1))
+            await queue.sign(b"sk", b"m")
+            stats = queue.get_stats()
+            await queue.aclose()
+            return stats
+
+        stats = run(scenario())
+
+        assert stats["stats"]["abandoned"] == 1
+        assert stats["stats"]["expired_in_flight"] == 1
+        assert stats["stats"]["expired_before_dispatch"] == 1
+        assert exports.freed == 2
+
+    def test_manager_skips_executor(self, run):
+        """With a native queue, the manager's single operations never reach the executor."""
+        exports = StubAsyncExports()
+
+        async def scenario():
+            queue = NativeAsyncQueue(StubLibrary(exports))
+            async with AsyncPQCManager(max_workers=1, native_queue=queue) as manager:
+                signature = await manager.dilithium_sign_async(StubKeyPair(), b"m", "user_1")
+                valid = await manager.dilithium_verify_async(StubKeyPair(), b"m", signature, "user_1")
+                shared_secret, ciphertext = await manager.kyber_encapsulate_async(StubKeyPair(), "user_1")
+                recovered = await manager.kyber_decapsulate_async(StubKeyPair(), ciphertext, "user_1")
+                status = await manager.get_operation_status()
+            return valid, shared_secret == recovered, status, queue.get_stats()
+
+        valid, roundtrip, status, queue_stats = run(scenario())
+
+        assert valid and roundtrip
+        assert "calls" not in status["executor_status"]["stats"]
+        assert status["native_queue_status"]["stats"]["completed"] == 4
+        assert queue_stats["closed"]
+        assert exports.close_thread not in (None, threading.get_ident())
+
+@pytest.mark.unit
+@pytest.mark.experimental
+@pytest.mark.skipif(not NATIVE_ASYNC,
+                    reason="experimental: the loaded PQC library predates the ffi_async_* exports")
+class TestNativeAsyncLibrary:
+    """NativeAsyncQueue against the built PQC library."""
+
+    def test_operations_roundtrip(self, run):
+        """Signatures and shared secrets from the queue check out with real keys."""
+        library = PQCLibrary()
+        dsa_keys = library.generate_ml_dsa_keypair()
+        kem_keys = library.generate_ml_kem_keypair()
+        dsa_public, dsa_private = bytes(dsa_keys['public_key']), bytes(dsa_keys['private_key'])
+        kem_public, kem_private = bytes(kem_keys['public_key']), bytes(kem_keys['private_key'])
+
+        async def scenario():
+            queue = NativeAsyncQueue(library, workers=2)
+            signatures = await asyncio.gather(*[queue.sign(dsa_private, b"m%d" % i) for i in range(8)])
+            valid = await asyncio.gather(*[queue.verify(dsa_public, b"m%d" % i, signature)
+                                           for i, signature in enumerate(signatures)])
+            forged = await queue.verify(dsa_public, b"other", signatures[0])
+            shared_secret, ciphertext = await queue.encapsulate(kem_public)
+            recovered = await queue.decapsulate(kem_private, ciphertext)
+            stats = queue.get_stats()
+            await queue.aclose()
+            return signatures, valid, forged, shared_secret, recovered, stats
+
+        signatures, valid, forged, shared_secret, recovered, stats = run(scenario())
+
+        assert all(valid) and not forged
+        assert library.ml_dsa_verify(dsa_keys['public_key'], b"m0", signatures[0])
+        assert len(shared_secret) == 32 and recovered == shared_secret
+        assert stats["in_flight"] == 0
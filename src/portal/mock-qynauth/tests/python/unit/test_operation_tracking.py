@@ -0,0 +1,111 @@
+"""
+Unit Tests for Operation Tracking
+
+This module tests operation tracking in AsyncPQCManager and sampled
+introspection in the performance monitor.
+"""
+
+import asyncio
+import os
+import pytest
+import sys
+from contextlib import nullcontext
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../../src'))
+
+from python_app.monitoring.performance_monitor import PQCPerformanceMonitor
+from python_app.pqc_bindings.async_support import AsyncPQCManager
+
+class StubKeyPair:
+    """Keypair stand-in whose operations return at once."""
+
+    def encapsulate(self):
+        return b"s" * 32, b"c" * 1088
+
+@pytest.mark.unit
+class TestOperationTracking:
+    """Unit tests for AsyncPQCManager operation tracking."""
+
+    def test_operations_registered_while_running(self, run):
+        """Running operations are listed under counter-based IDs and removed when done."""
+        async def scenario():
+            async with AsyncPQCManager(max_workers=1) as manager:
+                async with manager.track_operation("outer"):
+                    during = await manager.get_operation_status()
+                await manager.kyber_encapsulate_async(StubKeyPair(), "user_1")
+                await manager.kyber_encapsulate_async(StubKeyPair(), "user_1")
+                return manager, during, await manager.get_operation_status()
+
+        manager, during, after = run(scenario())
+
+        assert during["operation_ids"] == ["outer"]
+        assert after["active_operations"] == 0
+        assert next(manager._operation_ids) == 3
+
+    def test_duplicate_operation_rejected(self, run):
+        """An ID already in use cannot be tracked twice."""
+        async def scenario():
+            async with AsyncPQCManager(max_workers=1) as manager:
+                async with manager.track_operation("op"):
+                    with pytest.raises(ValueError):
+                        async with manager.track_operation("op"):
+                            pass
+                return manager.active_operations
+
+        assert run(scenario()) == {}
+
+    def test_status_samples_operation_ids(self, run):
+        """Status lists a bounded sample of IDs alongside the full count."""
+        async def scenario():
+            async with AsyncPQCManager(max_workers=1) as manager:
+                release = asyncio.Event()
+
+                async def tracked(i):
+                    async with manager.track_operation(f"op_{i}"):
+                        await release.wait()
+
+                tasks = [asyncio.ensure_future(tracked(i)) for i in range(30)]
+                await asyncio.sleep(0)
+                status = await manager.get_operation_status(sample_size=5)
+                release.set()
+                await asyncio.gather(*tasks)
+                return status
+
+        status = run(scenario())
+
+        assert status["active_operations"] == 30
+        assert status["operation_ids"] == [f"op_{i}" for i in range(5)]
+
+@pytest.mark.unit
+class TestSampledIntrospection:
+    """Unit tests for sampled introspection in PQCPerformanceMonitor."""
+
+    def test_resource_usage_sampled(self):
+        """Memory and CPU usage are read only on every Nth operation."""
+        monitor = PQCPerformanceMonitor(introspection_interval=4)
+        reads = []
+        monitor._get_memory_usage = lambda: reads.append("memory") or 1.0
+        monitor._get_cpu_usage = lambda interval=0.1: reads.append(interval) or 5.0
+
+        for _ in range(8):
+            with monitor.monitor_operation("encapsulation", "user_1", "ML-KEM-768"):
+                pass
+
+        assert reads == ["memory", "memory", None] * 2
+
+    def test_aggregates_computed_on_read(self):
+        """Aggregates are recomputed when read, not on every operation."""
+        monitor = PQCPerformanceMonitor(introspection_interval=1000)
+        for fail in (False, False, True):
+            with pytest.raises(RuntimeError) if fail else nullcontext():
+                with monitor.monitor_operation("signature", "user_1", "ML-DSA-65"):
+                    if fail:
+                        raise RuntimeError("boom")
+
+        assert monitor.aggregated_metrics == {}
+
+        aggregated = monitor.get_aggregated_metrics("signature")["signature"]
+
+        assert aggregated["total_count"] == 3
+        assert aggregated["failure_count"] == 1
+        assert 'pqc_operation_total{operation="signature"} 3' in monitor.export_metrics("prometheus")
@@ -0,0 +1,163 @@
+"""
+Unit Tests for PQC Shared Rate Limit Store
+
+This module tests the shared memory rate limit table and the limiter's
+SHARED_MEMORY backend across threads and worker processes.
+"""
+
+import multiprocessing
+import uuid
+import pytest
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../../src'))
+
+from python_app.optimization.rate_limiter import (
+    PQCRateLimiter, QuotaLevel, RateLimitBackend, RateLimitConfig, RateLimitState,
+    RateLimitStrategy
+)
+from python_app.optimization.rate_limit_store import SharedRateLimitTable
+
+@pytest.fixture
+def table_name():
+    name = f"pqc_rl_test_{uuid.uuid4().hex[:12]}"
+    yield name
+    table = SharedRateLimitTable(name)
+    table.close()
+    table.unlink()
+
+def shared_config(name, strategy=RateLimitStrategy.TOKEN_BUCKET, max_requests=100):
+    return RateLimitConfig(max_requests, 60.0, strategy,
+                           backend=RateLimitBackend.SHARED_MEMORY, shared_table=name)
+
+def worker_checks(name, requests, results):
+    """Run checks against the shared backend from a separate process."""
+    limiter = PQCRateLimiter(shared_config(name))
+    results.put(sum(limiter.check_rate_limit_sync("user_1", "sign") for _ in range(requests)))
+
+@pytest.mark.unit
+class TestSharedRateLimitTable:
+    """Unit tests for SharedRateLimitTable."""
+
+    def test_update_peek_and_remove(self, table_name):
+        """State written through update is visible to peek until removed."""
+        table = SharedRateLimitTable(table_name, slots=256, stripes=4)
+
+        def record(state):
+            state.tat = 2_000_000_000.0
+            state.total_requests += 1
+            state.reclaim_at = state.tat
+            return state.total_requests
+
+        assert table.update("u1:sign", record, RateLimitState) == 1
+        assert table.update("u1:sign", record, RateLimitState) == 2
+        assert table.peek("u1:sign", RateLimitState).total_requests == 2
+        assert table.peek("u2:sign", RateLimitState) is None
+
+        assert table.remove("u1:sign")
+        assert table.peek("u1:sign", RateLimitState) is None
+        table.close()
+
+    def test_attach_shares_state(self, table_name):
+        """A second handle attaches to the existing segment and its geometry."""
+        first = SharedRateLimitTable(table_name, slots=256, stripes=4)
+        second = SharedRateLimitTable(table_name, slots=4096, stripes=64)
+
+        first.update("u1:sign", lambda state: setattr(state, "window_count", 7), RateLimitState)
+
+        assert (second.slots, second.stripes) == (256, 4)
+        assert second.peek("u1:sign", RateLimitState).window_count == 7
+        first.close()
+        second.close()
+
+    def test_full_probe_window_reuses_cells(self, table_name):
+        """Keys beyond capacity displace the soonest-idle cells."""
+        table = SharedRateLimitTable(table_name, slots=16, stripes=1)
+
+        def hold(state):
+            state.reclaim_at = 2_000_000_000.0
+
+        for i in range(40):
+            table.update(f"user_{i}:sign", hold, RateLimitState)
+
+        stats = table.get_stats()
+        assert stats["live_entries"] == 16
+        assert stats["evictions"] == 24
+        table.close()
+
+@pytest.mark.unit
+class TestSharedBackend:
+    """Unit tests for PQCRateLimiter with the SHARED_MEMORY backend."""
+
+    @pytest.mark.parametrize("strategy", list(RateLimitStrategy))
+    def test_limiters_share_one_budget(self, table_name, strategy, run):
+        """Two limiters on the same table enforce a single limit."""
+        first = PQCRateLimiter(shared_config(table_name, strategy, max_requests=10))
+        second = PQCRateLimiter(shared_config(table_name, strategy, max_requests=10))
+
+        allowed = sum(
+            limiter.check_rate_limit_sync("user_1")
+            for _ in range(10) for limiter in (first, second)
+        )
+
+        assert allowed == 10
+        status = run(second.get_user_status("user_1"))
+        assert status["remaining_requests"] == 0
+        assert status["total_requests"] == 10
+
+    def test_reset_and_stats(self, table_name, run):
+        """Resetting a user clears shared state and stats report the table."""
+        limiter = PQCRateLimiter(shared_config(table_name, max_requests=3))
+        assert sum(limiter.check_rate_limit_sync("user_1") for _ in range(5)) == 3
+
+        run(limiter.reset_user_limits("user_1"))
+        assert sum(limiter.check_rate_limit_sync("user_1") for _ in range(5)) == 3
+
+        stats = run(limiter.get_stats())
+        assert stats["stats"]["limits_reset"] == 1
+        assert stats["shared_tables"][table_name]["live_entries"] == 1
+        assert stats["active_states"] == 0
+
+    def test_shared_global_quota(self, table_name):
+        """A shared global quota caps the total across limiters with local user state."""
+        limiters = [PQCRateLimiter() for _ in range(2)]
+        for limiter in limiters:
+            limiter.configure_quota(QuotaLevel.GLOBAL, shared_config(table_name, max_requests=12))
+            limiter.set_operation_cost("sign", 2.0)
+
+        allowed = sum(
+            limiter.check_rate_limit_sync(f"user_{i}", "sign")
+            for i in range(10) for limiter in limiters
+        )
+
+        assert allowed == 6
+
+    def test_transaction_claims_distinct_cells(self, table_name):
+        """New keys locked together in one probe window get separate cells."""
+        table = SharedRateLimitTable(table_name, slots=8, stripes=1)
+        with table.transaction(["a", "b", "c"], RateLimitState) as states:
+            for count, state in enumerate(states, 1):
+                state.window_count = count
+                state.reclaim_at = 2_000_000_000.0
+
+        assert [table.peek(key, RateLimitState).window_count for key in "abc"] == [1, 2, 3]
+        table.close()
+
+    @pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(),
+                        reason="requires fork start method")
+    def test_worker_processes_share_one_budget(self, table_name):
+        """Concurrent worker processes never admit more than the limit."""
+        context = multiprocessing.get_context("fork")
+        results = context.Queue()
+        workers = [
+            context.Process(target=worker_checks, args=(table_name, 100, results))
+            for _ in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        allowed = sum(results.get(timeout=30) for _ in workers)
+        for worker in workers:
+            worker.join(timeout=30)
+
+        assert allowed == 100
@@ -0,0 +1,269 @@
+"""
+Unit Tests for PQC Rate Limiter
+
+This module tests the constant-memory rate limiting strategies and the
+sharded, self-reclaiming state behind them, and cost-weighted quotas.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../../src'))
+
+from python_app.optimization import rate_limiter as rate_limiter_module
+from python_app.optimization.rate_limiter import (
+    PQCRateLimiter, QuotaLevel, RateLimitConfig, RateLimitState, RateLimitStrategy
+)
+
+class FakeClock:
+    """Stand-in for the time module with a manually advanced clock."""
+
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limiter_module, "time", fake)
+    return fake
+
+def make_limiter(strategy, max_requests=10, time_window=1.0, **kwargs):
+    return PQCRateLimiter(RateLimitConfig(max_requests, time_window, strategy, **kwargs))
+
+async def allowed_count(limiter, requests, user_id="u1"):
+    results = [await limiter.check_rate_limit(user_id) for _ in range(requests)]
+    return sum(results)
+
+@pytest.mark.unit
+class TestRateLimitStrategies:
+    """Unit tests for PQCRateLimiter strategies."""
+
+    def test_state_has_no_per_request_storage(self):
+        """State is a fixed set of scalar fields."""
+        state = RateLimitState()
+        assert all(isinstance(value, (int, float)) for value in vars(state).values())
+
+    def test_fixed_window_resets_on_new_window(self, clock, run):
+        """The counter restarts when the window id changes."""
+        limiter = make_limiter(RateLimitStrategy.FIXED_WINDOW)
+        assert run(allowed_count(limiter, 15)) == 10
+
+        clock.now += 1.0
+        assert run(allowed_count(limiter, 15)) == 10
+
+    def test_sliding_window_weights_previous_window(self, clock, run):
+        """Half way into a window, half of the previous window still counts."""
+        limiter = make_limiter(RateLimitStrategy.SLIDING_WINDOW)
+        assert run(allowed_count(limiter, 10)) == 10
+
+        clock.now += 1.5
+        assert run(allowed_count(limiter, 10)) == 5
+
+        clock.now += 2.0
+        assert run(allowed_count(limiter, 15)) == 10
+
+    def test_token_bucket_burst_and_refill(self, clock, run):
+        """GCRA allows max_requests + burst at once, then refills at the configured rate."""
+        limiter = make_limiter(RateLimitStrategy.TOKEN_BUCKET, burst_allowance=2)
+        assert run(allowed_count(limiter, 20)) == 12
+
+        clock.now += 0.25
+        assert run(allowed_count(limiter, 5)) == 2
+
+        clock.now += 10.0
+        assert run(allowed_count(limiter, 20)) == 12
+
+    def test_token_bucket_sustained_rate(self, clock, run):
+        """Evenly spaced requests at the configured rate are never rejected."""
+        limiter = make_limiter(RateLimitStrategy.TOKEN_BUCKET)
+        allowed = 0
+        for _ in range(100):
+            clock.now += 0.1
+            allowed += run(limiter.check_rate_limit("u1"))
+        assert allowed == 100
+
+    def test_cooldown_blocks_after_limit(self, clock, run):
+        """A rejection starts the cooldown period."""
+        limiter = make_limiter(RateLimitStrategy.FIXED_WINDOW, cooldown_period=5.0)
+        assert run(allowed_count(limiter, 11)) == 10
+
+        clock.now += 2.0
+        assert run(allowed_count(limiter, 3)) == 0
+
+        clock.now += 4.0
+        assert run(allowed_count(limiter, 3)) == 3
+
+    @pytest.mark.parametrize("strategy", list(RateLimitStrategy))
+    def test_user_status(self, clock, strategy, run):
+        """Status reports usage and remaining requests for every strategy."""
+        limiter = make_limiter(strategy)
+        run(allowed_count(limiter, 4))
+
+        status = run(limiter.get_user_status("u1"))
+
+        assert status["current_requests"] == 4
+        assert status["remaining_requests"] == 6
+        assert status["total_requests"] == 4
+        if strategy == RateLimitStrategy.TOKEN_BUCKET:
+            assert status["tokens"] == pytest.approx(6)
+
+    def test_users_are_independent(self, clock, run):
+        """Limits apply per user."""
+        limiter = make_limiter(RateLimitStrategy.SLIDING_WINDOW)
+        assert run(allowed_count(limiter, 12, "u1")) == 10
+        assert run(allowed_count(limiter, 12, "u2")) == 10
+
+        run(limiter.reset_user_limits("u1"))
+        assert run(allowed_count(limiter, 12, "u1")) == 10
+
+@pytest.mark.unit
+class TestRateLimiterState:
+    """Unit tests for sharded state, idle reclamation and the memory budget."""
+
+    def test_idle_states_reclaimed_on_access(self, clock, run):
+        """States that can no longer affect a decision are dropped lazily."""
+        limiter = PQCRateLimiter(RateLimitConfig(10, 1.0, RateLimitStrategy.FIXED_WINDOW), shards=1)
+        for i in range(5):
+            run(limiter.check_rate_limit(f"user_{i}"))
+
+        clock.now += 1.0
+        run(limiter.check_rate_limit("user_new"))
+        stats = run(limiter.get_stats())
+
+        assert stats["active_states"] == 1
+        assert stats["states_reclaimed"] == 5
+
+    def test_active_states_are_kept(self, clock, run):
+        """A state inside its window or cooldown is not reclaimed."""
+        limiter = PQCRateLimiter(
+            RateLimitConfig(1, 1.0, RateLimitStrategy.SLIDING_WINDOW, cooldown_period=10.0), shards=1)
+        run(allowed_count(limiter, 2, "blocked"))
+
+        clock.now += 5.0
+        run(limiter.check_rate_limit("other"))
+
+        assert run(limiter.get_user_status("blocked"))["is_blocked"]
+        assert limiter.purge_idle_states() == 0
+
+        clock.now += 6.0
+        assert limiter.purge_idle_states() == 2
+
+    def test_memory_budget_bounds_distinct_users(self, clock, run):
+        """A flood of random user IDs stays within the memory budget."""
+        limiter = PQCRateLimiter(
+            RateLimitConfig(10, 60.0, RateLimitStrategy.TOKEN_BUCKET), max_memory_mb=0.25, shards=4)
+        for i in range(20_000):
+            limiter.check_rate_limit_sync(f"attacker_{i}")
+
+        stats = run(limiter.get_stats())
+
+        assert stats["memory_bytes"] <= stats["memory_budget_bytes"]
+        assert stats["states_evicted"] == 20_000 - stats["active_states"]
+        assert stats["stats"]["requests_allowed"] == 20_000
+
+    def test_status_does_not_create_state(self, clock, run):
+        """Querying status for an unknown user keeps no state."""
+        limiter = make_limiter(RateLimitStrategy.SLIDING_WINDOW)
+        status = run(limiter.get_user_status("nobody"))
+
+        assert status["remaining_requests"] == 10
+        assert run(limiter.get_stats())["active_states"] == 0
+
+    def test_concurrent_checks_from_threads(self, clock):
+        """Concurrent threads never admit more than the limit for one key."""
+        limiter = PQCRateLimiter(RateLimitConfig(500, 60.0, RateLimitStrategy.FIXED_WINDOW))
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            results = list(executor.map(
+                lambda i: limiter.check_rate_limit_sync("shared", "sign"), range(2000)))
+
+        assert sum(results) == 500
+
+def quota_limiter(**quotas):
+    """Limiter with a generous per-operation limit and the given quota budgets."""
+    limiter = make_limiter(RateLimitStrategy.FIXED_WINDOW, max_requests=1000, time_window=60.0)
+    for level, budget in quotas.items():
+        limiter.configure_quota(
+            QuotaLevel(level), RateLimitConfig(budget, 60.0, RateLimitStrategy.FIXED_WINDOW))
+    return limiter
+
+@pytest.mark.unit
+class TestHierarchicalQuotas:
+    """Unit tests for cost-weighted global, tenant and user quotas."""
+
+    def test_costs_are_charged_to_quotas(self, clock):
+        """Expensive operations use up a user's budget faster."""
+        limiter = quota_limiter(user=10)
+        limiter.set_operation_cost("sign", 4.0)
+
+        signs = sum(limiter.check_rate_limit_sync("u1", "sign") for _ in range(5))
+
+        assert signs == 3
+        assert not limiter.check_rate_limit_sync("u1", "encapsulate")
+        assert limiter.check_rate_limit_sync("u2", "encapsulate")
+
+    def test_levels_sharing_a_shard(self, clock, run):
+        """Quota and operation states in one shard are all kept and charged."""
+        limiter = PQCRateLimiter(RateLimitConfig(1000, 60.0, RateLimitStrategy.FIXED_WINDOW), shards=1)
+        limiter.configure_quota(QuotaLevel.USER, RateLimitConfig(10, 60.0, RateLimitStrategy.FIXED_WINDOW))
+        limiter.set_operation_cost("sign", 4.0)
+
+        assert sum(limiter.check_rate_limit_sync("u1", "sign") for _ in range(5)) == 3
+        assert run(limiter.get_stats())["stats"].get("states_reclaimed", 0) == 0
+
+    def test_global_quota_spans_users(self, clock, run):
+        """The global budget caps the total across users."""
+        limiter = quota_limiter(**{"global": 20, "user": 15})
+
+        allowed = sum(limiter.check_rate_limit_sync(f"u{i % 4}", "verify") for i in range(40))
+
+        assert allowed == 20
+        stats = run(limiter.get_stats())
+        assert stats["stats"]["quota_rejected_global"] == 20
+        assert stats["active_users"] == 4
+
+    def test_tenant_quota_requires_tenant(self, clock):
+        """The tenant level applies per tenant and only when a tenant is given."""
+        limiter = quota_limiter(tenant=5)
+
+        assert sum(limiter.check_rate_limit_sync(f"u{i}", "sign", "10.0.0.1") for i in range(8)) == 5
+        assert sum(limiter.check_rate_limit_sync(f"u{i}", "sign", "10.0.0.2") for i in range(8)) == 5
+        assert sum(limiter.check_rate_limit_sync(f"u{i}", "sign") for i in range(8)) == 8
+
+    def test_rejection_charges_no_other_level(self, clock, run):
+        """A request rejected by one level is not recorded by the others."""
+        limiter = quota_limiter(**{"global": 3, "user": 100})
+        limiter.set_operation_cost("sign", 3.0)
+        assert limiter.check_rate_limit_sync("u1", "sign")
+
+        assert not limiter.check_rate_limit_sync("u2", "sign")
+        status = run(limiter.get_user_status("u2", "sign"))
+        key = limiter._quota_key(QuotaLevel.USER, "u2")
+        user_quota = limiter._shard_for(key).states.get(key)
+
+        assert status["current_requests"] == 0
+        assert user_quota.window_count == 0
+
+    def test_operation_limit_still_applies(self, clock, run):
+        """The per user/operation request limit is checked with the quotas."""
+        limiter = quota_limiter(user=100)
+        limiter.configure_operation("sign", RateLimitConfig(2, 60.0, RateLimitStrategy.FIXED_WINDOW))
+
+        assert sum(limiter.check_rate_limit_sync("u1", "sign") for _ in range(5)) == 2
+        assert run(limiter.get_stats())["stats"].get("quota_rejected_user", 0) == 0
+
+    def test_calibrate_costs(self):
+        """Costs are proportional to latency, relative to the fastest operation."""
+        limiter = PQCRateLimiter()
+        costs = limiter.calibrate_costs({"encapsulate": 0.05, "sign": 0.4, "verify": 0.1})
+
+        assert costs == pytest.approx({"encapsulate": 1.0, "sign": 8.0, "verify": 2.0})
+        assert limiter.get_operation_cost("sign") == pytest.approx(8.0)
+        assert limiter.get_operation_cost("keygen") == 1.0
+
+        with pytest.raises(ValueError):
+            limiter.set_operation_cost("sign", 0)
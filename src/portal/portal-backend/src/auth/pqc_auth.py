@@ -23,9 +23,11 @@ from contextlib import asynccontextmanager
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../../mock-qynauth/src/python_app'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../../mock-qynauth/src'))
 
 try:
     from pqc_ffi import PQCLibrary, get_pqc_library, PQCLibraryError
+    from python_app.optimization.key_store import PQCKeyStore
     PQCLibraryV2 = PQCLibrary
     PQCError = PQCLibraryError
     KyberError = PQCLibraryError
@@ -142,6 +144,7 @@ class PQCAuthenticationService:
         self.session_cache = PQCKeyCache(config.max_concurrent_sessions)
         
         self.pqc_lib: Optional[PQCLibraryV2] = None
+        self.key_store: Optional[PQCKeyStore] = None
         self.performance_monitor: Optional[Dict[str, Any]] = None
         
         self.logger = logging.getLogger(__name__)
@@ -149,6 +152,8 @@ class PQCAuthenticationService:
         if PQC_AVAILABLE:
             try:
                 self.pqc_lib = get_pqc_library()
+                # Caches hold StoredKey values, with keys as bytes rather than lists
+                self.key_store = PQCKeyStore(self.pqc_lib)
                 if config.enable_performance_monitoring:
                     self.performance_monitor = {'enabled': True, 'metrics': {}}
                 self.logger.info("PQC authentication service initialized successfully")
@@ -448,45 +453,39 @@ class PQCAuthenticationService:
         """Get or create cached Kyber keypair for user."""
         cache_key = f"kyber_{user_id}"
         
-        cached_keypair = self.kyber_cache.get(cache_key)
-        if cached_keypair:
-            return cached_keypair
-        
-        if not self.pqc_lib:
+        if not self.key_store:
             raise PQCError("PQC library not available")
         
-        public_key, private_key = self.pqc_lib.generate_ml_kem_keypair()
-        keypair = {
-            'public_key': public_key,
-            'private_key': private_key,
+        stored_key = self.kyber_cache.get(cache_key)
+        if stored_key is None:
+            stored_key = self.key_store.generate("ML-KEM-768")
+            self.kyber_cache.put(cache_key, stored_key, self.config.kyber_key_cache_ttl)
+        
+        keypair = self.key_store.keypair(stored_key)
+        return {
+            'public_key': keypair['public_key'],
+            'private_key': keypair['private_key'],
             'user_id': user_id
         }
-        
-        self.kyber_cache.put(cache_key, keypair, self.config.kyber_key_cache_ttl)
-        
-        return keypair
     
     async def _get_or_create_dilithium_keypair(self, user_id: str) -> Dict[str, bytes]:
         """Get or create cached Dilithium keypair for user."""
         cache_key = f"dilithium_{user_id}"
         
-        cached_keypair = self.dilithium_cache.get(cache_key)
-        if cached_keypair:
-            return cached_keypair
-        
-        if not self.pqc_lib:
+        if not self.key_store:
             raise PQCError("PQC library not available")
         
-        public_key, private_key = self.pqc_lib.generate_ml_dsa_keypair()
-        keypair = {
-            'public_key': public_key,
-            'private_key': private_key,
+        stored_key = self.dilithium_cache.get(cache_key)
+        if stored_key is None:
+            stored_key = self.key_store.generate("ML-DSA-65")
+            self.dilithium_cache.put(cache_key, stored_key, self.config.dilithium_key_cache_ttl)
+        
+        keypair = self.key_store.keypair(stored_key)
+        return {
+            'public_key': keypair['public_key'],
+            'private_key': keypair['private_key'],
             'user_id': user_id
         }
-        
-        self.dilithium_cache.put(cache_key, keypair, self.config.dilithium_key_cache_ttl)
-        
-        return keypair
     
     def _generate_session_id(self, user_id: str, shared_secret: bytes) -> str:
         """Generate unique session ID."""
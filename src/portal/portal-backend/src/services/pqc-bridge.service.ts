@@ -89,7 +89,7 @@ export class PQCBridgeService {
 
     try {
       // CRITICAL: Call the live Python service via spawn
-      const result = await this.callPythonPQCService(operation, params);
+      const result = await this.callPythonPQCService(operation, params, options.timeout);
       this.logger.debug(`Live PQC operation ${operation} completed successfully in ${Date.now() - startTime}ms`);
       return result;
     } catch (error) {
@@ -127,15 +127,28 @@ export class PQCBridgeService {
     }
   }
 
-  private async callPythonPQCService(operation: string, params: PQCOperationParams): Promise<PQCOperationResult> {
+  private async callPythonPQCService(
+    operation: string,
+    params: PQCOperationParams,
+    timeoutMs?: number,
+  ): Promise<PQCOperationResult> {
     const pythonParams = {
       user_id: params.user_id,
       payload: params.payload || { data_hash: params.data_hash },
       ...params,
+      // Unix timestamp in seconds; the bridge drops the request once it has passed
+      ...(timeoutMs ? { deadline: (Date.now() + timeoutMs) / 1000 } : {}),
     };
 
     return new Promise((resolve, reject) => {
       const pythonProcess = spawn(this.pythonExecutable, [this.pythonScriptPath, operation, JSON.stringify(pythonParams)]);
+      const deadlineTimer = timeoutMs
+        ? setTimeout(() => {
+          this.logger.warn(`PQC operation ${operation} exceeded its ${timeoutMs}ms deadline, stopping Python process`);
+          pythonProcess.kill();
+          reject(new Error(`PQC operation ${operation} exceeded its ${timeoutMs}ms deadline`));
+        }, timeoutMs)
+        : undefined;
 
       let stdoutData = '';
       let stderrData = '';
@@ -149,6 +162,7 @@ export class PQCBridgeService {
       });
 
       pythonProcess.on('close', (code) => {
+        clearTimeout(deadlineTimer);
         if (code === 0) {
           try {
             const result: PQCOperationResult = JSON.parse(stdoutData);
@@ -169,6 +183,7 @@ export class PQCBridgeService {
       });
 
       pythonProcess.on('error', (err) => {
+        clearTimeout(deadlineTimer);
         this.logger.error(`Failed to spawn Python process for operation ${operation}: ${err.message}`);
         reject(new Error(`Failed to start PQC service: ${err.message}`));
       });